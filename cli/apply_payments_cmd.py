@@ -0,0 +1,59 @@
+"""
+CLI command for applying customer payments to open invoices.
+
+Implements the 'apply-payments' command: read a CSV or plaintext payment list,
+match each payment to an open invoice and apply them all in one session.
+"""
+
+import click
+
+
+@click.command()
+@click.argument("gnucash_file", type=click.Path(exists=True, dir_okay=False))
+@click.argument("payments_file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Show which invoice each payment would pay without changing the book",
+)
+def apply_payments(gnucash_file, payments_file, dry_run):
+    """
+    Apply customer payments to their open invoices.
+
+    PAYMENTS_FILE is a CSV file (.csv) with a header row, or a plaintext file
+    of payment blocks. Fields: customer_id, date, amount, bank_account and,
+    optionally, memo, num and billing_id.
+
+    A payment with a billing_id pays the open invoice with that billing ID.
+    Any other payment pays the customer's oldest open invoice whose remaining
+    balance equals the payment amount. Payments that match no invoice are
+    listed and left out; all others are applied and the book is saved once.
+
+    \b
+    Examples:
+      Apply a bank export:
+        gnucash-plaintext apply-payments mybook.gnucash payments.csv
+
+      Preview the matches first:
+        gnucash-plaintext apply-payments mybook.gnucash payments.csv --dry-run
+    """
+    from repositories.gnucash_repository import GnuCashRepository
+    from services.payment_matcher import read_payments
+    from use_cases.apply_payments import ApplyPaymentsUseCase
+
+    try:
+        payments = read_payments(payments_file)
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+
+    repo = GnuCashRepository(gnucash_file)
+    repo.open()
+    try:
+        result = ApplyPaymentsUseCase(repo).execute(payments, dry_run=dry_run)
+        if result.applied and not dry_run:
+            repo.save()
+    finally:
+        repo.close()
+
+    click.echo(result.get_summary(dry_run=dry_run))
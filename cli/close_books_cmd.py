@@ -5,30 +5,50 @@ Implements the 'close-books' subcommand which zeroes out all Income/Expense
 accounts and transfers net income to Equity:Retained Earnings:{currency}.
 """
 
-from datetime import date, datetime
+import os
+from datetime import date
+from typing import List
 
 import click
 
-from repositories.gnucash_repository import GnuCashRepository
-from use_cases.close_books import AlreadyClosedError, CloseBooksUseCase
+from cli.common import parse_date
+from services.balance_checkpoint import BalanceCheckpoints
+from services.balance_provider import BALANCE_SOURCES, BalanceMismatchError
 
 
-def _parse_date(ctx, param, value: str) -> date:
+def _parse_dates(ctx, param, values) -> List[date]:
+    return [parse_date(ctx, param, value) for value in values]
+
+
+def _year_end_dates(from_year: int, to_year: int, year_end: str) -> List[date]:
+    """Closing dates for each fiscal year from from_year to to_year (inclusive)."""
     try:
-        return datetime.strptime(value, "%Y-%m-%d").date()
+        month, day = (int(part) for part in year_end.split("-"))
+        return [date(year, month, day) for year in range(from_year, to_year + 1)]
     except ValueError as e:
-        raise click.BadParameter(f"Date must be in YYYY-MM-DD format, got: {value}") from e
+        raise click.BadParameter(
+            f"Year end must be in MM-DD format, got: {year_end}", param_hint="--year-end"
+        ) from e
 
 
 @click.command("close-books")
 @click.argument("gnucash_file", type=click.Path(exists=True))
 @click.option(
     "--closing-date",
-    required=True,
-    callback=_parse_date,
+    "closing_dates",
+    multiple=True,
+    callback=_parse_dates,
     is_eager=True,
     expose_value=True,
-    help="Date to close books (YYYY-MM-DD)",
+    help="Date to close books (YYYY-MM-DD); repeat to close several periods",
+)
+@click.option("--from-year", type=int, help="First fiscal year to close")
+@click.option("--to-year", type=int, help="Last fiscal year to close")
+@click.option(
+    "--year-end",
+    default="12-31",
+    show_default=True,
+    help="Fiscal year end (MM-DD) used with --from-year/--to-year",
 )
 @click.option(
     "--equity-account",
@@ -52,9 +72,28 @@ def _parse_date(ctx, param, value: str) -> date:
     "--status",
     is_flag=True,
     default=False,
-    help="Check closing status without making changes",
+    help="Check that Income/Expense balances are zero on each date, without making changes",
 )
-def close_books(gnucash_file, closing_date, equity_account, force, dry_run, status):
+@click.option(
+    "--balance-source",
+    type=click.Choice(BALANCE_SOURCES),
+    default="python",
+    show_default=True,
+    help="Compute balances in Python, ask the GnuCash engine, or do both and verify they agree",
+)
+@click.option(
+    "--checkpoint",
+    is_flag=True,
+    default=False,
+    help="After closing, record per-account balance checkpoints at the last closing date",
+)
+@click.option(
+    "--checkpoint-file",
+    type=click.Path(dir_okay=False),
+    help="Balance checkpoint file (default: <gnucash_file>.balance-checkpoints.json)",
+)
+def close_books(gnucash_file, closing_dates, from_year, to_year, year_end, equity_account, force, dry_run,
+                status, balance_source, checkpoint, checkpoint_file):
     """
     Close books for fiscal year (per-currency closing).
 
@@ -75,42 +114,93 @@ def close_books(gnucash_file, closing_date, equity_account, force, dry_run, stat
 
       Re-close (e.g. after adding missed transactions):
         gnucash-plaintext close-books mybook.gnucash --closing-date 2024-12-31 --force
+
+      Close every year from 2010 to 2024 in one run (one save):
+        gnucash-plaintext close-books mybook.gnucash --from-year 2010 --to-year 2024
+
+      Fiscal years ending March 31:
+        gnucash-plaintext close-books mybook.gnucash --from-year 2020 --to-year 2024 --year-end 03-31
+
+      Close 2024 and checkpoint balances so later runs skip history up to it:
+        gnucash-plaintext close-books mybook.gnucash --closing-date 2024-12-31 --checkpoint
+
+      Check engine balances against the Python computation:
+        gnucash-plaintext close-books mybook.gnucash --closing-date 2024-12-31 --status --balance-source verify
     """
+    closing_dates = list(closing_dates)
+    if from_year is not None or to_year is not None:
+        if from_year is None or to_year is None:
+            raise click.UsageError("--from-year and --to-year must be used together.")
+        if from_year > to_year:
+            raise click.UsageError("--from-year must not be after --to-year.")
+        closing_dates.extend(_year_end_dates(from_year, to_year, year_end))
+
+    if not closing_dates:
+        raise click.UsageError("Missing closing date. Use --closing-date or --from-year/--to-year.")
+
+    # Checkpoints are verified against the book before use, so an existing
+    # sidecar is always safe to start from
+    checkpoint_path = checkpoint_file or BalanceCheckpoints.default_path(gnucash_file)
+    checkpoints = None
+    if checkpoint or os.path.exists(checkpoint_path):
+        checkpoints = BalanceCheckpoints.load(checkpoint_path)
+
+    from repositories.gnucash_repository import GnuCashRepository
+    from use_cases.close_books import AlreadyClosedError, CloseBooksUseCase
+
     repo = GnuCashRepository(gnucash_file)
     repo.open()
 
     try:
-        use_case = CloseBooksUseCase(repo)
+        use_case = CloseBooksUseCase(repo, balance_source=balance_source, checkpoints=checkpoints)
 
         if status:
-            is_closed = use_case.check_status(closing_date)
-            if is_closed:
-                click.echo(f"Books are CLOSED as of {closing_date}")
-                click.echo(
-                    "All Income/Expense accounts have zero balance on this date."
-                )
-            else:
-                click.echo(f"Books are OPEN as of {closing_date}")
-                click.echo(
-                    "Some Income/Expense accounts have non-zero balances on this date."
-                )
+            for closing_date, is_closed in use_case.check_status_many(closing_dates):
+                if is_closed:
+                    click.echo(f"Books are CLOSED as of {closing_date}")
+                    click.echo(
+                        "All Income/Expense accounts have zero balance on this date."
+                    )
+                else:
+                    click.echo(f"Books are OPEN as of {closing_date}")
+                    click.echo(
+                        "Some Income/Expense accounts have non-zero balances on this date."
+                    )
             return
 
-        try:
-            result = use_case.execute(
-                closing_date=closing_date,
+        if len(closing_dates) == 1:
+            try:
+                results = [use_case.execute(
+                    closing_date=closing_dates[0],
+                    equity_template=equity_account,
+                    force=force,
+                    dry_run=dry_run,
+                )]
+            except AlreadyClosedError as e:
+                click.echo(f"Error: {e}", err=True)
+                raise click.Abort() from e
+        else:
+            results = use_case.execute_many(
+                closing_dates,
                 equity_template=equity_account,
                 force=force,
                 dry_run=dry_run,
             )
-        except AlreadyClosedError as e:
-            click.echo(f"Error: {e}", err=True)
-            raise click.Abort() from e
 
         if not dry_run:
             repo.save()
 
-        click.echo(result.get_summary())
+        click.echo("\n\n".join(result.get_summary() for result in results))
+
+        if checkpoint and not dry_run:
+            as_of = max(closing_dates)
+            count = use_case.record_checkpoints(as_of)
+            checkpoints.save()
+            click.echo(f"Balance checkpoints recorded as of {as_of}: {count} account(s)")
+
+    except BalanceMismatchError as e:
+        click.echo(f"Error: balance sources disagree: {e}", err=True)
+        raise click.Abort() from e
 
     finally:
         repo.close()
@@ -0,0 +1,43 @@
+"""
+Helpers shared by CLI commands: option callbacks and output.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from fractions import Fraction
+from typing import Optional
+
+import click
+
+
+def parse_date(ctx, param, value: Optional[str]) -> Optional[date]:
+    """Option callback: parse a YYYY-MM-DD value (None stays None)."""
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError as e:
+        raise click.BadParameter(f"Date must be in YYYY-MM-DD format, got: {value}") from e
+
+
+def parse_amount(ctx, param, value: Optional[str]) -> Optional[Fraction]:
+    """Option callback: parse a finite decimal number exactly (None stays None)."""
+    if value is None:
+        return None
+    try:
+        amount = Decimal(value)
+    except InvalidOperation as e:
+        raise click.BadParameter(f"Amount must be a decimal number, got: {value}") from e
+    if not amount.is_finite():
+        raise click.BadParameter(f"Amount must be a decimal number, got: {value}")
+    return Fraction(amount)
+
+
+def write_output(text: str, output: Optional[str]):
+    """Write report text to a file, or to stdout."""
+    if output:
+        with open(output, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        click.echo(f"✓ Report saved to {output}")
+    else:
+        click.echo(text, nl=False)
@@ -6,9 +6,6 @@ import os
 
 import click
 
-from repositories.gnucash_repository import GnuCashRepository, SessionMode
-from use_cases.export_beancount import ExportBeancountUseCase
-
 
 @click.command()
 @click.argument('gnucash_file', required=False, type=click.Path())
@@ -68,6 +65,9 @@ def export_beancount(gnucash_file, output_file, input_file, output_path, date_fr
     if not os.path.exists(gnucash_file):
         raise click.UsageError(f"Input file does not exist: {gnucash_file}")
 
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from use_cases.export_beancount import ExportBeancountUseCase
+
     try:
         repo = GnuCashRepository(gnucash_file)
         repo.open(mode=SessionMode.READ_ONLY)
@@ -6,10 +6,6 @@ import os
 
 import click
 
-from repositories.gnucash_repository import GnuCashRepository, SessionMode
-from use_cases.export_business_objects import ExportBusinessObjectsUseCase
-from use_cases.export_transactions import ExportTransactionsUseCase
-
 
 @click.command()
 @click.argument('gnucash_file', required=False, type=click.Path())
@@ -57,18 +53,17 @@ def export_transactions(gnucash_file, output_file, input_file, output_path, star
     # Validate file existence
     if not os.path.exists(gnucash_file):
         raise click.UsageError(f"Input file does not exist: {gnucash_file}")
+
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from use_cases.export_business_objects import ExportBusinessObjectsUseCase
+    from use_cases.export_transactions import ExportTransactionsUseCase
+
     try:
         # Open repository
         repo = GnuCashRepository(gnucash_file)
         repo.open(mode=SessionMode.READ_ONLY)
 
         try:
-            business_objects_output = ""
-            if include_business_objects:
-                click.echo("Exporting business objects...")
-                business_use_case = ExportBusinessObjectsUseCase(repo.book)
-                business_objects_output = business_use_case.execute()
-
             # Create use case
             use_case = ExportTransactionsUseCase(repo)
 
@@ -83,15 +78,15 @@ def export_transactions(gnucash_file, output_file, input_file, output_path, star
             count = len(result.transactions)
 
             with open(output_file, "w") as f:
-                if business_objects_output:
-                    # Write in import-ready order: accounts, then business objects, then transactions
-                    accounts_output = use_case.format_accounts_section(result)
-                    txn_output = use_case.format_transactions_section(result)
-                    f.write(accounts_output)
-                    f.write("\n")
-                    f.write(business_objects_output)
-                    f.write("\n\n")
-                    f.write(txn_output)
+                if include_business_objects:
+                    # Write in import-ready order: accounts, then business objects, then transactions.
+                    # Business objects are streamed to the file one at a time.
+                    click.echo("Exporting business objects...")
+                    f.write(use_case.format_accounts_section(result))
+                    business_use_case = ExportBusinessObjectsUseCase(repo.book)
+                    if business_use_case.write(f, lead="\n"):
+                        f.write("\n\n")
+                    f.write(use_case.format_transactions_section(result))
                 else:
                     f.write(use_case.format_as_plaintext(result))
 
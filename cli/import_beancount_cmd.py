@@ -6,9 +6,7 @@ import os
 
 import click
 
-from repositories.gnucash_repository import GnuCashRepository
 from services.beancount_parser import BeancountValidationError
-from use_cases.import_beancount import ImportBeancountUseCase
 
 
 @click.command()
@@ -97,6 +95,9 @@ def import_beancount(gnucash_file, beancount_file, gnucash_path, beancount_path,
         else:
             click.echo(f"Importing {beancount_file} to {gnucash_file}...")
 
+            from repositories.gnucash_repository import GnuCashRepository
+            from use_cases.import_beancount import ImportBeancountUseCase
+
             # Create new GnuCash file
             GnuCashRepository.create_new_file(gnucash_file)
 
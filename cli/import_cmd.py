@@ -6,11 +6,7 @@ import os
 
 import click
 
-from repositories.gnucash_repository import GnuCashRepository, SessionMode
-from services.conflict_resolver import ResolutionStrategy
-from services.gnucash_importer import GnuCashImporter
-from services.plaintext_parser import DirectiveType, PlaintextParser
-from use_cases.import_transactions import ImportTransactionsUseCase
+from cli.common import parse_amount
 
 
 @click.command()
@@ -36,7 +32,19 @@ from use_cases.import_transactions import ImportTransactionsUseCase
     help='Create a new GnuCash file (file must not already exist)'
 )
 @click.option('--include-business-objects', is_flag=True, help='Include business objects (customers, invoices, etc.)')
-def import_transactions(gnucash_file, input_file, gnucash_path, plaintext_file, strategy, dry_run, create_new, include_business_objects):
+@click.option(
+    '--match-window-days',
+    type=click.IntRange(min=0),
+    default=0,
+    help='Also skip transactions matching an existing one within N days (default: 0, disabled)'
+)
+@click.option(
+    '--amount-tolerance',
+    default='0',
+    callback=parse_amount,
+    help='Maximum per-account amount difference for --match-window-days (default: 0)'
+)
+def import_transactions(gnucash_file, input_file, gnucash_path, plaintext_file, strategy, dry_run, create_new, include_business_objects, match_window_days, amount_tolerance):
     """
     Import plaintext transactions to GnuCash file.
 
@@ -61,6 +69,8 @@ def import_transactions(gnucash_file, input_file, gnucash_path, plaintext_file,
         gnucash-plaintext import -i mybook.gnucash -f transactions.txt --strategy keep-incoming
 
         gnucash-plaintext import --new mybook.gnucash chart-of-accounts.txt
+
+        gnucash-plaintext import mybook.gnucash bank-feed.txt --match-window-days 3 --amount-tolerance 0.05
     """
     # Support both positional and flag-based arguments
     gnucash_file = gnucash_path or gnucash_file
@@ -90,6 +100,15 @@ def import_transactions(gnucash_file, input_file, gnucash_path, plaintext_file,
     if not os.path.exists(input_file):
         raise click.UsageError(f"Plaintext file does not exist: {input_file}")
 
+    if amount_tolerance < 0:
+        raise click.UsageError("--amount-tolerance must not be negative.")
+
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from services.conflict_resolver import ResolutionStrategy
+    from services.gnucash_importer import GnuCashImporter
+    from services.plaintext_parser import DirectiveType, PlaintextParser
+    from use_cases.import_transactions import ImportTransactionsUseCase
+
     # Map CLI strategy to ResolutionStrategy enum
     strategy_map = {
         'skip': ResolutionStrategy.SKIP,
@@ -129,7 +148,12 @@ def import_transactions(gnucash_file, input_file, gnucash_path, plaintext_file,
             if dry_run:
                 click.echo("(Dry run - no changes will be made)")
 
-            result = use_case.import_from_file(input_file, resolution_strategy)
+            result = use_case.import_from_file(
+                input_file,
+                resolution_strategy,
+                match_window_days=match_window_days,
+                amount_tolerance=amount_tolerance
+            )
 
             # Display results
             click.echo("")
@@ -141,6 +165,16 @@ def import_transactions(gnucash_file, input_file, gnucash_path, plaintext_file,
             click.echo(f"  Conflicts:    {len(result.conflicts)}")
             click.echo(f"  Errors:       {result.error_count}")
 
+            if result.fuzzy_matches:
+                click.echo("")
+                click.echo(f"Matched within {match_window_days} day(s) (skipped):")
+                for match in result.fuzzy_matches:
+                    click.echo(
+                        f"  - {match.incoming.date} {match.incoming.description} ~ "
+                        f"{match.existing.date} {match.existing.description} "
+                        f"(confidence {match.confidence:.2f})"
+                    )
+
             if result.conflicts:
                 click.echo("")
                 click.echo("Conflicts detected:")
@@ -3,48 +3,145 @@
 CLI command for printing GnuCash invoices to PDF.
 """
 
+import os
 from pathlib import Path
 
 import click
-import gnucash.gnucash_business as gb
-from gnucash import Query
 
-from repositories.gnucash_repository import GnuCashRepository, SessionMode
-from services.invoice_renderer import read_book_company_info, render_to_pdf
+from cli.common import parse_date
+from services.invoice_render_pool import OUTPUT_FORMATS, render_invoices
 
 _XSLT_PATH = Path(__file__).parent.parent / "services" / "invoice.xslt"
 
 
+def _parse_date_range(ctx, param, value):
+    if not value:
+        return None
+    start, end = (parse_date(ctx, param, v) for v in value)
+    if start > end:
+        raise click.BadParameter("the first date must not be after the second")
+    return start, end
+
+
 @click.command()
 @click.argument('gnucash_file', type=click.Path(exists=True))
-@click.option("--invoice-id", required=True, help="ID of the invoice to print.")
-@click.option("-o", "--output", required=True, type=click.Path(), help="Output PDF file path.")
-def print_invoice(gnucash_file, invoice_id, output):
-    """Prints a GnuCash invoice to a PDF file."""
+@click.option("--invoice-id", help="ID of the invoice to print.")
+@click.option("-o", "--output", type=click.Path(), help="Output file path (with --invoice-id).")
+@click.option("--all", "all_invoices", is_flag=True, help="Print every posted customer invoice.")
+@click.option("--customer", "customer_id", help="Print the posted invoices of this customer ID.")
+@click.option(
+    "--posted-between", nargs=2, callback=_parse_date_range, metavar="FROM TO",
+    help="Print invoices posted between two dates (YYYY-MM-DD, inclusive).",
+)
+@click.option("--output-dir", type=click.Path(file_okay=False), help="Directory for batch PDFs.")
+@click.option("-j", "--jobs", type=click.IntRange(min=1), help="Rendering processes (default: CPU count).")
+@click.option(
+    "--format", "output_format", type=click.Choice(OUTPUT_FORMATS), default="pdf", show_default=True,
+    help="html skips PDF rendering, for quick previews.",
+)
+def print_invoice(gnucash_file, invoice_id, output, all_invoices, customer_id, posted_between, output_dir, jobs,
+                  output_format):
+    """
+    Prints GnuCash invoices to PDF (or HTML) files.
+
+    \b
+    Examples:
+      One invoice:
+        gnucash-plaintext print-invoice mybook.gnucash --invoice-id INV-2026-001 -o invoice.pdf
+
+    \b
+      All of January's invoices, one PDF per invoice:
+        gnucash-plaintext print-invoice mybook.gnucash --posted-between 2026-01-01 2026-01-31 --output-dir pdf/
+
+    \b
+      HTML preview of one invoice:
+        gnucash-plaintext print-invoice mybook.gnucash --invoice-id INV-2026-001 --format html -o invoice.html
+    """
+    batch = all_invoices or customer_id is not None or posted_between is not None
+    if invoice_id is not None:
+        if batch or output_dir:
+            raise click.UsageError("--invoice-id cannot be combined with --all, --customer, --posted-between or --output-dir.")
+        if not output:
+            raise click.UsageError("--invoice-id requires -o/--output.")
+        _print_one(gnucash_file, invoice_id, output, output_format)
+        return
+
+    if not batch:
+        raise click.UsageError("Give --invoice-id, or select invoices with --all, --customer or --posted-between.")
+    if not output_dir:
+        raise click.UsageError("Batch printing requires --output-dir.")
+    if output:
+        raise click.UsageError("-o/--output is only for --invoice-id; use --output-dir.")
+    _print_batch(gnucash_file, customer_id, posted_between, output_dir, jobs, output_format)
+
+
+def _print_one(gnucash_file, invoice_id, output, output_format):
     click.echo(f"Printing invoice {invoice_id} from {gnucash_file} to {output}...")
 
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from services.invoice_renderer import read_book_company_info, render_to_html, render_to_pdf
+
     repo = GnuCashRepository(gnucash_file)
     repo.open(SessionMode.READ_ONLY)
     book = repo.book
 
     try:
-        q = Query()
-        q.search_for('gncInvoice')
-        q.set_book(book)
-        invoice = next(
-            (inv for r in q.run() for inv in [gb.Invoice(instance=r)] if inv.GetID() == invoice_id),
-            None
-        )
-        q.destroy()
-
+        invoice = repo.get_invoice(invoice_id)
         if not invoice:
             raise click.UsageError(f"Invoice with ID '{invoice_id}' not found.")
 
         company_info = read_book_company_info(gnucash_file)
 
-        render_to_pdf(invoice, book, str(_XSLT_PATH), output, company_info)
+        render = render_to_html if output_format == "html" else render_to_pdf
+        render(invoice, book, str(_XSLT_PATH), output, company_info)
 
         click.echo(f"✓ Successfully printed invoice to {output}")
 
     finally:
         repo.close()
+
+
+def _print_batch(gnucash_file, customer_id, posted_between, output_dir, jobs, output_format):
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from services.invoice_renderer import read_book_company_info
+    from use_cases.print_invoices import PrintInvoicesUseCase, invoice_file_name, invoice_file_names
+
+    posted_from, posted_to = posted_between or (None, None)
+
+    repo = GnuCashRepository(gnucash_file)
+    repo.open(SessionMode.READ_ONLY)
+    try:
+        use_case = PrintInvoicesUseCase(repo)
+        invoices = use_case.find_invoices(customer_id, posted_from, posted_to)
+        if not invoices:
+            click.echo("No matching posted invoices.")
+            return
+        company_info = read_book_company_info(gnucash_file)
+        extracted, failed = use_case.extract(invoices, company_info)
+    finally:
+        repo.close()
+
+    os.makedirs(output_dir, exist_ok=True)
+    click.echo(f"Rendering {len(extracted)} invoice(s) to {output_dir}...")
+    file_names = invoice_file_names([inv_id for inv_id, _ in extracted], output_format)
+    for (inv_id, _), file_name in zip(extracted, file_names):
+        if file_name != invoice_file_name(inv_id, output_format):
+            click.echo(f"Note: {inv_id} written to {file_name} (file name already used)")
+    render_jobs = [
+        (xml_str, os.path.join(output_dir, file_name))
+        for (_, xml_str), file_name in zip(extracted, file_names)
+    ]
+    results = render_invoices(render_jobs, str(_XSLT_PATH), workers=jobs, output_format=output_format)
+
+    printed = 0
+    for (inv_id, _), (_, error) in zip(extracted, results):
+        if error is None:
+            printed += 1
+        else:
+            failed.append((inv_id, error))
+
+    click.echo(f"✓ Printed {printed} invoice(s) to {output_dir}")
+    if failed:
+        for inv_id, error in failed:
+            click.echo(f"✗ {inv_id}: {error}", err=True)
+        raise click.ClickException(f"{len(failed)} invoice(s) could not be printed.")
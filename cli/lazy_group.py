@@ -0,0 +1,82 @@
+"""
+Click group that imports its subcommands on first use.
+
+Importing a command module pulls in what the command needs: the GnuCash
+bindings, the use cases, the importer. A plain click.Group needs every command
+object up front, so `--help`, `--version` and a mistyped command name would
+load all of it. LazyGroup instead knows each subcommand by an import path and
+its one-line help, imports only the subcommand that is run (or whose help is
+shown), and lists subcommands in the group's help without importing any.
+"""
+
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+
+def _short_help(text: str, limit: int) -> str:
+    """Shorten one-line help to at most limit characters, ending with '...' if cut."""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    words: List[str] = []
+    length = len("...")
+    for word in text.split(" "):
+        length += len(word) + (1 if words else 0)
+        if length > limit:
+            break
+        words.append(word)
+    return " ".join(words) + "..."
+
+
+class LazyGroup(click.Group):
+    """Group whose subcommands are imported when first looked up"""
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, Tuple[str, str]]] = None, **kwargs):
+        """
+        Initialize group.
+
+        Args:
+            lazy_subcommands: Command name -> ("module:attribute", one-line help)
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        import_path, _ = self.lazy_subcommands[cmd_name]
+        module_name, attribute = import_path.split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{import_path} is not a click command")
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        """List subcommands, using the registered help of those not imported yet."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            command = self.commands.get(name)
+            if command is None:
+                help_text = _short_help(self.lazy_subcommands[name][1], limit)
+            elif command.hidden:
+                continue
+            else:
+                help_text = command.get_short_help_str(limit)
+            rows.append((name, help_text))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
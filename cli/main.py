@@ -7,18 +7,49 @@ plaintext format.
 
 import click
 
-from cli.close_books_cmd import close_books
-from cli.export_beancount_cmd import export_beancount
-from cli.export_cmd import export_transactions
-from cli.import_beancount_cmd import import_beancount
-from cli.import_cmd import import_transactions
-from cli.invoice_print_cmd import print_invoice
-from cli.validate_cmd import validate_ledger
+from cli.lazy_group import LazyGroup
 
+# Command name -> ("module:attribute", one-line help). Command modules are
+# imported only when their command is run, so --help does not load GnuCash.
+COMMANDS = {
+    'export': ('cli.export_cmd:export_transactions', 'Export transactions from GnuCash file to plaintext format.'),
+    'import': ('cli.import_cmd:import_transactions', 'Import plaintext transactions to GnuCash file.'),
+    'validate': ('cli.validate_cmd:validate_ledger', 'Validate GnuCash ledger integrity.'),
+    'export-beancount': ('cli.export_beancount_cmd:export_beancount', 'Export GnuCash file to beancount format.'),
+    'import-beancount': (
+        'cli.import_beancount_cmd:import_beancount', 'Import GnuCash-compatible beancount file to GnuCash.'
+    ),
+    'close-books': ('cli.close_books_cmd:close_books', 'Close books for fiscal year (per-currency closing).'),
+    'print-invoice': ('cli.invoice_print_cmd:print_invoice', 'Prints GnuCash invoices to PDF (or HTML) files.'),
+    'report': ('cli.report_cmd:report', 'Print reports with one column per period.'),
+    'query': ('cli.query_cmd:query', 'Print the register of one account, filtered.'),
+    'apply-payments': ('cli.apply_payments_cmd:apply_payments', 'Apply customer payments to their open invoices.'),
+    'serve': ('cli.serve_cmd:serve', 'Keep books open and run commands for thin clients.'),
+}
 
-@click.group()
+
+class MainGroup(LazyGroup):
+    """Top-level group; with --socket, commands are sent to the daemon instead"""
+
+    def resolve_command(self, ctx, args):
+        socket_path = ctx.params.get('socket_path')
+        if socket_path and args and args[0] in self.lazy_subcommands:
+            from cli.serve_cmd import LOCAL_COMMANDS, remote_command
+
+            if args[0] not in LOCAL_COMMANDS:
+                return args[0], remote_command(args[0], socket_path), args[1:]
+        return super().resolve_command(ctx, args)
+
+
+@click.group(cls=MainGroup, lazy_subcommands=COMMANDS)
 @click.version_option(version='0.2.0', prog_name='gnucash-plaintext')
-def cli():
+@click.option(
+    '--socket', 'socket_path',
+    envvar='GNUCASH_PLAINTEXT_SOCKET',
+    type=click.Path(dir_okay=False),
+    help='Run the command in the daemon listening on this socket (see serve)',
+)
+def cli(socket_path):
     """
     GnuCash Plaintext - Work with GnuCash files in plaintext format.
 
@@ -48,15 +79,5 @@ def run(script, args):
     subprocess.run([sys.executable, script] + list(args), check=True)
 
 
-# Register commands
-cli.add_command(export_transactions, name='export')
-cli.add_command(import_transactions, name='import')
-cli.add_command(validate_ledger, name='validate')
-cli.add_command(export_beancount, name='export-beancount')
-cli.add_command(import_beancount, name='import-beancount')
-cli.add_command(close_books, name='close-books')
-cli.add_command(print_invoice, name='print-invoice')
-
-
 if __name__ == '__main__':
     cli()
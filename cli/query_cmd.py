@@ -0,0 +1,70 @@
+"""
+CLI command for querying an account register.
+
+Implements the 'query' command: print one account's register lines, filtered
+by date range, description and amount, with a running balance.
+"""
+
+import click
+
+from cli.common import parse_amount, parse_date, write_output
+
+
+@click.command()
+@click.argument("gnucash_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--account", "account_name", required=True, help="Full account name (e.g. Liabilities:Visa)")
+@click.option("--from", "start", callback=parse_date, help="First date (YYYY-MM-DD)")
+@click.option("--to", "end", callback=parse_date, help="Last date (YYYY-MM-DD)")
+@click.option("--description-regex", help="Only lines whose description matches this regular expression")
+@click.option("-i", "--ignore-case", is_flag=True, help="Match --description-regex case-insensitively")
+@click.option("--min-amount", callback=parse_amount, help="Only lines of at least this amount (either sign)")
+@click.option("--max-amount", callback=parse_amount, help="Only lines of at most this amount (either sign)")
+@click.option("--limit", type=int, help="Stop after the first N matching lines")
+@click.option("--tail", type=int, help="Print only the last N matching lines")
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Write to file instead of stdout")
+def query(gnucash_file, account_name, start, end, description_regex, ignore_case,
+          min_amount, max_amount, limit, tail, output):
+    """
+    Print the register of one account, filtered.
+
+    Each line shows the date, number, description, the other account of the
+    transaction, the amount and the account's running balance.
+
+    \b
+    Examples:
+      Amazon charges on the Visa card in 2024:
+        gnucash-plaintext query mybook.gnucash --account Liabilities:Visa \\
+          --from 2024-01-01 --to 2024-12-31 --description-regex amazon -i
+
+    \b
+      Last 20 checking account lines over 100:
+        gnucash-plaintext query mybook.gnucash --account Assets:Bank:Checking --min-amount 100 --tail 20
+    """
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from services.register_query import RegisterFilter, render_register
+    from use_cases.query_register import QueryRegisterUseCase
+
+    try:
+        register_filter = RegisterFilter.build(
+            start=start,
+            end=end,
+            description_regex=description_regex,
+            ignore_case=ignore_case,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            limit=limit,
+            tail=tail,
+        )
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+
+    repo = GnuCashRepository(gnucash_file)
+    repo.open(mode=SessionMode.READ_ONLY)
+    try:
+        lines = QueryRegisterUseCase(repo).execute(account_name, register_filter)
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+    finally:
+        repo.close()
+
+    write_output(render_register(account_name, lines), output)
@@ -0,0 +1,201 @@
+"""
+CLI commands for reports.
+
+Implements the 'report' command group: trial-balance, income-statement,
+balance-sheet and net-worth, each with one column per month, quarter or year,
+and aging, with one column per days-past-due bucket.
+"""
+
+from datetime import date
+
+import click
+
+from cli.common import parse_date, write_output
+from services.period_report import PERIODS, render_csv, render_text
+
+
+def _period_report_command(kind: str, help_text: str):
+    """Create a report subcommand for one PeriodReportBuilder report."""
+
+    @click.command(kind, help=help_text)
+    @click.argument("gnucash_file", type=click.Path(exists=True, dir_okay=False))
+    @click.option(
+        "--period",
+        type=click.Choice(PERIODS),
+        default="month",
+        show_default=True,
+        help="Column width",
+    )
+    @click.option("--from", "start", callback=parse_date, help="First date (YYYY-MM-DD; default: first transaction)")
+    @click.option("--to", "end", callback=parse_date, help="Last date (YYYY-MM-DD; default: last transaction)")
+    @click.option(
+        "--format", "output_format",
+        type=click.Choice(["text", "csv"]),
+        default="text",
+        show_default=True,
+        help="Output format",
+    )
+    @click.option("-o", "--output", type=click.Path(dir_okay=False), help="Write to file instead of stdout")
+    def command(gnucash_file, period, start, end, output_format, output):
+        if start is not None and end is not None and start > end:
+            raise click.UsageError("--from must not be after --to.")
+
+        from repositories.gnucash_repository import GnuCashRepository, SessionMode
+        from use_cases.report import PeriodReportUseCase
+
+        repo = GnuCashRepository(gnucash_file)
+        repo.open(mode=SessionMode.READ_ONLY)
+        try:
+            report = PeriodReportUseCase(repo).execute(kind, period, start, end)
+        except ValueError as e:
+            raise click.UsageError(str(e)) from e
+        finally:
+            repo.close()
+
+        text = render_csv(report) if output_format == "csv" else render_text(report)
+        write_output(text, output)
+
+    return command
+
+
+@click.group("report")
+def report():
+    """
+    Print reports with one column per period.
+
+    \b
+    Examples:
+      Monthly income statement for 2024:
+        gnucash-plaintext report income-statement mybook.gnucash --from 2024-01-01 --to 2024-12-31
+
+      Quarterly balance sheet as CSV:
+        gnucash-plaintext report balance-sheet mybook.gnucash --period quarter --format csv -o bs.csv
+
+      Yearly trial balance:
+        gnucash-plaintext report trial-balance mybook.gnucash --period year
+
+      Monthly net worth in USD:
+        gnucash-plaintext report net-worth mybook.gnucash --interval month --currency USD
+
+      Receivables and payables aging at the end of June:
+        gnucash-plaintext report aging mybook.gnucash --as-of 2024-06-30 --buckets 30,60,90
+    """
+    pass
+
+
+report.add_command(_period_report_command(
+    "trial-balance",
+    "Balance of every account at the end of each period (positive = debit).",
+))
+report.add_command(_period_report_command(
+    "income-statement",
+    "Income and expenses within each period, and net income.",
+))
+report.add_command(_period_report_command(
+    "balance-sheet",
+    "Assets, liabilities and equity at the end of each period.",
+))
+
+
+@report.command("net-worth")
+@click.argument("gnucash_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--currency", required=True, help="Report currency (e.g. USD)")
+@click.option(
+    "--interval", "period",
+    type=click.Choice(PERIODS),
+    default="month",
+    show_default=True,
+    help="Column width",
+)
+@click.option("--from", "start", callback=parse_date, help="First date (YYYY-MM-DD; default: first transaction)")
+@click.option("--to", "end", callback=parse_date, help="Last date (YYYY-MM-DD; default: last transaction)")
+@click.option(
+    "--format", "output_format",
+    type=click.Choice(["text", "csv"]),
+    default="text",
+    show_default=True,
+    help="Output format",
+)
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Write to file instead of stdout")
+def net_worth(gnucash_file, currency, period, start, end, output_format, output):
+    """
+    Assets minus liabilities at the end of each period, in one currency.
+
+    Holdings in other commodities are converted at the latest price on or
+    before each period end, from the price database or from multi-currency
+    transactions.
+    """
+    if start is not None and end is not None and start > end:
+        raise click.UsageError("--from must not be after --to.")
+
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from use_cases.report import PeriodReportUseCase
+
+    repo = GnuCashRepository(gnucash_file)
+    repo.open(mode=SessionMode.READ_ONLY)
+    try:
+        result = PeriodReportUseCase(repo).net_worth(currency.upper(), period, start, end)
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+    finally:
+        repo.close()
+
+    for commodity, periods in result.unpriced.items():
+        click.echo(
+            f"Warning: no {commodity} price in {currency.upper()} for {', '.join(periods)}; counted as zero",
+            err=True,
+        )
+
+    text = render_csv(result.report) if output_format == "csv" else render_text(result.report)
+    write_output(text, output)
+
+
+def _parse_buckets(ctx, param, value: str):
+    from services.aging_report import parse_buckets
+
+    try:
+        return parse_buckets(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
+@report.command("aging")
+@click.argument("gnucash_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--as-of", "as_of", callback=parse_date, help="Report date (YYYY-MM-DD; default: today)")
+@click.option(
+    "--buckets",
+    default="30,60,90",
+    show_default=True,
+    callback=_parse_buckets,
+    help="Comma-separated bucket limits in days past due",
+)
+@click.option(
+    "--format", "output_format",
+    type=click.Choice(["text", "csv"]),
+    default="text",
+    show_default=True,
+    help="Output format",
+)
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Write to file instead of stdout")
+def aging(gnucash_file, as_of, buckets, output_format, output):
+    """
+    Open invoices and bills by days past their due date.
+
+    Balances owed by each customer (Receivable) and owed to each vendor
+    (Payable) on the report date, from each posted invoice's remaining
+    balance. Payments dated after the report date are not counted.
+    """
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from use_cases.report import AgingReportUseCase
+
+    as_of = as_of or date.today()
+
+    repo = GnuCashRepository(gnucash_file)
+    repo.open(mode=SessionMode.READ_ONLY)
+    try:
+        report = AgingReportUseCase(repo).execute(as_of, buckets)
+    finally:
+        repo.close()
+
+    text = render_csv(report) if output_format == "csv" else render_text(report)
+    write_output(text, output)
@@ -0,0 +1,184 @@
+"""
+CLI command for the local daemon, and the client side of it.
+
+'serve' keeps GnuCash books open between commands. It listens on a Unix
+socket for JSON-RPC 2.0 requests, one method per CLI command (export, import,
+validate, report, ...), with params {"args": [...], "cwd": "..."}: the
+command's arguments and the working directory to resolve relative paths in.
+The command runs inside the daemon exactly as it would from the shell, but
+its GnuCashRepository sessions come from a SessionPool, so the book is
+loaded and locked once rather than on every call. The result is
+{"exit_code": ..., "stdout": ..., "stderr": ...}.
+
+Requests are handled one at a time, so writes to a book are serialized and
+the GnuCash engine is never used from two threads. A book changed on disk by
+another program is reloaded before the next request uses it.
+
+With `gnucash-plaintext --socket PATH <command> ...` (or the
+GNUCASH_PLAINTEXT_SOCKET environment variable) the CLI is a thin client: it
+sends the command to the daemon and prints what the daemon returns.
+"""
+
+import contextlib
+import io
+import os
+import signal
+import sys
+import threading
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, Dict, List
+
+import click
+
+from infrastructure.jsonrpc import INVALID_PARAMS, JsonRpcError, call
+
+# Commands always run by the CLI itself, never sent to the daemon
+LOCAL_COMMANDS = ('serve', 'run')
+
+
+def _invoke(command: click.Command, name: str, args: List[str]) -> int:
+    """Run a click command like its console script would; return its exit code."""
+    try:
+        rv = command.main(args=args, prog_name=f"gnucash-plaintext {name}", standalone_mode=False)
+        return rv if isinstance(rv, int) else 0
+    except click.ClickException as e:
+        e.show(file=sys.stderr)
+        return e.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+
+def _command_method(group: click.Group, name: str):
+    """JSON-RPC method running one CLI command in this process."""
+
+    def method(params: Dict[str, Any]) -> Dict[str, Any]:
+        args = params.get('args', [])
+        cwd = params.get('cwd')
+        if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+            raise JsonRpcError(INVALID_PARAMS, "args must be a list of strings")
+        if cwd is not None and not isinstance(cwd, str):
+            raise JsonRpcError(INVALID_PARAMS, "cwd must be a string")
+
+        command = group.get_command(click.Context(group), name)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        previous_cwd = os.getcwd()
+        try:
+            if cwd:
+                os.chdir(cwd)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                exit_code = _invoke(command, name, args)
+        finally:
+            os.chdir(previous_cwd)
+        return {'exit_code': exit_code, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+    return method
+
+
+def remote_command(name: str, socket_path: str) -> click.Command:
+    """
+    Build a command that runs `name` in the daemon listening on socket_path.
+
+    Every argument, including --help, is passed on unparsed.
+
+    Args:
+        name: CLI command name
+        socket_path: Daemon socket
+
+    Returns:
+        click.Command
+    """
+
+    def forward(args):
+        params = {'args': list(args), 'cwd': os.getcwd()}
+        try:
+            result = call(socket_path, name, params)
+        except (OSError, JsonRpcError) as e:
+            raise click.ClickException(f"Daemon at {socket_path} failed: {e}") from e
+
+        if result['stdout']:
+            click.echo(result['stdout'], nl=False)
+        if result['stderr']:
+            click.echo(result['stderr'], nl=False, err=True)
+        click.get_current_context().exit(result['exit_code'])
+
+    return click.Command(
+        name,
+        callback=forward,
+        params=[click.Argument(['args'], nargs=-1, type=click.UNPROCESSED)],
+        context_settings={'ignore_unknown_options': True, 'allow_extra_args': True, 'help_option_names': []},
+        add_help_option=False,
+    )
+
+
+@click.command()
+@click.option(
+    "--socket", "socket_path",
+    required=True,
+    type=click.Path(dir_okay=False),
+    help="Unix socket to listen on",
+)
+@click.argument("books", nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.pass_context
+def serve(ctx, socket_path, books):
+    """
+    Keep books open and run commands for thin clients.
+
+    Listens on a Unix socket for commands sent with
+    `gnucash-plaintext --socket PATH <command> ...`. Books are opened on first
+    use and stay open (and locked, once written to) until the daemon stops;
+    BOOKS given here are opened read-only at startup.
+
+    \b
+    Examples:
+      Start the daemon:
+        gnucash-plaintext serve --socket /tmp/gnucash.sock mybook.gnucash
+      Run commands through it:
+        gnucash-plaintext --socket /tmp/gnucash.sock validate mybook.gnucash
+        gnucash-plaintext --socket /tmp/gnucash.sock export mybook.gnucash out.txt
+      Or for every command of a shell session:
+        export GNUCASH_PLAINTEXT_SOCKET=/tmp/gnucash.sock
+    """
+    from infrastructure.jsonrpc import JsonRpcServer
+    from repositories.gnucash_repository import SessionMode
+    from repositories.session_pool import SessionPool
+
+    root = ctx.find_root()
+    group = root.command
+    pool = SessionPool()
+    server = None
+
+    def stop(params):
+        # serve_forever() must be stopped from another thread
+        threading.Thread(target=server.shutdown, daemon=True).start()
+        return 'stopping'
+
+    methods = {
+        name: _command_method(group, name)
+        for name in group.list_commands(root)
+        if name not in LOCAL_COMMANDS
+    }
+    methods['ping'] = lambda params: 'pong'
+    methods['books'] = lambda params: [{'path': path, 'mode': mode} for path, mode in pool.books()]
+    methods['shutdown'] = stop
+
+    try:
+        server = JsonRpcServer(socket_path, methods)
+    except OSError as e:
+        raise click.ClickException(str(e)) from e
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop({}))
+    with pool.installed(), server:
+        for book in books:
+            pool.acquire(book, SessionMode.READ_ONLY)
+            pool.release(book)
+        click.echo(f"Listening on {socket_path} (Ctrl+C to stop)")
+        with contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
+    click.echo("Stopped")
@@ -6,8 +6,8 @@ import os
 
 import click
 
-from repositories.gnucash_repository import GnuCashRepository, SessionMode
-from use_cases.validate_ledger import ValidateLedgerUseCase
+from services.ledger_validator import VALIDATION_RULES
+from services.validation_cache import ValidationCache
 
 
 @click.command()
@@ -16,7 +16,37 @@ from use_cases.validate_ledger import ValidateLedgerUseCase
 @click.option('--report', '-r', type=click.Path(), help='Save report to file')
 @click.option('--quick', '-q', is_flag=True, help='Quick check (errors only)')
 @click.option('--stats', '-s', is_flag=True, help='Show statistics')
-def validate_ledger(gnucash_file, input_file, report, quick, stats):
+@click.option(
+    '--rule', 'enabled_rules',
+    multiple=True,
+    type=click.Choice(list(VALIDATION_RULES)),
+    help='Only run this rule (repeatable; default: all rules)'
+)
+@click.option(
+    '--skip-rule', 'disabled_rules',
+    multiple=True,
+    type=click.Choice(list(VALIDATION_RULES)),
+    help='Do not run this rule (repeatable)'
+)
+@click.option('--list-rules', is_flag=True, help='List available validation rules and exit')
+@click.option(
+    '--jobs', '-j',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Worker processes for transaction checks (default: 1)'
+)
+@click.option(
+    '--incremental',
+    is_flag=True,
+    help='Only re-check new or edited transactions, using a cache next to the book'
+)
+@click.option(
+    '--cache-file',
+    type=click.Path(dir_okay=False),
+    help='Validation cache file for --incremental (default: <file>.validation-cache.json)'
+)
+def validate_ledger(gnucash_file, input_file, report, quick, stats, enabled_rules, disabled_rules, list_rules, jobs,
+                    incremental, cache_file):
     """
     Validate GnuCash ledger integrity.
 
@@ -39,7 +69,20 @@ def validate_ledger(gnucash_file, input_file, report, quick, stats):
         gnucash-plaintext validate mybook.gnucash --report validation.txt
 
         gnucash-plaintext validate -i mybook.gnucash --stats
+
+        gnucash-plaintext validate mybook.gnucash --skip-rule date-order --skip-rule future-dates
+
+        gnucash-plaintext validate mybook.gnucash --rule transactions --rule duplicates
+
+        gnucash-plaintext validate mybook.gnucash --jobs 4
+
+        gnucash-plaintext validate mybook.gnucash --incremental
     """
+    if list_rules:
+        for name, rule_class in VALIDATION_RULES.items():
+            click.echo(f"  {name:<14} {rule_class.description}")
+        return
+
     # Support both positional and flag-based arguments
     gnucash_file = input_file or gnucash_file
 
@@ -49,6 +92,16 @@ def validate_ledger(gnucash_file, input_file, report, quick, stats):
     # Validate file existence
     if not os.path.exists(gnucash_file):
         raise click.UsageError(f"GnuCash file does not exist: {gnucash_file}")
+
+    if cache_file and not incremental:
+        raise click.UsageError("--cache-file requires --incremental.")
+    cache = None
+    if incremental:
+        cache = ValidationCache.load(cache_file or ValidationCache.default_path(gnucash_file))
+
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from use_cases.validate_ledger import ValidateLedgerUseCase
+
     try:
         # Open repository
         repo = GnuCashRepository(gnucash_file)
@@ -57,11 +110,17 @@ def validate_ledger(gnucash_file, input_file, report, quick, stats):
         try:
             # Create use case
             use_case = ValidateLedgerUseCase(repo)
+            validation_options = {
+                'enabled_rules': enabled_rules or None,
+                'disabled_rules': disabled_rules,
+                'jobs': jobs,
+                'cache': cache
+            }
 
             if quick:
                 # Quick validation
                 click.echo(f"Running quick validation on {gnucash_file}...")
-                is_valid = use_case.quick_check()
+                is_valid = use_case.quick_check(**validation_options)
 
                 if is_valid:
                     click.echo("✓ Ledger is valid (no errors)")
@@ -72,7 +131,7 @@ def validate_ledger(gnucash_file, input_file, report, quick, stats):
             elif stats:
                 # Show statistics
                 click.echo(f"Analyzing {gnucash_file}...")
-                ledger_stats = use_case.get_statistics()
+                ledger_stats = use_case.get_statistics(**validation_options)
 
                 click.echo("")
                 click.echo("Ledger Statistics:")
@@ -101,10 +160,12 @@ def validate_ledger(gnucash_file, input_file, report, quick, stats):
             else:
                 # Full validation with report
                 click.echo(f"Validating {gnucash_file}...")
-                result = use_case.validate_and_report(output_path=report)
+                result = use_case.validate_and_report(output_path=report, **validation_options)
 
                 click.echo("")
                 click.echo(result.get_summary())
+                if cache is not None:
+                    click.echo(f"Cache: {cache.hits} result(s) reused, {cache.misses} re-checked")
 
                 if result.is_valid():
                     if result.has_warnings():
@@ -0,0 +1,135 @@
+"""
+ID lookups for GnuCash business objects.
+
+The engine's lookup-by-ID functions (book.CustomerLookupByID and friends) each
+run a QOF query over every object of the type, so looking up one customer per
+invoice, or one invoice per printed ID, scans the book again and again.
+
+BusinessObjectIndex runs one query per object type the first time that type is
+looked up, and answers later lookups from a dict. Invoices and bills share the
+gncInvoice type and may reuse IDs, so they are indexed separately by owner.
+An ID missing from the index (e.g. an object created after the index was
+built) falls back to the engine lookup, and a hit is added to the index.
+"""
+
+from typing import Callable, Dict, Optional
+
+import gnucash.gnucash_business as gb
+from gnucash import Query
+
+
+def _run_query(book, type_name: str, wrap: Callable):
+    query = Query()
+    query.search_for(type_name)
+    query.set_book(book)
+    objects = [wrap(instance=r) for r in query.run()]
+    query.destroy()
+    return objects
+
+
+def _invoice_owner_kind(invoice) -> Optional[str]:
+    """'customer' for an invoice, 'vendor' for a bill, None for other owners."""
+    try:
+        owner = invoice.GetOwner()
+        if owner.GetCustomer() is not None:
+            return 'customer'
+        if owner.GetVendor() is not None:
+            return 'vendor'
+    except Exception:
+        pass
+    return None
+
+
+class BusinessObjectIndex:
+    """Customers, vendors, invoices and bills of one book by ID, built lazily"""
+
+    def __init__(self, book):
+        """
+        Initialize an empty index.
+
+        Args:
+            book: GnuCash Book
+        """
+        self.book = book
+        self._customers: Optional[Dict[str, object]] = None
+        self._vendors: Optional[Dict[str, object]] = None
+        self._invoices: Optional[Dict[str, Dict[str, object]]] = None  # owner kind -> ID -> invoice
+
+    def customer(self, customer_id: str):
+        """
+        Find a customer by ID.
+
+        Args:
+            customer_id: Customer ID
+
+        Returns:
+            Customer, or None if not found
+        """
+        if self._customers is None:
+            self._customers = {c.GetID(): c for c in _run_query(self.book, 'gncCustomer', gb.Customer)}
+        return self._lookup(self._customers, customer_id, self.book.CustomerLookupByID)
+
+    def vendor(self, vendor_id: str):
+        """
+        Find a vendor by ID.
+
+        Args:
+            vendor_id: Vendor ID
+
+        Returns:
+            Vendor, or None if not found
+        """
+        if self._vendors is None:
+            self._vendors = {v.GetID(): v for v in _run_query(self.book, 'gncVendor', gb.Vendor)}
+        return self._lookup(self._vendors, vendor_id, self.book.VendorLookupByID)
+
+    def invoice(self, invoice_id: str):
+        """
+        Find a customer invoice by ID.
+
+        Args:
+            invoice_id: Invoice ID
+
+        Returns:
+            Invoice, or None if no customer invoice has the ID
+        """
+        return self._invoice('customer', invoice_id)
+
+    def bill(self, bill_id: str):
+        """
+        Find a vendor bill by ID.
+
+        Args:
+            bill_id: Bill ID
+
+        Returns:
+            Invoice owned by a vendor, or None if not found
+        """
+        return self._invoice('vendor', bill_id)
+
+    def _invoice(self, kind: str, invoice_id: str):
+        if self._invoices is None:
+            self._invoices = {'customer': {}, 'vendor': {}}
+            for inv in _run_query(self.book, 'gncInvoice', gb.Invoice):
+                owner_kind = _invoice_owner_kind(inv)
+                if owner_kind is not None:
+                    self._invoices[owner_kind][inv.GetID()] = inv
+
+        by_id = self._invoices[kind]
+        invoice = by_id.get(invoice_id)
+        if invoice is None:
+            # The engine lookup returns the first gncInvoice with the ID,
+            # which may be of the other kind
+            found = self.book.InvoiceLookupByID(invoice_id)
+            if found is not None and _invoice_owner_kind(found) == kind:
+                by_id[invoice_id] = invoice = found
+        return invoice
+
+    @staticmethod
+    def _lookup(by_id: Dict[str, object], object_id: str, engine_lookup: Callable):
+        obj = by_id.get(object_id)
+        if obj is None:
+            obj = engine_lookup(object_id)
+            if obj is not None:
+                by_id[object_id] = obj
+        return obj
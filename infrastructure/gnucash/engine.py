@@ -29,8 +29,13 @@ On x86_64 a 64-bit pointer like 0x7f1234567890 is silently truncated to
 Setting argtypes = [ctypes.c_void_p] tells ctypes to pass the full 64-bit
 value.  This is mandatory; omitting it will crash on Ubuntu (and silently
 give wrong results on any 64-bit platform if the pointer happens to be >4 GB).
+
+The configured handle is created once per process and then reused: the
+library stays mapped for the life of the process, so repeating the dlopen and
+the restype/argtypes setup for every invoice would only cost time.
 """
 import ctypes
+from typing import Optional
 
 _ENGINE_LIB_PATHS = [
     '/usr/lib/x86_64-linux-gnu/gnucash/libgnc-engine.so',            # Debian 11/12/13, Ubuntu 22/24
@@ -38,6 +43,9 @@ _ENGINE_LIB_PATHS = [
 ]
 
 
+_engine_lib: Optional[ctypes.CDLL] = None
+
+
 class GncNumericC(ctypes.Structure):
     """Mirrors the C GncNumeric struct: {int64 num, int64 denom}."""
     _fields_ = [('num', ctypes.c_int64), ('denom', ctypes.c_int64)]
@@ -88,6 +96,18 @@ def _setup_lib_restypes(lib: ctypes.CDLL) -> None:
 
 
 def load_gnc_engine() -> ctypes.CDLL:
+    """Return the process-wide, correctly configured libgnc-engine handle.
+
+    The first call loads the library; later calls return the same handle.
+    A failed load is not cached, so a later call tries again.
+    """
+    global _engine_lib
+    if _engine_lib is None:
+        _engine_lib = _load_gnc_engine()
+    return _engine_lib
+
+
+def _load_gnc_engine() -> ctypes.CDLL:
     """Load libgnc-engine and return a correctly configured ctypes handle.
 
     Always promotes the library to RTLD_GLOBAL via its known on-disk path
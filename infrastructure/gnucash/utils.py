@@ -6,11 +6,15 @@ Extracted from legacy utils.py and placed in new architecture.
 """
 
 import copy
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from fractions import Fraction
 from typing import List, Optional, Union
 
-from gnucash import Account, GncCommodity, GncNumeric
+from gnucash import Account, GncCommodity, GncNumeric, Query, Transaction
+
+# QOF parameter name of a transaction's posted date (TRANS_DATE_POSTED)
+TRANS_DATE_POSTED = 'date-posted'
 
 
 def get_account_full_name(account: Account) -> str:
@@ -103,6 +107,51 @@ def find_account(account: Account, name: str) -> Optional[Account]:
     return acc
 
 
+def query_transactions_by_date(book, start: date, end: date) -> List[Transaction]:
+    """
+    Find transactions posted from start through end with a QOF date query.
+
+    The engine filters on the posted date, so only matching transactions are
+    wrapped and returned instead of every transaction in the book.
+
+    Args:
+        book: GnuCash Book
+        start: First posted date (inclusive)
+        end: Last posted date (inclusive)
+
+    Returns:
+        List of Transaction objects
+    """
+    from gnucash.gnucash_core import QueryDatePredicate
+    from gnucash.gnucash_core_c import (
+        QOF_COMPARE_GTE,
+        QOF_COMPARE_LT,
+        QOF_DATE_MATCH_NORMAL,
+        QOF_QUERY_AND,
+    )
+
+    # Posted dates are stored as a time of day; cover whole local days
+    day_start = datetime.combine(start, time.min)
+    next_day_start = datetime.combine(end + timedelta(days=1), time.min)
+
+    query = Query()
+    query.search_for('Trans')
+    query.set_book(book)
+    query.add_term(
+        [TRANS_DATE_POSTED],
+        QueryDatePredicate(QOF_COMPARE_GTE, QOF_DATE_MATCH_NORMAL, day_start),
+        QOF_QUERY_AND,
+    )
+    query.add_term(
+        [TRANS_DATE_POSTED],
+        QueryDatePredicate(QOF_COMPARE_LT, QOF_DATE_MATCH_NORMAL, next_day_start),
+        QOF_QUERY_AND,
+    )
+    transactions = [Transaction(instance=tx) for tx in query.run()]
+    query.destroy()
+    return transactions
+
+
 def get_commodity_ticker(commodity: GncCommodity) -> str:
     """
     Get commodity ticker in format 'NAMESPACE.MNEMONIC' or just 'MNEMONIC' for currencies.
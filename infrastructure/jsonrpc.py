@@ -0,0 +1,188 @@
+"""
+JSON-RPC 2.0 over a Unix domain socket.
+
+Each message is one JSON object on one line (UTF-8, terminated by a newline).
+A client connects, sends requests and reads one response per request (none
+for notifications, i.e. requests without an id). Batches are not supported.
+
+The server handles one connection at a time, so methods never run
+concurrently. The socket file is created readable and writable by its owner
+only.
+"""
+
+import contextlib
+import json
+import os
+import socket
+import socketserver
+import stat
+from typing import Any, Callable, Dict, Optional
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# params -> result (JSON-serializable)
+Method = Callable[[Dict[str, Any]], Any]
+
+
+class JsonRpcError(Exception):
+    """Error returned in a JSON-RPC response"""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def to_dict(self) -> Dict[str, Any]:
+        error = {'code': self.code, 'message': self.message}
+        if self.data is not None:
+            error['data'] = self.data
+        return error
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def call(socket_path: str, method: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None):
+    """
+    Send one request and wait for its result.
+
+    Args:
+        socket_path: Path of the server's Unix socket
+        method: Method name
+        params: Named parameters
+        timeout: Seconds to wait for the connection and the response
+            (default: no limit)
+
+    Returns:
+        The method's result
+
+    Raises:
+        OSError: If the server cannot be reached
+        JsonRpcError: If the server returns an error
+    """
+    request = {'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params or {}}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(_encode(request))
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile('rb') as stream:
+            line = stream.readline()
+
+    if not line:
+        raise JsonRpcError(INTERNAL_ERROR, "Connection closed without a response")
+    response = json.loads(line)
+    if 'error' in response:
+        error = response['error']
+        raise JsonRpcError(error.get('code', INTERNAL_ERROR), error.get('message', ''), error.get('data'))
+    return response.get('result')
+
+
+def is_listening(socket_path: str) -> bool:
+    """Whether a server accepts connections on a socket path."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.dispatch(line)
+            if response is not None:
+                self.wfile.write(_encode(response))
+                self.wfile.flush()
+
+
+class JsonRpcServer(socketserver.UnixStreamServer):
+    """Server calling named methods, one request at a time"""
+
+    def __init__(self, socket_path: str, methods: Dict[str, Method]):
+        """
+        Bind the socket.
+
+        A stale socket file (one no server listens on) is removed first.
+
+        Args:
+            socket_path: Path of the Unix socket to create
+            methods: Method name -> function of the request's named params
+
+        Raises:
+            OSError: If another server is listening on the socket path
+        """
+        if os.path.exists(socket_path):
+            if is_listening(socket_path):
+                raise OSError(f"A server is already listening on {socket_path}")
+            if stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                os.unlink(socket_path)
+        self.socket_path = socket_path
+        self.methods = methods
+
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+
+    def dispatch(self, line: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Handle one request line.
+
+        Args:
+            line: Request JSON
+
+        Returns:
+            Response message, or None for a notification
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {'jsonrpc': '2.0', 'id': None, 'error': JsonRpcError(PARSE_ERROR, f"Parse error: {e}").to_dict()}
+
+        if not isinstance(request, dict):
+            error = JsonRpcError(INVALID_REQUEST, "Request must be an object")
+            return {'jsonrpc': '2.0', 'id': None, 'error': error.to_dict()}
+
+        request_id = request.get('id')
+        try:
+            result = self._call(request)
+        except JsonRpcError as e:
+            error = e
+        except Exception as e:
+            error = JsonRpcError(INTERNAL_ERROR, str(e) or e.__class__.__name__)
+        else:
+            if 'id' not in request:
+                return None
+            return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+        if 'id' not in request:
+            return None
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': error.to_dict()}
+
+    def _call(self, request: Dict[str, Any]):
+        method = request.get('method')
+        if request.get('jsonrpc') != '2.0' or not isinstance(method, str):
+            raise JsonRpcError(INVALID_REQUEST, "Not a JSON-RPC 2.0 request")
+        if method not in self.methods:
+            raise JsonRpcError(METHOD_NOT_FOUND, f"Unknown method '{method}'")
+        params = request.get('params', {})
+        if not isinstance(params, dict):
+            raise JsonRpcError(INVALID_PARAMS, "params must be an object")
+        return self.methods[method](params)
@@ -10,7 +10,10 @@ from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
 from gnucash import Account, Query, Session, Split, Transaction
 
+from infrastructure.gnucash.business_index import BusinessObjectIndex
+
 if TYPE_CHECKING:
+    from repositories.session_pool import SessionPool
     from services.ledger_validator import ValidationResult
 
 
@@ -24,6 +27,10 @@ class SessionMode:
 class GnuCashRepository:
     """Repository for GnuCash file operations"""
 
+    # Sessions shared across repositories, installed by a long-running process
+    # (see repositories.session_pool). None: every repository opens its own.
+    session_pool: Optional['SessionPool'] = None
+
     def __init__(self, file_path: str):
         """
         Initialize repository for a GnuCash file.
@@ -34,18 +41,44 @@ class GnuCashRepository:
         self.file_path = file_path
         self.session = None
         self._book = None
+        self._business_index: Optional[BusinessObjectIndex] = None
+        self._pool: Optional[SessionPool] = None
 
     def open(self, mode: str = SessionMode.NORMAL):
         """
         Open GnuCash file session.
 
+        With a session pool installed, READ_ONLY and NORMAL sessions come
+        from the pool.
+
         Args:
             mode: Session mode (READ_ONLY, NORMAL, or NEW)
         """
         if self.session is not None:
             raise RuntimeError("Session already open")
 
-        uri = f"xml://{self.file_path}"
+        pool = GnuCashRepository.session_pool
+        if pool is not None and mode != SessionMode.NEW:
+            self.session = pool.acquire(self.file_path, mode)
+            self._pool = pool
+        else:
+            self.session = self.open_session(self.file_path, mode)
+
+        self._book = self.session.book
+
+    @staticmethod
+    def open_session(file_path: str, mode: str = SessionMode.NORMAL) -> Session:
+        """
+        Open a new GnuCash session.
+
+        Args:
+            file_path: Path to GnuCash XML file
+            mode: Session mode (READ_ONLY, NORMAL, or NEW)
+
+        Returns:
+            GnuCash Session
+        """
+        uri = f"xml://{file_path}"
 
         # Use version-specific session API (try new API first)
         try:
@@ -58,30 +91,35 @@ class GnuCashRepository:
             else:
                 session_mode = SessionOpenMode.SESSION_NORMAL_OPEN
 
-            self.session = Session(uri, session_mode)
+            return Session(uri, session_mode)
         except ImportError:
             # Fall back to older GnuCash API (< 4.0)
             if mode == SessionMode.READ_ONLY:
-                self.session = Session(uri, ignore_lock=True)
+                return Session(uri, ignore_lock=True)
             elif mode == SessionMode.NEW:
-                self.session = Session(uri, is_new=True)
+                return Session(uri, is_new=True)
             else:
-                self.session = Session(uri)
-
-        self._book = self.session.book
+                return Session(uri)
 
     def close(self):
-        """Close GnuCash file session."""
+        """Close GnuCash file session (or give it back to the session pool)."""
         if self.session is not None:
-            self.session.end()
+            if self._pool is not None:
+                self._pool.release(self.file_path)
+                self._pool = None
+            else:
+                self.session.end()
             self.session = None
             self._book = None
+            self._business_index = None
 
     def save(self):
         """Save changes to GnuCash file."""
         if self.session is None:
             raise RuntimeError("No session open")
         self.session.save()
+        if self._pool is not None:
+            self._pool.saved(self.file_path)
 
     @property
     def book(self):
@@ -251,20 +289,12 @@ class GnuCashRepository:
         """
         from datetime import datetime
 
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-
-        all_transactions = self.get_all_transactions()
-        filtered = []
+        from infrastructure.gnucash.utils import query_transactions_by_date
 
-        for tx in all_transactions:
-            tx_date = tx.GetDate()
-            tx_datetime = datetime(tx_date.year, tx_date.month, tx_date.day)
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(end_date, "%Y-%m-%d").date()
 
-            if start <= tx_datetime <= end:
-                filtered.append(tx)
-
-        return filtered
+        return query_transactions_by_date(self.book, start, end)
 
     def create_transaction(
         self,
@@ -353,6 +383,51 @@ class GnuCashRepository:
         all_accounts = self.get_all_accounts()
         return [acc for acc in all_accounts if predicate(acc)]
 
+    # Business object operations
+
+    @property
+    def business_index(self) -> BusinessObjectIndex:
+        """Get the ID index of customers, vendors and invoices (built on first use)."""
+        if self._business_index is None:
+            self._business_index = BusinessObjectIndex(self.book)
+        return self._business_index
+
+    def get_invoice(self, invoice_id: str):
+        """
+        Get customer invoice by ID.
+
+        Args:
+            invoice_id: Invoice ID (e.g., "INV-2026-001")
+
+        Returns:
+            Invoice object or None if not found
+        """
+        return self.business_index.invoice(invoice_id)
+
+    def get_customer(self, customer_id: str):
+        """
+        Get customer by ID.
+
+        Args:
+            customer_id: Customer ID
+
+        Returns:
+            Customer object or None if not found
+        """
+        return self.business_index.customer(customer_id)
+
+    def get_vendor(self, vendor_id: str):
+        """
+        Get vendor by ID.
+
+        Args:
+            vendor_id: Vendor ID
+
+        Returns:
+            Vendor object or None if not found
+        """
+        return self.business_index.vendor(vendor_id)
+
     # Commodity operations
 
     def get_commodity(self, namespace: str, mnemonic: str):
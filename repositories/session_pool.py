@@ -0,0 +1,169 @@
+"""
+Open GnuCash sessions shared by every GnuCashRepository of a process.
+
+Opening a book takes its lock and loads the whole XML file, which is most of
+the run time of a quick command. A long-running process (see the serve
+command) installs a SessionPool; from then on GnuCashRepository.open()
+attaches to the pool's session for the file, opening it on first use, and
+close() detaches without ending it.
+
+The pool keeps each session the same as the file on disk:
+- When the last repository using a session closes it with unsaved changes
+  (a dry run, or a command that failed half way), the session is ended
+  without saving, so the next user loads the file again.
+- Before a session is handed out, the file's inode, size and modification
+  time are compared with those recorded when it was loaded or last saved. If
+  another program changed the file, the session is reloaded.
+- A session opened read-only is reopened normally (taking the lock) the
+  first time a repository opens the book for writing.
+
+The pool is not thread-safe; callers handle one request at a time.
+"""
+
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from repositories.gnucash_repository import GnuCashRepository, SessionMode
+
+# (inode, size, modification time in ns)
+FileSignature = Tuple[int, int, int]
+
+
+def file_signature(path: str) -> FileSignature:
+    """Identify the current contents of a file without reading it."""
+    st = os.stat(path)
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+@dataclass
+class PooledSession:
+    """One open session and what the pool knows about it"""
+
+    session: Any
+    mode: str  # SessionMode.READ_ONLY or SessionMode.NORMAL
+    signature: FileSignature
+    users: int = 0
+
+
+class SessionPool:
+    """Open sessions by file path"""
+
+    def __init__(self, open_session: Callable[[str, str], Any] = GnuCashRepository.open_session):
+        """
+        Initialize an empty pool.
+
+        Args:
+            open_session: Function opening a session for (file path, mode)
+        """
+        self._open_session = open_session
+        self._sessions: Dict[str, PooledSession] = {}
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.realpath(file_path)
+
+    def acquire(self, file_path: str, mode: str = SessionMode.NORMAL):
+        """
+        Get the open session of a book, opening or reloading it if needed.
+
+        Args:
+            file_path: Path to GnuCash XML file
+            mode: SessionMode.READ_ONLY or SessionMode.NORMAL
+
+        Returns:
+            GnuCash Session
+
+        Raises:
+            RuntimeError: If the book must be reopened for writing while
+                another repository is using it
+        """
+        key = self._key(file_path)
+        pooled = self._sessions.get(key)
+        if pooled is not None and pooled.users == 0:
+            try:
+                changed = file_signature(key) != pooled.signature
+            except OSError:
+                changed = True
+            upgrade = mode == SessionMode.NORMAL and pooled.mode == SessionMode.READ_ONLY
+            if changed or upgrade:
+                self.discard(key)
+                pooled = None
+        elif pooled is not None and mode == SessionMode.NORMAL and pooled.mode == SessionMode.READ_ONLY:
+            raise RuntimeError(f"{file_path} is open read-only and in use")
+
+        if pooled is None:
+            session = self._open_session(key, mode)
+            pooled = PooledSession(session, mode, file_signature(key))
+            self._sessions[key] = pooled
+
+        pooled.users += 1
+        return pooled.session
+
+    def release(self, file_path: str):
+        """
+        Give back a session from acquire().
+
+        The session stays open unless it has unsaved changes and no one else
+        is using it.
+
+        Args:
+            file_path: Path given to acquire()
+        """
+        key = self._key(file_path)
+        pooled = self._sessions.get(key)
+        if pooled is None:
+            return
+        pooled.users = max(0, pooled.users - 1)
+        if pooled.users == 0 and pooled.session.book.session_not_saved():
+            self.discard(key)
+
+    def saved(self, file_path: str):
+        """
+        Record that a session was saved, so its own save is not taken for an
+        outside change.
+
+        Args:
+            file_path: Path given to acquire()
+        """
+        key = self._key(file_path)
+        pooled = self._sessions.get(key)
+        if pooled is not None:
+            pooled.signature = file_signature(key)
+
+    def discard(self, file_path: str):
+        """
+        End a book's session without saving.
+
+        Args:
+            file_path: Path to GnuCash XML file
+        """
+        pooled = self._sessions.pop(self._key(file_path), None)
+        if pooled is not None:
+            pooled.session.end()
+
+    def close_all(self):
+        """End every session without saving."""
+        for key in list(self._sessions):
+            self.discard(key)
+
+    def books(self) -> List[Tuple[str, str]]:
+        """
+        List the open books.
+
+        Returns:
+            (real path, mode) of each open session
+        """
+        return [(key, pooled.mode) for key, pooled in sorted(self._sessions.items())]
+
+    @contextmanager
+    def installed(self) -> Iterator['SessionPool']:
+        """Make GnuCashRepository use this pool inside a with block; end every session after it."""
+        previous = GnuCashRepository.session_pool
+        GnuCashRepository.session_pool = self
+        try:
+            yield self
+        finally:
+            GnuCashRepository.session_pool = previous
+            self.close_all()
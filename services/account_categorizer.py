@@ -10,6 +10,9 @@ from typing import Dict, List, Optional, Tuple
 import gnucash
 from gnucash import Account
 
+from services.account_category import AccountCategory
+from services.balance_checker import imbalance
+
 
 class AccountType:
     """Account type constants matching GnuCash types"""
@@ -29,16 +32,6 @@ class AccountType:
     TRADING = gnucash.ACCT_TYPE_TRADING
 
 
-class AccountCategory:
-    """High-level account category groupings"""
-    ASSET = "Asset"
-    LIABILITY = "Liability"
-    INCOME = "Income"
-    EXPENSE = "Expense"
-    EQUITY = "Equity"
-    OTHER = "Other"
-
-
 class AccountCategorizer:
     """Service for categorizing and analyzing GnuCash accounts"""
 
@@ -341,9 +334,13 @@ class AccountCategorizer:
         """
         Check if splits balance (sum to zero).
 
+        Values with different denominators are brought to their common
+        denominator first, so the sum is exact.
+
         Args:
             splits: List of Split objects
-            tolerance_numerator: Tolerance for rounding (default 0 = exact)
+            tolerance_numerator: Tolerance for rounding, in units of the common
+                denominator (default 0 = exact)
 
         Returns:
             True if balanced within tolerance
@@ -351,12 +348,15 @@ class AccountCategorizer:
         if not splits:
             return True
 
-        # Sum all split values
-        total_num = 0
-
+        values = []
         for split in splits:
             value = split.GetValue()
-            total_num += value.num()
+            values.append((value.num(), value.denom()))
+
+        try:
+            total_num, _ = imbalance(values)
+        except ValueError:
+            return False
 
         # Check if within tolerance
         return abs(total_num) <= tolerance_numerator
@@ -0,0 +1,17 @@
+"""
+High-level account categories.
+
+Kept apart from services/account_categorizer.py, which needs the GnuCash
+bindings, so reports built from plain snapshots can use the categories without
+importing GnuCash.
+"""
+
+
+class AccountCategory:
+    """High-level account category groupings"""
+    ASSET = "Asset"
+    LIABILITY = "Liability"
+    INCOME = "Income"
+    EXPENSE = "Expense"
+    EQUITY = "Equity"
+    OTHER = "Other"
@@ -0,0 +1,137 @@
+"""
+Receivables and payables aging.
+
+Each open invoice or bill is one OpenItem: its owner, due date and the balance
+of its posted lot as of the report date. Items are bucketed by days past due
+with a bisect over the sorted bucket limits (e.g. 30, 60, 90 gives Current,
+1-30, 31-60, 61-90 and Over 90) and totalled per owner and currency. Owners
+are told apart by their ID, so two customers sharing a name get two rows.
+
+The result is a PeriodReport whose columns are the buckets plus a total, so it
+prints with the same text and CSV renderers as the period reports.
+Receivable amounts are what customers owe; payable amounts are what is owed
+to vendors. Both are positive while a balance is outstanding.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date
+from fractions import Fraction
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from services.period_report import PeriodReport, ReportRow, ReportSection
+
+RECEIVABLE = "Receivable"
+PAYABLE = "Payable"
+
+DEFAULT_BUCKETS = (30, 60, 90)
+
+
+@dataclass(frozen=True)
+class OpenItem:
+    """Outstanding balance of one posted invoice or bill"""
+
+    kind: str  # RECEIVABLE or PAYABLE
+    owner_id: str  # customer or vendor ID
+    owner: str  # customer or vendor name
+    invoice_id: str
+    due: date
+    currency: str
+    balance: Fraction  # positive while outstanding
+
+
+def parse_buckets(text: str) -> List[int]:
+    """
+    Parse bucket limits such as "30,60,90".
+
+    Args:
+        text: Comma-separated day counts
+
+    Returns:
+        Sorted, distinct, positive day counts
+
+    Raises:
+        ValueError: If a limit is not a positive integer
+    """
+    try:
+        limits = sorted({int(part) for part in text.split(",") if part.strip()})
+    except ValueError as e:
+        raise ValueError(f"Buckets must be comma-separated day counts, got: {text}") from e
+    if not limits or limits[0] < 1:
+        raise ValueError(f"Buckets must be positive day counts, got: {text}")
+    return limits
+
+
+def bucket_labels(limits: Sequence[int]) -> List[str]:
+    """
+    Column labels for bucket limits.
+
+    Args:
+        limits: Sorted day counts, e.g. [30, 60, 90]
+
+    Returns:
+        Labels, e.g. ["Current", "1-30", "31-60", "61-90", "Over 90"]
+    """
+    labels = ["Current"]
+    lower = 1
+    for limit in limits:
+        labels.append(f"{lower}-{limit}")
+        lower = limit + 1
+    labels.append(f"Over {limits[-1]}")
+    return labels
+
+
+def bucket_index(days_overdue: int, limits: Sequence[int]) -> int:
+    """
+    Column of an item that is days_overdue past its due date.
+
+    Args:
+        days_overdue: as_of - due, in days (zero or negative is current)
+        limits: Sorted day counts
+
+    Returns:
+        Index into bucket_labels(limits)
+    """
+    if days_overdue <= 0:
+        return 0
+    return bisect_left(limits, days_overdue) + 1
+
+
+def aging_report(items: Iterable[OpenItem], as_of: date, limits: Sequence[int]) -> PeriodReport:
+    """
+    Bucket open items by days past due, per owner and currency.
+
+    Args:
+        items: Open items as of the report date
+        as_of: Report date
+        limits: Sorted day counts
+
+    Returns:
+        PeriodReport with Receivable and Payable sections (empty ones are left
+        out); each row and total has one amount per bucket and then the total
+    """
+    labels = bucket_labels(limits)
+    columns = len(labels) + 1
+
+    # (kind, owner name, owner ID, currency) -> amounts; the name only sorts and labels
+    rows: Dict[Tuple[str, str, str, str], List[Fraction]] = {}
+    for item in items:
+        key = (item.kind, item.owner, item.owner_id, item.currency)
+        amounts = rows.setdefault(key, [Fraction(0)] * columns)
+        amounts[bucket_index((as_of - item.due).days, limits)] += item.balance
+        amounts[-1] += item.balance
+
+    report = PeriodReport(f"Aging as of {as_of.isoformat()}", labels + ["Total"])
+    for kind in (RECEIVABLE, PAYABLE):
+        section = ReportSection(kind)
+        for (row_kind, owner, _, currency), amounts in sorted(rows.items()):
+            if row_kind != kind:
+                continue
+            section.rows.append(ReportRow(owner, 0, currency, amounts))
+            totals = section.totals.setdefault(currency, [Fraction(0)] * columns)
+            for i, amount in enumerate(amounts):
+                totals[i] += amount
+        if section.rows:
+            section.totals = dict(sorted(section.totals.items()))
+            report.sections.append(section)
+    return report
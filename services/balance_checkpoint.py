@@ -0,0 +1,222 @@
+"""
+Per-account balance checkpoints stored in a sidecar file.
+
+Once books are closed for a year, the splits on or before the closing date are
+settled history. A checkpoint records, for one account, its balance as of a
+date and how many splits it had on or before that date. BalanceLedger can then
+seed an account's history from the checkpoint and read only the splits after it.
+
+A checkpoint is used only while it still describes the account:
+- the account has at least split_count splits, the split at split_count - 1 is
+  posted on or before the checkpoint date and the next one after it (the
+  engine keeps each account's split list sorted by posted date), and
+- when the engine balance was recorded, xaccAccountGetBalanceAsOfDate still
+  returns it, which catches edited amounts in the closed period.
+Anything else (a back-dated entry, a deleted or edited split) makes the ledger
+fall back to reading the account's full history.
+
+The Python bindings do not expose arbitrary KVP slots, so checkpoints live in a
+JSON file next to the book, keyed by account GUID.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from fractions import Fraction
+from typing import Dict, Optional, Sequence
+
+CHECKPOINT_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class BalanceCheckpoint:
+    """Balance of one account as of a date"""
+
+    as_of: date
+    balance: Fraction  # sum of split values on or before as_of
+    split_count: int  # number of splits on or before as_of
+    engine_balance: Optional[Fraction] = None  # xaccAccountGetBalanceAsOfDate, if available
+
+
+def _engine_balance(account, as_of: date) -> Optional[Fraction]:
+    """Engine balance of splits posted on or before as_of, or None if unsupported."""
+    if not hasattr(account, 'GetBalanceAsOfDate'):
+        return None
+    balance = account.GetBalanceAsOfDate(datetime.combine(as_of + timedelta(days=1), time.min))
+    return Fraction(balance.num(), balance.denom())
+
+
+def _split_date(split) -> date:
+    posted = split.GetParent().GetDate()
+    return date(posted.year, posted.month, posted.day)
+
+
+def is_valid(checkpoint: BalanceCheckpoint, account, splits: Sequence) -> bool:
+    """
+    Check that a checkpoint still matches an account.
+
+    Args:
+        checkpoint: Checkpoint to verify
+        account: GnuCash Account object
+        splits: The account's split list (account.GetSplitList())
+
+    Returns:
+        True if the first split_count splits are exactly those on or before
+        the checkpoint date and the recorded engine balance (if any) is unchanged
+    """
+    count = checkpoint.split_count
+    if count > len(splits):
+        return False
+    if count > 0 and _split_date(splits[count - 1]) > checkpoint.as_of:
+        return False
+    if count < len(splits) and _split_date(splits[count]) <= checkpoint.as_of:
+        return False
+
+    return (
+        checkpoint.engine_balance is None
+        or _engine_balance(account, checkpoint.as_of) == checkpoint.engine_balance
+    )
+
+
+class BalanceCheckpoints:
+    """Balance checkpoints of a book, stored in a JSON sidecar file"""
+
+    def __init__(self, path: str):
+        """
+        Initialize an empty checkpoint store.
+
+        Args:
+            path: Sidecar file path
+        """
+        self.path = path
+        self.used = 0
+        self.rejected = 0
+        self._entries: Dict[str, Dict] = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'BalanceCheckpoints':
+        """
+        Load checkpoints from their sidecar file.
+
+        A missing, unreadable or incompatible file gives an empty store.
+
+        Args:
+            path: Sidecar file path
+
+        Returns:
+            BalanceCheckpoints
+        """
+        checkpoints = cls(path)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return checkpoints
+
+        if isinstance(data, dict) and data.get('version') == CHECKPOINT_FORMAT_VERSION:
+            checkpoints._entries = data.get('accounts', {})
+        return checkpoints
+
+    @staticmethod
+    def default_path(gnucash_file: str) -> str:
+        """
+        Sidecar path for a GnuCash file.
+
+        Args:
+            gnucash_file: Path to GnuCash file
+
+        Returns:
+            Path of the checkpoint file next to it
+        """
+        return f"{gnucash_file}.balance-checkpoints.json"
+
+    def get(self, account) -> Optional[BalanceCheckpoint]:
+        """
+        Stored checkpoint of an account (not verified).
+
+        Args:
+            account: GnuCash Account object
+
+        Returns:
+            BalanceCheckpoint, or None if the account has none
+        """
+        entry = self._entries.get(account.GetGUID().to_string())
+        if entry is None:
+            return None
+
+        engine_balance = None
+        if entry.get('engine_num') is not None:
+            engine_balance = Fraction(entry['engine_num'], entry['engine_denom'])
+
+        return BalanceCheckpoint(
+            as_of=date.fromisoformat(entry['date']),
+            balance=Fraction(entry['num'], entry['denom']),
+            split_count=entry['splits'],
+            engine_balance=engine_balance,
+        )
+
+    def usable(self, account, splits: Sequence, before: Optional[date] = None) -> Optional[BalanceCheckpoint]:
+        """
+        Checkpoint of an account that can seed its history.
+
+        Args:
+            account: GnuCash Account object
+            splits: The account's split list (account.GetSplitList())
+            before: Only use a checkpoint dated strictly before this date
+
+        Returns:
+            Verified BalanceCheckpoint, or None
+        """
+        checkpoint = self.get(account)
+        if checkpoint is None or (before is not None and checkpoint.as_of >= before):
+            return None
+        if not is_valid(checkpoint, account, splits):
+            self.rejected += 1
+            return None
+        self.used += 1
+        return checkpoint
+
+    def record(self, account, as_of: date, balance: Fraction, split_count: int):
+        """
+        Store a checkpoint for an account, replacing any earlier one.
+
+        The engine balance as of the date is recorded too when the bindings
+        provide it, so later edits to amounts in the closed period are detected.
+
+        Args:
+            account: GnuCash Account object
+            as_of: Checkpoint date
+            balance: Sum of split values on or before as_of
+            split_count: Number of splits on or before as_of
+        """
+        entry = {
+            'date': as_of.isoformat(),
+            'num': balance.numerator,
+            'denom': balance.denominator,
+            'splits': split_count,
+        }
+        engine_balance = _engine_balance(account, as_of)
+        if engine_balance is not None:
+            entry['engine_num'] = engine_balance.numerator
+            entry['engine_denom'] = engine_balance.denominator
+        self._entries[account.GetGUID().to_string()] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self):
+        """
+        Write the checkpoints.
+
+        The file is written to a temporary name and renamed, so an interrupted
+        run never leaves a truncated file behind.
+        """
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(
+                {'version': CHECKPOINT_FORMAT_VERSION, 'accounts': self._entries},
+                f,
+                separators=(',', ':')
+            )
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,232 @@
+"""
+Prefix-sum balance ledger.
+
+Reads each account's splits once, sorts them by posted date and keeps cumulative
+balances as integers over a per-account common denominator. "Balance as of D" is
+then a bisect into the sorted dates instead of a scan of the account's history,
+and one build can answer any number of balance queries (closing checks, per-currency
+grouping, reports for several dates).
+
+An account can be seeded from a balance checkpoint (services.balance_checkpoint),
+in which case only its splits after the checkpoint date are read. Such an
+account cannot answer for dates before the checkpoint, and transactions on or
+before it are not excludable.
+"""
+
+from bisect import bisect_right
+from datetime import date
+from fractions import Fraction
+from math import gcd
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from services.balance_checkpoint import BalanceCheckpoint, BalanceCheckpoints
+from services.balance_provider import BalanceProvider
+
+
+class AccountHistory:
+    """Date-sorted split values of one account with cumulative sums"""
+
+    __slots__ = ('denom', 'ordinals', 'cumulative', 'values_by_guid', 'floor', 'base_total', 'base_count')
+
+    def __init__(
+        self,
+        entries: List[Tuple[int, str, int, int]],
+        checkpoint: Optional[BalanceCheckpoint] = None,
+    ):
+        """
+        Build from unsorted entries.
+
+        Args:
+            entries: (date ordinal, transaction GUID, value numerator, value denominator)
+            checkpoint: Balance the entries start from; entries must all be after its date
+        """
+        entries.sort(key=lambda entry: entry[0])
+
+        denom = checkpoint.balance.denominator if checkpoint is not None else 1
+        for _, _, _, value_denom in entries:
+            denom = denom // gcd(denom, value_denom) * value_denom
+        self.denom = denom
+
+        self.floor: Optional[int] = None
+        self.base_total = 0
+        self.base_count = 0
+        if checkpoint is not None:
+            self.floor = checkpoint.as_of.toordinal()
+            self.base_total = checkpoint.balance.numerator * (denom // checkpoint.balance.denominator)
+            self.base_count = checkpoint.split_count
+
+        self.ordinals: List[int] = []
+        self.cumulative: List[int] = []
+        self.values_by_guid: Dict[str, List[Tuple[int, int]]] = {}
+
+        total = self.base_total
+        for ordinal, guid, num, value_denom in entries:
+            scaled = num * (denom // value_denom)
+            total += scaled
+            self.ordinals.append(ordinal)
+            self.cumulative.append(total)
+            self.values_by_guid.setdefault(guid, []).append((ordinal, scaled))
+
+    def balance_as_of(self, as_of: date, exclude_guids: Optional[Set[str]] = None) -> Fraction:
+        """
+        Balance of splits posted on or before as_of.
+
+        Args:
+            as_of: Include splits on or before this date
+            exclude_guids: Transaction GUIDs to leave out
+
+        Returns:
+            Balance as a Fraction
+
+        Raises:
+            ValueError: If as_of is before the checkpoint the history starts from
+        """
+        ordinal = self._check_floor(as_of)
+        index = bisect_right(self.ordinals, ordinal)
+        total = self.cumulative[index - 1] if index else self.base_total
+
+        if exclude_guids:
+            for guid in exclude_guids:
+                for value_ordinal, scaled in self.values_by_guid.get(guid, ()):
+                    if value_ordinal <= ordinal:
+                        total -= scaled
+
+        return Fraction(total, self.denom)
+
+    def split_count_as_of(self, as_of: date) -> int:
+        """
+        Number of splits posted on or before as_of.
+
+        Args:
+            as_of: Count splits on or before this date
+
+        Returns:
+            Split count
+
+        Raises:
+            ValueError: If as_of is before the checkpoint the history starts from
+        """
+        return self.base_count + bisect_right(self.ordinals, self._check_floor(as_of))
+
+    def _check_floor(self, as_of: date) -> int:
+        """Return as_of's ordinal, rejecting dates before the checkpoint."""
+        ordinal = as_of.toordinal()
+        if self.floor is not None and ordinal < self.floor:
+            raise ValueError(
+                f"History starts from a checkpoint on {date.fromordinal(self.floor)}; "
+                f"no balance as of {as_of}"
+            )
+        return ordinal
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+
+class BalanceLedger(BalanceProvider):
+    """Balances as of any date for a set of accounts, from one pass over their splits"""
+
+    name = "python"
+
+    def __init__(self):
+        """Initialize an empty ledger"""
+        self._histories: Dict[int, AccountHistory] = {}
+
+    @classmethod
+    def from_accounts(
+        cls,
+        accounts: Iterable,
+        checkpoints: Optional[BalanceCheckpoints] = None,
+        before: Optional[date] = None,
+    ) -> 'BalanceLedger':
+        """
+        Build a ledger for the given accounts.
+
+        Args:
+            accounts: GnuCash Account objects
+            checkpoints: Checkpoints to start accounts from, where still valid
+            before: Only use checkpoints dated strictly before this date (the
+                earliest date the ledger will be asked about)
+
+        Returns:
+            BalanceLedger
+        """
+        ledger = cls()
+        for account in accounts:
+            ledger.add_account(account, checkpoints, before)
+        return ledger
+
+    def add_account(
+        self,
+        account,
+        checkpoints: Optional[BalanceCheckpoints] = None,
+        before: Optional[date] = None,
+    ):
+        """
+        Read an account's splits into the ledger.
+
+        Args:
+            account: GnuCash Account object
+            checkpoints: Checkpoints to start the account from, if still valid
+            before: Only use a checkpoint dated strictly before this date
+        """
+        splits = account.GetSplitList()
+        checkpoint = None
+        if checkpoints is not None:
+            checkpoint = checkpoints.usable(account, splits, before)
+        if checkpoint is not None:
+            splits = splits[checkpoint.split_count:]
+
+        entries = []
+        for split in splits:
+            tx = split.GetParent()
+            tx_date = tx.GetDate()
+            ordinal = date(tx_date.year, tx_date.month, tx_date.day).toordinal()
+            guid = tx.GetGUID().to_string()
+            value = split.GetValue()
+            entries.append((ordinal, guid, value.num(), value.denom()))
+
+        self._histories[int(account.instance)] = AccountHistory(entries, checkpoint)
+
+    def __contains__(self, account) -> bool:
+        return int(account.instance) in self._histories
+
+    def balance_as_of(
+        self,
+        account,
+        as_of: date,
+        exclude_guids: Optional[Set[str]] = None,
+    ) -> Fraction:
+        """
+        Account balance as of a date (sum of split values on or before it).
+
+        Positive = debit balance, Negative = credit balance.
+
+        Args:
+            account: GnuCash Account object (must have been added)
+            as_of: Include splits on or before this date
+            exclude_guids: Transaction GUIDs to leave out
+
+        Returns:
+            Balance as a Fraction
+
+        Raises:
+            KeyError: If the account is not in the ledger
+        """
+        return self._histories[int(account.instance)].balance_as_of(as_of, exclude_guids)
+
+    def split_count_as_of(self, account, as_of: date) -> int:
+        """
+        Number of the account's splits posted on or before a date.
+
+        Args:
+            account: GnuCash Account object (must have been added)
+            as_of: Count splits on or before this date
+
+        Returns:
+            Split count
+
+        Raises:
+            KeyError: If the account is not in the ledger
+        """
+        return self._histories[int(account.instance)].split_count_as_of(as_of)
+
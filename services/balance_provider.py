@@ -0,0 +1,190 @@
+"""
+Balance providers for BookCloser.
+
+A balance provider answers "balance of this account as of this date". Two
+implementations exist:
+
+- BalanceLedger (services.balance_ledger): reads each account's splits once into
+  Python prefix sums. Exact, independent of the engine, and the default.
+- EngineBalanceProvider: asks the GnuCash engine, which already keeps a sorted
+  split list with running balances per account (xaccAccountGetBalanceAsOfDate),
+  so there is no build step at all.
+
+VerifyingBalanceProvider runs both and raises BalanceMismatchError on the first
+disagreement, which makes it easy to check the engine provider against a real book.
+
+The engine balance is in the account's commodity (split amounts), while
+BalanceLedger sums split values (transaction currency). They are the same
+whenever a transaction's currency is the account's commodity, which is how
+Income/Expense accounts are normally used.
+"""
+
+from datetime import date, datetime, time, timedelta
+from fractions import Fraction
+from typing import Optional, Set
+
+# Balance sources accepted by BookCloser.build_balance_provider
+BALANCE_SOURCES = ("python", "engine", "verify")
+
+
+class BalanceMismatchError(ValueError):
+    """Raised by VerifyingBalanceProvider when two providers disagree"""
+    pass
+
+
+class BalanceProvider:
+    """Interface shared by all balance providers"""
+
+    name = ""
+
+    def balance_as_of(
+        self,
+        account,
+        as_of: date,
+        exclude_guids: Optional[Set[str]] = None,
+    ) -> Fraction:
+        """
+        Account balance as of a date (splits on or before it).
+
+        Positive = debit balance, Negative = credit balance.
+
+        Args:
+            account: GnuCash Account object
+            as_of: Include splits on or before this date
+            exclude_guids: Transaction GUIDs to leave out
+
+        Returns:
+            Balance as a Fraction
+        """
+        raise NotImplementedError
+
+
+def engine_balances_supported() -> bool:
+    """
+    Check whether the installed bindings expose balance-as-of-date queries.
+
+    Returns:
+        True if Account.GetBalanceAsOfDate is available
+    """
+    from gnucash import Account
+
+    return hasattr(Account, 'GetBalanceAsOfDate')
+
+
+def _posted_date(transaction) -> date:
+    posted = transaction.GetDate()
+    return date(posted.year, posted.month, posted.day)
+
+
+class EngineBalanceProvider(BalanceProvider):
+    """Balances from the engine's per-account running balances"""
+
+    name = "engine"
+
+    def __init__(self, book):
+        """
+        Initialize the provider.
+
+        Args:
+            book: GnuCash Book (used to look up excluded transactions)
+        """
+        self.book = book
+
+    def balance_as_of(
+        self,
+        account,
+        as_of: date,
+        exclude_guids: Optional[Set[str]] = None,
+    ) -> Fraction:
+        """
+        Account balance as of a date, from xaccAccountGetBalanceAsOfDate.
+
+        The engine counts splits posted strictly before the given time, so the
+        query uses local midnight at the start of the following day. Excluded
+        transactions that still exist in the book are looked up by GUID and their
+        splits in this account subtracted; deleted ones are already gone from
+        the engine's balance.
+
+        Args:
+            account: GnuCash Account object
+            as_of: Include splits on or before this date
+            exclude_guids: Transaction GUIDs to leave out
+
+        Returns:
+            Balance as a Fraction
+        """
+        end = datetime.combine(as_of + timedelta(days=1), time.min)
+        balance = account.GetBalanceAsOfDate(end)
+        total = Fraction(balance.num(), balance.denom())
+
+        if exclude_guids:
+            total -= self._excluded_amount(account, as_of, exclude_guids)
+
+        return total
+
+    def _excluded_amount(self, account, as_of: date, exclude_guids: Set[str]) -> Fraction:
+        """Sum of the account's split amounts in excluded transactions up to as_of."""
+        from services.transaction_matcher import GuidIndex
+
+        index = GuidIndex.from_book(self.book)
+        ptr = int(account.instance)
+
+        total = Fraction(0)
+        for guid in exclude_guids:
+            tx = index.get(guid)
+            if tx is None or _posted_date(tx) > as_of:
+                continue
+            for split in tx.GetSplitList():
+                split_account = split.GetAccount()
+                if split_account is not None and int(split_account.instance) == ptr:
+                    amount = split.GetAmount()
+                    total += Fraction(amount.num(), amount.denom())
+        return total
+
+
+class VerifyingBalanceProvider(BalanceProvider):
+    """Query two providers and fail on the first balance they disagree on"""
+
+    name = "verify"
+
+    def __init__(self, primary: BalanceProvider, reference: BalanceProvider):
+        """
+        Initialize the provider.
+
+        Args:
+            primary: Provider under test (its answers are returned)
+            reference: Provider it must agree with
+        """
+        self.primary = primary
+        self.reference = reference
+
+    def balance_as_of(
+        self,
+        account,
+        as_of: date,
+        exclude_guids: Optional[Set[str]] = None,
+    ) -> Fraction:
+        """
+        Account balance as of a date, checked against the reference provider.
+
+        Args:
+            account: GnuCash Account object
+            as_of: Include splits on or before this date
+            exclude_guids: Transaction GUIDs to leave out
+
+        Returns:
+            Balance as a Fraction
+
+        Raises:
+            BalanceMismatchError: If the providers disagree
+        """
+        balance = self.primary.balance_as_of(account, as_of, exclude_guids)
+        expected = self.reference.balance_as_of(account, as_of, exclude_guids)
+        if balance != expected:
+            from infrastructure.gnucash.utils import get_account_full_name
+
+            raise BalanceMismatchError(
+                f"{get_account_full_name(account)} as of {as_of}: "
+                f"{self.primary.name} balance {balance} != {self.reference.name} balance {expected}"
+            )
+        return balance
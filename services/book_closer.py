@@ -14,7 +14,16 @@ from typing import Dict, List, Optional, Set, Tuple
 from gnucash import Account, GncNumeric, Split, Transaction
 from gnucash.gnucash_core_c import ACCT_TYPE_EQUITY, ACCT_TYPE_EXPENSE, ACCT_TYPE_INCOME
 
-from infrastructure.gnucash.utils import find_account
+from infrastructure.gnucash.utils import find_account, query_transactions_by_date
+from services.balance_checkpoint import BalanceCheckpoints
+from services.balance_ledger import BalanceLedger
+from services.balance_provider import (
+    BALANCE_SOURCES,
+    BalanceProvider,
+    EngineBalanceProvider,
+    VerifyingBalanceProvider,
+    engine_balances_supported,
+)
 
 CLOSING_DESCRIPTION_PREFIX = "Closing entry"
 
@@ -22,6 +31,65 @@ CLOSING_DESCRIPTION_PREFIX = "Closing entry"
 class BookCloser:
     """Service for closing books with multi-currency support"""
 
+    def build_ledger(
+        self,
+        root: Account,
+        checkpoints: Optional[BalanceCheckpoints] = None,
+        before: Optional[date] = None,
+    ) -> BalanceLedger:
+        """
+        Read all Income/Expense splits once into a BalanceLedger.
+
+        is_closed and group_accounts_by_currency accept the ledger, so a closing
+        run scans history once. With checkpoints, accounts start from their last
+        valid checkpoint before `before` and only later splits are read.
+
+        Args:
+            root: Root account
+            checkpoints: Balance checkpoints to start from (optional)
+            before: Earliest date the ledger will be asked about
+
+        Returns:
+            BalanceLedger over every Income/Expense account
+        """
+        return BalanceLedger.from_accounts(
+            (
+                account for account in root.get_descendants()
+                if account.GetType() in (ACCT_TYPE_INCOME, ACCT_TYPE_EXPENSE)
+            ),
+            checkpoints,
+            before,
+        )
+
+    def record_checkpoints(self, root: Account, checkpoints: BalanceCheckpoints, as_of: date) -> int:
+        """
+        Record a balance checkpoint as of a date for every Income/Expense account.
+
+        Call after closing (and before saving the sidecar) so later runs can
+        skip the splits on or before as_of.
+
+        Args:
+            root: Root account
+            checkpoints: Checkpoint store to update
+            as_of: Checkpoint date (normally the closing date)
+
+        Returns:
+            Number of accounts checkpointed
+        """
+        ledger = self.build_ledger(root, checkpoints, before=as_of)
+        count = 0
+        for account in root.get_descendants():
+            if account.GetType() not in (ACCT_TYPE_INCOME, ACCT_TYPE_EXPENSE):
+                continue
+            checkpoints.record(
+                account,
+                as_of,
+                ledger.balance_as_of(account, as_of),
+                ledger.split_count_as_of(account, as_of),
+            )
+            count += 1
+        return count
+
     def get_balance_as_of_date(
         self,
         account: Account,
@@ -50,19 +118,88 @@ class BookCloser:
                 total += Fraction(value.num(), value.denom())
         return total
 
-    def is_closed(self, root: Account, closing_date: date) -> bool:
+    def build_balance_provider(
+        self,
+        root: Account,
+        source: str = "python",
+        checkpoints: Optional[BalanceCheckpoints] = None,
+        before: Optional[date] = None,
+    ) -> BalanceProvider:
+        """
+        Create the balance provider used for a closing run.
+
+        "python" is the BalanceLedger from build_ledger. "engine" queries the
+        engine's running balances, falling back to the ledger if the bindings do
+        not expose them. "verify" uses the engine and checks every answer against
+        the ledger.
+
+        Checkpoints only apply to the "python" source; the engine needs no scan,
+        and verification always compares against the full history.
+
+        Args:
+            root: Root account
+            source: One of BALANCE_SOURCES
+            checkpoints: Balance checkpoints for the Python ledger (optional)
+            before: Earliest date the provider will be asked about
+
+        Returns:
+            BalanceProvider over every Income/Expense account
+
+        Raises:
+            ValueError: If source is unknown
+        """
+        if source not in BALANCE_SOURCES:
+            raise ValueError(
+                f"Unknown balance source '{source}'. Available: {', '.join(BALANCE_SOURCES)}"
+            )
+
+        if source == "python" or not engine_balances_supported():
+            return self.build_ledger(root, checkpoints, before)
+
+        accounts = [
+            account for account in root.get_descendants()
+            if account.GetType() in (ACCT_TYPE_INCOME, ACCT_TYPE_EXPENSE)
+        ]
+        engine = EngineBalanceProvider(root.get_book())
+        if source == "engine":
+            return engine
+        return VerifyingBalanceProvider(engine, BalanceLedger.from_accounts(accounts))
+
+    def is_closed(
+        self,
+        root: Account,
+        closing_date: date,
+        ledger: Optional[BalanceProvider] = None,
+        exclude_guids: Optional[Set[str]] = None,
+        since: Optional[date] = None,
+    ) -> bool:
         """
         Check if books are closed as of closing_date.
 
         Definition: All Income/Expense accounts have zero balance as of the closing date.
         This is the ground truth — if balances are zero, the books are closed
         regardless of how it was achieved.
+
+        When since is given, books are taken to be closed as of that date, as in
+        group_accounts_by_currency, so only the activity after it is checked.
+
+        Args:
+            root: Root account
+            closing_date: Date to check
+            ledger: Provider from build_ledger/build_balance_provider (built here if not given)
+            exclude_guids: Transaction GUIDs to leave out of the balances
+            since: Date the books were last closed (balances start from zero after it)
         """
+        if ledger is None:
+            ledger = self.build_ledger(root)
+
         for account in root.get_descendants():
             account_type = account.GetType()
             if account_type not in (ACCT_TYPE_INCOME, ACCT_TYPE_EXPENSE):
                 continue
-            balance = self.get_balance_as_of_date(account, closing_date)
+            balance = ledger.balance_as_of(account, closing_date, exclude_guids)
+            if since is not None:
+                balance -= ledger.balance_as_of(account, since, exclude_guids)
             if balance != Fraction(0):
                 return False
         return True
@@ -72,6 +209,8 @@ class BookCloser:
         root: Account,
         closing_date: date,
         exclude_guids: Optional[Set[str]] = None,
+        ledger: Optional[BalanceProvider] = None,
+        since: Optional[date] = None,
     ) -> Dict[str, List[Tuple[Account, Fraction]]]:
         """
         Group Income/Expense accounts with non-zero balances by their commodity.
@@ -79,11 +218,21 @@ class BookCloser:
         Returns: {currency_code: [(account, balance), ...]}
         Only includes accounts with non-zero balances as of closing_date.
 
+        When since is given, books are taken to be closed as of that date (every
+        balance zero), so only activity after it counts. This lets several years
+        be closed in order from one ledger without re-reading the closing
+        transactions created for earlier years.
+
         Args:
             root: Root account
             closing_date: Date to compute balances as of
             exclude_guids: Transaction GUIDs to exclude from balance computation
+            ledger: Provider from build_ledger/build_balance_provider (built here if not given)
+            since: Date the books were last closed (balances start from zero after it)
         """
+        if ledger is None:
+            ledger = self.build_ledger(root)
+
         accounts_by_currency: Dict[str, List[Tuple[Account, Fraction]]] = {}
 
         for account in root.get_descendants():
@@ -96,7 +245,9 @@ class BookCloser:
                 continue
 
             currency_code = commodity.get_mnemonic()
-            balance = self.get_balance_as_of_date(account, closing_date, exclude_guids)
+            balance = ledger.balance_as_of(account, closing_date, exclude_guids)
+            if since is not None:
+                balance -= ledger.balance_as_of(account, since, exclude_guids)
 
             if balance != Fraction(0):
                 if currency_code not in accounts_by_currency:
@@ -106,32 +257,27 @@ class BookCloser:
         return accounts_by_currency
 
     def find_closing_transactions(
-        self, root: Account, closing_date: date
+        self,
+        root: Account,
+        closing_date: date,
     ) -> List[Transaction]:
         """
         Find existing closing transactions on the given date.
 
         Identifies by: date == closing_date AND description starts with "Closing entry ("
-        Returns unique transactions (deduped by GUID).
-        """
-        closing_txns = []
-        seen_guids: Set[str] = set()
+        A QOF date query fetches only the transactions posted on closing_date, so
+        the rest of the book is never visited, whatever the balance source.
 
-        for account in root.get_descendants():
-            for split in account.GetSplitList():
-                tx = split.GetParent()
-                tx_date = tx.GetDate()
-                if date(tx_date.year, tx_date.month, tx_date.day) != closing_date:
-                    continue
-                desc = tx.GetDescription()
-                if not desc.startswith(f"{CLOSING_DESCRIPTION_PREFIX} ("):
-                    continue
-                guid = tx.GetGUID().to_string()
-                if guid not in seen_guids:
-                    seen_guids.add(guid)
-                    closing_txns.append(tx)
+        Args:
+            root: Root account
+            closing_date: Date of the closing entries
+        """
+        candidates = query_transactions_by_date(root.get_book(), closing_date, closing_date)
 
-        return closing_txns
+        return [
+            tx for tx in candidates
+            if tx.GetDescription().startswith(f"{CLOSING_DESCRIPTION_PREFIX} (")
+        ]
 
     def get_or_create_equity_account(
         self,
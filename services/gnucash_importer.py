@@ -7,7 +7,7 @@ Converts PlaintextDirective objects from the parser into GnuCash objects
 
 import logging
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 
 import gnucash.gnucash_core_c as gc
 from gnucash import Account, Book, GncCommodity, GncNumeric, Split, Transaction
@@ -28,6 +28,7 @@ from gnucash.gnucash_core_c import (
     gncTaxTableEntrySetAccount,
 )
 
+from infrastructure.gnucash.business_index import BusinessObjectIndex
 from infrastructure.gnucash.utils import find_account, string_to_gnc_numeric
 from services.plaintext_parser import DirectiveType, PlaintextDirective
 
@@ -77,6 +78,59 @@ def create_tax_table_entry(book, account, amount_percent):
     return TaxTableEntry(instance=raw)
 
 
+class ImportContext:
+    """
+    Lookups shared by the business objects of one import run.
+
+    Every invoice and bill entry, posting and payment names its account, tax
+    table and owner, and most name the same few. The context resolves each
+    name once: accounts by full path, currencies by mnemonic, tax tables by
+    name, customers and vendors by ID (through BusinessObjectIndex). Misses are
+    not cached, so objects created later in the run are still found.
+    """
+
+    def __init__(self, book: Book):
+        self.book = book
+        self.index = BusinessObjectIndex(book)
+        self._root = None
+        self._accounts: Dict[str, Account] = {}
+        self._currencies: Dict[str, GncCommodity] = {}
+        self._tax_tables: Dict[str, TaxTable] = {}
+
+    def account(self, path: str) -> Optional[Account]:
+        account = self._accounts.get(path)
+        if account is None:
+            if self._root is None:
+                self._root = self.book.get_root_account()
+            account = find_account(self._root, path)
+            if account is not None:
+                self._accounts[path] = account
+        return account
+
+    def currency(self, mnemonic: str) -> Optional[GncCommodity]:
+        currency = self._currencies.get(mnemonic)
+        if currency is None:
+            currency = self.book.get_table().lookup("CURRENCY", mnemonic)
+            if currency is not None:
+                self._currencies[mnemonic] = currency
+        return currency
+
+    def tax_table(self, name: str) -> Optional[TaxTable]:
+        tax_table = self._tax_tables.get(name)
+        if tax_table is None:
+            tt_ptr = gc.gncTaxTableLookupByName(self.book.instance, name)
+            if tt_ptr:
+                tax_table = TaxTable(instance=tt_ptr)
+                self._tax_tables[name] = tax_table
+        return tax_table
+
+    def customer(self, customer_id: str):
+        return self.index.customer(customer_id)
+
+    def vendor(self, vendor_id: str):
+        return self.index.vendor(vendor_id)
+
+
 class GnuCashImporter:
     """Service for importing plaintext directives to GnuCash"""
 
@@ -277,11 +331,12 @@ class GnuCashImporter:
         return True
 
     @staticmethod
-    def import_customer(directive: PlaintextDirective, book: Book):
+    def import_customer(directive: PlaintextDirective, book: Book, context: Optional[ImportContext] = None):
         if directive.type != DirectiveType.CUSTOMER:
             raise ValueError(f"Expected CUSTOMER but got {directive.type}")
 
-        customer = Customer(book, directive.props['id'], book.get_table().lookup("CURRENCY", directive.metadata['currency']))
+        context = context or ImportContext(book)
+        customer = Customer(book, directive.props['id'], context.currency(directive.metadata['currency']))
         customer.BeginEdit()
         customer.SetName(directive.metadata['name'])
 
@@ -296,21 +351,24 @@ class GnuCashImporter:
         logging.debug(f"Created customer {directive.props['id']}")
 
     @staticmethod
-    def import_vendor(directive: PlaintextDirective, book: Book):
+    def import_vendor(directive: PlaintextDirective, book: Book, context: Optional[ImportContext] = None):
         if directive.type != DirectiveType.VENDOR:
             raise ValueError(f"Expected VENDOR but got {directive.type}")
 
-        vendor = Vendor(book, directive.props['id'], book.get_table().lookup("CURRENCY", directive.metadata['currency']))
+        context = context or ImportContext(book)
+        vendor = Vendor(book, directive.props['id'], context.currency(directive.metadata['currency']))
         vendor.BeginEdit()
         vendor.SetName(directive.metadata['name'])
         vendor.CommitEdit()
         logging.debug(f"Created vendor {directive.props['id']}")
 
     @staticmethod
-    def import_taxtable(directive: PlaintextDirective, book: Book):
+    def import_taxtable(directive: PlaintextDirective, book: Book, context: Optional[ImportContext] = None):
         if directive.type != DirectiveType.TAXTABLE:
             raise ValueError(f"Expected TAXTABLE but got {directive.type}")
 
+        context = context or ImportContext(book)
+
         first_entry_directive = None
         for d in directive.children:
             if d.type == DirectiveType.TAXTABLE_ENTRY:
@@ -321,7 +379,7 @@ class GnuCashImporter:
             # A taxtable must have at least one entry
             return
 
-        account = find_account(book.get_root_account(), first_entry_directive.metadata['account'])
+        account = context.account(first_entry_directive.metadata['account'])
         rate_str = first_entry_directive.metadata['rate']
         rate = float(rate_str.replace("%", ""))
         first_entry = create_tax_table_entry(book, account, rate)
@@ -330,7 +388,7 @@ class GnuCashImporter:
 
         for entry_directive in directive.children[1:]:
             if entry_directive.type == DirectiveType.TAXTABLE_ENTRY:
-                account = find_account(book.get_root_account(), entry_directive.metadata['account'])
+                account = context.account(entry_directive.metadata['account'])
                 rate_str = entry_directive.metadata['rate']
                 rate = float(rate_str.replace("%", ""))
                 entry = create_tax_table_entry(book, account, rate)
@@ -339,11 +397,16 @@ class GnuCashImporter:
         logging.debug(f"Created taxtable {directive.props['name']}")
 
     @staticmethod
-    def import_invoice(directive: PlaintextDirective, book: Book):
+    def import_invoice(directive: PlaintextDirective, book: Book, context: Optional[ImportContext] = None):
         if directive.type != DirectiveType.INVOICE:
             raise ValueError(f"Expected INVOICE but got {directive.type}")
 
-        invoice = Invoice(book, directive.props['id'], book.get_table().lookup("CURRENCY", directive.metadata['currency']), book.CustomerLookupByID(directive.metadata['customer_id']))
+        context = context or ImportContext(book)
+        customer = context.customer(directive.metadata['customer_id'])
+        if customer is None:
+            raise ValueError(f"Customer '{directive.metadata['customer_id']}' not found for invoice '{directive.props['id']}'")
+
+        invoice = Invoice(book, directive.props['id'], context.currency(directive.metadata['currency']), customer)
         invoice.BeginEdit()
         invoice.SetDateOpened(datetime.strptime(directive.metadata['date_opened'], "%Y-%m-%d"))
 
@@ -359,19 +422,19 @@ class GnuCashImporter:
                 entry.SetDate(datetime.strptime(entry_directive.metadata['date'], "%Y-%m-%d"))
                 entry.SetDescription(entry_directive.metadata['description'])
                 entry.SetAction(entry_directive.metadata['action'])
-                entry.SetInvAccount(find_account(book.get_root_account(), entry_directive.metadata['account']))
+                entry.SetInvAccount(context.account(entry_directive.metadata['account']))
                 entry.SetQuantity(string_to_gnc_numeric_quantity(entry_directive.metadata['quantity']))
                 entry.SetInvPrice(string_to_gnc_numeric_quantity(entry_directive.metadata['price']))
                 entry.SetInvTaxable(entry_directive.metadata['taxable'] == 'true')
                 entry.SetInvTaxIncluded(entry_directive.metadata['tax_included'] == 'true')
                 if 'tax_table' in entry_directive.metadata:
-                    tt_ptr = gc.gncTaxTableLookupByName(book.instance, entry_directive.metadata['tax_table'])
-                    if tt_ptr:
-                        entry.SetInvTaxTable(TaxTable(instance=tt_ptr))
+                    tax_table = context.tax_table(entry_directive.metadata['tax_table'])
+                    if tax_table is not None:
+                        entry.SetInvTaxTable(tax_table)
                 invoice.AddEntry(entry)
                 entry.CommitEdit()
             elif entry_directive.type == DirectiveType.POSTED:
-                ar_account = find_account(book.get_root_account(), entry_directive.metadata['ar_account'])
+                ar_account = context.account(entry_directive.metadata['ar_account'])
                 post_date = datetime.strptime(entry_directive.metadata['date'], "%Y-%m-%d")
                 due_date = datetime.strptime(entry_directive.metadata['due'], "%Y-%m-%d")
                 memo = entry_directive.metadata['memo']
@@ -386,7 +449,7 @@ class GnuCashImporter:
                     posting_txn.SetNotes("business_generated: true")
                     posting_txn.CommitEdit()
             elif entry_directive.type == DirectiveType.PAYMENT:
-                bank_account = find_account(book.get_root_account(), entry_directive.metadata['bank_account'])
+                bank_account = context.account(entry_directive.metadata['bank_account'])
                 pay_date = datetime.strptime(entry_directive.metadata['date'], "%Y-%m-%d")
                 amount = string_to_gnc_numeric_quantity(entry_directive.metadata['amount'])
                 memo = entry_directive.metadata['memo']
@@ -398,12 +461,17 @@ class GnuCashImporter:
         logging.debug(f"Created invoice {directive.props['id']}")
 
     @staticmethod
-    def import_bill(directive: PlaintextDirective, book: Book):
+    def import_bill(directive: PlaintextDirective, book: Book, context: Optional[ImportContext] = None):
         if directive.type != DirectiveType.BILL:
             raise ValueError(f"Expected BILL but got {directive.type}")
 
+        context = context or ImportContext(book)
+        vendor = context.vendor(directive.metadata['vendor_id'])
+        if vendor is None:
+            raise ValueError(f"Vendor '{directive.metadata['vendor_id']}' not found for bill '{directive.props['id']}'")
+
         # Bills are Invoice objects whose owner is a Vendor (no separate Bill class)
-        bill = Invoice(book, directive.props['id'], book.get_table().lookup("CURRENCY", directive.metadata['currency']), book.VendorLookupByID(directive.metadata['vendor_id']))
+        bill = Invoice(book, directive.props['id'], context.currency(directive.metadata['currency']), vendor)
         bill.BeginEdit()
         bill.SetDateOpened(datetime.strptime(directive.metadata['date_opened'], "%Y-%m-%d"))
 
@@ -413,18 +481,18 @@ class GnuCashImporter:
                 entry.BeginEdit()
                 entry.SetDate(datetime.strptime(entry_directive.metadata['date'], "%Y-%m-%d"))
                 entry.SetDescription(entry_directive.metadata['description'])
-                entry.SetInvAccount(find_account(book.get_root_account(), entry_directive.metadata['account']))
+                entry.SetInvAccount(context.account(entry_directive.metadata['account']))
                 entry.SetQuantity(string_to_gnc_numeric_quantity(entry_directive.metadata['quantity']))
                 entry.SetInvPrice(string_to_gnc_numeric_quantity(entry_directive.metadata['price']))
                 entry.SetInvTaxable(entry_directive.metadata['taxable'] == 'true')
                 if 'tax_table' in entry_directive.metadata:
-                    tt_ptr = gc.gncTaxTableLookupByName(book.instance, entry_directive.metadata['tax_table'])
-                    if tt_ptr:
-                        entry.SetInvTaxTable(TaxTable(instance=tt_ptr))
+                    tax_table = context.tax_table(entry_directive.metadata['tax_table'])
+                    if tax_table is not None:
+                        entry.SetInvTaxTable(tax_table)
                 bill.AddEntry(entry)
                 entry.CommitEdit()
             elif entry_directive.type == DirectiveType.POSTED:
-                ap_account = find_account(book.get_root_account(), entry_directive.metadata['ap_account'])
+                ap_account = context.account(entry_directive.metadata['ap_account'])
                 post_date = datetime.strptime(entry_directive.metadata['date'], "%Y-%m-%d")
                 due_date = datetime.strptime(entry_directive.metadata['due'], "%Y-%m-%d")
                 memo = entry_directive.metadata['memo']
@@ -439,7 +507,7 @@ class GnuCashImporter:
                     posting_txn.SetNotes("business_generated: true")
                     posting_txn.CommitEdit()
             elif entry_directive.type == DirectiveType.PAYMENT:
-                bank_account = find_account(book.get_root_account(), entry_directive.metadata['bank_account'])
+                bank_account = context.account(entry_directive.metadata['bank_account'])
                 pay_date = datetime.strptime(entry_directive.metadata['date'], "%Y-%m-%d")
                 amount = string_to_gnc_numeric_quantity(entry_directive.metadata['amount'])
                 memo = entry_directive.metadata['memo']
@@ -451,21 +519,25 @@ class GnuCashImporter:
         logging.debug(f"Created bill {directive.props['id']}")
 
     def import_business_objects(self, directives: List[PlaintextDirective], book: Book):
+        # One context for the whole run, so each account, currency, tax table
+        # and owner is looked up once
+        context = ImportContext(book)
+
         # Import customers and vendors first
         for directive in directives:
             if directive.type == DirectiveType.CUSTOMER:
-                self.import_customer(directive, book)
+                self.import_customer(directive, book, context)
             elif directive.type == DirectiveType.VENDOR:
-                self.import_vendor(directive, book)
+                self.import_vendor(directive, book, context)
 
         # Then tax tables
         for directive in directives:
             if directive.type == DirectiveType.TAXTABLE:
-                self.import_taxtable(directive, book)
+                self.import_taxtable(directive, book, context)
 
         # Finally, invoices and bills
         for directive in directives:
             if directive.type == DirectiveType.INVOICE:
-                self.import_invoice(directive, book)
+                self.import_invoice(directive, book, context)
             elif directive.type == DirectiveType.BILL:
-                self.import_bill(directive, book)
+                self.import_bill(directive, book, context)
@@ -0,0 +1,154 @@
+"""
+Rendering of invoice XML to PDF or HTML, in a pool of warm worker processes.
+
+Turning an invoice into a PDF has two very different halves: extracting the
+invoice XML needs the open GnuCash session, while the XSLT transform and
+weasyprint layout need neither the engine nor the book. Batch printing extracts
+every invoice's XML in one session and hands the strings to this module.
+
+Compiled XSLT transforms are cached by stylesheet path and modification time,
+so a process compiles the stylesheet once and picks up edits to it. Each
+worker compiles the XSLT and (for PDF output) imports weasyprint once, in its
+initializer, and then renders as many invoices as it is given. HTML output
+stops after the XSLT transform and never loads weasyprint, for quick previews.
+This module does not import gnucash, so worker processes start without
+loading the engine.
+"""
+
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+OUTPUT_FORMATS = ('pdf', 'html')
+
+# (invoice XML string, output path)
+RenderJob = Tuple[str, str]
+# (output path, error message or None)
+RenderResult = Tuple[str, Optional[str]]
+
+_worker_transform = None
+_worker_format = 'pdf'
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_xslt(xslt_path: str, mtime_ns: int):
+    from lxml import etree as lxml_etree
+
+    return lxml_etree.XSLT(lxml_etree.parse(xslt_path))
+
+
+def compile_xslt(xslt_path: str):
+    """
+    Parse and compile an XSLT stylesheet, or return the cached transform.
+
+    Args:
+        xslt_path: Path to the stylesheet
+
+    Returns:
+        lxml.etree.XSLT transform
+    """
+    path = os.path.realpath(xslt_path)
+    return _compile_xslt(path, os.stat(path).st_mtime_ns)
+
+
+def xml_to_html(xml_str: str, transform) -> str:
+    """
+    Transform one invoice XML string to HTML.
+
+    Args:
+        xml_str: Invoice XML (see invoice_renderer.invoice_to_xml)
+        transform: Compiled XSLT transform
+
+    Returns:
+        HTML document
+    """
+    from lxml import etree as lxml_etree
+
+    return str(transform(lxml_etree.fromstring(xml_str)))
+
+
+def xml_to_pdf(xml_str: str, transform, pdf_path: str):
+    """
+    Render one invoice XML string to a PDF file.
+
+    Args:
+        xml_str: Invoice XML (see invoice_renderer.invoice_to_xml)
+        transform: Compiled XSLT transform
+        pdf_path: Output PDF path
+    """
+    import weasyprint
+
+    weasyprint.HTML(string=xml_to_html(xml_str, transform)).write_pdf(pdf_path)
+
+
+def write_output(xml_str: str, transform, path: str, output_format: str = 'pdf'):
+    """
+    Render one invoice XML string to a PDF or HTML file.
+
+    Args:
+        xml_str: Invoice XML
+        transform: Compiled XSLT transform
+        path: Output file path
+        output_format: One of OUTPUT_FORMATS
+    """
+    if output_format == 'html':
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(xml_to_html(xml_str, transform))
+    else:
+        xml_to_pdf(xml_str, transform, path)
+
+
+def _init_worker(xslt_path: str, output_format: str = 'pdf'):
+    """Compile the stylesheet and, for PDF output, load weasyprint once per worker."""
+    global _worker_transform, _worker_format
+    if output_format == 'pdf':
+        import weasyprint  # noqa: F401
+
+    _worker_transform = compile_xslt(xslt_path)
+    _worker_format = output_format
+
+
+def _render_job(job: RenderJob) -> RenderResult:
+    xml_str, path = job
+    try:
+        write_output(xml_str, _worker_transform, path, _worker_format)
+    except Exception as e:
+        return path, str(e) or e.__class__.__name__
+    return path, None
+
+
+def render_invoices(
+    jobs: Sequence[RenderJob],
+    xslt_path: str,
+    workers: Optional[int] = None,
+    output_format: str = 'pdf',
+) -> List[RenderResult]:
+    """
+    Render many invoices to PDF or HTML files.
+
+    A failing invoice does not stop the others; its error is returned instead.
+
+    Args:
+        jobs: (invoice XML, output path) pairs
+        xslt_path: Path to the stylesheet
+        workers: Number of worker processes (default: CPU count). With one
+            worker, or one job, rendering runs in this process.
+        output_format: One of OUTPUT_FORMATS
+
+    Returns:
+        (output path, error or None) for each job, in job order
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{output_format}'. Available: {', '.join(OUTPUT_FORMATS)}")
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        _init_worker(xslt_path, output_format)
+        return [_render_job(job) for job in jobs]
+
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(xslt_path, output_format)
+    ) as pool:
+        return list(pool.map(_render_job, jobs, chunksize=chunksize))
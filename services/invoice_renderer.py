@@ -3,29 +3,52 @@
 Service for rendering GnuCash invoices to PDF.
 """
 import ctypes
+import functools
+import os
 import xml.etree.ElementTree as ET
 
 import gnucash.gnucash_core_c as gc
 from gnucash import Split
 
 from infrastructure.gnucash.engine import load_gnc_engine
+from services.invoice_render_pool import compile_xslt, write_output, xml_to_pdf
 
+SLOT_KEY = '{http://www.gnucash.org/XML/slot}key'
+SLOT_VALUE = '{http://www.gnucash.org/XML/slot}value'
+BOOK_SLOTS = '{http://www.gnucash.org/XML/book}slots'
+GNC_BOOK = '{http://www.gnucash.org/XML/gnc}book'
 
-def read_book_company_info(file_path):
+# Elements the XML writer puts after the book slots; reaching one means the
+# book has no slots and there is nothing more to read.
+_AFTER_BOOK_SLOTS = frozenset(
+    '{http://www.gnucash.org/XML/gnc}' + name
+    for name in ('commodity', 'pricedb', 'account', 'transaction', 'schedxaction', 'GncInvoice')
+)
+
+
+def _open_book_xml(file_path):
     import gzip as _gz
-    import xml.etree.ElementTree
 
-    slot_key = '{http://www.gnucash.org/XML/slot}key'
-    slot_val = '{http://www.gnucash.org/XML/slot}value'
-    book_slots = '{http://www.gnucash.org/XML/book}slots'
-    gnc_book = '{http://www.gnucash.org/XML/gnc}book'
+    with open(file_path, 'rb') as f:
+        magic = f.read(2)
+    if magic == b'\x1f\x8b':
+        return _gz.open(file_path, 'rb')
+    return open(file_path, 'rb')
 
-    try:
-        with _gz.open(file_path, 'rb') as f:
-            xml_root = xml.etree.ElementTree.parse(f).getroot()
-    except Exception:
-        xml_root = xml.etree.ElementTree.parse(file_path).getroot()
 
+def _find_book_slots(f):
+    """Stream the file up to the end of the book's slots, and return them."""
+    for event, elem in ET.iterparse(f, events=('start', 'end')):
+        if event == 'end' and elem.tag == BOOK_SLOTS:
+            return elem
+        if event == 'start' and elem.tag in _AFTER_BOOK_SLOTS:
+            return None
+        if event == 'end' and elem.tag == GNC_BOOK:
+            return None
+    return None
+
+
+def _company_info_from_slots(book_slots):
     def _frame_val(parent, key):
         if parent is None:
             return None
@@ -33,17 +56,15 @@ def read_book_company_info(file_path):
         if not candidates:
             candidates = [c for c in parent if c.tag.endswith('}slot') or c.tag == 'slot']
         for slot in candidates:
-            k = slot.find(slot_key)
+            k = slot.find(SLOT_KEY)
             if k is not None and k.text == key:
-                return slot.find(slot_val)
+                return slot.find(SLOT_VALUE)
         return None
 
     def _str_val(parent, key):
         v = _frame_val(parent, key)
         return (v.text or '').strip() if v is not None else ''
 
-    book_el = xml_root.find('.//' + gnc_book)
-    book_slots = book_el.find(book_slots) if book_el is not None else None
     options_el = _frame_val(book_slots, 'options')
     biz_el = _frame_val(options_el, 'Business')
 
@@ -62,6 +83,33 @@ def read_book_company_info(file_path):
     return result
 
 
+@functools.lru_cache(maxsize=16)
+def _read_company_info(file_path, size, mtime_ns):
+    with _open_book_xml(file_path) as f:
+        book_slots = _find_book_slots(f)
+    return _company_info_from_slots(book_slots)
+
+
+def read_book_company_info(file_path):
+    """
+    Read the Business options (company name, address, ...) of an XML book.
+
+    Only the start of the file is parsed: streaming stops at the end of the
+    book's slots, before any account or transaction. Results are cached by
+    path, size and modification time, so batch printing reads the file once.
+
+    Args:
+        file_path: Path to a GnuCash XML file (compressed or not)
+
+    Returns:
+        Dict with name, id, phone, email, url and addr1-addr4 (empty strings
+        for options that are not set)
+    """
+    path = os.path.realpath(file_path)
+    st = os.stat(path)
+    return dict(_read_company_info(path, st.st_size, st.st_mtime_ns))
+
+
 def _read_tax_label(lib, ptr):
     taxable = bool(lib.gncEntryGetInvTaxable(ptr))
     if not taxable:
@@ -222,17 +270,17 @@ def invoice_to_xml(inv, book, company_info=None):
     return ET.ElementTree(root)
 
 
-def render_to_pdf(invoice, book, xslt_path, pdf_path, company_info=None):
-    import weasyprint
-    from lxml import etree as lxml_etree
+def invoice_to_xml_string(inv, book, company_info=None):
+    xml_tree = invoice_to_xml(inv, book, company_info=company_info)
+    return ET.tostring(xml_tree.getroot(), encoding='unicode')
 
-    xml_tree = invoice_to_xml(invoice, book, company_info=company_info)
 
-    # In-memory transformation
-    xml_str = ET.tostring(xml_tree.getroot(), encoding='unicode')
-    xml_doc = lxml_etree.fromstring(xml_str)
-    xslt_doc = lxml_etree.parse(xslt_path)
-    transform = lxml_etree.XSLT(xslt_doc)
-    html_doc = transform(xml_doc)
+def render_to_pdf(invoice, book, xslt_path, pdf_path, company_info=None):
+    xml_str = invoice_to_xml_string(invoice, book, company_info=company_info)
+    xml_to_pdf(xml_str, compile_xslt(xslt_path), pdf_path)
+
 
-    weasyprint.HTML(string=str(html_doc)).write_pdf(pdf_path)
+def render_to_html(invoice, book, xslt_path, html_path, company_info=None):
+    """Render an invoice to HTML only, without weasyprint (for previews)."""
+    xml_str = invoice_to_xml_string(invoice, book, company_info=company_info)
+    write_output(xml_str, compile_xslt(xslt_path), html_path, 'html')
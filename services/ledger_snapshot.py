@@ -0,0 +1,181 @@
+"""
+Picklable snapshots of GnuCash transactions.
+
+GnuCash objects are SWIG proxies bound to an open session; they cannot be sent to
+another process and every attribute access is a C call. A TransactionRow holds the
+fields validation needs as plain Python values, extracted once, so rules can run
+on rows in a worker process (see LedgerValidator.run_rules with jobs > 1).
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SplitRow:
+    """Account and value of a split (value as numerator/denominator)"""
+
+    account: Optional[str]
+    value_num: int
+    value_denom: int
+
+
+@dataclass(frozen=True)
+class TransactionRow:
+    """Plain-data copy of a transaction"""
+
+    guid: str
+    date: Optional[date]
+    description: str
+    currency: Optional[str]
+    doc_link: Optional[str]
+    splits: Tuple[SplitRow, ...]
+
+    @property
+    def signature(self) -> Tuple[str, Tuple[str, ...], Optional[str]]:
+        """
+        Duplicate-detection signature, as in TransactionMatcher.get_signature.
+
+        Returns:
+            Tuple of (date_string, tuple_of_sorted_account_names, doc_link)
+        """
+        date_str = self.date.strftime("%Y-%m-%d") if self.date else ""
+        accounts = tuple(sorted(split.account or "" for split in self.splits))
+        return (date_str, accounts, self.doc_link)
+
+
+def snapshot_transaction(transaction, name_cache: Optional[Dict[int, str]] = None) -> TransactionRow:
+    """
+    Copy a GnuCash transaction into a TransactionRow.
+
+    Args:
+        transaction: GnuCash Transaction object
+        name_cache: Optional dict of account pointer to full name, shared across calls
+
+    Returns:
+        TransactionRow
+    """
+    from infrastructure.gnucash.utils import get_account_full_name
+
+    if name_cache is None:
+        name_cache = {}
+
+    splits = []
+    for split in transaction.GetSplitList():
+        account = split.GetAccount()
+        account_name = None
+        if account is not None:
+            ptr = int(account.instance)
+            account_name = name_cache.get(ptr)
+            if account_name is None:
+                account_name = get_account_full_name(account)
+                name_cache[ptr] = account_name
+
+        value = split.GetValue()
+        splits.append(SplitRow(account_name, value.num(), value.denom()))
+
+    posted = transaction.GetDate()
+    if isinstance(posted, datetime):
+        posted = posted.date()
+
+    currency = transaction.GetCurrency()
+
+    try:
+        doc_link = transaction.GetDocLink()
+    except AttributeError:
+        doc_link = transaction.GetAssociation()
+
+    return TransactionRow(
+        guid=transaction.GetGUID().to_string(),
+        date=posted,
+        description=transaction.GetDescription() or "",
+        currency=currency.get_mnemonic() if currency is not None else None,
+        doc_link=doc_link,
+        splits=tuple(splits),
+    )
+
+
+def edit_stamp(transaction, name_cache: Optional[Dict[int, str]] = None) -> str:
+    """
+    Stand-in for a transaction's last-edit time, read without building a row.
+
+    GnuCash sets the entered date when a transaction is created and never moves
+    it, so the stamp pairs it with a digest of the transaction's content: posted
+    date, description, currency, doc_link and each split's account, value,
+    amount and memo. Any edit that a TransactionRow or a rule could see changes
+    the stamp.
+
+    Args:
+        transaction: GnuCash Transaction object
+        name_cache: Optional dict of account pointer to full name, shared across calls
+
+    Returns:
+        Stamp string, equal between runs while the transaction is unchanged
+    """
+    from infrastructure.gnucash.utils import get_account_full_name
+
+    if name_cache is None:
+        name_cache = {}
+
+    currency = transaction.GetCurrency()
+    try:
+        doc_link = transaction.GetDocLink()
+    except AttributeError:
+        doc_link = transaction.GetAssociation()
+
+    parts = [
+        str(transaction.GetDate()),
+        transaction.GetDescription() or "",
+        currency.get_mnemonic() if currency is not None else "",
+        doc_link or "",
+    ]
+    for split in transaction.GetSplitList():
+        account = split.GetAccount()
+        account_name = ""
+        if account is not None:
+            ptr = int(account.instance)
+            account_name = name_cache.get(ptr)
+            if account_name is None:
+                account_name = get_account_full_name(account)
+                name_cache[ptr] = account_name
+        value = split.GetValue()
+        amount = split.GetAmount()
+        parts.append(
+            f"{account_name}:{value.num()}/{value.denom()}:{amount.num()}/{amount.denom()}:{split.GetMemo() or ''}"
+        )
+
+    digest = hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+    return f"{transaction.GetDateEntered()}|{digest}"
+
+
+def partition_by_date(rows: List[TransactionRow], parts: int) -> List[List[TransactionRow]]:
+    """
+    Split rows into at most `parts` contiguous date ranges of similar size.
+
+    Rows with the same date always land in the same partition. Rows without a date
+    sort first.
+
+    Args:
+        rows: Rows to partition
+        parts: Number of partitions wanted
+
+    Returns:
+        List of non-empty partitions, in date order
+    """
+    if not rows:
+        return []
+
+    ordered = sorted(rows, key=lambda row: row.date or date.min)
+    target = max(1, -(-len(ordered) // max(1, parts)))
+
+    partitions: List[List[TransactionRow]] = []
+    current: List[TransactionRow] = []
+    for row in ordered:
+        if len(current) >= target and row.date != current[-1].date:
+            partitions.append(current)
+            current = []
+        current.append(row)
+    partitions.append(current)
+    return partitions
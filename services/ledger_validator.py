@@ -3,12 +3,30 @@ Ledger validation service for GnuCash data.
 
 Validates transactions, accounts, and overall ledger integrity.
 Detects common errors and inconsistencies in GnuCash data.
+
+Checks are implemented as rules (ValidationRule subclasses registered in
+VALIDATION_RULES). Each rule declares whether it looks at accounts, transactions
+or both, and LedgerValidator.run_rules visits every account and every transaction
+exactly once, dispatching to all enabled rules.
 """
 
+from __future__ import annotations
+
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
-from gnucash import Account, Split, Transaction
+from services.balance_checker import is_balanced
+from services.ledger_snapshot import (
+    TransactionRow,
+    edit_stamp,
+    partition_by_date,
+    snapshot_transaction,
+)
+from services.validation_cache import ValidationCache
+
+if TYPE_CHECKING:
+    from gnucash import Account, Split, Transaction
 
 
 class ValidationError:
@@ -47,6 +65,11 @@ class ValidationError:
             'context': self.context
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> ValidationError:
+        """Create from a dictionary produced by to_dict"""
+        return cls(data['severity'], data['code'], data['message'], data.get('context'))
+
 
 class ValidationResult:
     """Results from validation"""
@@ -69,6 +92,15 @@ class ValidationResult:
         """Add an info message"""
         self.info.append(ValidationError("INFO", code, message, context))
 
+    def add_issue(self, issue: ValidationError):
+        """Add an existing issue to the list matching its severity"""
+        if issue.severity == "ERROR":
+            self.errors.append(issue)
+        elif issue.severity == "WARNING":
+            self.warnings.append(issue)
+        else:
+            self.info.append(issue)
+
     def has_errors(self) -> bool:
         """Check if there are any errors"""
         return len(self.errors) > 0
@@ -101,51 +133,118 @@ class ValidationResult:
         return f"Validation completed: {', '.join(lines)}"
 
 
-class LedgerValidator:
-    """Service for validating GnuCash ledger data"""
+class ValidationRule:
+    """
+    Base class for ledger validation rules.
 
-    def __init__(self):
-        """Initialize ledger validator"""
-        pass
+    A rule declares the levels it checks ('account', 'transaction') and overrides
+    the matching hooks. LedgerValidator.run_rules calls begin() once, then
+    check_account() for every account and check_transaction() for every transaction
+    (only for rules that declared that level), then finish().
+
+    Transaction-level rules see TransactionRow snapshots, not GnuCash objects. A
+    rule marked partitionable can run on separate partitions of the transactions
+    in worker processes: each worker returns export_state(), and the parent hands
+    every partition's state to merge_state() before calling finish().
+
+    A rule marked cacheable reports issues that depend only on the transaction
+    itself, so its results can be kept in a ValidationCache between runs. Bump
+    version when a cacheable rule's checks change, to invalidate cached results.
+    """
+
+    name = ""
+    description = ""
+    levels: Tuple[str, ...] = ()
+    partitionable = False
+    cacheable = False
+    version = 1
+
+    @property
+    def cache_key(self) -> str:
+        """Key of this rule's results in a ValidationCache"""
+        return f"{self.name}:{self.version}"
 
-    def validate_transaction(self, transaction: Transaction) -> ValidationResult:
+    def begin(self, validator: LedgerValidator, result: ValidationResult):
         """
-        Validate a single transaction.
+        Reset state before a validation pass.
 
         Args:
-            transaction: Transaction to validate
+            validator: Validator running the pass
+            result: ValidationResult to add issues to
+        """
+        self.validator = validator
 
-        Returns:
-            ValidationResult with any issues found
+    def check_account(self, account: Account, full_name: str, result: ValidationResult):
         """
-        result = ValidationResult()
+        Check one (non-root) account.
 
+        Args:
+            account: Account to check
+            full_name: Colon-separated full account name
+            result: ValidationResult to add issues to
+        """
+
+    def check_transaction(self, row: TransactionRow, result: ValidationResult):
+        """
+        Check one transaction.
+
+        Args:
+            row: Snapshot of the transaction to check
+            result: ValidationResult to add issues to
+        """
+
+    def export_state(self):
+        """Return picklable state needed by finish() (partitioned runs)."""
+        return None
+
+    def merge_state(self, state):
+        """Fold in the exported state of one partition."""
+
+    def finish(self, result: ValidationResult):
+        """
+        Report issues that need the whole pass (counts, totals).
+
+        Args:
+            result: ValidationResult to add issues to
+        """
+
+
+class TransactionStructureRule(ValidationRule):
+    """Description, date, splits, balance and currency of each transaction"""
+
+    name = "transactions"
+    description = "Transaction structure: description, date, splits, balance, currency"
+    levels = ("transaction",)
+    partitionable = True
+    cacheable = True
+    version = 2
+
+    def check_transaction(self, row: TransactionRow, result: ValidationResult):
         # Check description
-        desc = transaction.GetDescription()
+        desc = row.description
         if not desc or desc.strip() == "":
             result.add_warning(
                 "EMPTY_DESCRIPTION",
                 "Transaction has empty description",
-                {'guid': transaction.GetGUID().to_string()}
+                {'guid': row.guid}
             )
 
         # Check date
-        date = transaction.GetDate()
-        if date is None:
+        if row.date is None:
             result.add_error(
                 "MISSING_DATE",
                 "Transaction has no date",
-                {'guid': transaction.GetGUID().to_string()}
+                {'guid': row.guid}
             )
 
         # Check splits
-        splits = transaction.GetSplitList()
+        splits = row.splits
         if len(splits) == 0:
             result.add_error(
                 "NO_SPLITS",
                 "Transaction has no splits",
                 {
-                    'guid': transaction.GetGUID().to_string(),
+                    'guid': row.guid,
                     'description': desc
                 }
             )
@@ -154,80 +253,518 @@ class LedgerValidator:
                 "SINGLE_SPLIT",
                 "Transaction has only one split",
                 {
-                    'guid': transaction.GetGUID().to_string(),
+                    'guid': row.guid,
                     'description': desc
                 }
             )
 
         # Check if transaction is balanced
-        if len(splits) > 0 and not self._is_transaction_balanced(splits):
+        if len(splits) > 0 and not is_balanced((split.value_num, split.value_denom) for split in splits):
             result.add_error(
                 "UNBALANCED",
                 "Transaction is not balanced",
                 {
-                    'guid': transaction.GetGUID().to_string(),
+                    'guid': row.guid,
                     'description': desc
                 }
             )
 
         # Check for splits without accounts
         for split in splits:
-            account = split.GetAccount()
-            if account is None:
+            if split.account is None:
                 result.add_error(
                     "SPLIT_NO_ACCOUNT",
                     "Split has no account",
                     {
-                        'transaction_guid': transaction.GetGUID().to_string(),
+                        'transaction_guid': row.guid,
                         'description': desc
                     }
                 )
 
         # Check currency
-        currency = transaction.GetCurrency()
-        if currency is None:
+        if row.currency is None:
             result.add_error(
                 "NO_CURRENCY",
                 "Transaction has no currency",
                 {
-                    'guid': transaction.GetGUID().to_string(),
+                    'guid': row.guid,
                     'description': desc
                 }
             )
 
+
+class AccountRule(ValidationRule):
+    """Name, placeholder flag and commodity of each account"""
+
+    name = "accounts"
+    description = "Account fields: name, placeholder flag, commodity"
+    levels = ("account",)
+
+    def check_account(self, account: Account, full_name: str, result: ValidationResult):
+        self.validator.validate_account(account, result)
+
+
+class CategoryHierarchyRule(ValidationRule):
+    """Child accounts must have the same category as their parent"""
+
+    name = "hierarchy"
+    description = "Account category matches its parent's category"
+    levels = ("account",)
+
+    def begin(self, validator: LedgerValidator, result: ValidationResult):
+        super().begin(validator, result)
+        from services.account_categorizer import AccountCategorizer
+        self.categorizer = AccountCategorizer()
+        # Parents are visited before children, so each category is computed once
+        self.categories: Dict[str, str] = {}
+
+    def check_account(self, account: Account, full_name: str, result: ValidationResult):
+        account_category = self.categorizer.get_category(account)
+        self.categories[full_name] = account_category
+
+        if ':' not in full_name:
+            return
+
+        parent_name = full_name.rsplit(':', 1)[0]
+        parent_category = self.categories.get(parent_name)
+        if parent_category is None:
+            parent_category = self.categorizer.get_category(account.get_parent())
+
+        if parent_category != account_category:
+            result.add_warning(
+                "CATEGORY_MISMATCH",
+                "Category mismatch in hierarchy",
+                {
+                    'account': full_name,
+                    'account_category': account_category,
+                    'parent_category': parent_category
+                }
+            )
+
+
+class DuplicateRule(ValidationRule):
+    """Transactions sharing a signature (date, accounts, doc_link)"""
+
+    name = "duplicates"
+    description = "Duplicate transactions (same date, accounts and doc_link)"
+    levels = ("transaction",)
+    partitionable = True
+
+    def __init__(self, code: str = "DUPLICATES_DETECTED"):
+        """
+        Initialize rule.
+
+        Args:
+            code: Warning code to report duplicates with
+        """
+        self.code = code
+
+    def begin(self, validator: LedgerValidator, result: ValidationResult):
+        super().begin(validator, result)
+        self.signature_counts: Counter = Counter()
+
+    def check_transaction(self, row: TransactionRow, result: ValidationResult):
+        self.signature_counts[row.signature] += 1
+
+    def export_state(self):
+        return self.signature_counts
+
+    def merge_state(self, state):
+        # Same-date rows never straddle partitions, but summing counts keeps the
+        # reduce correct for any partitioning.
+        self.signature_counts.update(state)
+
+    def finish(self, result: ValidationResult):
+        duplicate_count = sum(count - 1 for count in self.signature_counts.values())
+        if duplicate_count > 0:
+            result.add_warning(
+                self.code,
+                f"Found {duplicate_count} duplicate transaction(s)",
+                {'count': duplicate_count}
+            )
+
+
+class DateOrderRule(ValidationRule):
+    """Transactions should appear in chronological order"""
+
+    name = "date-order"
+    description = "Transactions appear in chronological order"
+    levels = ("transaction",)
+
+    def begin(self, validator: LedgerValidator, result: ValidationResult):
+        super().begin(validator, result)
+        self.prev_date = None
+
+    def check_transaction(self, row: TransactionRow, result: ValidationResult):
+        current_date = row.date
+
+        if self.prev_date and current_date and current_date < self.prev_date:
+            result.add_info(
+                "OUT_OF_ORDER",
+                "Transactions are not in chronological order",
+                {
+                    'description': row.description,
+                    'date': current_date.strftime("%Y-%m-%d")
+                }
+            )
+
+        self.prev_date = current_date
+
+
+class FutureDateRule(ValidationRule):
+    """Transactions dated after the reference date"""
+
+    name = "future-dates"
+    description = "Transactions dated in the future"
+    levels = ("transaction",)
+    partitionable = True
+
+    def __init__(self, reference_date: Optional[datetime] = None):
+        """
+        Initialize rule.
+
+        Args:
+            reference_date: Reference date (defaults to now when the pass begins)
+        """
+        self.reference_date = reference_date
+
+    def begin(self, validator: LedgerValidator, result: ValidationResult):
+        super().begin(validator, result)
+        self.cutoff = self.reference_date or datetime.now()
+
+    def check_transaction(self, row: TransactionRow, result: ValidationResult):
+        tx_date = row.date
+        if tx_date is None:
+            return
+        tx_datetime = datetime(tx_date.year, tx_date.month, tx_date.day)
+
+        if tx_datetime > self.cutoff:
+            result.add_info(
+                "FUTURE_DATE",
+                "Transaction has future date",
+                {
+                    'description': row.description,
+                    'date': tx_date.strftime("%Y-%m-%d")
+                }
+            )
+
+
+# Registered rules by name, in the order they run
+VALIDATION_RULES: Dict[str, type] = {
+    rule.name: rule
+    for rule in (
+        CategoryHierarchyRule,
+        AccountRule,
+        TransactionStructureRule,
+        DuplicateRule,
+        DateOrderRule,
+        FutureDateRule,
+    )
+}
+
+
+def _validate_partition(rules: List[ValidationRule], rows: List[TransactionRow]):
+    """
+    Worker entry point: run rules over one partition of transaction rows.
+
+    Args:
+        rules: Partitionable rules (pickled copies, state is reset by begin())
+        rows: Transaction rows of this partition
+
+    Returns:
+        Tuple of (ValidationResult, list of exported rule states)
+    """
+    validator = LedgerValidator()
+    result = ValidationResult()
+
+    for rule in rules:
+        rule.begin(validator, result)
+
+    for row in rows:
+        for rule in rules:
+            rule.check_transaction(row, result)
+
+    return result, [rule.export_state() for rule in rules]
+
+
+class LedgerValidator:
+    """Service for validating GnuCash ledger data"""
+
+    def __init__(self):
+        """Initialize ledger validator"""
+        pass
+
+    def create_rules(
+        self,
+        enabled: Optional[Iterable[str]] = None,
+        disabled: Iterable[str] = (),
+        options: Optional[Dict[str, Dict]] = None
+    ) -> List[ValidationRule]:
+        """
+        Instantiate registered rules.
+
+        Args:
+            enabled: Rule names to run (defaults to all registered rules)
+            disabled: Rule names to leave out
+            options: Constructor keyword arguments per rule name
+
+        Returns:
+            List of rules in registry order
+
+        Raises:
+            ValueError: If a rule name is not registered
+        """
+        enabled = set(VALIDATION_RULES) if enabled is None else set(enabled)
+        disabled = set(disabled)
+        unknown = (enabled | disabled) - set(VALIDATION_RULES)
+        if unknown:
+            raise ValueError(
+                f"Unknown validation rule(s): {', '.join(sorted(unknown))}. "
+                f"Available: {', '.join(VALIDATION_RULES)}"
+            )
+
+        options = options or {}
+        return [
+            rule_class(**options.get(name, {}))
+            for name, rule_class in VALIDATION_RULES.items()
+            if name in enabled and name not in disabled
+        ]
+
+    def run_rules(
+        self,
+        root_account: Optional[Account],
+        transactions: Iterable,
+        rules: List[ValidationRule],
+        jobs: int = 1,
+        cache: Optional[ValidationCache] = None
+    ) -> ValidationResult:
+        """
+        Run rules over the ledger in a single pass.
+
+        Every account below root_account and every transaction is visited exactly
+        once; each is handed to all rules that declared that level. Transactions
+        are snapshotted into TransactionRows first.
+
+        With jobs > 1, the rows are partitioned by date range and partitionable
+        rules run on the partitions in a process pool; their per-partition results
+        and exported state are merged here. Other rules run in this process.
+
+        With a cache, unchanged transactions (same edit stamp) are not
+        snapshotted: cacheable rules replay their stored issues and the other
+        rules see the cached snapshot. Only new or edited transactions are
+        snapshotted and checked by cacheable rules (in this process).
+
+        Args:
+            root_account: Root account (None to skip account-level rules)
+            transactions: Transactions (GnuCash Transaction objects or TransactionRows)
+            rules: Rules to run (see create_rules)
+            jobs: Number of worker processes for transaction-level rules
+            cache: Per-transaction result cache (optional; caller saves it)
+
+        Returns:
+            ValidationResult with all issues found
+        """
+        result = ValidationResult()
+        account_rules = [rule for rule in rules if "account" in rule.levels]
+        transaction_rules = [rule for rule in rules if "transaction" in rule.levels]
+
+        for rule in rules:
+            rule.begin(self, result)
+
+        if root_account is not None and account_rules:
+            def visit(account: Account, path: List[str]):
+                if not account.is_root():
+                    path = path + [account.GetName()]
+                    full_name = ':'.join(path)
+                    for rule in account_rules:
+                        rule.check_account(account, full_name, result)
+
+                for child in account.get_children_sorted():
+                    visit(child, path)
+
+            visit(root_account, [])
+
+        if transaction_rules:
+            cached_rules = []
+            if cache is not None:
+                cached_rules = [rule for rule in transaction_rules if rule.cacheable]
+
+            name_cache: Dict[int, str] = {}
+            rows = []
+            for tx in transactions:
+                if isinstance(tx, TransactionRow):
+                    row = tx
+                    for rule in cached_rules:
+                        rule.check_transaction(row, result)
+                elif cache is not None:
+                    row = self._check_cached(cached_rules, tx, cache, name_cache, result)
+                else:
+                    row = snapshot_transaction(tx, name_cache)
+                rows.append(row)
+
+            parallel_rules = []
+            if jobs > 1 and len(rows) > 1:
+                parallel_rules = [
+                    rule for rule in transaction_rules
+                    if rule.partitionable and rule not in cached_rules
+                ]
+            serial_rules = [
+                rule for rule in transaction_rules
+                if rule not in parallel_rules and rule not in cached_rules
+            ]
+
+            for row in rows:
+                for rule in serial_rules:
+                    rule.check_transaction(row, result)
+
+            if parallel_rules:
+                self._run_partitioned(rows, parallel_rules, jobs, result)
+
+        for rule in rules:
+            rule.finish(result)
+
+        return result
+
+    def _check_cached(
+        self,
+        rules: List[ValidationRule],
+        transaction: Transaction,
+        cache: ValidationCache,
+        name_cache: Dict[int, str],
+        result: ValidationResult
+    ) -> TransactionRow:
+        """
+        Replay cacheable rules' issues for a transaction, checking it on a miss.
+
+        An unchanged transaction (same edit stamp) is not snapshotted; its row
+        comes from the cache. Otherwise it is snapshotted, checked and stored.
+
+        Args:
+            rules: Cacheable rules (already begun)
+            transaction: GnuCash Transaction object
+            cache: Validation cache
+            name_cache: Account-name cache shared with snapshot_transaction
+            result: ValidationResult to add issues to
+
+        Returns:
+            TransactionRow of the transaction, for the uncached rules
+        """
+        stamp = edit_stamp(transaction, name_cache)
+        cached = cache.get(transaction.GetGUID().to_string(), stamp)
+        if cached is None:
+            row = snapshot_transaction(transaction, name_cache)
+            rule_issues: Dict[str, List[Dict]] = {}
+        else:
+            row, rule_issues = cached
+
+        missing = []
+        for rule in rules:
+            issues = rule_issues.get(rule.cache_key)
+            if issues is None:
+                missing.append(rule)
+            else:
+                for issue in issues:
+                    result.add_issue(ValidationError.from_dict(issue))
+
+        if missing:
+            for rule in missing:
+                row_result = ValidationResult()
+                rule.check_transaction(row, row_result)
+                issues = row_result.get_all_issues()
+                for issue in issues:
+                    result.add_issue(issue)
+                rule_issues[rule.cache_key] = [issue.to_dict() for issue in issues]
+            cache.put(row, stamp, rule_issues)
+
+        return row
+
+    def _run_partitioned(
+        self,
+        rows: List[TransactionRow],
+        rules: List[ValidationRule],
+        jobs: int,
+        result: ValidationResult
+    ):
+        """
+        Run partitionable rules over date-range partitions in a process pool.
+
+        Args:
+            rows: Transaction snapshots
+            rules: Partitionable rules (already begun in this process)
+            jobs: Number of worker processes
+            result: ValidationResult to merge partition results into
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        partitions = partition_by_date(rows, jobs)
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(partitions))) as executor:
+            partials = list(executor.map(_validate_partition, [rules] * len(partitions), partitions))
+
+        for partial, states in partials:
+            result.errors.extend(partial.errors)
+            result.warnings.extend(partial.warnings)
+            result.info.extend(partial.info)
+            for rule, state in zip(rules, states):
+                rule.merge_state(state)
+
+    def validate_transaction(
+        self,
+        transaction: Transaction,
+        result: Optional[ValidationResult] = None
+    ) -> ValidationResult:
+        """
+        Validate a single transaction.
+
+        Args:
+            transaction: Transaction to validate
+            result: Existing ValidationResult to add issues to (optional)
+
+        Returns:
+            ValidationResult with any issues found
+        """
+        if result is None:
+            result = ValidationResult()
+
+        TransactionStructureRule().check_transaction(snapshot_transaction(transaction), result)
         return result
 
     def _is_transaction_balanced(self, splits: List[Split]) -> bool:
         """
         Check if splits balance to zero.
 
+        Values are compared exactly, across differing denominators.
+
         Args:
             splits: List of splits to check
 
         Returns:
             True if balanced
         """
-        if not splits:
-            return True
-
-        total_num = 0
+        values = []
         for split in splits:
             value = split.GetValue()
-            total_num += value.num()
+            values.append((value.num(), value.denom()))
 
-        return total_num == 0
+        return is_balanced(values)
 
-    def validate_account(self, account: Account) -> ValidationResult:
+    def validate_account(
+        self,
+        account: Account,
+        result: Optional[ValidationResult] = None
+    ) -> ValidationResult:
         """
         Validate a single account.
 
         Args:
             account: Account to validate
+            result: Existing ValidationResult to add issues to (optional)
 
         Returns:
             ValidationResult with any issues found
         """
-        result = ValidationResult()
+        if result is None:
+            result = ValidationResult()
 
         # Check name
         name = account.GetName()
@@ -272,39 +809,7 @@ class LedgerValidator:
         Returns:
             ValidationResult with any issues found
         """
-        result = ValidationResult()
-
-        def visit(account: Account, path: List[str]):
-            if not account.is_root():
-                name = account.GetName()
-                current_path = path + [name]
-
-                # Check parent-child category consistency
-                parent = account.get_parent()
-                if parent and not parent.is_root():
-                    from services.account_categorizer import AccountCategorizer
-                    categorizer = AccountCategorizer()
-
-                    parent_category = categorizer.get_category(parent)
-                    account_category = categorizer.get_category(account)
-
-                    if parent_category != account_category:
-                        result.add_warning(
-                            "CATEGORY_MISMATCH",
-                            "Category mismatch in hierarchy",
-                            {
-                                'account': ':'.join(current_path),
-                                'account_category': account_category,
-                                'parent_category': parent_category
-                            }
-                        )
-
-            # Visit children
-            for child in account.get_children_sorted():
-                visit(child, path + [account.GetName()] if not account.is_root() else path)
-
-        visit(root_account, [])
-        return result
+        return self.run_rules(root_account, [], [CategoryHierarchyRule()])
 
     def validate_transactions(
         self,
@@ -321,30 +826,10 @@ class LedgerValidator:
         Returns:
             ValidationResult with any issues found
         """
-        result = ValidationResult()
-
-        for tx in transactions:
-            tx_result = self.validate_transaction(tx)
-
-            # Merge results
-            result.errors.extend(tx_result.errors)
-            result.warnings.extend(tx_result.warnings)
-            result.info.extend(tx_result.info)
-
+        rules = [TransactionStructureRule()]
         if check_duplicates:
-            # Check for duplicate transactions
-            from services.transaction_matcher import TransactionMatcher
-            matcher = TransactionMatcher()
-            dup_count = matcher.get_duplicate_count(transactions)
-
-            if dup_count > 0:
-                result.add_warning(
-                    "DUPLICATES_FOUND",
-                    f"Found {dup_count} duplicate transaction(s)",
-                    {'count': dup_count}
-                )
-
-        return result
+            rules.append(DuplicateRule(code="DUPLICATES_FOUND"))
+        return self.run_rules(None, transactions, rules)
 
     def validate_ledger(
         self,
@@ -361,34 +846,11 @@ class LedgerValidator:
         Returns:
             ValidationResult with all issues found
         """
-        result = ValidationResult()
-
-        # Validate account hierarchy
-        hierarchy_result = self.validate_account_hierarchy(root_account)
-        result.errors.extend(hierarchy_result.errors)
-        result.warnings.extend(hierarchy_result.warnings)
-        result.info.extend(hierarchy_result.info)
-
-        # Validate all accounts
-        def visit_accounts(account: Account):
-            if not account.is_root():
-                account_result = self.validate_account(account)
-                result.errors.extend(account_result.errors)
-                result.warnings.extend(account_result.warnings)
-                result.info.extend(account_result.info)
-
-            for child in account.get_children_sorted():
-                visit_accounts(child)
-
-        visit_accounts(root_account)
-
-        # Validate transactions
-        tx_result = self.validate_transactions(transactions)
-        result.errors.extend(tx_result.errors)
-        result.warnings.extend(tx_result.warnings)
-        result.info.extend(tx_result.info)
-
-        return result
+        rules = self.create_rules(
+            disabled=(DateOrderRule.name, FutureDateRule.name),
+            options={DuplicateRule.name: {'code': "DUPLICATES_FOUND"}}
+        )
+        return self.run_rules(root_account, transactions, rules)
 
     def check_transaction_date_order(
         self,
@@ -403,28 +865,7 @@ class LedgerValidator:
         Returns:
             ValidationResult with any issues
         """
-        result = ValidationResult()
-
-        if len(transactions) <= 1:
-            return result
-
-        prev_date = None
-        for tx in transactions:
-            current_date = tx.GetDate()
-
-            if prev_date and current_date < prev_date:
-                result.add_info(
-                    "OUT_OF_ORDER",
-                    "Transactions are not in chronological order",
-                    {
-                        'description': tx.GetDescription(),
-                        'date': current_date.strftime("%Y-%m-%d")
-                    }
-                )
-
-            prev_date = current_date
-
-        return result
+        return self.run_rules(None, transactions, [DateOrderRule()])
 
     def check_future_transactions(
         self,
@@ -441,26 +882,7 @@ class LedgerValidator:
         Returns:
             ValidationResult with any issues
         """
-        result = ValidationResult()
-
-        if reference_date is None:
-            reference_date = datetime.now()
-
-        for tx in transactions:
-            tx_date = tx.GetDate()
-            tx_datetime = datetime(tx_date.year, tx_date.month, tx_date.day)
-
-            if tx_datetime > reference_date:
-                result.add_info(
-                    "FUTURE_DATE",
-                    "Transaction has future date",
-                    {
-                        'description': tx.GetDescription(),
-                        'date': tx_date.strftime("%Y-%m-%d")
-                    }
-                )
-
-        return result
+        return self.run_rules(None, transactions, [FutureDateRule(reference_date)])
 
     def format_validation_report(self, result: ValidationResult) -> str:
         """
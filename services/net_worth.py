@@ -0,0 +1,204 @@
+"""
+Net worth over time, converted to one currency.
+
+Balances come from the same split snapshot as the period reports: asset and
+liability balances at each period end are prefix sums of per-period activity
+(see period_report.aggregate and cumulative), totalled per commodity.
+
+Each commodity's balances are then converted with the latest price on or
+before each period end. Prices are loaded once into a PriceTable, which keeps
+one pair of sorted arrays (date ordinals, prices) per commodity/currency pair,
+so every lookup is a bisect. A commodity with no direct quote in the report
+currency is converted through its inverse quote, or through one intermediate
+currency (e.g. a stock quoted in CAD reported in USD).
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from fractions import Fraction
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from services.account_category import AccountCategory
+from services.period_report import (
+    AccountInfo,
+    PeriodReport,
+    ReportRow,
+    ReportSection,
+    SplitEntry,
+    aggregate,
+    cumulative,
+    period_label,
+    period_starts,
+)
+
+# (commodity, currency, posted date ordinal, price of one commodity unit in currency)
+PriceEntry = Tuple[str, str, int, Fraction]
+
+NET_WORTH_CATEGORIES = (AccountCategory.ASSET, AccountCategory.LIABILITY)
+
+
+class PriceTable:
+    """Prices per commodity/currency pair, in sorted arrays for bisect lookup"""
+
+    def __init__(self, entries: Iterable[PriceEntry]):
+        """
+        Index price entries.
+
+        When a pair has several prices on one day, the last one given wins.
+
+        Args:
+            entries: Price entries in any order
+        """
+        by_pair: Dict[Tuple[str, str], Dict[int, Fraction]] = {}
+        for commodity, currency, ordinal, price in entries:
+            if commodity == currency or price <= 0:
+                continue
+            by_pair.setdefault((commodity, currency), {})[ordinal] = price
+
+        self._ordinals: Dict[Tuple[str, str], List[int]] = {}
+        self._prices: Dict[Tuple[str, str], List[Fraction]] = {}
+        self._neighbours: Dict[str, List[str]] = {}
+        for pair, prices in by_pair.items():
+            ordinals = sorted(prices)
+            self._ordinals[pair] = ordinals
+            self._prices[pair] = [prices[ordinal] for ordinal in ordinals]
+            commodity, currency = pair
+            self._neighbours.setdefault(commodity, []).append(currency)
+            self._neighbours.setdefault(currency, []).append(commodity)
+        for neighbours in self._neighbours.values():
+            neighbours.sort()
+
+    def __len__(self) -> int:
+        return sum(len(ordinals) for ordinals in self._ordinals.values())
+
+    def _latest(self, commodity: str, currency: str, ordinal: int) -> Optional[Fraction]:
+        ordinals = self._ordinals.get((commodity, currency))
+        if not ordinals:
+            return None
+        index = bisect_right(ordinals, ordinal) - 1
+        return self._prices[(commodity, currency)][index] if index >= 0 else None
+
+    def _pair_rate(self, commodity: str, currency: str, ordinal: int) -> Optional[Fraction]:
+        direct = self._latest(commodity, currency, ordinal)
+        if direct is not None:
+            return direct
+        inverse = self._latest(currency, commodity, ordinal)
+        return 1 / inverse if inverse is not None else None
+
+    def rate(self, commodity: str, currency: str, on: date) -> Optional[Fraction]:
+        """
+        Value of one unit of a commodity in a currency, as of a date.
+
+        Args:
+            commodity: Commodity mnemonic
+            currency: Target currency mnemonic
+            on: Date of the conversion; later prices are not used
+
+        Returns:
+            Exchange rate, or None if no price on or before the date links them
+        """
+        if commodity == currency:
+            return Fraction(1)
+        ordinal = on.toordinal()
+        rate = self._pair_rate(commodity, currency, ordinal)
+        if rate is not None:
+            return rate
+
+        for middle in self._neighbours.get(commodity, ()):
+            first = self._pair_rate(commodity, middle, ordinal)
+            second = self._pair_rate(middle, currency, ordinal) if first is not None else None
+            if second is not None:
+                return first * second
+        return None
+
+
+@dataclass
+class NetWorth:
+    """Net worth report and the holdings it could not convert"""
+
+    report: PeriodReport
+    unpriced: Dict[str, List[str]] = field(default_factory=dict)  # commodity -> period labels
+
+
+def _round(amount: Fraction, places: int) -> Fraction:
+    scale = 10 ** places
+    return Fraction(round(amount * scale), scale)
+
+
+def net_worth(
+    accounts: Sequence[AccountInfo],
+    entries: Iterable[SplitEntry],
+    prices: PriceTable,
+    period: str,
+    start: date,
+    end: date,
+    currency: str,
+    places: int = 2,
+) -> NetWorth:
+    """
+    Build a net worth report with one column per period.
+
+    Args:
+        accounts: Accounts of the book
+        entries: Split snapshot
+        prices: Price table
+        period: One of period_report.PERIODS
+        start: First date reported
+        end: Last date reported
+        currency: Report currency mnemonic
+        places: Decimal places converted values are rounded to
+
+    Returns:
+        NetWorth. Holdings with no price on a period end count as zero in
+        that period and are listed in unpriced.
+
+    Raises:
+        ValueError: If start is after end
+    """
+    if start > end:
+        raise ValueError(f"Report start {start} is after end {end}")
+
+    starts = period_starts(start, end, period)
+    labels = [period_label(s, period) for s in starts]
+    # Each column is valued at its period end (the day before the next period starts)
+    ends = [date.fromordinal(s.toordinal() - 1) for s in starts[1:]] + [end]
+
+    commodities = {info.name: info.commodity for info in accounts if info.category in NET_WORTH_CATEGORIES}
+    opening, activity = aggregate(
+        (entry for entry in entries if entry[0] in commodities), starts, end
+    )
+    balances = cumulative(opening, activity, len(starts))
+
+    holdings: Dict[str, List[Fraction]] = {}
+    for name, amounts in balances.items():
+        totals = holdings.setdefault(commodities[name], [Fraction(0)] * len(starts))
+        for i, amount in enumerate(amounts):
+            totals[i] += amount
+
+    held = ReportSection("Holdings")
+    valued = ReportSection(f"Value in {currency}")
+    total = [Fraction(0)] * len(starts)
+    unpriced: Dict[str, List[str]] = {}
+    for commodity, amounts in sorted(holdings.items()):
+        if not any(amounts):
+            continue
+        rates = [prices.rate(commodity, currency, day) for day in ends]
+        values = [
+            _round(amount * rate, places) if rate is not None else Fraction(0)
+            for amount, rate in zip(amounts, rates)
+        ]
+        missing = [label for label, amount, rate in zip(labels, amounts, rates) if amount and rate is None]
+        if missing:
+            unpriced[commodity] = missing
+
+        held.rows.append(ReportRow(commodity, 0, commodity, amounts))
+        valued.rows.append(ReportRow(commodity, 0, currency, values))
+        total = [t + v for t, v in zip(total, values)]
+
+    report = PeriodReport(f"Net Worth ({currency})", labels)
+    if held.rows:
+        valued.totals[currency] = total
+        report.sections = [held, valued]
+    report.summary = [("Net worth", currency, total)]
+    return NetWorth(report, unpriced)
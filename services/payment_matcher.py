@@ -0,0 +1,253 @@
+"""
+Matching of incoming customer payments to open invoices.
+
+A payment list is read from CSV or from plaintext payment blocks:
+
+    payment:
+      customer_id: "C001"
+      date: 2026-02-10
+      amount: 105.00
+      bank_account: "Assets:Bank"
+      memo: "Wire 4711"
+      num: "4711"
+      billing_id: "PO-88"
+
+CSV files have the same fields as header columns. customer_id, date, amount
+and bank_account are required; memo, num and billing_id are optional.
+
+OpenInvoiceIndex keeps, per customer, the open invoices sorted by (remaining
+amount, due date, ID), and a billing ID index beside it. A payment with a
+billing ID pays that invoice (partially, if the amount is smaller than what
+remains). Otherwise it pays the customer's oldest open invoice whose
+remaining amount equals the payment, found by bisect. Every match updates the
+index, so two equal payments pay two different invoices.
+"""
+
+import bisect
+import csv
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from fractions import Fraction
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from services.period_report import format_amount
+
+PAYMENT_FIELDS = ('customer_id', 'date', 'amount', 'bank_account', 'memo', 'num', 'billing_id')
+REQUIRED_FIELDS = ('customer_id', 'date', 'amount', 'bank_account')
+
+
+@dataclass(frozen=True)
+class IncomingPayment:
+    """One payment received from a customer"""
+
+    customer_id: str
+    date: date
+    amount: Fraction
+    bank_account: str
+    memo: str = ""
+    num: str = ""
+    billing_id: str = ""
+    source: str = ""  # e.g. "payments.csv:12", for messages
+
+    def describe(self) -> str:
+        """Short description for reports."""
+        text = f"{self.date.isoformat()} customer {self.customer_id} {format_amount(self.amount)}"
+        if self.billing_id:
+            text += f" (billing ID {self.billing_id})"
+        return f"{self.source}: {text}" if self.source else text
+
+
+@dataclass
+class OpenInvoice:
+    """Remaining balance of one posted customer invoice"""
+
+    customer_id: str
+    invoice_id: str
+    due: date
+    remaining: Fraction
+    billing_id: str = ""
+    invoice: Any = field(default=None, compare=False, repr=False)  # GnuCash Invoice
+
+    def sort_key(self) -> Tuple[Fraction, int, str]:
+        return self.remaining, self.due.toordinal(), self.invoice_id
+
+
+def _payment_from_fields(fields: Dict[str, Any], source: str) -> IncomingPayment:
+    """
+    Build a payment from raw field values.
+
+    Raises:
+        ValueError: If a required field is missing or a value is invalid
+    """
+    values = {name: ("" if fields.get(name) is None else str(fields[name]).strip()) for name in PAYMENT_FIELDS}
+    missing = [name for name in REQUIRED_FIELDS if not values[name]]
+    if missing:
+        raise ValueError(f"{source}: missing {', '.join(missing)}")
+
+    try:
+        paid_on = datetime.strptime(values['date'], "%Y-%m-%d").date()
+    except ValueError as e:
+        raise ValueError(f"{source}: date must be in YYYY-MM-DD format, got: {values['date']}") from e
+    try:
+        value = Decimal(values['amount'])
+    except InvalidOperation as e:
+        raise ValueError(f"{source}: invalid amount: {values['amount']}") from e
+    if not value.is_finite():
+        raise ValueError(f"{source}: invalid amount: {values['amount']}")
+    amount = Fraction(value)
+    if amount <= 0:
+        raise ValueError(f"{source}: amount must be positive, got: {values['amount']}")
+
+    return IncomingPayment(
+        customer_id=values['customer_id'],
+        date=paid_on,
+        amount=amount,
+        bank_account=values['bank_account'],
+        memo=values['memo'],
+        num=values['num'],
+        billing_id=values['billing_id'],
+        source=source,
+    )
+
+
+def read_payments_csv(path: str) -> List[IncomingPayment]:
+    """
+    Read payments from a CSV file with a header row.
+
+    Args:
+        path: CSV file path
+
+    Returns:
+        Payments in file order
+
+    Raises:
+        ValueError: If a required column is missing or a row is invalid
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        missing = [name for name in REQUIRED_FIELDS if name not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"{path}: missing column(s) {', '.join(missing)}")
+        # Line 1 is the header
+        return [_payment_from_fields(row, f"{path}:{line}") for line, row in enumerate(reader, start=2)]
+
+
+def read_payments_plaintext(path: str) -> List[IncomingPayment]:
+    """
+    Read payments from top-level plaintext payment blocks.
+
+    Args:
+        path: Plaintext file path
+
+    Returns:
+        Payments in file order
+
+    Raises:
+        ValueError: If the file does not parse or a block is invalid
+    """
+    # The parser decodes values with the GnuCash utilities; CSV input does not need them
+    from services.plaintext_parser import DirectiveType, PlaintextParser
+
+    parser = PlaintextParser()
+    parser.parse_file(path)
+    if parser.errors:
+        raise ValueError(f"{path}: {'; '.join(parser.errors)}")
+
+    blocks = [d for d in parser.root_directive.children if d.type == DirectiveType.PAYMENT]
+    return [_payment_from_fields(d.metadata, f"{path}: payment {i}") for i, d in enumerate(blocks, start=1)]
+
+
+def read_payments(path: str) -> List[IncomingPayment]:
+    """Read a payment list, as CSV if the file name ends in .csv and as plaintext otherwise."""
+    if path.lower().endswith('.csv'):
+        return read_payments_csv(path)
+    return read_payments_plaintext(path)
+
+
+class OpenInvoiceIndex:
+    """Open invoices per customer, sorted by remaining amount, and by billing ID"""
+
+    def __init__(self, invoices: Iterable[OpenInvoice]):
+        """
+        Index open invoices.
+
+        Args:
+            invoices: Invoices with a positive remaining balance
+        """
+        self._keys: Dict[str, List[Tuple[Fraction, int, str]]] = {}
+        self._invoices: Dict[str, List[OpenInvoice]] = {}
+        self._by_billing_id: Dict[Tuple[str, str], List[OpenInvoice]] = {}
+
+        for invoice in sorted(invoices, key=OpenInvoice.sort_key):
+            if invoice.remaining <= 0:
+                continue
+            self._keys.setdefault(invoice.customer_id, []).append(invoice.sort_key())
+            self._invoices.setdefault(invoice.customer_id, []).append(invoice)
+            if invoice.billing_id:
+                self._by_billing_id.setdefault((invoice.customer_id, invoice.billing_id), []).append(invoice)
+        # Oldest due date first
+        for invoices_of_id in self._by_billing_id.values():
+            invoices_of_id.sort(key=lambda inv: (inv.due, inv.invoice_id))
+
+    def __len__(self) -> int:
+        return sum(len(keys) for keys in self._keys.values())
+
+    def _remove(self, invoice: OpenInvoice):
+        keys = self._keys[invoice.customer_id]
+        i = bisect.bisect_left(keys, invoice.sort_key())
+        del keys[i]
+        del self._invoices[invoice.customer_id][i]
+
+    def _insert(self, invoice: OpenInvoice):
+        keys = self._keys[invoice.customer_id]
+        i = bisect.bisect_left(keys, invoice.sort_key())
+        keys.insert(i, invoice.sort_key())
+        self._invoices[invoice.customer_id].insert(i, invoice)
+
+    def find(self, payment: IncomingPayment) -> Tuple[Optional[OpenInvoice], str]:
+        """
+        Find the invoice a payment pays, without changing the index.
+
+        Args:
+            payment: Incoming payment
+
+        Returns:
+            Tuple of (invoice or None, reason it did not match)
+        """
+        if not self._keys.get(payment.customer_id):
+            return None, f"no open invoices for customer {payment.customer_id}"
+
+        if payment.billing_id:
+            candidates = self._by_billing_id.get((payment.customer_id, payment.billing_id))
+            if not candidates:
+                return None, f"no open invoice with billing ID {payment.billing_id}"
+            invoice = candidates[0]
+            if payment.amount > invoice.remaining:
+                return None, (
+                    f"amount is more than the {format_amount(invoice.remaining)} "
+                    f"remaining on invoice {invoice.invoice_id}"
+                )
+            return invoice, ""
+
+        keys = self._keys[payment.customer_id]
+        # Smallest key with this remaining amount: the oldest due date
+        i = bisect.bisect_left(keys, (payment.amount,))
+        if i < len(keys) and keys[i][0] == payment.amount:
+            return self._invoices[payment.customer_id][i], ""
+        return None, f"no open invoice of {format_amount(payment.amount)} for customer {payment.customer_id}"
+
+    def settle(self, invoice: OpenInvoice, amount: Fraction):
+        """
+        Record a payment against an invoice found by find().
+
+        Args:
+            invoice: Matched invoice
+            amount: Amount paid
+        """
+        self._remove(invoice)
+        invoice.remaining -= amount
+        if invoice.remaining > 0:
+            self._insert(invoice)
+        elif invoice.billing_id:
+            self._by_billing_id[(invoice.customer_id, invoice.billing_id)].remove(invoice)
@@ -0,0 +1,502 @@
+"""
+Period reports: trial balance, income statement and balance sheet.
+
+Reports are built from a flat snapshot of split amounts, one entry per split:
+(account full name, posted date ordinal, amount numerator, amount denominator).
+The snapshot is extracted from the book once (see use_cases/report.py) and then
+aggregated here without touching GnuCash objects.
+
+Aggregation is a single group-by over the snapshot: each entry's period is found
+by bisecting the sorted period start dates, and amounts are summed as integers
+per (account, period, denominator) before being combined into exact Fractions.
+Account totals are then rolled up through the account hierarchy, keeping one
+row per commodity so amounts in different commodities are never added together.
+
+Amounts are in each account's own commodity. Positive = debit, negative = credit;
+the income statement and balance sheet flip the sign of credit-normal categories
+(Income, Liability, Equity) so their usual balances print as positive numbers.
+"""
+
+import csv
+import io
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from fractions import Fraction
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from services.account_category import AccountCategory
+
+PERIODS = ("month", "quarter", "year")
+
+# (account full name, posted date ordinal, amount numerator, amount denominator)
+SplitEntry = Tuple[str, int, int, int]
+
+CREDIT_NORMAL = (AccountCategory.INCOME, AccountCategory.LIABILITY, AccountCategory.EQUITY)
+
+
+@dataclass(frozen=True)
+class AccountInfo:
+    """Where an account sits in the hierarchy, and what it is"""
+
+    name: str  # full name, e.g. "Expenses:Travel:Train"
+    category: str  # AccountCategory value
+    commodity: str
+
+    @property
+    def depth(self) -> int:
+        return self.name.count(":")
+
+
+@dataclass
+class ReportRow:
+    """One account (and commodity) with an amount per period"""
+
+    account: str
+    depth: int
+    commodity: str
+    amounts: List[Fraction]
+
+
+@dataclass
+class ReportSection:
+    """Rows of one category, with a total per commodity"""
+
+    title: str
+    rows: List[ReportRow] = field(default_factory=list)
+    totals: Dict[str, List[Fraction]] = field(default_factory=dict)
+
+
+@dataclass
+class PeriodReport:
+    """A report with one column per period"""
+
+    title: str
+    periods: List[str]
+    sections: List[ReportSection] = field(default_factory=list)
+    summary: List[Tuple[str, str, List[Fraction]]] = field(default_factory=list)  # (label, commodity, amounts)
+
+
+# ---------------------------------------------------------------------------
+# Periods
+# ---------------------------------------------------------------------------
+
+
+def period_start(day: date, period: str) -> date:
+    """
+    First day of the period containing a date.
+
+    Args:
+        day: Any date
+        period: One of PERIODS
+
+    Returns:
+        Start date of the month, quarter or year
+    """
+    if period == "month":
+        return date(day.year, day.month, 1)
+    if period == "quarter":
+        return date(day.year, (day.month - 1) // 3 * 3 + 1, 1)
+    if period == "year":
+        return date(day.year, 1, 1)
+    raise ValueError(f"Unknown period '{period}'. Available: {', '.join(PERIODS)}")
+
+
+def _next_period_start(start: date, period: str) -> date:
+    months = {"month": 1, "quarter": 3, "year": 12}[period]
+    month_index = start.year * 12 + start.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def period_starts(start: date, end: date, period: str) -> List[date]:
+    """
+    Start dates of every period from the one containing start to the one containing end.
+
+    Args:
+        start: First date covered
+        end: Last date covered
+        period: One of PERIODS
+
+    Returns:
+        Sorted list of period start dates
+    """
+    starts = []
+    current = period_start(start, period)
+    while current <= end:
+        starts.append(current)
+        current = _next_period_start(current, period)
+    return starts
+
+
+def period_label(start: date, period: str) -> str:
+    """
+    Column label of a period, e.g. 2024-03, 2024-Q1 or 2024.
+
+    Args:
+        start: Period start date
+        period: One of PERIODS
+
+    Returns:
+        Label string
+    """
+    if period == "month":
+        return f"{start.year}-{start.month:02d}"
+    if period == "quarter":
+        return f"{start.year}-Q{(start.month - 1) // 3 + 1}"
+    return str(start.year)
+
+
+# ---------------------------------------------------------------------------
+# Aggregation
+# ---------------------------------------------------------------------------
+
+
+def aggregate(
+    entries: Iterable[SplitEntry],
+    starts: Sequence[date],
+    end: date,
+) -> Tuple[Dict[str, Fraction], Dict[str, List[Fraction]]]:
+    """
+    Group split amounts by (account, period).
+
+    Args:
+        entries: Split snapshot
+        starts: Sorted period start dates
+        end: Last date included; later entries are ignored
+
+    Returns:
+        Tuple of (opening balance per account before the first period,
+        activity per account per period)
+    """
+    start_ordinals = [start.toordinal() for start in starts]
+    end_ordinal = end.toordinal()
+    first_ordinal = start_ordinals[0] if start_ordinals else end_ordinal + 1
+
+    # (account, period index or -1 for opening, denominator) -> numerator sum
+    sums: Dict[Tuple[str, int, int], int] = {}
+    for account, ordinal, num, denom in entries:
+        if ordinal > end_ordinal:
+            continue
+        if denom < 0:
+            num, denom = num * -denom, 1
+        index = bisect_right(start_ordinals, ordinal) - 1 if ordinal >= first_ordinal else -1
+        key = (account, index, denom)
+        sums[key] = sums.get(key, 0) + num
+
+    opening: Dict[str, Fraction] = {}
+    activity: Dict[str, List[Fraction]] = {}
+    for (account, index, denom), num in sums.items():
+        amount = Fraction(num, denom)
+        if index < 0:
+            opening[account] = opening.get(account, Fraction(0)) + amount
+        else:
+            amounts = activity.setdefault(account, [Fraction(0)] * len(starts))
+            amounts[index] += amount
+    return opening, activity
+
+
+def cumulative(opening: Dict[str, Fraction], activity: Dict[str, List[Fraction]], periods: int) -> Dict[str, List[Fraction]]:
+    """
+    Balances at the end of each period.
+
+    Args:
+        opening: Opening balance per account
+        activity: Activity per account per period
+        periods: Number of periods
+
+    Returns:
+        Closing balance per account per period
+    """
+    balances: Dict[str, List[Fraction]] = {}
+    for account in set(opening) | set(activity):
+        total = opening.get(account, Fraction(0))
+        amounts = activity.get(account, [Fraction(0)] * periods)
+        running = []
+        for amount in amounts:
+            total += amount
+            running.append(total)
+        balances[account] = running
+    return balances
+
+
+def roll_up(
+    accounts: Sequence[AccountInfo],
+    values: Dict[str, List[Fraction]],
+    periods: int,
+) -> Dict[Tuple[str, str], List[Fraction]]:
+    """
+    Add every account's amounts to all of its ancestors.
+
+    Args:
+        accounts: Accounts in hierarchy order
+        values: Own amounts per account per period
+        periods: Number of periods
+
+    Returns:
+        Rolled-up amounts keyed by (account name, commodity)
+    """
+    by_name = {info.name: info for info in accounts}
+    rolled: Dict[Tuple[str, str], List[Fraction]] = {}
+    for name, amounts in values.items():
+        info = by_name.get(name)
+        if info is None:
+            continue
+        current: Optional[str] = name
+        while current is not None:
+            totals = rolled.setdefault((current, info.commodity), [Fraction(0)] * periods)
+            for i, amount in enumerate(amounts):
+                totals[i] += amount
+            current = current.rsplit(":", 1)[0] if ":" in current else None
+    return rolled
+
+
+# ---------------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------------
+
+
+class PeriodReportBuilder:
+    """Build period reports from an account list and a split snapshot"""
+
+    def __init__(
+        self,
+        accounts: Sequence[AccountInfo],
+        entries: Iterable[SplitEntry],
+        period: str,
+        start: date,
+        end: date,
+    ):
+        """
+        Aggregate the snapshot once for all reports.
+
+        Args:
+            accounts: Accounts in hierarchy order (parents before children)
+            entries: Split snapshot
+            period: One of PERIODS
+            start: First date reported
+            end: Last date reported
+
+        Raises:
+            ValueError: If period is unknown or start is after end
+        """
+        if start > end:
+            raise ValueError(f"Report start {start} is after end {end}")
+
+        self.accounts = list(accounts)
+        self.period = period
+        self.starts = period_starts(start, end, period)
+        self.periods = [period_label(s, period) for s in self.starts]
+        self.opening, self.activity = aggregate(entries, self.starts, end)
+        self._categories = {info.name: info.category for info in self.accounts}
+
+    def trial_balance(self) -> PeriodReport:
+        """
+        Balance of every account at the end of each period.
+
+        Returns:
+            PeriodReport with one section per category and a per-commodity total
+            that is zero when the book balances
+        """
+        balances = cumulative(self.opening, self.activity, len(self.starts))
+        report = PeriodReport("Trial Balance", self.periods)
+        report.sections = self._sections(
+            balances,
+            [AccountCategory.ASSET, AccountCategory.LIABILITY, AccountCategory.EQUITY,
+             AccountCategory.INCOME, AccountCategory.EXPENSE, AccountCategory.OTHER],
+            signed=False,
+        )
+        report.summary = [
+            ("Total (debits - credits)", commodity, amounts)
+            for commodity, amounts in sorted(self._own_totals(balances, None).items())
+        ]
+        return report
+
+    def income_statement(self) -> PeriodReport:
+        """
+        Income and expenses within each period, and net income.
+
+        Returns:
+            PeriodReport with Income and Expense sections and a net income line
+        """
+        report = PeriodReport("Income Statement", self.periods)
+        report.sections = self._sections(
+            self.activity, [AccountCategory.INCOME, AccountCategory.EXPENSE], signed=True
+        )
+
+        net = self._net_income(self.activity)
+        report.summary = [("Net income", commodity, amounts) for commodity, amounts in sorted(net.items())]
+        return report
+
+    def balance_sheet(self) -> PeriodReport:
+        """
+        Assets, liabilities and equity at the end of each period.
+
+        Income and expenses not yet closed to equity are shown as a separate
+        line, so assets equal liabilities plus equity plus that line.
+
+        Returns:
+            PeriodReport with Asset, Liability and Equity sections
+        """
+        balances = cumulative(self.opening, self.activity, len(self.starts))
+        report = PeriodReport("Balance Sheet", self.periods)
+        report.sections = self._sections(
+            balances,
+            [AccountCategory.ASSET, AccountCategory.LIABILITY, AccountCategory.EQUITY],
+            signed=True,
+        )
+
+        unclosed = self._net_income(balances)
+        report.summary = [
+            ("Net income not closed to equity", commodity, amounts)
+            for commodity, amounts in sorted(unclosed.items())
+        ]
+        return report
+
+    def _sections(
+        self,
+        values: Dict[str, List[Fraction]],
+        categories: Sequence[str],
+        signed: bool,
+    ) -> List[ReportSection]:
+        """Rows and totals for each category, in hierarchy order."""
+        periods = len(self.starts)
+        rolled_by_name: Dict[str, List[Tuple[str, List[Fraction]]]] = {}
+        for (name, commodity), amounts in sorted(roll_up(self.accounts, values, periods).items()):
+            if any(amounts):
+                rolled_by_name.setdefault(name, []).append((commodity, amounts))
+
+        sections = []
+        for category in categories:
+            sign = -1 if signed and category in CREDIT_NORMAL else 1
+            section = ReportSection(category)
+
+            for info in self.accounts:
+                if info.category != category:
+                    continue
+                for commodity, amounts in rolled_by_name.get(info.name, ()):
+                    section.rows.append(ReportRow(
+                        info.name, info.depth, commodity, [sign * amount for amount in amounts]
+                    ))
+
+            for commodity, amounts in sorted(self._own_totals(values, category).items()):
+                section.totals[commodity] = [sign * amount for amount in amounts]
+
+            if section.rows:
+                sections.append(section)
+        return sections
+
+    def _own_totals(self, values: Dict[str, List[Fraction]], category: Optional[str]) -> Dict[str, List[Fraction]]:
+        """Sum of each account's own amounts per commodity (no double counting)."""
+        periods = len(self.starts)
+        commodities = {info.name: info.commodity for info in self.accounts}
+        totals: Dict[str, List[Fraction]] = {}
+        for name, amounts in values.items():
+            if name not in commodities:
+                continue
+            if category is not None and self._categories[name] != category:
+                continue
+            total = totals.setdefault(commodities[name], [Fraction(0)] * periods)
+            for i, amount in enumerate(amounts):
+                total[i] += amount
+        return totals
+
+    def _net_income(self, values: Dict[str, List[Fraction]]) -> Dict[str, List[Fraction]]:
+        """Income minus expenses per commodity (income is credit-normal, so negate the sum)."""
+        net: Dict[str, List[Fraction]] = {}
+        for category in (AccountCategory.INCOME, AccountCategory.EXPENSE):
+            for commodity, amounts in self._own_totals(values, category).items():
+                total = net.setdefault(commodity, [Fraction(0)] * len(self.starts))
+                for i, amount in enumerate(amounts):
+                    total[i] -= amount
+        return net
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+
+def format_amount(amount: Fraction) -> str:
+    """
+    Format an amount as a decimal with at least two places.
+
+    Amounts whose denominator is a power of ten (or divides one) print exactly;
+    others are rounded to six places.
+
+    Args:
+        amount: Exact amount
+
+    Returns:
+        Decimal string, e.g. "-1234.50"
+    """
+    denom = amount.denominator
+    twos = fives = 0
+    while denom % 2 == 0:
+        denom //= 2
+        twos += 1
+    while denom % 5 == 0:
+        denom //= 5
+        fives += 1
+    places = max(twos, fives) if denom == 1 else 6
+    places = max(2, places)
+
+    value = Decimal(amount.numerator) / Decimal(amount.denominator)
+    return f"{value:.{places}f}"
+
+
+def render_text(report: PeriodReport) -> str:
+    """
+    Render a report as an aligned text table.
+
+    Args:
+        report: PeriodReport
+
+    Returns:
+        Report text
+    """
+    lines: List[List[str]] = [["Account", "Commodity"] + report.periods]
+    for section in report.sections:
+        lines.append([section.title, ""] + [""] * len(report.periods))
+        for row in section.rows:
+            label = "  " * (row.depth + 1) + row.account.rsplit(":", 1)[-1]
+            lines.append([label, row.commodity] + [format_amount(a) for a in row.amounts])
+        for commodity, amounts in section.totals.items():
+            lines.append([f"Total {section.title}", commodity] + [format_amount(a) for a in amounts])
+        lines.append([""] * (len(report.periods) + 2))
+    for label, commodity, amounts in report.summary:
+        lines.append([label, commodity] + [format_amount(a) for a in amounts])
+
+    widths = [max(len(line[i]) for line in lines) for i in range(len(lines[0]))]
+    out = [report.title, "=" * len(report.title)]
+    for line in lines:
+        cells = [line[0].ljust(widths[0]), line[1].ljust(widths[1])]
+        cells += [cell.rjust(width) for cell, width in zip(line[2:], widths[2:])]
+        out.append("  ".join(cells).rstrip())
+    return "\n".join(out) + "\n"
+
+
+def render_csv(report: PeriodReport) -> str:
+    """
+    Render a report as CSV, one row per account and commodity.
+
+    Columns: section, account (full name), commodity, then one per period.
+    Section totals and summary lines use "Total" and "Summary" as the section.
+
+    Args:
+        report: PeriodReport
+
+    Returns:
+        CSV text
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["section", "account", "commodity"] + report.periods)
+    for section in report.sections:
+        for row in section.rows:
+            writer.writerow([section.title, row.account, row.commodity] + [format_amount(a) for a in row.amounts])
+        for commodity, amounts in section.totals.items():
+            writer.writerow(["Total", section.title, commodity] + [format_amount(a) for a in amounts])
+    for label, commodity, amounts in report.summary:
+        writer.writerow(["Summary", label, commodity] + [format_amount(a) for a in amounts])
+    return buffer.getvalue()
@@ -0,0 +1,245 @@
+"""
+Account register queries.
+
+Filters one account's register the way GnuCash's register window shows it: the
+account's own split list, in posted-date order, with a running balance.
+
+The engine keeps each account's split list sorted by posted date, so the split
+list doubles as a date index. A --from/--to range is found by binary search
+over it (reading O(log n) transaction dates), and only splits inside the range
+are examined. Description and amount filters are applied while walking the
+range, and the walk stops as soon as --limit matches are found (or, for
+--tail, walks backwards from the end of the range). The running balance is the
+engine's per-split balance (xaccSplitGetBalance), so no history before the
+range has to be summed.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date
+from fractions import Fraction
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Sequence
+
+from services.period_report import format_amount
+
+SPLIT_TRANSACTION = "-- Split Transaction --"
+
+
+@dataclass
+class RegisterFilter:
+    """Conditions a register line must meet"""
+
+    start: Optional[date] = None
+    end: Optional[date] = None
+    description: Optional[Pattern] = None  # matched with search()
+    min_amount: Optional[Fraction] = None  # on the absolute amount
+    max_amount: Optional[Fraction] = None  # on the absolute amount
+    limit: Optional[int] = None  # first N matches
+    tail: Optional[int] = None  # last N matches
+
+    @classmethod
+    def build(
+        cls,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        description_regex: Optional[str] = None,
+        ignore_case: bool = False,
+        min_amount: Optional[Fraction] = None,
+        max_amount: Optional[Fraction] = None,
+        limit: Optional[int] = None,
+        tail: Optional[int] = None,
+    ) -> 'RegisterFilter':
+        """
+        Build a filter, checking that its options are consistent.
+
+        Raises:
+            ValueError: If the regex is invalid, a range is reversed, or both
+                limit and tail are given
+        """
+        if start is not None and end is not None and start > end:
+            raise ValueError("--from must not be after --to.")
+        if min_amount is not None and max_amount is not None and min_amount > max_amount:
+            raise ValueError("--min-amount must not be greater than --max-amount.")
+        if limit is not None and tail is not None:
+            raise ValueError("Use either --limit or --tail, not both.")
+        if (limit is not None and limit < 1) or (tail is not None and tail < 1):
+            raise ValueError("--limit and --tail must be at least 1.")
+
+        pattern = None
+        if description_regex is not None:
+            try:
+                pattern = re.compile(description_regex, re.IGNORECASE if ignore_case else 0)
+            except re.error as e:
+                raise ValueError(f"Invalid --description-regex: {e}") from e
+
+        return cls(
+            start=start,
+            end=end,
+            description=pattern,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            limit=limit,
+            tail=tail,
+        )
+
+
+@dataclass
+class RegisterLine:
+    """One split of the queried account"""
+
+    date: date
+    num: str
+    description: str
+    transfer: str  # other account, or SPLIT_TRANSACTION
+    amount: Fraction
+    balance: Fraction  # running balance after this split
+
+
+def _to_fraction(numeric) -> Fraction:
+    return Fraction(numeric.num(), numeric.denom())
+
+
+def _split_ordinal(split) -> int:
+    posted = split.GetParent().GetDate()
+    return date(posted.year, posted.month, posted.day).toordinal()
+
+
+def lower_bound(splits: Sequence, ordinal: int) -> int:
+    """Index of the first split posted on or after a date ordinal."""
+    lo, hi = 0, len(splits)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _split_ordinal(splits[mid]) < ordinal:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def upper_bound(splits: Sequence, ordinal: int) -> int:
+    """Index of the first split posted after a date ordinal."""
+    lo, hi = 0, len(splits)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _split_ordinal(splits[mid]) <= ordinal:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+class RegisterQuery:
+    """Filter the register of one account"""
+
+    def __init__(self, account_name: Callable[[object], str]):
+        """
+        Initialize query.
+
+        Args:
+            account_name: Function giving an account's full name, used for the
+                transfer column
+        """
+        self.account_name = account_name
+
+    def _matches(self, split, query: RegisterFilter) -> bool:
+        description = query.description
+        if description is not None and not description.search(split.GetParent().GetDescription() or ""):
+            return False
+        if query.min_amount is None and query.max_amount is None:
+            return True
+
+        amount = abs(_to_fraction(split.GetAmount()))
+        if query.min_amount is not None and amount < query.min_amount:
+            return False
+        return query.max_amount is None or amount <= query.max_amount
+
+    def _transfer(self, split) -> str:
+        ptr = int(split.instance)
+        others = [s for s in split.GetParent().GetSplitList() if int(s.instance) != ptr]
+        if len(others) != 1:
+            return SPLIT_TRANSACTION
+        account = others[0].GetAccount()
+        return self.account_name(account) if account is not None else ""
+
+    def _line(self, split) -> RegisterLine:
+        tx = split.GetParent()
+        posted = tx.GetDate()
+        return RegisterLine(
+            date=date(posted.year, posted.month, posted.day),
+            num=tx.GetNum() or "",
+            description=tx.GetDescription() or "",
+            transfer=self._transfer(split),
+            amount=_to_fraction(split.GetAmount()),
+            balance=_to_fraction(split.GetBalance()),
+        )
+
+    def run(self, account, query: RegisterFilter) -> List[RegisterLine]:
+        """
+        Find the register lines of an account that match a filter.
+
+        Args:
+            account: GnuCash Account object
+            query: Conditions and limits
+
+        Returns:
+            Matching lines in posted-date order
+        """
+        splits = account.GetSplitList()
+        first = 0 if query.start is None else lower_bound(splits, query.start.toordinal())
+        stop = len(splits) if query.end is None else upper_bound(splits, query.end.toordinal())
+
+        if query.tail is not None:
+            indexes: Iterable[int] = range(stop - 1, first - 1, -1)
+            wanted = query.tail
+        else:
+            indexes = range(first, stop)
+            wanted = query.limit
+
+        matched = []
+        for i in indexes:
+            if self._matches(splits[i], query):
+                matched.append(splits[i])
+                if wanted is not None and len(matched) >= wanted:
+                    break
+
+        if query.tail is not None:
+            matched.reverse()
+        return [self._line(split) for split in matched]
+
+
+def render_register(account: str, lines: List[RegisterLine]) -> str:
+    """
+    Format register lines as an aligned text table.
+
+    Args:
+        account: Full name of the queried account
+        lines: Lines to print
+
+    Returns:
+        Text ending in a newline
+    """
+    rows = [["Date", "Num", "Description", "Transfer", "Amount", "Balance"]]
+    for line in lines:
+        rows.append([
+            line.date.isoformat(),
+            line.num,
+            line.description,
+            line.transfer,
+            format_amount(line.amount),
+            format_amount(line.balance),
+        ])
+
+    widths: Dict[int, int] = {}
+    for row in rows:
+        for i, cell in enumerate(row):
+            widths[i] = max(widths.get(i, 0), len(cell))
+
+    out = [account]
+    for row in rows:
+        cells = [
+            cell.rjust(widths[i]) if i >= 4 else cell.ljust(widths[i])
+            for i, cell in enumerate(row)
+        ]
+        out.append("  ".join(cells).rstrip())
+    out.append(f"{len(lines)} line(s)")
+    return "\n".join(out) + "\n"
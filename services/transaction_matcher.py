@@ -28,10 +28,289 @@ receipt or external document. It is never auto-generated by GnuCash. Therefore:
 GnuCash 3.x–5.x API compatibility (GetDocLink / GetAssociation) is covered by
 scripts/test-all-versions.sh.
 
+## Amount keys
+
+Duplicate vs conflict classification compares split values. Instead of comparing
+transactions pairwise, each transaction gets an amount key: the sorted multiset of
+(account, value numerator, value denominator) with every value reduced to lowest
+terms, so 5000/100 and 50/1 produce the same key. Keys are computed once per
+transaction and stored per signature, making classification a single set lookup
+even when thousands of transactions share a signature (e.g. same-day card charges).
+
+## Date-window (fuzzy) matching
+
+Bank feeds often post a charge one to three days away from the manually entered
+transaction. Fuzzy matching relaxes the date to a window of +/- N days and optionally
+allows a small per-account amount difference. Existing transactions are snapshotted
+into MatchRecords and kept in a per-account sorted date index, so candidates for an
+incoming transaction are found with bisect on its most selective account: O(log n + k)
+where k is the number of transactions in the window. Account set and doc_link must
+still match exactly. Each match carries a confidence between 0 and 1 that decreases
+with the day offset and with the amount difference.
+
+## GUID lookups
+
+GuidIndex gives O(1) lookup of transactions by GUID. It either holds a dict keyed by
+the 16-byte binary GUID (built once from a transaction list), or, when created with
+GuidIndex.from_book, asks the engine directly (xaccTransLookup through the book's
+transaction collection), which needs no build step and also sees transactions created
+after the index. find_by_guid, plaintext import and beancount import share it.
+
 This service operates on GnuCash Transaction objects directly, no duplicate domain models.
 """
 
-from typing import List, Optional, Set, Tuple
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime
+from fractions import Fraction
+from math import gcd
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+Signature = Tuple[str, Tuple[str, ...], Optional[str]]
+AmountKey = Tuple[Tuple[str, int, int], ...]
+
+
+@dataclass
+class MatchRecord:
+    """Snapshot of a transaction used for date-window matching"""
+    date: date
+    accounts: Tuple[str, ...]  # sorted, one entry per split
+    amounts: Dict[str, Fraction]  # total split value per account
+    doc_link: Optional[str] = None
+    description: str = ""
+    source: object = None  # gnucash.Transaction or PlaintextDirective
+
+
+@dataclass
+class FuzzyMatch:
+    """An incoming transaction matched to an existing one within a date window"""
+    incoming: MatchRecord
+    existing: MatchRecord
+    day_offset: int
+    amount_difference: Fraction
+    confidence: float
+
+
+def _score_match(
+    incoming: MatchRecord,
+    existing: MatchRecord,
+    window_days: int,
+    amount_tolerance: Fraction,
+) -> Optional[FuzzyMatch]:
+    """
+    Score a candidate pair, or return None if it is outside the window or tolerance.
+
+    confidence = date_score * amount_score, where
+      date_score   = 1 - day_offset / (window_days + 1)
+      amount_score = 1 for exact amounts, falling to 0.5 at the tolerance limit
+    """
+    if incoming.accounts != existing.accounts or incoming.doc_link != existing.doc_link:
+        return None
+
+    day_offset = abs((incoming.date - existing.date).days)
+    if day_offset > window_days:
+        return None
+
+    difference = max(
+        (abs(value - existing.amounts.get(account, Fraction(0)))
+         for account, value in incoming.amounts.items()),
+        default=Fraction(0),
+    )
+    if difference > amount_tolerance:
+        return None
+
+    date_score = 1 - Fraction(day_offset, window_days + 1)
+    amount_score = 1 - difference / (2 * amount_tolerance) if difference else Fraction(1)
+    return FuzzyMatch(
+        incoming=incoming,
+        existing=existing,
+        day_offset=day_offset,
+        amount_difference=difference,
+        confidence=round(float(date_score * amount_score), 2),
+    )
+
+
+class TransactionDateIndex:
+    """
+    Per-account sorted date index over MatchRecords.
+
+    Each account maps to parallel sorted lists of date ordinals and record
+    positions, so all records touching an account within a date range are
+    found with two bisects.
+    """
+
+    def __init__(self, records: Iterable[MatchRecord] = ()):
+        """
+        Build the index.
+
+        Args:
+            records: MatchRecords of existing transactions
+        """
+        self._records: List[MatchRecord] = []
+        buckets: Dict[str, List[Tuple[int, int]]] = {}
+        for record in records:
+            position = len(self._records)
+            self._records.append(record)
+            ordinal = record.date.toordinal()
+            for account in set(record.accounts):
+                buckets.setdefault(account, []).append((ordinal, position))
+
+        self._dates: Dict[str, List[int]] = {}
+        self._positions: Dict[str, List[int]] = {}
+        for account, bucket in buckets.items():
+            bucket.sort()
+            self._dates[account] = [ordinal for ordinal, _ in bucket]
+            self._positions[account] = [position for _, position in bucket]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def candidates(self, account: str, on: date, window_days: int) -> List[MatchRecord]:
+        """
+        Get records touching an account within +/- window_days of a date.
+
+        Args:
+            account: Full account name
+            on: Center date of the window
+            window_days: Days before and after `on` to include
+
+        Returns:
+            Matching records in date order
+        """
+        dates = self._dates.get(account)
+        if not dates:
+            return []
+        ordinal = on.toordinal()
+        lo = bisect_left(dates, ordinal - window_days)
+        hi = bisect_right(dates, ordinal + window_days)
+        positions = self._positions[account]
+        return [self._records[positions[i]] for i in range(lo, hi)]
+
+    def find_best_match(
+        self,
+        record: MatchRecord,
+        window_days: int,
+        amount_tolerance: Fraction = Fraction(0),
+    ) -> Optional[FuzzyMatch]:
+        """
+        Find the highest-confidence existing record matching `record`.
+
+        Candidates are taken from the record's least-used account, which keeps
+        the number of scored candidates small.
+
+        Args:
+            record: Incoming transaction snapshot
+            window_days: Maximum date distance in days
+            amount_tolerance: Maximum per-account value difference
+
+        Returns:
+            Best FuzzyMatch, or None if nothing matches
+        """
+        if not record.accounts:
+            return None
+
+        probe = min(set(record.accounts), key=lambda a: len(self._dates.get(a, ())))
+        best = None
+        for candidate in self.candidates(probe, record.date, window_days):
+            match = _score_match(record, candidate, window_days, amount_tolerance)
+            if match is not None and (best is None or match.confidence > best.confidence):
+                best = match
+        return best
+
+
+class GuidIndex:
+    """
+    Transactions keyed by GUID.
+
+    Keys are the 16-byte binary form of the 32-character hex GUID string, so each
+    transaction's GUID is converted once when indexed. An index created with
+    from_book falls back to an engine lookup for GUIDs it has not seen.
+    """
+
+    def __init__(self, transactions: Iterable = ()):
+        """
+        Build the index.
+
+        Args:
+            transactions: GnuCash Transaction objects to index
+        """
+        self._book = None
+        self._by_guid: Dict[bytes, object] = {}
+        for tx in transactions:
+            self.add(tx)
+
+    @classmethod
+    def from_book(cls, book) -> 'GuidIndex':
+        """
+        Create an index that resolves GUIDs through the book's transaction collection.
+
+        Args:
+            book: GnuCash Book
+
+        Returns:
+            GuidIndex backed by engine lookups
+        """
+        index = cls()
+        index._book = book
+        return index
+
+    @staticmethod
+    def _key(guid: str) -> Optional[bytes]:
+        """Convert a GUID hex string to its 16-byte key, or None if malformed."""
+        try:
+            key = bytes.fromhex(guid)
+        except (TypeError, ValueError):
+            return None
+        return key if len(key) == 16 else None
+
+    def add(self, transaction):
+        """
+        Add a transaction to the index.
+
+        Args:
+            transaction: GnuCash Transaction object
+        """
+        key = self._key(transaction.GetGUID().to_string())
+        if key is not None:
+            self._by_guid[key] = transaction
+
+    def get(self, guid: str) -> Optional[object]:  # Optional[gnucash.Transaction]
+        """
+        Look up a transaction by GUID.
+
+        Args:
+            guid: GnuCash GUID string (32-character hex)
+
+        Returns:
+            Transaction object if found, None otherwise
+        """
+        key = self._key(guid)
+        if key is None:
+            return None
+
+        tx = self._by_guid.get(key)
+        if tx is None and self._book is not None:
+            tx = self._lookup_in_book(guid)
+            if tx is not None:
+                self._by_guid[key] = tx
+        return tx
+
+    def _lookup_in_book(self, guid: str) -> Optional[object]:
+        """Resolve a GUID with xaccTransLookup."""
+        from gnucash.gnucash_core import GUID
+        from gnucash.gnucash_core_c import string_to_guid
+
+        gnc_guid = GUID()
+        if not string_to_guid(guid, gnc_guid.get_instance()):
+            return None
+        return gnc_guid.TransLookup(self._book)
+
+    def __contains__(self, guid: str) -> bool:
+        return self.get(guid) is not None
+
+    def __len__(self) -> int:
+        """Number of transactions held in the dict (engine-backed lookups excluded)."""
+        return len(self._by_guid)
 
 
 class TransactionMatcher:
@@ -70,40 +349,254 @@ class TransactionMatcher:
         duplicates = []
         conflicts = []
 
-        # Build lookup index of existing transactions by signature
-        existing_by_signature = {}
-        for tx in existing_transactions:
-            sig = self.get_signature(tx)
-            if sig not in existing_by_signature:
-                existing_by_signature[sig] = []
-            existing_by_signature[sig].append(tx)
+        # Build lookup index of existing amount keys by signature
+        name_cache: Dict[int, str] = {}
+        existing_index = self.build_amount_index(existing_transactions, name_cache)
 
         # Check each incoming transaction
         for incoming_tx in incoming_transactions:
-            incoming_sig = self.get_signature(incoming_tx)
+            incoming_sig, incoming_amounts = self.get_match_key(incoming_tx, name_cache)
+            amount_keys = existing_index.get(incoming_sig)
 
-            if incoming_sig not in existing_by_signature:
+            if amount_keys is None:
                 # No match found - this is a new transaction
                 new.append(incoming_tx)
+            elif incoming_amounts in amount_keys:
+                # Same signature and same amounts = duplicate
+                duplicates.append(incoming_tx)
             else:
-                # Found transaction(s) with same signature
-                matching_txs = existing_by_signature[incoming_sig]
+                # Same signature but different amounts = conflict
+                conflicts.append(incoming_tx)
+
+        return new, duplicates, conflicts
 
-                # Check if amounts match (duplicate) or differ (conflict)
-                is_duplicate = False
-                for existing_tx in matching_txs:
-                    if self._amounts_match(incoming_tx, existing_tx):
-                        is_duplicate = True
-                        duplicates.append(incoming_tx)
-                        break
+    def build_amount_index(
+        self,
+        transactions: List,  # List[gnucash.Transaction]
+        name_cache: Optional[Dict[int, str]] = None,
+    ) -> Dict[Signature, Set[AmountKey]]:
+        """
+        Index transactions by signature, keeping the set of amount keys seen per signature.
 
-                if not is_duplicate:
-                    # Same signature but different amounts = conflict
-                    conflicts.append(incoming_tx)
+        Args:
+            transactions: GnuCash Transaction objects to index
+            name_cache: Optional account-name cache shared with get_match_key
 
-        return new, duplicates, conflicts
+        Returns:
+            Dictionary mapping signature to the set of amount keys with that signature
+        """
+        index: Dict[Signature, Set[AmountKey]] = {}
+        for tx in transactions:
+            sig, amount_key = self.get_match_key(tx, name_cache)
+            index.setdefault(sig, set()).add(amount_key)
+        return index
+
+    def index_by_signature(
+        self,
+        transactions: List,  # List[gnucash.Transaction]
+    ) -> Dict[Signature, List]:
+        """
+        Group transactions by signature.
 
-    def get_signature(self, transaction) -> Tuple[str, Tuple[str, ...], Optional[str]]:
+        Args:
+            transactions: GnuCash Transaction objects to group
+
+        Returns:
+            Dictionary mapping signature to transactions with that signature, in input order
+        """
+        index: Dict[Signature, List] = {}
+        for tx in transactions:
+            index.setdefault(self.get_signature(tx), []).append(tx)
+        return index
+
+    def get_match_key(
+        self,
+        transaction,
+        name_cache: Optional[Dict[int, str]] = None,
+    ) -> Tuple[Signature, AmountKey]:
+        """
+        Extract signature and amount key in a single pass over the splits.
+
+        Args:
+            transaction: GnuCash Transaction object
+            name_cache: Optional dict caching full account names by account pointer
+
+        Returns:
+            Tuple of (signature, amount_key)
+
+        Example:
+            (("2024-01-15", ("Assets:Bank:Checking", "Expenses:Groceries"), None),
+             (("Assets:Bank:Checking", -50, 1), ("Expenses:Groceries", 50, 1)))
+        """
+        account_names = []
+        amounts = []
+        for split in transaction.GetSplitList():
+            account_name = self._get_cached_account_name(split.GetAccount(), name_cache)
+            value = split.GetValue()
+            account_names.append(account_name)
+            amounts.append((account_name, value.num(), value.denom()))
+
+        signature = (
+            self._get_date_string(transaction),
+            tuple(sorted(account_names)),
+            self._get_doc_link(transaction),
+        )
+        return signature, self.make_amount_key(amounts)
+
+    @staticmethod
+    def make_amount_key(amounts: Iterable[Tuple[str, int, int]]) -> AmountKey:
+        """
+        Build an amount key from (account_name, numerator, denominator) triples.
+
+        Values are reduced to lowest terms with a positive denominator so equal
+        amounts written with different denominators produce the same key.
+
+        Args:
+            amounts: Iterable of (account_name, numerator, denominator)
+
+        Returns:
+            Sorted tuple of normalized (account_name, numerator, denominator)
+        """
+        normalized = []
+        for account_name, num, denom in amounts:
+            num, denom = int(num), int(denom)
+            if denom < 0:
+                num, denom = -num, -denom
+            divisor = gcd(num, denom) or 1
+            normalized.append((account_name, num // divisor, denom // divisor))
+        return tuple(sorted(normalized))
+
+    def find_fuzzy_duplicates(
+        self,
+        existing_transactions: List,  # List[gnucash.Transaction]
+        incoming_transactions: List,  # List[gnucash.Transaction]
+        window_days: int,
+        amount_tolerance: Fraction = Fraction(0),
+    ) -> Tuple[List, List[FuzzyMatch]]:
+        """
+        Find incoming transactions that match existing ones within a date window.
+
+        Args:
+            existing_transactions: Transactions already in GnuCash file
+            incoming_transactions: New transactions to check
+            window_days: Maximum date distance in days
+            amount_tolerance: Maximum per-account value difference
+
+        Returns:
+            Tuple of (new_transactions, matches)
+        """
+        name_cache: Dict[int, str] = {}
+        index = self.build_date_index(existing_transactions, name_cache)
+
+        new = []
+        matches = []
+        for incoming_tx in incoming_transactions:
+            record = self.record_from_transaction(incoming_tx, name_cache)
+            match = index.find_best_match(record, window_days, amount_tolerance)
+            if match is None:
+                new.append(incoming_tx)
+            else:
+                matches.append(match)
+
+        return new, matches
+
+    def build_date_index(
+        self,
+        transactions: List,  # List[gnucash.Transaction]
+        name_cache: Optional[Dict[int, str]] = None,
+    ) -> TransactionDateIndex:
+        """
+        Build a per-account date index over GnuCash transactions.
+
+        Args:
+            transactions: GnuCash Transaction objects to index
+            name_cache: Optional account-name cache
+
+        Returns:
+            TransactionDateIndex
+        """
+        return TransactionDateIndex(
+            self.record_from_transaction(tx, name_cache) for tx in transactions
+        )
+
+    def record_from_transaction(
+        self,
+        transaction,
+        name_cache: Optional[Dict[int, str]] = None,
+    ) -> MatchRecord:
+        """
+        Snapshot a GnuCash transaction for date-window matching.
+
+        Args:
+            transaction: GnuCash Transaction object
+            name_cache: Optional account-name cache
+
+        Returns:
+            MatchRecord
+        """
+        tx_date = transaction.GetDate()
+        account_names = []
+        amounts: Dict[str, Fraction] = {}
+        for split in transaction.GetSplitList():
+            account_name = self._get_cached_account_name(split.GetAccount(), name_cache)
+            value = split.GetValue()
+            account_names.append(account_name)
+            amounts[account_name] = (
+                amounts.get(account_name, Fraction(0)) + Fraction(value.num(), value.denom())
+            )
+
+        return MatchRecord(
+            date=date(tx_date.year, tx_date.month, tx_date.day),
+            accounts=tuple(sorted(account_names)),
+            amounts=amounts,
+            doc_link=self._get_doc_link(transaction),
+            description=transaction.GetDescription() or "",
+            source=transaction,
+        )
+
+    @staticmethod
+    def record_from_plaintext(
+        date_str: str,
+        splits: List[Tuple[str, str]],
+        doc_link: Optional[str] = None,
+        description: str = "",
+        source: object = None,
+    ) -> MatchRecord:
+        """
+        Snapshot plaintext transaction data for date-window matching.
+
+        Args:
+            date_str: Date in YYYY-MM-DD format
+            splits: List of (account_name, value) with value as a decimal or "num/denom" string
+            doc_link: doc_link value from plaintext metadata, or None if not set
+            description: Transaction description
+            source: Originating object (e.g. PlaintextDirective)
+
+        Returns:
+            MatchRecord
+        """
+        account_names = []
+        amounts: Dict[str, Fraction] = {}
+        for account_name, value in splits:
+            account_names.append(account_name)
+            amounts[account_name] = (
+                amounts.get(account_name, Fraction(0)) + Fraction(str(value).replace(',', '.'))
+            )
+
+        return MatchRecord(
+            date=datetime.strptime(date_str, "%Y-%m-%d").date(),
+            accounts=tuple(sorted(account_names)),
+            amounts=amounts,
+            doc_link=doc_link,
+            description=description or "",
+            source=source,
+        )
+
+    def get_signature(
+        self,
+        transaction,
+        name_cache: Optional[Dict[int, str]] = None,
+    ) -> Signature:
         """
         Extract transaction signature: (date, sorted_account_names, doc_link).
 
@@ -112,6 +605,7 @@ class TransactionMatcher:
 
         Args:
             transaction: GnuCash Transaction object
+            name_cache: Optional dict of account pointer to full name, shared across calls
 
         Returns:
             Tuple of (date_string, tuple_of_sorted_account_names, doc_link)
@@ -119,29 +613,22 @@ class TransactionMatcher:
         Example:
             ("2024-01-15", ("Assets:Bank:Checking", "Expenses:Groceries"), "receipts/2024-01-15.txt")
         """
-        tx_date = transaction.GetDate()
-        date_str = tx_date.strftime("%Y-%m-%d")
+        date_str = self._get_date_string(transaction)
 
         splits = transaction.GetSplitList()
         account_names = []
         for split in splits:
             account = split.GetAccount()
-            account_names.append(self._get_account_full_name(account))
-
-        # GetAssociation was renamed to GetDocLink in GnuCash 4.x
-        try:
-            doc_link = transaction.GetDocLink()
-        except AttributeError:
-            doc_link = transaction.GetAssociation()
+            account_names.append(self._get_cached_account_name(account, name_cache))
 
-        return (date_str, tuple(sorted(account_names)), doc_link)
+        return (date_str, tuple(sorted(account_names)), self._get_doc_link(transaction))
 
     def get_signature_for_plaintext(
         self,
         date_str: str,
         account_names: List[str],
         doc_link: Optional[str] = None,
-    ) -> Tuple[str, Tuple[str, ...], Optional[str]]:
+    ) -> Signature:
         """
         Create signature from plaintext transaction data (before creating GnuCash object).
 
@@ -159,7 +646,7 @@ class TransactionMatcher:
 
     def find_by_guid(
         self,
-        transactions: List,  # List[gnucash.Transaction]
+        transactions: Union[List, GuidIndex],  # List[gnucash.Transaction] or GuidIndex
         guid: str
     ) -> Optional[object]:  # Optional[gnucash.Transaction]
         """
@@ -168,13 +655,19 @@ class TransactionMatcher:
         GUIDs are unique identifiers assigned by GnuCash. Used for finding
         transactions that were previously exported from GnuCash.
 
+        Passing a list scans it once; for repeated lookups build a GuidIndex
+        (or GuidIndex.from_book) once and pass that instead.
+
         Args:
-            transactions: List of GnuCash Transaction objects
+            transactions: List of GnuCash Transaction objects, or a GuidIndex
             guid: GnuCash GUID string (32-character hex)
 
         Returns:
             Transaction object if found, None otherwise
         """
+        if isinstance(transactions, GuidIndex):
+            return transactions.get(guid)
+
         for tx in transactions:
             tx_guid = tx.GetGUID().to_string()
             if tx_guid == guid:
@@ -206,6 +699,40 @@ class TransactionMatcher:
 
         return ":".join(names)
 
+    def _get_cached_account_name(self, account, name_cache: Optional[Dict[int, str]]) -> str:
+        """
+        Get full account name, memoized by account pointer when a cache is given.
+
+        Args:
+            account: GnuCash Account object
+            name_cache: Dict of account pointer to full name, or None to skip caching
+
+        Returns:
+            Full account name with hierarchy separated by colons
+        """
+        if name_cache is None:
+            return self._get_account_full_name(account)
+
+        ptr = int(account.instance)
+        name = name_cache.get(ptr)
+        if name is None:
+            name = self._get_account_full_name(account)
+            name_cache[ptr] = name
+        return name
+
+    @staticmethod
+    def _get_date_string(transaction) -> str:
+        """Get transaction posted date as YYYY-MM-DD."""
+        return transaction.GetDate().strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _get_doc_link(transaction) -> Optional[str]:
+        """Get transaction doc_link (GetAssociation was renamed to GetDocLink in GnuCash 4.x)."""
+        try:
+            return transaction.GetDocLink()
+        except AttributeError:
+            return transaction.GetAssociation()
+
     def _amounts_match(self, tx1, tx2) -> bool:
         """
         Check if two transactions have matching split amounts.
@@ -220,36 +747,9 @@ class TransactionMatcher:
         Returns:
             True if all split amounts match, False otherwise
         """
-        splits1 = tx1.GetSplitList()
-        splits2 = tx2.GetSplitList()
-
-        # Different number of splits = not a match
-        if len(splits1) != len(splits2):
-            return False
-
-        # Build amount dictionary by account for tx1
-        amounts1 = {}
-        for split in splits1:
-            account = split.GetAccount()
-            account_name = self._get_account_full_name(account)
-            amount = split.GetValue()
-            amounts1[account_name] = amount
-
-        # Check if tx2 has same amounts for same accounts
-        for split in splits2:
-            account = split.GetAccount()
-            account_name = self._get_account_full_name(account)
-            amount = split.GetValue()
-
-            if account_name not in amounts1:
-                return False
-
-            # Compare amounts (GnuCash uses GncNumeric, use .equal() method)
-            # Note: != operator doesn't work correctly on GnuCash 3.8/4.4
-            if not amounts1[account_name].equal(amount):
-                return False
-
-        return True
+        _, amounts1 = self.get_match_key(tx1)
+        _, amounts2 = self.get_match_key(tx2)
+        return amounts1 == amounts2
 
     def has_duplicate_signature(
         self,
@@ -292,7 +792,7 @@ class TransactionMatcher:
         Returns:
             Number of duplicate transactions found
         """
-        seen_signatures: Set[Tuple[str, Tuple[str, ...], Optional[str]]] = set()
+        seen_signatures: Set[Signature] = set()
         duplicate_count = 0
 
         for tx in transactions:
@@ -0,0 +1,165 @@
+"""
+Sidecar cache of per-transaction validation results.
+
+Most of a book's history does not change between validation runs. The cache
+stores, for each transaction GUID, its edit stamp (ledger_snapshot.edit_stamp),
+its snapshot and the issues each cacheable rule reported for it. On the next
+run, a transaction whose stamp is unchanged is not re-checked and no
+TransactionRow is built for it: its cached issues are replayed and its cached
+snapshot is handed to the whole-ledger checks. New or edited transactions
+(different stamp) are snapshotted, checked and stored again.
+
+GnuCash keeps no last-modified time on transactions. The stamp is the entered
+date, which GnuCash sets once at creation, together with a digest of the
+transaction's content (every split's account, value, amount and memo, and the
+transaction's dates, description, currency and doc_link), so any edit that a
+rule could see invalidates the entry.
+
+Only rules that look at one transaction at a time are cached. Whole-ledger checks
+(duplicates, date order) are recomputed on every run from the cached snapshots,
+so their signatures and dates come from the sidecar for unchanged transactions.
+"""
+
+import json
+import os
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from services.ledger_snapshot import SplitRow, TransactionRow
+
+CACHE_FORMAT_VERSION = 3
+
+
+def _encode_row(row: TransactionRow) -> List:
+    """Compact JSON form of a snapshot (the GUID is the entry's key)."""
+    return [
+        row.date.isoformat() if row.date else None,
+        row.description,
+        row.currency,
+        row.doc_link,
+        [[split.account, split.value_num, split.value_denom] for split in row.splits],
+    ]
+
+
+def _decode_row(guid: str, data: List) -> TransactionRow:
+    """Rebuild a snapshot stored by _encode_row."""
+    posted, description, currency, doc_link, splits = data
+    return TransactionRow(
+        guid=guid,
+        date=date.fromisoformat(posted) if posted else None,
+        description=description,
+        currency=currency,
+        doc_link=doc_link,
+        splits=tuple(SplitRow(*split) for split in splits),
+    )
+
+
+class ValidationCache:
+    """Per-transaction validation results stored in a JSON sidecar file"""
+
+    def __init__(self, path: str):
+        """
+        Initialize an empty cache.
+
+        Args:
+            path: Sidecar file path
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict] = {}
+        self._seen = set()
+
+    @classmethod
+    def load(cls, path: str) -> 'ValidationCache':
+        """
+        Load a cache from its sidecar file.
+
+        A missing, unreadable or incompatible file gives an empty cache.
+
+        Args:
+            path: Sidecar file path
+
+        Returns:
+            ValidationCache
+        """
+        cache = cls(path)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cache
+
+        if isinstance(data, dict) and data.get('version') == CACHE_FORMAT_VERSION:
+            cache._entries = data.get('transactions', {})
+        return cache
+
+    @staticmethod
+    def default_path(gnucash_file: str) -> str:
+        """
+        Sidecar path for a GnuCash file.
+
+        Args:
+            gnucash_file: Path to GnuCash file
+
+        Returns:
+            Path of the cache file next to it
+        """
+        return f"{gnucash_file}.validation-cache.json"
+
+    def get(self, guid: str, stamp: str) -> Optional[Tuple[TransactionRow, Dict[str, List[Dict]]]]:
+        """
+        Cached snapshot and rule results of an unchanged transaction.
+
+        Args:
+            guid: Transaction GUID
+            stamp: Current edit stamp of the transaction
+
+        Returns:
+            Tuple of (TransactionRow, {rule_key: list of issue dicts}), or None
+            when the transaction is new or its stamp changed
+        """
+        self._seen.add(guid)
+        entry = self._entries.get(guid)
+        if entry is None or entry['stamp'] != stamp:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _decode_row(guid, entry['row']), entry['rules']
+
+    def put(self, row: TransactionRow, stamp: str, rule_issues: Dict[str, List[Dict]]):
+        """
+        Store a transaction's snapshot and the issues each cacheable rule reported.
+
+        Args:
+            row: Transaction snapshot
+            stamp: Edit stamp the snapshot was taken at
+            rule_issues: {rule_key: list of issue dicts (ValidationError.to_dict)},
+                keyed by ValidationRule.cache_key
+        """
+        self._seen.add(row.guid)
+        self._entries[row.guid] = {'stamp': stamp, 'row': _encode_row(row), 'rules': rule_issues}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self):
+        """
+        Write the cache, dropping transactions not seen in this run (deleted).
+
+        The file is written to a temporary name and renamed, so an interrupted
+        run never leaves a truncated cache behind.
+        """
+        if self._seen:
+            self._entries = {
+                guid: entry for guid, entry in self._entries.items() if guid in self._seen
+            }
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(
+                {'version': CACHE_FORMAT_VERSION, 'transactions': self._entries},
+                f,
+                separators=(',', ':')
+            )
+        os.replace(tmp_path, self.path)
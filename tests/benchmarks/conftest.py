@@ -0,0 +1,79 @@
+"""
+Pytest fixtures shared by the benchmarks
+
+Timings are recorded as test properties (pytest's record_property, written to
+the JUnit XML report with --junitxml) and quoted in the message of a failed
+time-budget assertion, instead of being printed.
+"""
+
+import time
+
+import pytest
+
+
+class BudgetTimer:
+    """Context manager timing a block, recording it and checking it against a budget"""
+
+    def __init__(self, record_property, name: str, budget_seconds: float):
+        """
+        Initialize the timer.
+
+        Args:
+            record_property: pytest's record_property fixture
+            name: What is timed; the property is "<name>_seconds"
+            budget_seconds: Time budget the block must stay within
+        """
+        self.record_property = record_property
+        self.name = name
+        self.budget_seconds = budget_seconds
+        self.elapsed = 0.0
+
+    def __enter__(self) -> 'BudgetTimer':
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed = time.perf_counter() - self.started
+        self.record_property(f"{self.name}_seconds", round(self.elapsed, 3))
+        if exc_type is None:
+            assert self.elapsed < self.budget_seconds, (
+                f"{self.name} took {self.elapsed:.2f}s (budget {self.budget_seconds:.0f}s)"
+            )
+        return False
+
+
+@pytest.fixture
+def budget_timer(record_property):
+    """
+    Time blocks against a budget.
+
+    Usage: ``with budget_timer("find_duplicates", 30.0) as timer: ...``; the
+    elapsed time is recorded as the "find_duplicates_seconds" property and
+    available as timer.elapsed afterwards.
+    """
+    def start(name: str, budget_seconds: float) -> BudgetTimer:
+        return BudgetTimer(record_property, name, budget_seconds)
+
+    return start
+
+
+@pytest.fixture
+def temp_gnucash_book(temp_gnucash_file):
+    """
+    Open temp_gnucash_file for a benchmark to fill with generated data.
+
+    Yields the book. The session is discarded without saving.
+    """
+    from gnucash import Session
+
+    try:
+        from gnucash import SessionOpenMode
+        session = Session(f'xml://{temp_gnucash_file}', SessionOpenMode.SESSION_NORMAL_OPEN)
+    except ImportError:
+        # Fall back to older GnuCash API (< 4.0)
+        session = Session(f'xml://{temp_gnucash_file}')
+
+    try:
+        yield session.book
+    finally:
+        session.end()
@@ -0,0 +1,104 @@
+"""
+Benchmarks for BookCloser balance providers.
+
+Builds a book with 200k splits (100k two-split transactions between expense
+accounts and Assets:Bank:Checking spread over ten years) and computes the
+closing balances for every year end with the Python BalanceLedger and with the
+engine's running balances. Both must give the same answers.
+
+Run only the benchmarks with:
+    pytest tests/benchmarks -m benchmark
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+TRANSACTION_COUNT = 100_000  # two splits each
+YEARS = range(2015, 2025)
+TIME_BUDGET_SECONDS = 60.0
+
+
+@pytest.fixture
+def large_expense_book(temp_gnucash_book):
+    """
+    Add TRANSACTION_COUNT expenses over YEARS to temp_gnucash_book.
+
+    Transactions alternate between Expenses:Groceries and Expenses:Dining, each
+    paid from Assets:Bank:Checking, one or more per day.
+
+    Returns the book.
+    """
+    from gnucash import GncNumeric, Split, Transaction
+
+    from tests.conftest import find_account
+
+    book = temp_gnucash_book
+    root = book.get_root_account()
+    cad = book.get_table().lookup('CURRENCY', 'CAD')
+
+    expenses = [
+        find_account(root, 'Expenses:Groceries'),
+        find_account(root, 'Expenses:Dining'),
+    ]
+    checking = find_account(root, 'Assets:Bank:Checking')
+
+    first_day = date(YEARS[0], 1, 1)
+    day_count = (date(YEARS[-1], 12, 31) - first_day).days + 1
+
+    for i in range(TRANSACTION_COUNT):
+        posted = first_day + timedelta(days=i * day_count // TRANSACTION_COUNT)
+        amount = 100 + i % 5000
+
+        tx = Transaction(book)
+        tx.BeginEdit()
+        tx.SetCurrency(cad)
+        tx.SetDate(posted.day, posted.month, posted.year)
+        tx.SetDescription(f"Expense {i}")
+
+        expense_split = Split(book)
+        expense_split.SetParent(tx)
+        expense_split.SetAccount(expenses[i % 2])
+        expense_split.SetValue(GncNumeric(amount, 100))
+
+        bank_split = Split(book)
+        bank_split.SetParent(tx)
+        bank_split.SetAccount(checking)
+        bank_split.SetValue(GncNumeric(-amount, 100))
+
+        tx.CommitEdit()
+
+    return book
+
+
+def _closing_balances(root, source):
+    """Build a provider and group balances for every year end."""
+    from services.book_closer import BookCloser
+
+    closer = BookCloser()
+    provider = closer.build_balance_provider(root, source)
+    balances = {}
+    for year in YEARS:
+        grouped = closer.group_accounts_by_currency(root, date(year, 12, 31), ledger=provider)
+        balances[year] = {
+            currency: sorted((account.GetName(), balance) for account, balance in accounts)
+            for currency, accounts in grouped.items()
+        }
+    return balances
+
+
+class TestBalanceProviderBenchmark:
+    """Python ledger vs engine running balances on a 200k-split book"""
+
+    def test_engine_and_python_agree(self, large_expense_book, budget_timer):
+        """Year-end balances for ten years are identical from both providers"""
+        root = large_expense_book.get_root_account()
+
+        with budget_timer("python_balances", TIME_BUDGET_SECONDS):
+            python_balances = _closing_balances(root, "python")
+        with budget_timer("engine_balances", TIME_BUDGET_SECONDS):
+            engine_balances = _closing_balances(root, "engine")
+
+        assert engine_balances == python_balances
@@ -0,0 +1,104 @@
+"""
+Benchmark for importing business objects.
+
+Generates a plaintext file with 100 customers, one tax table and 10k posted
+invoices of 5 entries each (accounts from tests/fixtures/business_objects.txt),
+and imports it into a new book with GnuCashImporter.import_business_objects.
+Every entry, posting and payment names an account, tax table or customer,
+so this measures the ImportContext lookup caches.
+
+Run only the benchmarks with:
+    pytest tests/benchmarks -m benchmark
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+CUSTOMER_COUNT = 100
+INVOICE_COUNT = 10_000
+ENTRIES_PER_INVOICE = 5
+TIME_BUDGET_SECONDS = 600.0
+
+
+def _accounts_header() -> str:
+    """Account declarations of the business objects fixture (everything before the first customer)."""
+    with open("tests/fixtures/business_objects.txt") as f:
+        text = f.read()
+    return text[:text.index('customer "')]
+
+
+def _business_objects_text() -> str:
+    blocks = [_accounts_header().rstrip()]
+    for c in range(CUSTOMER_COUNT):
+        blocks.append(f'customer "C{c:03d}"\n  name: "Customer {c}"\n  currency: CAD')
+    blocks.append(
+        'taxtable "GST"\n'
+        '  entry:\n'
+        '    account: "Liabilities:GST"\n'
+        '    rate: 5.0%\n'
+        '    type: PERCENT'
+    )
+
+    first_day = date(2026, 1, 1)
+    for i in range(INVOICE_COUNT):
+        day = (first_day + timedelta(days=i % 365)).isoformat()
+        due = (first_day + timedelta(days=i % 365 + 30)).isoformat()
+        lines = [
+            f'invoice "INV-{i:05d}"',
+            f'  customer_id: "C{i % CUSTOMER_COUNT:03d}"',
+            '  currency: CAD',
+            f'  date_opened: {day}',
+        ]
+        for e in range(ENTRIES_PER_INVOICE):
+            lines += [
+                '  entry:',
+                f'    date: {day}',
+                f'    description: "Item {e}"',
+                '    action: "Hours"',
+                '    account: "Income:Sales"',
+                f'    quantity: {e + 1}',
+                '    price: 100',
+                '    taxable: true',
+                '    tax_included: false',
+                '    tax_table: "GST"',
+            ]
+        lines += [
+            '  posted:',
+            f'    date: {day}',
+            f'    due: {due}',
+            '    ar_account: "Assets:Accounts Receivable"',
+            f'    memo: "Invoice INV-{i:05d}"',
+            '    accumulate: true',
+        ]
+        blocks.append('\n'.join(lines))
+    return '\n\n'.join(blocks) + '\n'
+
+
+def test_import_10k_invoices(tmp_path, budget_timer):
+    from repositories.gnucash_repository import GnuCashRepository
+    from services.gnucash_importer import GnuCashImporter
+    from services.plaintext_parser import DirectiveType, PlaintextParser
+
+    parser = PlaintextParser()
+    parser.parse_string(_business_objects_text())
+    directives = parser.root_directive.children
+
+    path = str(tmp_path / "business.gnucash")
+    GnuCashRepository.create_new_file(path)
+    repo = GnuCashRepository(path)
+    repo.open()
+    try:
+        importer = GnuCashImporter()
+        for directive in directives:
+            if directive.type == DirectiveType.OPEN_ACCOUNT:
+                importer.create_account(directive, repo.book)
+
+        with budget_timer("import_business_objects", TIME_BUDGET_SECONDS):
+            importer.import_business_objects(directives, repo.book)
+
+        assert repo.get_invoice(f"INV-{INVOICE_COUNT - 1:05d}") is not None
+    finally:
+        repo.close()
@@ -0,0 +1,26 @@
+"""
+Benchmark for CLI startup.
+
+Runs `gnucash-plaintext --help` in a fresh interpreter under
+`python -X importtime` (cli_import_times fixture); importing cli.main must stay
+within the time budget. That help and usage errors never import the GnuCash
+bindings is checked by tests/unit/cli/test_lazy_commands.py in the normal run.
+
+Run only the benchmarks with:
+    pytest tests/benchmarks -m benchmark
+"""
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+TIME_BUDGET_SECONDS = 1.0
+
+
+@pytest.mark.parametrize("args", [("--help",), ("--version",)])
+def test_cli_import_time(cli_import_times, record_property, args):
+    times = cli_import_times(*args)
+
+    elapsed = times["cli.main"] / 1_000_000
+    record_property("cli_main_import_seconds", round(elapsed, 3))
+    assert elapsed < TIME_BUDGET_SECONDS, f"Importing cli.main took {elapsed:.2f}s"
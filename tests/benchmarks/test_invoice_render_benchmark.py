@@ -0,0 +1,50 @@
+"""
+Benchmark for invoice rendering.
+
+Imports tests/fixtures/business_objects.txt and renders its posted invoice
+1,000 times: the invoice XML is extracted from the open session each time, then
+all 1,000 documents are rendered to HTML. This exercises the cached engine
+handle (one dlopen for the run) and the cached XSLT transform (one compile
+for the run). PDF layout is left out, since weasyprint dominates it and is
+not affected by either cache.
+
+Run only the benchmarks with:
+    pytest tests/benchmarks -m benchmark
+"""
+
+import os
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+INVOICE_COUNT = 1_000
+TIME_BUDGET_SECONDS = 60.0
+
+
+def test_render_1000_invoices(temp_gnucash_with_business_objects, tmp_path, budget_timer):
+    pytest.importorskip("lxml")
+
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from services.invoice_render_pool import render_invoices
+    from use_cases.print_invoices import PrintInvoicesUseCase
+
+    xslt_path = os.path.join("services", "invoice.xslt")
+    # The budget covers extraction and rendering together; each step is also recorded
+    with budget_timer("extract_and_render", TIME_BUDGET_SECONDS):
+        with budget_timer("extract", TIME_BUDGET_SECONDS):
+            repo = GnuCashRepository(temp_gnucash_with_business_objects)
+            repo.open(SessionMode.READ_ONLY)
+            try:
+                use_case = PrintInvoicesUseCase(repo)
+                invoice = use_case.find_invoices()[0]
+                extracted, failed = use_case.extract([invoice] * INVOICE_COUNT)
+            finally:
+                repo.close()
+
+        jobs = [(xml_str, str(tmp_path / f"{i}.html")) for i, (_, xml_str) in enumerate(extracted)]
+        with budget_timer("render", TIME_BUDGET_SECONDS):
+            results = render_invoices(jobs, xslt_path, workers=1, output_format="html")
+
+    assert not failed
+    assert all(error is None for _, error in results)
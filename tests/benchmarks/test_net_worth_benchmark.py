@@ -0,0 +1,51 @@
+"""
+Benchmark for the net worth report.
+
+Builds a snapshot of 30 commodities held over 20 years (a split every few days
+per commodity, 60k splits in all) with a daily price for every commodity
+(219k prices) and builds a monthly net worth report in one currency.
+
+Run only the benchmarks with:
+    pytest tests/benchmarks -m benchmark
+"""
+
+from datetime import date
+from fractions import Fraction
+
+import pytest
+
+from services.account_category import AccountCategory
+from services.net_worth import PriceTable, net_worth
+from services.period_report import AccountInfo
+
+pytestmark = pytest.mark.benchmark
+
+COMMODITY_COUNT = 30
+START = date(2005, 1, 1)
+END = date(2024, 12, 31)
+SPLITS_PER_COMMODITY = 2_000
+TIME_BUDGET_SECONDS = 10.0
+
+
+def test_net_worth_30_commodities_20_years(budget_timer):
+    commodities = [f"C{i:02d}" for i in range(COMMODITY_COUNT)]
+    accounts = [AccountInfo(f"Assets:{c}", AccountCategory.ASSET, c) for c in commodities]
+
+    first, last = START.toordinal(), END.toordinal()
+    step = (last - first) // SPLITS_PER_COMMODITY
+    entries = [
+        (f"Assets:{c}", first + n * step, 1000 + (n * 37 + i) % 500 - 250, 100)
+        for i, c in enumerate(commodities)
+        for n in range(SPLITS_PER_COMMODITY)
+    ]
+    prices = [
+        (c, "USD", ordinal, Fraction(100 + (ordinal + i) % 50, 100))
+        for i, c in enumerate(commodities)
+        for ordinal in range(first, last + 1)
+    ]
+
+    with budget_timer("net_worth", TIME_BUDGET_SECONDS):
+        result = net_worth(accounts, entries, PriceTable(prices), "month", START, END, "USD")
+
+    assert len(result.report.periods) == 240
+    assert result.unpriced == {}
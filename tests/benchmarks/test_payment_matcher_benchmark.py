@@ -0,0 +1,55 @@
+"""
+Benchmark for matching payments to open invoices.
+
+Indexes 100k open invoices of 1,000 customers and matches 50k payments by
+amount and 10k by billing ID. Each match is a bisect in one customer's
+invoices, so this stays far from the O(payments x invoices) of a linear scan.
+
+Run only the benchmarks with:
+    pytest tests/benchmarks -m benchmark
+"""
+
+from datetime import date, timedelta
+from fractions import Fraction
+
+import pytest
+
+from services.payment_matcher import IncomingPayment, OpenInvoice, OpenInvoiceIndex
+
+pytestmark = pytest.mark.benchmark
+
+CUSTOMER_COUNT = 1_000
+INVOICE_COUNT = 100_000
+TIME_BUDGET_SECONDS = 10.0
+
+
+def test_match_60k_payments_against_100k_invoices(budget_timer):
+    first_due = date(2024, 1, 1)
+    invoices = [
+        OpenInvoice(
+            customer_id=f"C{n % CUSTOMER_COUNT:04d}",
+            invoice_id=f"INV-{n:06d}",
+            due=first_due + timedelta(days=n % 365),
+            remaining=Fraction(10_000 + (n * 37) % 90_000, 100),
+            billing_id=f"PO-{n:06d}" if n % 10 == 0 else "",
+        )
+        for n in range(INVOICE_COUNT)
+    ]
+    payments = [
+        IncomingPayment(invoice.customer_id, date(2024, 6, 1), invoice.remaining, "Assets:Bank")
+        for invoice in invoices[1::2]
+    ] + [
+        IncomingPayment(invoice.customer_id, date(2024, 6, 1), Fraction(50), "Assets:Bank", billing_id=invoice.billing_id)
+        for invoice in invoices[::10]
+    ]
+
+    with budget_timer("match_payments", TIME_BUDGET_SECONDS):
+        index = OpenInvoiceIndex(invoices)
+        matched = 0
+        for payment in payments:
+            invoice, _ = index.find(payment)
+            if invoice is not None:
+                index.settle(invoice, payment.amount)
+                matched += 1
+
+    assert matched == len(payments)
@@ -0,0 +1,109 @@
+"""
+Benchmarks for TransactionMatcher duplicate detection.
+
+A busy card account can post thousands of charges on the same day against
+the same pair of accounts, so every one of them shares a signature. These
+tests make sure classification stays linear in that worst case.
+
+Run only the benchmarks with:
+    pytest tests/benchmarks -m benchmark
+"""
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+SAME_DAY_COUNT = 10_000
+TIME_BUDGET_SECONDS = 30.0
+
+
+@pytest.fixture
+def same_day_card_book(temp_gnucash_book):
+    """
+    Add SAME_DAY_COUNT card charges on 2024-03-15 to temp_gnucash_book.
+
+    Each charge debits Expenses:Groceries and credits Liabilities:Visa with a
+    distinct amount (1.00, 1.01, ...), so all transactions share one signature
+    but have different amount keys.
+
+    Returns (book, transactions).
+    """
+    import gnucash
+    from gnucash import Account, GncNumeric, Split, Transaction
+
+    from tests.conftest import find_account
+
+    book = temp_gnucash_book
+    root = book.get_root_account()
+    cad = book.get_table().lookup('CURRENCY', 'CAD')
+
+    liabilities = Account(book)
+    liabilities.SetName('Liabilities')
+    liabilities.SetType(gnucash.ACCT_TYPE_LIABILITY)
+    liabilities.SetCommodity(cad)
+    root.append_child(liabilities)
+
+    visa = Account(book)
+    visa.SetName('Visa')
+    visa.SetType(gnucash.ACCT_TYPE_CREDIT)
+    visa.SetCommodity(cad)
+    liabilities.append_child(visa)
+
+    groceries = find_account(root, 'Expenses:Groceries')
+
+    transactions = []
+    for i in range(SAME_DAY_COUNT):
+        tx = Transaction(book)
+        tx.BeginEdit()
+        tx.SetCurrency(cad)
+        tx.SetDate(15, 3, 2024)
+        tx.SetDescription(f"Card charge {i}")
+
+        expense_split = Split(book)
+        expense_split.SetParent(tx)
+        expense_split.SetAccount(groceries)
+        expense_split.SetValue(GncNumeric(100 + i, 100))
+
+        card_split = Split(book)
+        card_split.SetParent(tx)
+        card_split.SetAccount(visa)
+        card_split.SetValue(GncNumeric(-(100 + i), 100))
+
+        tx.CommitEdit()
+        transactions.append(tx)
+
+    return book, transactions
+
+
+class TestFindDuplicatesSameDayBenchmark:
+    """find_duplicates with every transaction sharing one signature"""
+
+    def test_all_duplicates(self, same_day_card_book, budget_timer):
+        """Re-importing all 10k same-day charges classifies each as duplicate"""
+        from services.transaction_matcher import TransactionMatcher
+
+        _, transactions = same_day_card_book
+        matcher = TransactionMatcher()
+
+        with budget_timer("find_duplicates", TIME_BUDGET_SECONDS):
+            new, duplicates, conflicts = matcher.find_duplicates(transactions, transactions)
+
+        assert len(new) == 0
+        assert len(duplicates) == SAME_DAY_COUNT
+        assert len(conflicts) == 0
+
+    def test_all_conflicts(self, same_day_card_book, budget_timer):
+        """Charges whose amounts are not present in the other half are conflicts"""
+        from services.transaction_matcher import TransactionMatcher
+
+        _, transactions = same_day_card_book
+        half = SAME_DAY_COUNT // 2
+        existing, incoming = transactions[:half], transactions[half:]
+        matcher = TransactionMatcher()
+
+        with budget_timer("find_duplicates", TIME_BUDGET_SECONDS):
+            new, duplicates, conflicts = matcher.find_duplicates(existing, incoming)
+
+        assert len(new) == 0
+        assert len(duplicates) == 0
+        assert len(conflicts) == len(incoming)
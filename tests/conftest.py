@@ -6,9 +6,11 @@ Tests run in Docker with real GnuCash Python bindings.
 """
 
 import os
+import subprocess
 import sys
 import tempfile
 from datetime import date
+from typing import Dict
 
 import pytest
 
@@ -420,3 +422,64 @@ def temp_gnucash_comprehensive():
         lock_path = path + '.LCK'
         if os.path.exists(lock_path):
             os.unlink(lock_path)
+
+
+@pytest.fixture
+def temp_gnucash_with_business_objects(tmp_path):
+    """
+    Create a GnuCash file from tests/fixtures/business_objects.txt.
+
+    The file is imported with `import --new --include-business-objects`, so it
+    has the fixture's accounts, customer "1" (Test Customer), tax table and the
+    posted invoice INV-2026-001 (105.00, due 2026-01-31, unpaid).
+
+    Returns the file path (under the test's tmp_path).
+    """
+    from click.testing import CliRunner
+
+    from cli.main import cli
+
+    test_dir = os.path.dirname(os.path.abspath(__file__))
+    plaintext_path = os.path.join(test_dir, 'fixtures', 'business_objects.txt')
+    path = tmp_path / "business.gnucash"
+
+    result = CliRunner().invoke(
+        cli, ["import", "--new", str(path), plaintext_path, "--include-business-objects"]
+    )
+    assert result.exit_code == 0, f"Import failed:\n{result.output}"
+    return str(path)
+
+
+@pytest.fixture
+def cli_import_times():
+    """
+    Run the CLI in a fresh interpreter under `python -X importtime`.
+
+    Deprecation warnings are turned into errors. The returned function takes the
+    CLI arguments and the expected exit code, and returns module name ->
+    cumulative import time in microseconds, read from the import log on stderr.
+    """
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def run(*args: str, exit_code: int = 0) -> Dict[str, int]:
+        result = subprocess.run(
+            [
+                sys.executable, "-X", "importtime", "-W", "error::DeprecationWarning",
+                "-c", "from cli.main import cli; cli()", *args,
+            ],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == exit_code, result.stderr
+
+        times = {}
+        for line in result.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            if not line.startswith("import time:") or "imported package" in line:
+                continue
+            _, cumulative, module = line[len("import time:"):].split("|")
+            times[module.strip()] = int(cumulative)
+        return times
+
+    return run
@@ -75,3 +75,109 @@ def test_business_objects_roundtrip(tmp_path):
     result = runner.invoke(cli, ["print-invoice", str(gnucash_file), "--invoice-id", "INV-2026-001", "-o", str(pdf_file)])
     assert result.exit_code == 0, f"print-invoice failed:\n{result.output}"
     assert os.path.exists(pdf_file)
+
+
+def test_print_invoice_batch(tmp_path, temp_gnucash_with_business_objects):
+    runner = CliRunner()
+    gnucash_file = temp_gnucash_with_business_objects
+    output_dir = tmp_path / "pdf"
+
+    result = runner.invoke(cli, [
+        "print-invoice", str(gnucash_file), "--customer", "1",
+        "--posted-between", "2026-01-01", "2026-01-31", "--output-dir", str(output_dir),
+    ])
+    assert result.exit_code == 0, f"print-invoice failed:\n{result.output}"
+    assert "Printed 1 invoice(s)" in result.output
+    assert os.path.exists(output_dir / "INV-2026-001.pdf")
+
+    result = runner.invoke(cli, ["print-invoice", str(gnucash_file), "--customer", "999", "--output-dir", str(output_dir)])
+    assert result.exit_code == 0, f"print-invoice failed:\n{result.output}"
+    assert "No matching posted invoices" in result.output
+
+    result = runner.invoke(cli, ["print-invoice", str(gnucash_file), "--all"])
+    assert result.exit_code != 0
+    assert "--output-dir" in result.output
+
+    result = runner.invoke(cli, ["print-invoice", str(gnucash_file), "--all", "--format", "html", "--output-dir", str(output_dir)])
+    assert result.exit_code == 0, f"print-invoice failed:\n{result.output}"
+    html = (output_dir / "INV-2026-001.html").read_text(encoding="utf-8")
+    assert "<title>Invoice INV-2026-001</title>" in html
+
+
+def test_business_objects_streamed_write(temp_gnucash_with_business_objects):
+    import io
+
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from use_cases.export_business_objects import ExportBusinessObjectsUseCase
+
+    repo = GnuCashRepository(temp_gnucash_with_business_objects)
+    repo.open(SessionMode.READ_ONLY)
+    try:
+        use_case = ExportBusinessObjectsUseCase(repo.book)
+        out = io.StringIO()
+        # One customer, one tax table, one invoice
+        assert use_case.write(out, lead="\n") == 3
+        assert out.getvalue() == "\n" + use_case.execute()
+        assert 'account: "Liabilities:GST"' in out.getvalue()
+    finally:
+        repo.close()
+
+
+def test_report_aging(temp_gnucash_with_business_objects):
+    runner = CliRunner()
+    gnucash_file = temp_gnucash_with_business_objects
+
+    # INV-2026-001: 105.00 (100 + 5% GST), due 2026-01-31, unpaid
+    result = runner.invoke(cli, ["report", "aging", str(gnucash_file), "--as-of", "2026-03-15", "--format", "csv"])
+    assert result.exit_code == 0, f"report aging failed:\n{result.output}"
+    lines = result.output.splitlines()
+    assert lines[0] == "section,account,commodity,Current,1-30,31-60,61-90,Over 90,Total"
+    assert "Receivable,Test Customer,CAD,0.00,0.00,105.00,0.00,0.00,105.00" in lines
+    assert "Total,Receivable,CAD,0.00,0.00,105.00,0.00,0.00,105.00" in lines
+
+    result = runner.invoke(cli, ["report", "aging", str(gnucash_file), "--as-of", "2026-01-15", "--buckets", "15,45"])
+    assert result.exit_code == 0, f"report aging failed:\n{result.output}"
+    assert "Current" in result.output and "Over 45" in result.output
+    assert "Test Customer" in result.output
+
+    # Posted after the report date
+    result = runner.invoke(cli, ["report", "aging", str(gnucash_file), "--as-of", "2025-12-31", "--format", "csv"])
+    assert result.exit_code == 0, f"report aging failed:\n{result.output}"
+    assert "Test Customer" not in result.output
+
+    result = runner.invoke(cli, ["report", "aging", str(gnucash_file), "--buckets", "30,x"])
+    assert result.exit_code != 0
+
+
+def test_apply_payments(tmp_path, temp_gnucash_with_business_objects):
+    runner = CliRunner()
+    gnucash_file = temp_gnucash_with_business_objects
+    payments_file = tmp_path / "payments.csv"
+
+    # INV-2026-001 has 105.00 open; only the second payment matches it
+    payments_file.write_text(
+        "customer_id,date,amount,bank_account,memo,num\n"
+        "1,2026-02-01,100.00,Assets,Short payment,\n"
+        "1,2026-02-05,105.00,Assets,Wire,4711\n"
+        "1,2026-02-06,105.00,Assets,Duplicate,\n"
+    )
+
+    result = runner.invoke(cli, ["apply-payments", str(gnucash_file), str(payments_file), "--dry-run"])
+    assert result.exit_code == 0, f"apply-payments failed:\n{result.output}"
+    assert "Would apply 1 payment(s)" in result.output
+
+    result = runner.invoke(cli, ["apply-payments", str(gnucash_file), str(payments_file)])
+    assert result.exit_code == 0, f"apply-payments failed:\n{result.output}"
+    assert "Applied 1 payment(s)" in result.output
+    assert "2026-02-05 customer 1 105.00 -> invoice INV-2026-001" in result.output
+    assert "Unmatched: 2 payment(s)" in result.output
+
+    # The invoice is paid, so nothing is left to age or to match
+    result = runner.invoke(cli, ["report", "aging", str(gnucash_file), "--as-of", "2026-03-15"])
+    assert result.exit_code == 0, f"report aging failed:\n{result.output}"
+    assert "Test Customer" not in result.output
+
+    result = runner.invoke(cli, ["apply-payments", str(gnucash_file), str(payments_file)])
+    assert result.exit_code == 0, f"apply-payments failed:\n{result.output}"
+    assert "Applied 0 payment(s)" in result.output
+    assert "no open invoices for customer 1" in result.output
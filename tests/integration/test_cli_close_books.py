@@ -595,3 +595,64 @@ class TestCloseBooksCLI:
         ])
         assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
         assert "Books closed as of" in result.output
+
+    def test_cli_from_year_to_year(self, temp_gnucash_for_close_books):
+        """CLI closes a range of fiscal years in one run"""
+        from click.testing import CliRunner
+
+        from cli.close_books_cmd import close_books
+
+        runner = CliRunner()
+        result = runner.invoke(close_books, [
+            temp_gnucash_for_close_books, "--from-year", "2023", "--to-year", "2024"
+        ])
+        assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
+        assert "2023-12-31" in result.output
+        assert "Books closed as of 2024-12-31" in result.output
+
+        result = runner.invoke(close_books, [
+            temp_gnucash_for_close_books, "--from-year", "2023", "--to-year", "2024", "--status"
+        ])
+        assert result.exit_code == 0
+        assert "OPEN" not in result.output
+
+    def test_cli_requires_closing_date(self, temp_gnucash_for_close_books):
+        """CLI without --closing-date or a year range is a usage error"""
+        from click.testing import CliRunner
+
+        from cli.close_books_cmd import close_books
+
+        runner = CliRunner()
+        result = runner.invoke(close_books, [temp_gnucash_for_close_books])
+        assert result.exit_code != 0
+        assert "Missing closing date" in result.output
+
+        result = runner.invoke(close_books, [temp_gnucash_for_close_books, "--from-year", "2024"])
+        assert result.exit_code != 0
+
+    def test_cli_checkpoint(self, temp_gnucash_for_close_books):
+        """--checkpoint writes the sidecar; the next run starts from it"""
+        import os
+
+        from click.testing import CliRunner
+
+        from cli.close_books_cmd import close_books
+
+        runner = CliRunner()
+        result = runner.invoke(close_books, [
+            temp_gnucash_for_close_books, "--closing-date", "2024-12-31", "--checkpoint"
+        ])
+        assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
+        assert "Balance checkpoints recorded as of 2024-12-31" in result.output
+
+        sidecar = f"{temp_gnucash_for_close_books}.balance-checkpoints.json"
+        try:
+            assert os.path.exists(sidecar)
+            result = runner.invoke(close_books, [
+                temp_gnucash_for_close_books, "--closing-date", "2025-12-31", "--status"
+            ])
+            assert result.exit_code == 0
+            assert "CLOSED as of 2025-12-31" in result.output
+        finally:
+            if os.path.exists(sidecar):
+                os.unlink(sidecar)
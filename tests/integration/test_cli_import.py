@@ -7,6 +7,7 @@ These tests verify the CLI command works end-to-end.
 import os
 import tempfile
 
+import pytest
 from click.testing import CliRunner
 
 from cli.import_cmd import import_transactions
@@ -301,3 +302,79 @@ class TestImportCLI:
             assert os.path.exists(new_gnucash)
             assert "Errors:" in result.output
             assert "Failed to create account" in result.output
+
+
+class TestImportMatchWindowCLI:
+    """Test --match-window-days fuzzy duplicate matching"""
+
+    def _write_shifted_groceries(self):
+        """Write the 2024-01-15 groceries transaction from the fixture, posted two days later"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            f.write("2024-01-17 commodity CAD\n")
+            f.write('\tmnemonic: "CAD"\n')
+            f.write('\tfullname: "Canadian Dollar"\n')
+            f.write('\tnamespace: "CURRENCY"\n')
+            f.write('\tfraction: 100\n')
+            f.write('2024-01-17 * "GROCERY STORE #42"\n')
+            f.write('\tExpenses:Groceries 50.00 CAD\n')
+            f.write('\tAssets:Bank:Checking -50.00 CAD\n')
+            return f.name
+
+    def test_shifted_transaction_imported_without_window(self, temp_gnucash_with_transactions):
+        """Without a match window, a shifted posting is treated as new"""
+        runner = CliRunner()
+        input_path = self._write_shifted_groceries()
+
+        try:
+            result = runner.invoke(import_transactions, [
+                temp_gnucash_with_transactions,
+                input_path,
+                '--dry-run'
+            ])
+
+            assert result.exit_code == 0
+            assert "Transactions: 1" in result.output
+
+        finally:
+            os.unlink(input_path)
+
+    def test_shifted_transaction_skipped_with_window(self, temp_gnucash_with_transactions):
+        """With --match-window-days, a shifted posting is skipped and reported with confidence"""
+        runner = CliRunner()
+        input_path = self._write_shifted_groceries()
+
+        try:
+            result = runner.invoke(import_transactions, [
+                temp_gnucash_with_transactions,
+                input_path,
+                '--dry-run',
+                '--match-window-days', '3'
+            ])
+
+            assert result.exit_code == 0
+            assert "Transactions: 0" in result.output
+            assert "Skipped:      1" in result.output
+            assert "confidence 0.50" in result.output
+
+        finally:
+            os.unlink(input_path)
+
+    @pytest.mark.parametrize('value', ['abc', 'inf', '-Infinity', 'nan'])
+    def test_amount_tolerance_rejects_invalid_value(self, temp_gnucash_with_transactions, value):
+        """--amount-tolerance must be a finite decimal number"""
+        runner = CliRunner()
+        input_path = self._write_shifted_groceries()
+
+        try:
+            result = runner.invoke(import_transactions, [
+                temp_gnucash_with_transactions,
+                input_path,
+                '--match-window-days', '3',
+                '--amount-tolerance', value
+            ])
+
+            assert result.exit_code == 2
+            assert "Amount must be a decimal number" in result.output
+
+        finally:
+            os.unlink(input_path)
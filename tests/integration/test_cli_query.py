@@ -0,0 +1,66 @@
+"""
+Integration tests for the query command.
+
+Uses temp_gnucash_for_close_books; Assets:Bank:Checking ends 2024 at 5850 CAD.
+"""
+
+import pytest
+from click.testing import CliRunner
+
+
+def _invoke(*args):
+    from cli.query_cmd import query
+
+    return CliRunner().invoke(query, list(args))
+
+
+class TestQueryCommand:
+    """query --account ..."""
+
+    def test_register_lines(self, temp_gnucash_for_close_books):
+        """Lines print with amount and running balance"""
+        result = _invoke(
+            temp_gnucash_for_close_books, "--account", "Assets:Bank:Checking",
+            "--from", "2024-07-01", "--to", "2024-07-31",
+        )
+
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert lines[0] == "Assets:Bank:Checking"
+        assert lines[2].startswith("2024-07-05")
+        assert "Monthly groceries" in lines[2]
+        assert lines[2].endswith("-400.00  5850.00")
+        assert lines[-1] == "1 line(s)"
+
+    def test_tail_with_regex(self, temp_gnucash_for_close_books):
+        result = _invoke(
+            temp_gnucash_for_close_books, "--account", "Assets:Bank:Checking",
+            "--description-regex", "salary", "-i", "--tail", "1",
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "February base salary" in result.output
+        assert "January base salary" not in result.output
+
+    def test_unknown_account(self, temp_gnucash_for_close_books):
+        result = _invoke(temp_gnucash_for_close_books, "--account", "Assets:Nope")
+
+        assert result.exit_code != 0
+        assert "Account not found" in result.output
+
+    def test_limit_and_tail_rejected(self, temp_gnucash_for_close_books):
+        result = _invoke(
+            temp_gnucash_for_close_books, "--account", "Assets:Bank:Checking", "--limit", "1", "--tail", "1",
+        )
+
+        assert result.exit_code != 0
+        assert "--limit or --tail" in result.output
+
+    @pytest.mark.parametrize("value", ["abc", "inf", "-Infinity", "nan"])
+    def test_invalid_amount_rejected(self, temp_gnucash_for_close_books, value):
+        result = _invoke(
+            temp_gnucash_for_close_books, "--account", "Assets:Bank:Checking", "--min-amount", value,
+        )
+
+        assert result.exit_code == 2
+        assert "Amount must be a decimal number" in result.output
@@ -0,0 +1,123 @@
+"""
+Integration tests for the report command group.
+
+Uses temp_gnucash_for_close_books: 2024 CAD net income is 5850 (7200 income,
+1350 expenses) and USD net income is 400 (500 income, 100 expenses).
+"""
+
+from click.testing import CliRunner
+
+
+def _invoke(*args):
+    from cli.report_cmd import report
+
+    result = CliRunner().invoke(report, list(args))
+    assert result.exit_code == 0, f"Exit {result.exit_code}: {result.output}"
+    return result.output
+
+
+class TestReportCommand:
+    """report trial-balance|income-statement|balance-sheet"""
+
+    def test_income_statement_by_year(self, temp_gnucash_for_close_books):
+        """Yearly net income matches the close-books fixture"""
+        output = _invoke("income-statement", temp_gnucash_for_close_books, "--period", "year", "--format", "csv")
+
+        lines = output.splitlines()
+        assert lines[0] == "section,account,commodity,2024"
+        assert "Summary,Net income,CAD,5850.00" in lines
+        assert "Summary,Net income,USD,400.00" in lines
+        assert "Income,Income:Salary:Base,CAD,6000.00" in lines
+
+    def test_income_statement_by_quarter(self, temp_gnucash_for_close_books):
+        """Quarterly columns split the year's activity"""
+        output = _invoke(
+            "income-statement", temp_gnucash_for_close_books,
+            "--period", "quarter", "--from", "2024-01-01", "--to", "2024-12-31", "--format", "csv",
+        )
+
+        lines = output.splitlines()
+        assert lines[0] == "section,account,commodity,2024-Q1,2024-Q2,2024-Q3,2024-Q4"
+        # Q1: salary 6000 + bonus 1000; Q2: interest 200 - train 150 - flight 800
+        assert "Summary,Net income,CAD,7000.00,-750.00,-400.00,0.00" in lines
+
+    def test_trial_balance_totals_zero(self, temp_gnucash_for_close_books):
+        """Debits equal credits at every month end"""
+        output = _invoke("trial-balance", temp_gnucash_for_close_books, "--format", "csv")
+
+        totals = [line for line in output.splitlines() if line.startswith("Summary,")]
+        assert totals
+        for line in totals:
+            assert all(value == "0.00" for value in line.split(",")[3:])
+
+    def test_balance_sheet_to_file(self, temp_gnucash_for_close_books, tmp_path):
+        """Text output goes to --output"""
+        path = tmp_path / "balance-sheet.txt"
+        output = _invoke("balance-sheet", temp_gnucash_for_close_books, "--period", "year", "-o", str(path))
+
+        assert "Report saved" in output
+        text = path.read_text()
+        assert text.startswith("Balance Sheet\n")
+        assert "Checking" in text
+
+    def test_from_after_to(self, temp_gnucash_for_close_books):
+        """--from after --to is a usage error"""
+        from cli.report_cmd import report
+
+        result = CliRunner().invoke(report, [
+            "trial-balance", temp_gnucash_for_close_books, "--from", "2024-12-31", "--to", "2024-01-01"
+        ])
+        assert result.exit_code != 0
+        assert "--from must not be after --to" in result.output
+
+
+class TestNetWorthCommand:
+    """report net-worth"""
+
+    def test_net_worth_in_cad(self, temp_gnucash_for_close_books):
+        """USD holdings have no price in CAD, so they are reported and left out"""
+        from cli.report_cmd import report
+
+        result = CliRunner().invoke(
+            report, ["net-worth", temp_gnucash_for_close_books, "--currency", "CAD", "--interval", "year",
+                     "--format", "csv"],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Summary,Net worth,CAD,5850.00" in result.output
+        assert "Warning: no USD price in CAD for 2024" in result.output
+
+    def test_net_worth_with_price(self, temp_gnucash_for_close_books):
+        """A price database entry converts the USD account"""
+        from datetime import datetime
+
+        from gnucash import GncNumeric
+        from gnucash.gnucash_core import GncPrice
+
+        from cli.report_cmd import report
+        from repositories.gnucash_repository import GnuCashRepository
+
+        with GnuCashRepository(temp_gnucash_for_close_books) as repo:
+            book = repo.book
+            table = book.get_table()
+            price = GncPrice(book)
+            price.begin_edit()
+            price.set_commodity(table.lookup("CURRENCY", "USD"))
+            price.set_currency(table.lookup("CURRENCY", "CAD"))
+            price.set_time64(datetime(2024, 6, 30, 12))
+            price.set_source_string("user:price")
+            price.set_typestr("last")
+            price.set_value(GncNumeric(135, 100))
+            price.commit_edit()
+            book.get_price_db().add_price(price)
+            repo.save()
+
+        result = CliRunner().invoke(
+            report, ["net-worth", temp_gnucash_for_close_books, "--currency", "CAD", "--interval", "year",
+                     "--format", "csv"],
+        )
+
+        assert result.exit_code == 0, result.output
+        # 5850 CAD + 400 USD at 1.35
+        assert "Summary,Net worth,CAD,6390.00" in result.output
+        assert "Warning" not in result.output
@@ -0,0 +1,192 @@
+"""
+Integration tests for the serve command and the --socket thin client
+
+The daemon runs in a subprocess; commands are sent to it through the CLI.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from cli.import_cmd import import_transactions
+from cli.main import cli
+from infrastructure.jsonrpc import call, is_listening
+from repositories.gnucash_repository import GnuCashRepository, SessionMode
+from repositories.session_pool import SessionPool
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TRANSACTION = (
+    '2024-02-15 * "Daemon test transaction"\n'
+    '\tExpenses:Groceries 12.34 CAD\n'
+    '\tAssets:Bank:Checking -12.34 CAD\n'
+)
+
+
+@pytest.fixture
+def socket_path():
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'gnucash.sock')
+    yield path
+    if os.path.exists(path):
+        os.unlink(path)
+    os.rmdir(directory)
+
+
+@pytest.fixture
+def daemon(socket_path, temp_gnucash_with_transactions):
+    process = subprocess.Popen(
+        [sys.executable, '-c', 'from cli.main import cli; cli()', 'serve', '--socket', socket_path,
+         temp_gnucash_with_transactions],
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    deadline = time.monotonic() + 30
+    while not is_listening(socket_path):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            pytest.fail(f"serve did not start: {process.communicate()[1]}")
+        time.sleep(0.1)
+
+    yield socket_path
+
+    if process.poll() is None:
+        call(socket_path, 'shutdown', timeout=10)
+        process.wait(timeout=30)
+
+
+@pytest.fixture
+def transactions_file():
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+        f.write(TRANSACTION)
+        path = f.name
+    yield path
+    os.unlink(path)
+
+
+def _run(socket_path, *args):
+    return CliRunner().invoke(cli, ['--socket', socket_path, *args])
+
+
+def _export(socket_path, gnucash_file):
+    """Export through the daemon; return the plaintext."""
+    fd, output_path = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    try:
+        result = _run(socket_path, 'export', gnucash_file, output_path)
+        assert result.exit_code == 0, result.output
+        with open(output_path) as f:
+            return f.read()
+    finally:
+        os.unlink(output_path)
+
+
+class TestServeCLI:
+    """Test commands sent to a running daemon"""
+
+    def test_ping_and_preloaded_books(self, daemon, temp_gnucash_with_transactions):
+        assert call(daemon, 'ping', timeout=10) == 'pong'
+        books = call(daemon, 'books', timeout=10)
+        assert books == [{'path': os.path.realpath(temp_gnucash_with_transactions), 'mode': SessionMode.READ_ONLY}]
+
+    def test_validate(self, daemon, temp_gnucash_with_transactions):
+        result = _run(daemon, 'validate', temp_gnucash_with_transactions)
+
+        assert result.exit_code == 0, result.output
+        assert "Ledger is valid" in result.output
+
+    def test_failure_exit_code(self, daemon):
+        result = _run(daemon, 'validate', 'missing.gnucash')
+
+        assert result.exit_code == 2
+        assert "does not exist" in result.output
+
+    def test_import_then_export(self, daemon, temp_gnucash_with_transactions, transactions_file):
+        result = _run(daemon, 'import', temp_gnucash_with_transactions, transactions_file)
+        assert result.exit_code == 0, result.output
+        assert "Changes saved" in result.output
+
+        books = call(daemon, 'books', timeout=10)
+        assert books[0]['mode'] == SessionMode.NORMAL
+
+        assert "Daemon test transaction" in _export(daemon, temp_gnucash_with_transactions)
+
+    def test_dry_run_is_not_kept(self, daemon, temp_gnucash_with_transactions, transactions_file):
+        result = _run(daemon, 'import', temp_gnucash_with_transactions, transactions_file, '--dry-run')
+        assert result.exit_code == 0, result.output
+
+        assert "Daemon test transaction" not in _export(daemon, temp_gnucash_with_transactions)
+
+    def test_reload_after_outside_change(self, daemon, temp_gnucash_with_transactions, transactions_file):
+        assert "Daemon test transaction" not in _export(daemon, temp_gnucash_with_transactions)
+
+        # Written by another process while the daemon has the book open read-only
+        time.sleep(0.01)
+        result = CliRunner().invoke(import_transactions, [temp_gnucash_with_transactions, transactions_file])
+        assert result.exit_code == 0, result.output
+
+        assert "Daemon test transaction" in _export(daemon, temp_gnucash_with_transactions)
+
+    def test_relative_paths_use_client_cwd(self, daemon, temp_gnucash_with_transactions):
+        directory, name = os.path.split(temp_gnucash_with_transactions)
+        previous = os.getcwd()
+        os.chdir(directory)
+        try:
+            result = _run(daemon, 'validate', name)
+        finally:
+            os.chdir(previous)
+
+        assert result.exit_code == 0, result.output
+
+    def test_serve_refuses_busy_socket(self, daemon):
+        result = CliRunner().invoke(cli, ['serve', '--socket', daemon])
+
+        assert result.exit_code != 0
+        assert "already listening" in result.output
+
+    def test_daemon_not_running(self, socket_path):
+        result = _run(socket_path, 'validate', 'book.gnucash')
+
+        assert result.exit_code == 1
+        assert "Daemon at" in result.output
+
+
+class TestSessionPool:
+    """Test GnuCashRepository sessions shared through a pool"""
+
+    def test_session_reused(self, temp_gnucash_with_transactions):
+        pool = SessionPool()
+        with pool.installed():
+            first = GnuCashRepository(temp_gnucash_with_transactions)
+            first.open(mode=SessionMode.READ_ONLY)
+            session = first.session
+            first.close()
+
+            second = GnuCashRepository(temp_gnucash_with_transactions)
+            second.open(mode=SessionMode.READ_ONLY)
+            assert second.session is session
+            second.close()
+
+        assert pool.books() == []
+        assert GnuCashRepository.session_pool is None
+
+    def test_upgrade_to_normal(self, temp_gnucash_with_transactions):
+        pool = SessionPool()
+        with pool.installed():
+            reader = GnuCashRepository(temp_gnucash_with_transactions)
+            reader.open(mode=SessionMode.READ_ONLY)
+            with pytest.raises(RuntimeError):
+                GnuCashRepository(temp_gnucash_with_transactions).open(mode=SessionMode.NORMAL)
+            reader.close()
+
+            writer = GnuCashRepository(temp_gnucash_with_transactions)
+            writer.open(mode=SessionMode.NORMAL)
+            writer.close()
+            assert pool.books()[0][1] == SessionMode.NORMAL
@@ -134,3 +134,82 @@ class TestValidateCLI:
 
         assert result.exit_code != 0
         assert "Missing GnuCash file" in result.output
+
+    def test_validate_list_rules(self):
+        """Test listing validation rules"""
+        runner = CliRunner()
+
+        result = runner.invoke(validate_ledger, ['--list-rules'])
+
+        assert result.exit_code == 0
+        for name in ('transactions', 'accounts', 'hierarchy', 'duplicates', 'date-order', 'future-dates'):
+            assert name in result.output
+
+    def test_validate_with_rule_flags(self, temp_gnucash_with_transactions):
+        """Test selecting and skipping rules"""
+        runner = CliRunner()
+
+        result = runner.invoke(validate_ledger, [
+            temp_gnucash_with_transactions,
+            '--rule', 'transactions',
+            '--rule', 'duplicates',
+            '--skip-rule', 'duplicates'
+        ])
+
+        assert result.exit_code == 0
+        assert "Ledger is valid" in result.output
+
+        result = runner.invoke(validate_ledger, [
+            temp_gnucash_with_transactions,
+            '--skip-rule', 'no-such-rule'
+        ])
+
+        assert result.exit_code != 0
+
+    def test_validate_with_jobs(self, temp_gnucash_with_transactions):
+        """Test validation with worker processes"""
+        runner = CliRunner()
+
+        result = runner.invoke(validate_ledger, [
+            temp_gnucash_with_transactions,
+            '--jobs', '2'
+        ])
+
+        assert result.exit_code == 0
+        assert "Ledger is valid" in result.output
+
+    def test_validate_incremental(self, temp_gnucash_with_transactions):
+        """Test incremental validation with a sidecar cache"""
+        runner = CliRunner()
+        cache_path = f"{temp_gnucash_with_transactions}.validation-cache.json"
+
+        try:
+            result = runner.invoke(validate_ledger, [
+                temp_gnucash_with_transactions,
+                '--incremental'
+            ])
+            assert result.exit_code == 0
+            assert "0 result(s) reused" in result.output
+            assert os.path.exists(cache_path)
+
+            result = runner.invoke(validate_ledger, [
+                temp_gnucash_with_transactions,
+                '--incremental'
+            ])
+            assert result.exit_code == 0
+            assert "0 re-checked" in result.output
+        finally:
+            if os.path.exists(cache_path):
+                os.unlink(cache_path)
+
+    def test_validate_cache_file_requires_incremental(self, temp_gnucash_with_transactions):
+        """Test --cache-file without --incremental"""
+        runner = CliRunner()
+
+        result = runner.invoke(validate_ledger, [
+            temp_gnucash_with_transactions,
+            '--cache-file', 'cache.json'
+        ])
+
+        assert result.exit_code != 0
+        assert "--cache-file requires --incremental" in result.output
@@ -0,0 +1,61 @@
+"""
+Tests for the lazily loaded CLI commands
+
+Help output and usage errors caught before a book is opened run in a fresh
+interpreter (cli_import_times fixture), and the import log must not list the
+GnuCash bindings. Deprecation warnings are errors, so a deprecated click API
+fails the run.
+"""
+
+import importlib
+import inspect
+
+import pytest
+
+from cli.main import COMMANDS
+
+# Arguments and expected exit code: help, or a usage error found before any book is opened
+CLI_ARGS = [
+    (("--help",), 0),
+    (("--version",), 0),
+    (("export", "--help"), 0),
+    (("import", "--help"), 0),
+    (("validate", "--help"), 0),
+    (("validate", "--list-rules"), 0),
+    (("export-beancount", "--help"), 0),
+    (("import-beancount", "--help"), 0),
+    (("close-books", "--help"), 0),
+    (("print-invoice", "--help"), 0),
+    (("report", "--help"), 0),
+    (("report", "aging", "--help"), 0),
+    (("report", "net-worth", "--help"), 0),
+    (("report", "trial-balance", "--help"), 0),
+    (("query", "--help"), 0),
+    (("apply-payments", "--help"), 0),
+    (("serve", "--help"), 0),
+    (("validate",), 2),
+    (("close-books", "missing.gnucash"), 2),
+    (("report", "aging", "missing.gnucash"), 2),
+]
+
+
+class TestLazyCommands:
+    """Test that commands are imported only when run"""
+
+    @pytest.mark.parametrize("args,exit_code", CLI_ARGS, ids=lambda v: " ".join(v) if isinstance(v, tuple) else None)
+    def test_does_not_import_gnucash(self, cli_import_times, args, exit_code):
+        times = cli_import_times(*args, exit_code=exit_code)
+
+        assert "cli.main" in times
+        gnucash_modules = sorted(m for m in times if m == "gnucash" or m.startswith("gnucash."))
+        assert not gnucash_modules, f"{' '.join(args)} imported {', '.join(gnucash_modules)}"
+        assert "repositories.gnucash_repository" not in times
+
+    @pytest.mark.parametrize("name", sorted(COMMANDS))
+    def test_help_matches_docstring(self, name):
+        """The one-line help in COMMANDS is the first line of the command's docstring"""
+        import_path, short_help = COMMANDS[name]
+        module_name, attribute = import_path.split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+
+        assert inspect.cleandoc(command.help).splitlines()[0] == short_help
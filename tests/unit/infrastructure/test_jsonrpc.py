@@ -0,0 +1,136 @@
+"""
+Unit tests for infrastructure.jsonrpc
+"""
+
+import json
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from infrastructure.jsonrpc import (
+    INTERNAL_ERROR,
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    JsonRpcError,
+    JsonRpcServer,
+    call,
+    is_listening,
+)
+
+
+def _fail(params):
+    raise ValueError("boom")
+
+
+def _strict(params):
+    raise JsonRpcError(INVALID_PARAMS, "bad params", {'field': 'x'})
+
+
+METHODS = {
+    'echo': lambda params: params,
+    'fail': _fail,
+    'strict': _strict,
+}
+
+
+@pytest.fixture
+def socket_path():
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'test.sock')
+    yield path
+    if os.path.exists(path):
+        os.unlink(path)
+    os.rmdir(directory)
+
+
+@pytest.fixture
+def server(socket_path):
+    server = JsonRpcServer(socket_path, METHODS)
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _dispatch(server, request):
+    return server.dispatch(json.dumps(request).encode('utf-8'))
+
+
+class TestDispatch:
+    def test_result(self, server):
+        response = _dispatch(server, {'jsonrpc': '2.0', 'id': 7, 'method': 'echo', 'params': {'a': 1}})
+        assert response == {'jsonrpc': '2.0', 'id': 7, 'result': {'a': 1}}
+
+    def test_notification_has_no_response(self, server):
+        assert _dispatch(server, {'jsonrpc': '2.0', 'method': 'echo', 'params': {}}) is None
+        assert _dispatch(server, {'jsonrpc': '2.0', 'method': 'fail'}) is None
+
+    def test_parse_error(self, server):
+        response = server.dispatch(b'{not json')
+        assert response['id'] is None
+        assert response['error']['code'] == PARSE_ERROR
+
+    @pytest.mark.parametrize("request_", [
+        [1, 2],
+        {'id': 1, 'method': 'echo'},
+        {'jsonrpc': '2.0', 'id': 1, 'method': 3},
+    ])
+    def test_invalid_request(self, server, request_):
+        assert _dispatch(server, request_)['error']['code'] == INVALID_REQUEST
+
+    def test_unknown_method(self, server):
+        response = _dispatch(server, {'jsonrpc': '2.0', 'id': 1, 'method': 'missing'})
+        assert response['error']['code'] == METHOD_NOT_FOUND
+
+    def test_params_must_be_object(self, server):
+        response = _dispatch(server, {'jsonrpc': '2.0', 'id': 1, 'method': 'echo', 'params': [1]})
+        assert response['error']['code'] == INVALID_PARAMS
+
+    def test_method_errors(self, server):
+        response = _dispatch(server, {'jsonrpc': '2.0', 'id': 1, 'method': 'strict'})
+        assert response['error'] == {'code': INVALID_PARAMS, 'message': 'bad params', 'data': {'field': 'x'}}
+
+        response = _dispatch(server, {'jsonrpc': '2.0', 'id': 2, 'method': 'fail'})
+        assert response['error'] == {'code': INTERNAL_ERROR, 'message': 'boom'}
+
+
+class TestSocket:
+    def test_call(self, server, socket_path):
+        assert call(socket_path, 'echo', {'text': 'café'}, timeout=5) == {'text': 'café'}
+
+    def test_call_error(self, server, socket_path):
+        with pytest.raises(JsonRpcError) as excinfo:
+            call(socket_path, 'fail', timeout=5)
+        assert excinfo.value.code == INTERNAL_ERROR
+
+    def test_socket_is_private(self, server, socket_path):
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+    def test_second_server_refused(self, server, socket_path):
+        with pytest.raises(OSError):
+            JsonRpcServer(socket_path, METHODS)
+
+    def test_close_removes_socket(self, socket_path):
+        server = JsonRpcServer(socket_path, METHODS)
+        assert is_listening(socket_path)
+        server.server_close()
+        assert not os.path.exists(socket_path)
+        assert not is_listening(socket_path)
+
+    def test_stale_socket_replaced(self, socket_path):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()  # file left behind, nobody listening
+
+        server = JsonRpcServer(socket_path, METHODS)
+        try:
+            assert is_listening(socket_path)
+        finally:
+            server.server_close()
@@ -412,3 +412,41 @@ class TestSaveOperation:
         with GnuCashRepository(temp_gnucash_file) as repo:
             account = repo.get_account("Expenses:TestAccount")
             assert account is not None
+
+
+class TestBusinessObjectOperations:
+    """Test customer, vendor and invoice lookups by ID"""
+
+    def test_get_invoice_and_customer(self, temp_gnucash_with_business_objects):
+        """Test looking up the fixture's invoice and customer"""
+        from repositories.gnucash_repository import GnuCashRepository
+
+        with GnuCashRepository(temp_gnucash_with_business_objects) as repo:
+            invoice = repo.get_invoice("INV-2026-001")
+            assert invoice is not None
+            assert invoice.GetID() == "INV-2026-001"
+            assert repo.get_invoice("INV-MISSING") is None
+
+            customer = repo.get_customer("1")
+            assert customer is not None
+            assert customer.GetName() == "Test Customer"
+            # A customer ID is not a vendor ID
+            assert repo.get_vendor("1") is None
+
+    def test_object_created_after_index_is_found(self, temp_gnucash_with_business_objects):
+        """Test that a vendor added after the index was built is still found"""
+        from gnucash.gnucash_business import Vendor
+
+        from repositories.gnucash_repository import GnuCashRepository
+
+        with GnuCashRepository(temp_gnucash_with_business_objects) as repo:
+            assert repo.get_vendor("V-1") is None
+
+            vendor = Vendor(repo.book, "V-1", repo.get_commodity("CURRENCY", "CAD"))
+            vendor.BeginEdit()
+            vendor.SetName("Test Vendor")
+            vendor.CommitEdit()
+
+            found = repo.get_vendor("V-1")
+            assert found is not None
+            assert found.GetName() == "Test Vendor"
@@ -0,0 +1,97 @@
+"""
+Tests for aging buckets
+
+Open items are built by hand instead of opening a book.
+"""
+
+from datetime import date
+from fractions import Fraction
+
+import pytest
+
+from services.aging_report import (
+    PAYABLE,
+    RECEIVABLE,
+    OpenItem,
+    aging_report,
+    bucket_index,
+    bucket_labels,
+    parse_buckets,
+)
+
+AS_OF = date(2024, 6, 30)
+LIMITS = [30, 60, 90]
+
+
+def _item(kind, owner, due, amount, currency="CAD", owner_id=None):
+    owner_id = owner_id or owner.upper()
+    return OpenItem(kind, owner_id, owner, f"{owner}-{due.isoformat()}", due, currency, Fraction(amount))
+
+
+class TestBuckets:
+    """Bucket limits, labels and lookup"""
+
+    def test_parse_buckets_sorts_and_dedups(self):
+        assert parse_buckets("90, 30,60,30") == [30, 60, 90]
+
+    @pytest.mark.parametrize("text", ["", "30,abc", "0,30", "-5"])
+    def test_parse_buckets_rejects(self, text):
+        with pytest.raises(ValueError):
+            parse_buckets(text)
+
+    def test_labels(self):
+        assert bucket_labels(LIMITS) == ["Current", "1-30", "31-60", "61-90", "Over 90"]
+
+    @pytest.mark.parametrize("days, index", [
+        (-10, 0), (0, 0), (1, 1), (30, 1), (31, 2), (60, 2), (61, 3), (90, 3), (91, 4), (1000, 4),
+    ])
+    def test_bucket_edges(self, days, index):
+        assert bucket_index(days, LIMITS) == index
+
+
+class TestAgingReport:
+    """Grouping by owner and currency"""
+
+    def test_rows_and_totals(self):
+        items = [
+            _item(RECEIVABLE, "Acme", date(2024, 7, 15), 100),  # not yet due
+            _item(RECEIVABLE, "Acme", date(2024, 5, 1), 50),  # 60 days
+            _item(RECEIVABLE, "Bolt", date(2024, 1, 1), 25),  # 181 days
+            _item(PAYABLE, "Supply Co", date(2024, 6, 20), 40),  # 10 days
+        ]
+        report = aging_report(items, AS_OF, LIMITS)
+
+        assert report.title == "Aging as of 2024-06-30"
+        assert report.periods == ["Current", "1-30", "31-60", "61-90", "Over 90", "Total"]
+        receivable, payable = report.sections
+        assert [(row.account, row.amounts) for row in receivable.rows] == [
+            ("Acme", [100, 0, 50, 0, 0, 150]),
+            ("Bolt", [0, 0, 0, 0, 25, 25]),
+        ]
+        assert receivable.totals == {"CAD": [100, 0, 50, 0, 25, 175]}
+        assert payable.title == PAYABLE
+        assert payable.totals == {"CAD": [0, 40, 0, 0, 0, 40]}
+
+    def test_currencies_kept_apart(self):
+        items = [
+            _item(RECEIVABLE, "Acme", date(2024, 6, 1), 10, "CAD"),
+            _item(RECEIVABLE, "Acme", date(2024, 6, 1), 20, "USD"),
+        ]
+        (section,) = aging_report(items, AS_OF, LIMITS).sections
+
+        assert [(row.account, row.commodity) for row in section.rows] == [("Acme", "CAD"), ("Acme", "USD")]
+        assert list(section.totals) == ["CAD", "USD"]
+
+    def test_owners_with_same_name_kept_apart(self):
+        items = [
+            _item(RECEIVABLE, "Acme", date(2024, 6, 1), 10, owner_id="C001"),
+            _item(RECEIVABLE, "Acme", date(2024, 6, 1), 20, owner_id="C002"),
+            _item(RECEIVABLE, "Acme", date(2024, 6, 1), 5, owner_id="C001"),
+        ]
+        (section,) = aging_report(items, AS_OF, LIMITS).sections
+
+        assert [(row.account, row.amounts[-1]) for row in section.rows] == [("Acme", 15), ("Acme", 20)]
+        assert section.totals == {"CAD": [0, 35, 0, 0, 0, 35]}
+
+    def test_no_open_items(self):
+        assert aging_report([], AS_OF, LIMITS).sections == []
@@ -0,0 +1,78 @@
+"""
+Tests for exact balance checking
+
+The checker works on plain (numerator, denominator) values, so these tests
+do not need a GnuCash book.
+"""
+
+from datetime import date
+
+import pytest
+
+from services.balance_checker import find_unbalanced, find_unbalanced_rows, imbalance, is_balanced
+from services.ledger_snapshot import SplitRow, TransactionRow
+
+
+class TestIsBalanced:
+    """Test single-transaction balance checks"""
+
+    def test_same_denominator(self):
+        """Equal denominators sum numerators directly"""
+        assert is_balanced([(5000, 100), (-5000, 100)])
+        assert not is_balanced([(5000, 100), (-4999, 100)])
+
+    def test_mixed_denominators_balanced(self):
+        """50.00 and -50.000 balance although their numerators differ"""
+        assert is_balanced([(5000, 100), (-50000, 1000)])
+
+    def test_mixed_denominators_unbalanced(self):
+        """1.00 and -0.100 do not balance although their numerators cancel"""
+        assert not is_balanced([(100, 100), (-100, 1000)])
+
+    def test_three_way_split(self):
+        """Common denominator is the lcm, not the product"""
+        assert is_balanced([(1, 3), (1, 6), (-1, 2)])
+        assert imbalance([(1, 4), (1, 6)]) == (5, 12)
+
+    def test_negative_denominator(self):
+        """A negative denominator means num * |denom|"""
+        assert is_balanced([(5, -10), (-50, 1)])
+
+    def test_zero_denominator(self):
+        """A zero denominator is invalid"""
+        assert not is_balanced([(0, 0)])
+        with pytest.raises(ValueError):
+            imbalance([(1, 0)])
+
+    def test_empty(self):
+        """No splits sum to zero"""
+        assert is_balanced([])
+
+
+class TestFindUnbalanced:
+    """Test batch balance checks"""
+
+    def test_flat_arrays(self):
+        """Every unbalanced GUID is reported, in input order"""
+        guids = ["a", "b", "c", "d"]
+        offsets = [0, 2, 4, 5, 7]
+        nums = [5000, -50000, 100, -100, 0, 1, -1]
+        denoms = [100, 1000, 100, 1000, 100, 3, 3]
+
+        assert find_unbalanced(guids, offsets, nums, denoms) == ["b"]
+
+    def test_rows(self):
+        """Rows are flattened and checked in one pass"""
+        def row(guid, splits):
+            return TransactionRow(guid, date(2024, 1, 15), "Test", "CAD", None, tuple(
+                SplitRow("Assets:Bank:Checking", num, denom) for num, denom in splits
+            ))
+
+        rows = [
+            row("ok", [(5000, 100), (-5000, 100)]),
+            row("mixed-ok", [(5000, 100), (-50000, 1000)]),
+            row("bad", [(100, 100), (-100, 1000)]),
+            row("single", [(1, 100)]),
+        ]
+
+        assert find_unbalanced_rows(rows) == ["bad", "single"]
@@ -0,0 +1,122 @@
+"""
+Tests for balance checkpoints against a real book.
+
+Closes temp_gnucash_for_close_books for 2024, records checkpoints as of the
+closing date and checks that later balance queries start from them, and that a
+back-dated entry invalidates the checkpoint of the account it touches.
+"""
+
+from datetime import date
+from fractions import Fraction
+
+CLOSING_DATE = date(2024, 12, 31)
+
+
+def _add_expense(repo, day: date, amount_cents: int):
+    """Add an Expenses:Groceries purchase paid from Assets:Bank:Checking"""
+    from gnucash import GncNumeric, Split, Transaction
+
+    from infrastructure.gnucash.utils import find_account
+
+    book = repo.book
+    root = repo.get_root_account()
+    cad = book.get_table().lookup("CURRENCY", "CAD")
+
+    tx = Transaction(book)
+    tx.BeginEdit()
+    tx.SetCurrency(cad)
+    tx.SetDate(day.day, day.month, day.year)
+    tx.SetDescription("Groceries")
+    s1 = Split(book)
+    s1.SetParent(tx)
+    s1.SetAccount(find_account(root, "Expenses:Groceries"))
+    s1.SetValue(GncNumeric(amount_cents, 100))
+    s2 = Split(book)
+    s2.SetParent(tx)
+    s2.SetAccount(find_account(root, "Assets:Bank:Checking"))
+    s2.SetValue(GncNumeric(-amount_cents, 100))
+    tx.CommitEdit()
+
+
+def _closed_with_checkpoints(repo, tmp_path):
+    from services.balance_checkpoint import BalanceCheckpoints
+    from use_cases.close_books import CloseBooksUseCase
+
+    checkpoints = BalanceCheckpoints(str(tmp_path / "book.balance-checkpoints.json"))
+    use_case = CloseBooksUseCase(repo, checkpoints=checkpoints)
+    use_case.execute(CLOSING_DATE)
+    assert use_case.record_checkpoints(CLOSING_DATE) > 0
+    checkpoints.save()
+    return BalanceCheckpoints.load(checkpoints.path)
+
+
+class TestBalanceCheckpoints:
+    """Recording, loading and verifying checkpoints"""
+
+    def test_roundtrip(self, temp_gnucash_for_close_books, tmp_path):
+        """Saved checkpoints load back with the closing-date balance (zero)"""
+        from infrastructure.gnucash.utils import find_account
+        from repositories.gnucash_repository import GnuCashRepository
+
+        with GnuCashRepository(temp_gnucash_for_close_books) as repo:
+            checkpoints = _closed_with_checkpoints(repo, tmp_path)
+            groceries = find_account(repo.get_root_account(), "Expenses:Groceries")
+
+            checkpoint = checkpoints.get(groceries)
+            assert checkpoint.as_of == CLOSING_DATE
+            assert checkpoint.balance == Fraction(0)
+            assert checkpoint.split_count == len(groceries.GetSplitList())
+
+    def test_ledger_starts_from_checkpoint(self, temp_gnucash_for_close_books, tmp_path):
+        """Only splits after the checkpoint are read, and balances still match"""
+        from infrastructure.gnucash.utils import find_account
+        from repositories.gnucash_repository import GnuCashRepository
+        from services.book_closer import BookCloser
+
+        with GnuCashRepository(temp_gnucash_for_close_books) as repo:
+            checkpoints = _closed_with_checkpoints(repo, tmp_path)
+            _add_expense(repo, date(2025, 3, 1), 4250)
+
+            root = repo.get_root_account()
+            closer = BookCloser()
+            ledger = closer.build_ledger(root, checkpoints, before=date(2025, 12, 31))
+            assert checkpoints.used > 0
+            assert checkpoints.rejected == 0
+
+            groceries = find_account(root, "Expenses:Groceries")
+            assert ledger.balance_as_of(groceries, date(2025, 12, 31)) == Fraction(4250, 100)
+            assert ledger.balance_as_of(groceries, date(2025, 12, 31)) == closer.get_balance_as_of_date(
+                groceries, date(2025, 12, 31)
+            )
+
+    def test_back_dated_entry_invalidates_checkpoint(self, temp_gnucash_for_close_books, tmp_path):
+        """A new split on or before the checkpoint date makes the ledger read full history"""
+        from infrastructure.gnucash.utils import find_account
+        from repositories.gnucash_repository import GnuCashRepository
+        from services.book_closer import BookCloser
+
+        with GnuCashRepository(temp_gnucash_for_close_books) as repo:
+            checkpoints = _closed_with_checkpoints(repo, tmp_path)
+            _add_expense(repo, date(2024, 6, 1), 1000)
+
+            root = repo.get_root_account()
+            closer = BookCloser()
+            ledger = closer.build_ledger(root, checkpoints, before=date(2025, 12, 31))
+            assert checkpoints.rejected == 1
+
+            groceries = find_account(root, "Expenses:Groceries")
+            assert ledger.balance_as_of(groceries, CLOSING_DATE) == Fraction(10)
+            assert not closer.is_closed(root, CLOSING_DATE, ledger)
+
+    def test_checkpoint_not_used_for_earlier_dates(self, temp_gnucash_for_close_books, tmp_path):
+        """A ledger asked about the checkpoint date itself reads full history"""
+        from repositories.gnucash_repository import GnuCashRepository
+        from services.book_closer import BookCloser
+
+        with GnuCashRepository(temp_gnucash_for_close_books) as repo:
+            checkpoints = _closed_with_checkpoints(repo, tmp_path)
+
+            root = repo.get_root_account()
+            ledger = BookCloser().build_ledger(root, checkpoints, before=CLOSING_DATE)
+            assert checkpoints.used == 0
+            assert BookCloser().is_closed(root, CLOSING_DATE, ledger)
@@ -0,0 +1,98 @@
+"""
+Tests for the prefix-sum balance ledger
+
+AccountHistory works on plain (date, GUID, value) entries, so these tests do
+not need a GnuCash book. BalanceLedger against a real book is covered in
+test_book_closer.py.
+"""
+
+from datetime import date
+from fractions import Fraction
+
+import pytest
+
+from services.balance_checkpoint import BalanceCheckpoint
+from services.balance_ledger import AccountHistory
+
+
+def _entry(day: date, guid: str, num: int, denom: int = 100):
+    return (day.toordinal(), guid, num, denom)
+
+
+class TestAccountHistory:
+    """Test AccountHistory"""
+
+    def test_balance_as_of_uses_sorted_dates(self):
+        """Entries given out of order are summed up to and including the date"""
+        history = AccountHistory([
+            _entry(date(2024, 2, 28), "feb", -300000),
+            _entry(date(2024, 1, 31), "jan", -300000),
+            _entry(date(2024, 3, 31), "mar", -300000),
+        ])
+
+        assert history.balance_as_of(date(2023, 12, 31)) == Fraction(0)
+        assert history.balance_as_of(date(2024, 1, 31)) == Fraction(-3000)
+        assert history.balance_as_of(date(2024, 2, 27)) == Fraction(-3000)
+        assert history.balance_as_of(date(2024, 2, 28)) == Fraction(-6000)
+        assert history.balance_as_of(date(2030, 1, 1)) == Fraction(-9000)
+
+    def test_mixed_denominators_are_exact(self):
+        """Values with different denominators share one integer scale"""
+        history = AccountHistory([
+            _entry(date(2024, 1, 1), "a", 1, 3),
+            _entry(date(2024, 1, 2), "b", 5, 100),
+        ])
+
+        assert history.denom == 300
+        assert history.balance_as_of(date(2024, 1, 2)) == Fraction(1, 3) + Fraction(5, 100)
+
+    def test_exclude_guids(self):
+        """Excluded transactions are subtracted only if on or before the date"""
+        history = AccountHistory([
+            _entry(date(2024, 1, 31), "salary", -300000),
+            _entry(date(2024, 12, 31), "closing", 300000),
+        ])
+
+        assert history.balance_as_of(date(2024, 12, 31)) == Fraction(0)
+        assert history.balance_as_of(date(2024, 12, 31), {"closing"}) == Fraction(-3000)
+        assert history.balance_as_of(date(2024, 6, 30), {"closing"}) == Fraction(-3000)
+
+    def test_empty(self):
+        """An account without splits has a zero balance"""
+        history = AccountHistory([])
+
+        assert len(history) == 0
+        assert history.balance_as_of(date(2024, 1, 1)) == Fraction(0)
+
+
+class TestAccountHistoryFromCheckpoint:
+    """AccountHistory seeded from a balance checkpoint"""
+
+    def test_balances_continue_from_checkpoint(self):
+        """Later entries add to the checkpoint balance"""
+        checkpoint = BalanceCheckpoint(date(2024, 12, 31), Fraction(-9000), split_count=3)
+        history = AccountHistory(
+            [_entry(date(2025, 1, 31), "jan", -300000), _entry(date(2025, 2, 28), "feb", 1, 3)],
+            checkpoint,
+        )
+
+        assert history.balance_as_of(date(2024, 12, 31)) == Fraction(-9000)
+        assert history.balance_as_of(date(2025, 1, 31)) == Fraction(-12000)
+        assert history.balance_as_of(date(2025, 2, 28)) == Fraction(-12000) + Fraction(1, 3)
+        assert history.balance_as_of(date(2025, 2, 28), {"jan"}) == Fraction(-9000) + Fraction(1, 3)
+
+    def test_split_count_includes_checkpoint(self):
+        """Split counts start from the checkpoint's count"""
+        checkpoint = BalanceCheckpoint(date(2024, 12, 31), Fraction(0), split_count=5)
+        history = AccountHistory([_entry(date(2025, 1, 31), "jan", -300000)], checkpoint)
+
+        assert history.split_count_as_of(date(2024, 12, 31)) == 5
+        assert history.split_count_as_of(date(2025, 1, 31)) == 6
+
+    def test_before_checkpoint_raises(self):
+        """Dates before the checkpoint cannot be answered"""
+        checkpoint = BalanceCheckpoint(date(2024, 12, 31), Fraction(0), split_count=5)
+        history = AccountHistory([], checkpoint)
+
+        with pytest.raises(ValueError, match="checkpoint"):
+            history.balance_as_of(date(2024, 12, 30))
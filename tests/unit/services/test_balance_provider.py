@@ -0,0 +1,145 @@
+"""
+Tests for the balance providers used by BookCloser.
+
+The engine provider must agree with the Python BalanceLedger on every
+Income/Expense account of temp_gnucash_for_close_books, for dates before,
+inside and after the 2024 activity, with and without excluded transactions.
+"""
+
+from datetime import date
+
+import pytest
+
+AS_OF_DATES = (
+    date(2023, 12, 31),
+    date(2024, 1, 30),
+    date(2024, 1, 31),
+    date(2024, 6, 30),
+    date(2024, 12, 31),
+    date(2030, 1, 1),
+)
+
+
+def _open_read_only(path):
+    from gnucash import Session
+    try:
+        from gnucash import SessionOpenMode
+        return Session(f"xml://{path}", SessionOpenMode.SESSION_READ_ONLY)
+    except ImportError:
+        return Session(f"xml://{path}", ignore_lock=True)
+
+
+def _income_expense_accounts(root):
+    from gnucash.gnucash_core_c import ACCT_TYPE_EXPENSE, ACCT_TYPE_INCOME
+
+    return [
+        acc for acc in root.get_descendants()
+        if acc.GetType() in (ACCT_TYPE_INCOME, ACCT_TYPE_EXPENSE)
+    ]
+
+
+class TestEngineBalanceProvider:
+    """EngineBalanceProvider agrees with BalanceLedger"""
+
+    def test_agrees_with_ledger(self, temp_gnucash_for_close_books):
+        """Same balance for every Income/Expense account and date"""
+        from services.balance_ledger import BalanceLedger
+        from services.balance_provider import EngineBalanceProvider
+
+        session = _open_read_only(temp_gnucash_for_close_books)
+        try:
+            book = session.book
+            accounts = _income_expense_accounts(book.get_root_account())
+            assert accounts
+
+            engine = EngineBalanceProvider(book)
+            ledger = BalanceLedger.from_accounts(accounts)
+
+            for acc in accounts:
+                for as_of in AS_OF_DATES:
+                    assert engine.balance_as_of(acc, as_of) == ledger.balance_as_of(acc, as_of)
+        finally:
+            session.end()
+
+    def test_exclude_guids_agrees_with_ledger(self, temp_gnucash_for_close_books):
+        """Leaving out the Jan 31 transactions gives the same result in both"""
+        from infrastructure.gnucash.utils import query_transactions_by_date
+        from services.balance_ledger import BalanceLedger
+        from services.balance_provider import EngineBalanceProvider
+
+        session = _open_read_only(temp_gnucash_for_close_books)
+        try:
+            book = session.book
+            accounts = _income_expense_accounts(book.get_root_account())
+            engine = EngineBalanceProvider(book)
+            ledger = BalanceLedger.from_accounts(accounts)
+
+            jan_31 = date(2024, 1, 31)
+            excluded = {tx.GetGUID().to_string() for tx in query_transactions_by_date(book, jan_31, jan_31)}
+            assert excluded
+
+            for acc in accounts:
+                for as_of in AS_OF_DATES:
+                    assert (engine.balance_as_of(acc, as_of, excluded)
+                            == ledger.balance_as_of(acc, as_of, excluded))
+        finally:
+            session.end()
+
+
+class TestBuildBalanceProvider:
+    """BookCloser.build_balance_provider"""
+
+    def test_verify_source_checks_every_balance(self, temp_gnucash_for_close_books):
+        """is_closed runs through the verifying provider without a mismatch"""
+        from services.book_closer import BookCloser
+
+        session = _open_read_only(temp_gnucash_for_close_books)
+        try:
+            root = session.book.get_root_account()
+            closer = BookCloser()
+            provider = closer.build_balance_provider(root, "verify")
+
+            assert not closer.is_closed(root, date(2024, 12, 31), provider)
+            assert closer.is_closed(root, date(2023, 12, 31), provider)
+        finally:
+            session.end()
+
+    def test_unknown_source(self, temp_gnucash_for_close_books):
+        """An unknown source name raises ValueError"""
+        from services.book_closer import BookCloser
+
+        session = _open_read_only(temp_gnucash_for_close_books)
+        try:
+            with pytest.raises(ValueError, match="Unknown balance source"):
+                BookCloser().build_balance_provider(session.book.get_root_account(), "numpy")
+        finally:
+            session.end()
+
+
+class TestVerifyingBalanceProvider:
+    """VerifyingBalanceProvider raises when the providers disagree"""
+
+    def test_mismatch_raises(self, temp_gnucash_for_close_books):
+        """A provider that is off by one cent is reported"""
+        from fractions import Fraction
+
+        from services.balance_ledger import BalanceLedger
+        from services.balance_provider import BalanceMismatchError, VerifyingBalanceProvider
+
+        class OffByOneCent(BalanceLedger):
+            name = "off-by-one"
+
+            def balance_as_of(self, account, as_of, exclude_guids=None):
+                return super().balance_as_of(account, as_of, exclude_guids) + Fraction(1, 100)
+
+        session = _open_read_only(temp_gnucash_for_close_books)
+        try:
+            accounts = _income_expense_accounts(session.book.get_root_account())
+            provider = VerifyingBalanceProvider(
+                OffByOneCent.from_accounts(accounts), BalanceLedger.from_accounts(accounts)
+            )
+
+            with pytest.raises(BalanceMismatchError, match="off-by-one"):
+                provider.balance_as_of(accounts[0], date(2024, 12, 31))
+        finally:
+            session.end()
@@ -123,6 +123,39 @@ class TestGetBalanceAsOfDate:
             session.end()
 
 
+# ---------------------------------------------------------------------------
+# TestBuildLedger
+# ---------------------------------------------------------------------------
+
+
+class TestBuildLedger:
+    """build_ledger — one pass over Income/Expense splits, bisect queries"""
+
+    def test_ledger_matches_split_scan(self, temp_gnucash_for_close_books):
+        """Ledger balances equal get_balance_as_of_date for every account and date"""
+        from gnucash.gnucash_core_c import ACCT_TYPE_EXPENSE, ACCT_TYPE_INCOME
+
+        from services.book_closer import BookCloser
+
+        session = _open_read_only(temp_gnucash_for_close_books)
+        try:
+            root = session.book.get_root_account()
+            closer = BookCloser()
+            ledger = closer.build_ledger(root)
+
+            accounts = [
+                acc for acc in root.get_descendants()
+                if acc.GetType() in (ACCT_TYPE_INCOME, ACCT_TYPE_EXPENSE)
+            ]
+            assert accounts
+            for acc in accounts:
+                assert acc in ledger
+                for as_of in (date(2023, 12, 31), date(2024, 1, 31), date(2024, 6, 30), date(2024, 12, 31)):
+                    assert ledger.balance_as_of(acc, as_of) == closer.get_balance_as_of_date(acc, as_of)
+        finally:
+            session.end()
+
+
 # ---------------------------------------------------------------------------
 # TestIsClosed
 # ---------------------------------------------------------------------------
@@ -334,6 +367,31 @@ class TestFindClosingTransactions:
         finally:
             repo.close()
 
+    def test_date_query_finds_created_entries(self, temp_gnucash_for_close_books):
+        """The QOF date query finds exactly the closing entries just created"""
+        from repositories.gnucash_repository import GnuCashRepository
+        from services.book_closer import BookCloser
+        from use_cases.close_books import CloseBooksUseCase
+
+        repo = GnuCashRepository(temp_gnucash_for_close_books)
+        repo.open()
+        try:
+            closing_date = date(2024, 12, 31)
+            result = CloseBooksUseCase(repo).execute(closing_date)
+
+            root = repo.get_root_account()
+            closer = BookCloser()
+
+            def guids(txns):
+                return sorted(tx.GetGUID().to_string() for tx in txns)
+
+            assert guids(closer.find_closing_transactions(root, closing_date)) == guids(
+                result.transactions_created
+            )
+            assert closer.find_closing_transactions(root, date(2024, 12, 30)) == []
+        finally:
+            repo.close()
+
 
 # ---------------------------------------------------------------------------
 # TestGetOrCreateEquityAccount
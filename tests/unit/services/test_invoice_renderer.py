@@ -0,0 +1,58 @@
+"""
+Tests for reading the company details of an XML book.
+
+The book files are written by hand: only the head of a GnuCash XML file (the
+book element and its slots) matters here.
+"""
+
+import gzip
+
+BOOK_HEAD = '''<?xml version="1.0" encoding="utf-8" ?>
+<gnc-v2 xmlns:gnc="http://www.gnucash.org/XML/gnc" xmlns:book="http://www.gnucash.org/XML/book"
+        xmlns:slot="http://www.gnucash.org/XML/slot">
+<gnc:count-data>1</gnc:count-data>
+<gnc:book version="2.0.0">
+<book:id type="guid">0123456789abcdef0123456789abcdef</book:id>
+<book:slots>
+  <slot><slot:key>options</slot:key><slot:value type="frame">
+    <slot><slot:key>Business</slot:key><slot:value type="frame">
+      <slot><slot:key>Company Name</slot:key><slot:value type="string">{name}</slot:value></slot>
+      <slot><slot:key>Company Address</slot:key><slot:value type="string">1 Main St
+Toronto ON</slot:value></slot>
+    </slot:value></slot>
+  </slot:value></slot>
+</book:slots>
+'''
+
+# Anything after the book slots is never parsed
+UNPARSEABLE_TAIL = '<gnc:transaction version="2.0.0"> <<< not XML'
+
+
+class TestReadBookCompanyInfo:
+    """read_book_company_info"""
+
+    def test_compressed_book_stops_after_slots(self, tmp_path):
+        from services.invoice_renderer import read_book_company_info
+
+        path = tmp_path / "book.gnucash"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(BOOK_HEAD.format(name="Acme Ltd") + UNPARSEABLE_TAIL)
+
+        info = read_book_company_info(str(path))
+
+        assert info["name"] == "Acme Ltd"
+        assert info["addr1"] == "1 Main St"
+        assert info["addr2"] == "Toronto ON"
+        assert info["phone"] == ""
+
+    def test_cache_follows_file_changes(self, tmp_path):
+        from services.invoice_renderer import read_book_company_info
+
+        path = tmp_path / "book.gnucash"
+        path.write_text(BOOK_HEAD.format(name="Acme Ltd") + UNPARSEABLE_TAIL, encoding="utf-8")
+        first = read_book_company_info(str(path))
+        first["name"] = "changed by caller"
+        assert read_book_company_info(str(path))["name"] == "Acme Ltd"
+
+        path.write_text(BOOK_HEAD.format(name="Acme Holdings Ltd") + UNPARSEABLE_TAIL, encoding="utf-8")
+        assert read_book_company_info(str(path))["name"] == "Acme Holdings Ltd"
@@ -0,0 +1,70 @@
+"""
+Tests for ledger snapshot rows
+
+TransactionRow and partition_by_date are plain Python, so these tests
+do not need a GnuCash book.
+"""
+
+from datetime import date
+
+from services.ledger_snapshot import SplitRow, TransactionRow, partition_by_date
+
+
+def _row(guid: str, day: date, accounts=("Assets:Bank:Checking", "Expenses:Groceries"), doc_link=None):
+    return TransactionRow(
+        guid=guid,
+        date=day,
+        description="Groceries",
+        currency="CAD",
+        doc_link=doc_link,
+        splits=(SplitRow(accounts[0], -5000, 100), SplitRow(accounts[1], 5000, 100)),
+    )
+
+
+class TestTransactionRow:
+    """Test TransactionRow"""
+
+    def test_signature_matches_matcher_format(self):
+        """Signature is (date string, sorted account names, doc_link)"""
+        row = _row("a" * 32, date(2024, 1, 15), accounts=("Expenses:Groceries", "Assets:Bank:Checking"))
+
+        assert row.signature == (
+            "2024-01-15",
+            ("Assets:Bank:Checking", "Expenses:Groceries"),
+            None,
+        )
+
+    def test_signature_includes_doc_link(self):
+        """Rows differing only by doc_link have different signatures"""
+        first = _row("a" * 32, date(2024, 1, 15), doc_link="receipts/1.pdf")
+        second = _row("b" * 32, date(2024, 1, 15), doc_link="receipts/2.pdf")
+
+        assert first.signature != second.signature
+
+
+class TestPartitionByDate:
+    """Test date-range partitioning"""
+
+    def test_partitions_cover_all_rows_in_date_order(self):
+        """Every row lands in exactly one partition, partitions are date ranges"""
+        rows = [_row(f"{i:032x}", date(2024, 1 + i % 12, 1 + i % 28)) for i in range(100)]
+
+        partitions = partition_by_date(rows, 4)
+
+        assert 1 < len(partitions) <= 4
+        assert sorted(row.guid for part in partitions for row in part) == sorted(row.guid for row in rows)
+        for earlier, later in zip(partitions, partitions[1:]):
+            assert max(row.date for row in earlier) < min(row.date for row in later)
+
+    def test_same_date_stays_together(self):
+        """Rows with one date are never split across partitions"""
+        rows = [_row(f"{i:032x}", date(2024, 1, 15)) for i in range(10)]
+
+        partitions = partition_by_date(rows, 4)
+
+        assert len(partitions) == 1
+        assert len(partitions[0]) == 10
+
+    def test_empty(self):
+        """No rows, no partitions"""
+        assert partition_by_date([], 4) == []
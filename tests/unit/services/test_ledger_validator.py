@@ -429,6 +429,64 @@ class TestLedgerValidation:
         finally:
             session.end()
 
+    def test_run_rules_single_pass(self, temp_gnucash_with_transactions):
+        """Test that each account and transaction is visited once per pass"""
+        from gnucash import Session, Transaction
+
+        from services.ledger_validator import LedgerValidator, ValidationRule
+
+        class CountingRule(ValidationRule):
+            name = "counting"
+            levels = ("account", "transaction")
+
+            def begin(self, validator, result):
+                super().begin(validator, result)
+                self.accounts = []
+                self.transactions = 0
+
+            def check_account(self, account, full_name, result):
+                self.accounts.append(full_name)
+
+            def check_transaction(self, transaction, result):
+                self.transactions += 1
+
+        try:
+            from gnucash import SessionOpenMode
+            session = Session(f'xml://{temp_gnucash_with_transactions}',
+                            SessionOpenMode.SESSION_READ_ONLY)
+        except ImportError:
+            # Fall back to older GnuCash API (< 4.0)
+            session = Session(f'xml://{temp_gnucash_with_transactions}',
+                            ignore_lock=True)
+
+        try:
+            book = session.book
+            root = book.get_root_account()
+
+            from gnucash import Query
+            query = Query()
+            query.search_for('Trans')
+            query.set_book(book)
+            result = query.run()
+            transactions = [Transaction(instance=tx) for tx in result]
+
+            validator = LedgerValidator()
+            counting = CountingRule()
+            rules = validator.create_rules() + [counting]
+            validation_result = validator.run_rules(root, transactions, rules)
+
+            assert validation_result.is_valid()
+            assert counting.transactions == len(transactions)
+            assert len(counting.accounts) == len(set(counting.accounts))
+            assert "Assets:Bank:Checking" in counting.accounts
+            assert "Expenses:Groceries" in counting.accounts
+
+            with pytest.raises(ValueError):
+                validator.create_rules(disabled=['no-such-rule'])
+
+        finally:
+            session.end()
+
 
 class TestDateValidation:
     """Test date-related validation"""
@@ -0,0 +1,107 @@
+"""
+Tests for the net worth report and price lookups
+
+Snapshots and price entries are built by hand instead of opening a book.
+"""
+
+from datetime import date
+from fractions import Fraction
+
+from services.account_category import AccountCategory
+from services.net_worth import PriceTable, net_worth
+from services.period_report import AccountInfo
+
+ACCOUNTS = [
+    AccountInfo("Assets:Checking", AccountCategory.ASSET, "CAD"),
+    AccountInfo("Assets:Brokerage", AccountCategory.ASSET, "XYZ"),
+    AccountInfo("Liabilities:Visa", AccountCategory.LIABILITY, "CAD"),
+    AccountInfo("Income:Salary", AccountCategory.INCOME, "CAD"),
+]
+
+
+def _entry(account, day, cents):
+    return (account, day.toordinal(), cents, 100)
+
+
+def _ordinal(y, m, d):
+    return date(y, m, d).toordinal()
+
+
+class TestPriceTable:
+    """Bisect lookups of the latest prior price"""
+
+    def test_latest_prior_price(self):
+        table = PriceTable([
+            ("USD", "CAD", _ordinal(2024, 1, 10), Fraction(134, 100)),
+            ("USD", "CAD", _ordinal(2024, 3, 1), Fraction(136, 100)),
+        ])
+
+        assert table.rate("USD", "CAD", date(2024, 1, 9)) is None
+        assert table.rate("USD", "CAD", date(2024, 1, 10)) == Fraction(134, 100)
+        assert table.rate("USD", "CAD", date(2024, 2, 29)) == Fraction(134, 100)
+        assert table.rate("USD", "CAD", date(2024, 12, 31)) == Fraction(136, 100)
+
+    def test_inverse_and_same_currency(self):
+        table = PriceTable([("USD", "CAD", _ordinal(2024, 1, 1), Fraction(5, 4))])
+
+        assert table.rate("CAD", "USD", date(2024, 6, 1)) == Fraction(4, 5)
+        assert table.rate("EUR", "EUR", date(2024, 6, 1)) == 1
+
+    def test_one_intermediate_currency(self):
+        """A stock quoted in CAD is converted to USD through the USD/CAD rate"""
+        table = PriceTable([
+            ("XYZ", "CAD", _ordinal(2024, 1, 1), Fraction(50)),
+            ("USD", "CAD", _ordinal(2024, 1, 1), Fraction(5, 4)),
+        ])
+
+        assert table.rate("XYZ", "USD", date(2024, 1, 1)) == Fraction(40)
+
+    def test_same_day_last_entry_wins(self):
+        table = PriceTable([
+            ("USD", "CAD", _ordinal(2024, 1, 1), Fraction(130, 100)),
+            ("USD", "CAD", _ordinal(2024, 1, 1), Fraction(135, 100)),
+        ])
+
+        assert table.rate("USD", "CAD", date(2024, 1, 1)) == Fraction(135, 100)
+        assert len(table) == 1
+
+
+class TestNetWorth:
+    """Per-period balances converted to one currency"""
+
+    ENTRIES = [
+        _entry("Assets:Checking", date(2024, 1, 5), 100000),
+        _entry("Income:Salary", date(2024, 1, 5), -100000),
+        _entry("Liabilities:Visa", date(2024, 2, 10), -20000),
+        _entry("Assets:Brokerage", date(2024, 2, 15), 1000),  # 10 shares
+        _entry("Assets:Checking", date(2024, 2, 15), -50000),
+    ]
+
+    def test_converts_holdings_at_period_end(self):
+        prices = PriceTable([
+            ("XYZ", "CAD", _ordinal(2024, 2, 15), Fraction(50)),
+            ("XYZ", "CAD", _ordinal(2024, 3, 31), Fraction(60)),
+        ])
+        result = net_worth(
+            ACCOUNTS, self.ENTRIES, prices, "month", date(2024, 1, 1), date(2024, 3, 31), "CAD"
+        )
+
+        report = result.report
+        assert report.periods == ["2024-01", "2024-02", "2024-03"]
+        assert report.summary == [("Net worth", "CAD", [Fraction(1000), Fraction(800), Fraction(900)])]
+        assert result.unpriced == {}
+
+        holdings, values = report.sections
+        assert [(row.account, row.amounts) for row in holdings.rows] == [
+            ("CAD", [Fraction(1000), Fraction(300), Fraction(300)]),
+            ("XYZ", [Fraction(0), Fraction(10), Fraction(10)]),
+        ]
+        assert values.title == "Value in CAD"
+
+    def test_unpriced_holdings_count_as_zero(self):
+        result = net_worth(
+            ACCOUNTS, self.ENTRIES, PriceTable([]), "month", date(2024, 1, 1), date(2024, 2, 29), "CAD"
+        )
+
+        assert result.unpriced == {"XYZ": ["2024-02"]}
+        assert result.report.summary[0][2] == [Fraction(1000), Fraction(300)]
@@ -0,0 +1,152 @@
+"""
+Tests for reading payment lists and matching them to open invoices
+
+Open invoices are built by hand instead of opening a book.
+"""
+
+from datetime import date
+from fractions import Fraction
+
+import pytest
+
+from services.payment_matcher import (
+    IncomingPayment,
+    OpenInvoice,
+    OpenInvoiceIndex,
+    read_payments,
+)
+
+
+def _payment(customer_id, amount, billing_id=""):
+    return IncomingPayment(customer_id, date(2024, 3, 1), Fraction(amount), "Assets:Bank", billing_id=billing_id)
+
+
+def _invoices():
+    return [
+        OpenInvoice("C1", "INV-3", date(2024, 2, 28), Fraction(100)),
+        OpenInvoice("C1", "INV-1", date(2024, 1, 31), Fraction(100)),
+        OpenInvoice("C1", "INV-2", date(2024, 2, 15), Fraction(250), billing_id="PO-7"),
+        OpenInvoice("C2", "INV-4", date(2024, 1, 31), Fraction(100)),
+    ]
+
+
+class TestOpenInvoiceIndex:
+    """Matching by remaining amount and by billing ID"""
+
+    def test_exact_amount_oldest_due_first(self):
+        index = OpenInvoiceIndex(_invoices())
+
+        first, _ = index.find(_payment("C1", 100))
+        index.settle(first, Fraction(100))
+        second, _ = index.find(_payment("C1", 100))
+        index.settle(second, Fraction(100))
+        third, reason = index.find(_payment("C1", 100))
+
+        assert (first.invoice_id, second.invoice_id) == ("INV-1", "INV-3")
+        assert third is None
+        assert "no open invoice of 100.00" in reason
+        assert len(index) == 2
+
+    def test_amount_must_match(self):
+        invoice, reason = OpenInvoiceIndex(_invoices()).find(_payment("C1", "99.99"))
+
+        assert invoice is None
+        assert "99.99" in reason
+
+    def test_unknown_customer(self):
+        invoice, reason = OpenInvoiceIndex(_invoices()).find(_payment("C9", 100))
+
+        assert invoice is None
+        assert "customer C9" in reason
+
+    def test_billing_id_partial_payments(self):
+        index = OpenInvoiceIndex(_invoices())
+
+        invoice, _ = index.find(_payment("C1", 200, billing_id="PO-7"))
+        assert invoice.invoice_id == "INV-2"
+        index.settle(invoice, Fraction(200))
+        assert invoice.remaining == 50
+
+        # The rest now matches by amount, too
+        by_amount, _ = index.find(_payment("C1", 50))
+        assert by_amount is invoice
+
+        too_much, reason = index.find(_payment("C1", 60, billing_id="PO-7"))
+        assert too_much is None
+        assert "50.00 remaining on invoice INV-2" in reason
+
+        index.settle(invoice, Fraction(50))
+        paid, reason = index.find(_payment("C1", 50, billing_id="PO-7"))
+        assert paid is None
+        assert "billing ID PO-7" in reason
+
+    def test_billing_id_of_other_customer(self):
+        invoice, _ = OpenInvoiceIndex(_invoices()).find(_payment("C2", 250, billing_id="PO-7"))
+
+        assert invoice is None
+
+
+class TestReadPayments:
+    """CSV and plaintext payment lists"""
+
+    def test_csv(self, tmp_path):
+        path = tmp_path / "payments.csv"
+        path.write_text(
+            "customer_id,date,amount,bank_account,memo,num,billing_id\n"
+            "C1,2024-03-01,100.00,Assets:Bank,Wire,17,\n"
+            "C2,2024-03-02,0.10,Assets:Bank,,,PO-7\n"
+        )
+
+        first, second = read_payments(str(path))
+
+        assert first == IncomingPayment(
+            "C1", date(2024, 3, 1), Fraction(100), "Assets:Bank", "Wire", "17", "", f"{path}:2"
+        )
+        assert second.amount == Fraction(1, 10)
+        assert second.billing_id == "PO-7"
+
+    def test_plaintext(self, tmp_path):
+        path = tmp_path / "payments.txt"
+        path.write_text(
+            'payment:\n'
+            '  customer_id: "C1"\n'
+            '  date: 2024-03-01\n'
+            '  amount: 100.25\n'
+            '  bank_account: "Assets:Bank"\n'
+            '  memo: "Wire"\n'
+            '\n'
+            'payment:\n'
+            '  customer_id: "C2"\n'
+            '  date: 2024-03-02\n'
+            '  amount: 5\n'
+            '  bank_account: "Assets:Bank"\n'
+            '  billing_id: "PO-7"\n'
+        )
+
+        first, second = read_payments(str(path))
+
+        assert (first.customer_id, first.amount, first.memo) == ("C1", Fraction(401, 4), "Wire")
+        assert (second.customer_id, second.amount, second.billing_id) == ("C2", Fraction(5), "PO-7")
+
+    def test_csv_missing_column(self, tmp_path):
+        path = tmp_path / "payments.csv"
+        path.write_text("customer_id,date,amount\nC1,2024-03-01,1\n")
+
+        with pytest.raises(ValueError, match="bank_account"):
+            read_payments(str(path))
+
+    @pytest.mark.parametrize("row, message", [
+        ("C1,03/01/2024,1,Assets:Bank", "YYYY-MM-DD"),
+        ("C1,2024-03-01,abc,Assets:Bank", "invalid amount"),
+        ("C1,2024-03-01,inf,Assets:Bank", "invalid amount"),
+        ("C1,2024-03-01,-Infinity,Assets:Bank", "invalid amount"),
+        ("C1,2024-03-01,NaN,Assets:Bank", "invalid amount"),
+        ("C1,2024-03-01,-5,Assets:Bank", "positive"),
+        (",2024-03-01,5,Assets:Bank", "missing customer_id"),
+    ])
+    def test_csv_invalid_row(self, tmp_path, row, message):
+        path = tmp_path / "payments.csv"
+        path.write_text(f"customer_id,date,amount,bank_account\n{row}\n")
+
+        with pytest.raises(ValueError, match=message):
+            read_payments(str(path))
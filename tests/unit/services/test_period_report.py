@@ -0,0 +1,182 @@
+"""
+Tests for period report aggregation and rendering
+
+The builder works on AccountInfo lists and plain split entries, so these tests
+build small snapshots by hand instead of opening a book.
+"""
+
+from datetime import date
+from fractions import Fraction
+
+import pytest
+
+from services.account_category import AccountCategory
+from services.period_report import (
+    AccountInfo,
+    PeriodReportBuilder,
+    aggregate,
+    format_amount,
+    period_label,
+    period_starts,
+    render_csv,
+    render_text,
+    roll_up,
+)
+
+ACCOUNTS = [
+    AccountInfo("Assets", AccountCategory.ASSET, "CAD"),
+    AccountInfo("Assets:Checking", AccountCategory.ASSET, "CAD"),
+    AccountInfo("Assets:USD", AccountCategory.ASSET, "USD"),
+    AccountInfo("Income", AccountCategory.INCOME, "CAD"),
+    AccountInfo("Income:Salary", AccountCategory.INCOME, "CAD"),
+    AccountInfo("Expenses", AccountCategory.EXPENSE, "CAD"),
+    AccountInfo("Expenses:Food", AccountCategory.EXPENSE, "CAD"),
+    AccountInfo("Expenses:SaaS", AccountCategory.EXPENSE, "USD"),
+]
+
+
+def _entry(account: str, day: date, num: int, denom: int = 100):
+    return (account, day.toordinal(), num, denom)
+
+
+ENTRIES = [
+    # Opening balance from 2023
+    _entry("Assets:Checking", date(2023, 12, 1), 100000),
+    _entry("Income:Salary", date(2023, 12, 1), -100000),
+    # January salary, February groceries, March USD subscription
+    _entry("Assets:Checking", date(2024, 1, 31), 300000),
+    _entry("Income:Salary", date(2024, 1, 31), -300000),
+    _entry("Expenses:Food", date(2024, 2, 3), 4550),
+    _entry("Assets:Checking", date(2024, 2, 3), -4550),
+    _entry("Expenses:SaaS", date(2024, 3, 3), 1000),
+    _entry("Assets:USD", date(2024, 3, 3), -1000),
+]
+
+
+def _builder(period="month"):
+    return PeriodReportBuilder(ACCOUNTS, ENTRIES, period, date(2024, 1, 1), date(2024, 3, 31))
+
+
+class TestPeriods:
+    """Period boundaries and labels"""
+
+    def test_period_starts(self):
+        """Periods cover the start and end dates"""
+        assert period_starts(date(2023, 11, 5), date(2024, 2, 1), "quarter") == [
+            date(2023, 10, 1), date(2024, 1, 1)
+        ]
+        assert period_starts(date(2024, 12, 31), date(2025, 1, 1), "month") == [
+            date(2024, 12, 1), date(2025, 1, 1)
+        ]
+        assert period_starts(date(2024, 6, 1), date(2024, 6, 1), "year") == [date(2024, 1, 1)]
+
+    def test_labels(self):
+        assert period_label(date(2024, 3, 1), "month") == "2024-03"
+        assert period_label(date(2024, 4, 1), "quarter") == "2024-Q2"
+        assert period_label(date(2024, 1, 1), "year") == "2024"
+
+    def test_unknown_period(self):
+        with pytest.raises(ValueError, match="Unknown period"):
+            period_starts(date(2024, 1, 1), date(2024, 2, 1), "week")
+
+
+class TestAggregate:
+    """Group-by over the split snapshot"""
+
+    def test_opening_and_activity(self):
+        """Entries before the first period go to the opening balance"""
+        starts = period_starts(date(2024, 1, 1), date(2024, 3, 31), "month")
+        opening, activity = aggregate(ENTRIES, starts, date(2024, 3, 31))
+
+        assert opening == {"Assets:Checking": Fraction(1000), "Income:Salary": Fraction(-1000)}
+        assert activity["Assets:Checking"] == [Fraction(3000), Fraction(-4550, 100), Fraction(0)]
+        assert activity["Expenses:SaaS"] == [Fraction(0), Fraction(0), Fraction(10)]
+
+    def test_mixed_denominators(self):
+        """Amounts with different denominators sum exactly"""
+        starts = [date(2024, 1, 1)]
+        entries = [_entry("A", date(2024, 1, 2), 1, 3), _entry("A", date(2024, 1, 3), 5, 100)]
+        _, activity = aggregate(entries, starts, date(2024, 1, 31))
+        assert activity["A"] == [Fraction(1, 3) + Fraction(5, 100)]
+
+    def test_roll_up_keeps_commodities_apart(self):
+        """A parent gets one row per commodity in its subtree"""
+        rolled = roll_up(ACCOUNTS, {"Assets:Checking": [Fraction(5)], "Assets:USD": [Fraction(-1)]}, 1)
+        assert rolled[("Assets", "CAD")] == [Fraction(5)]
+        assert rolled[("Assets", "USD")] == [Fraction(-1)]
+
+
+class TestReports:
+    """Trial balance, income statement and balance sheet"""
+
+    def test_trial_balance_totals_zero(self):
+        """Debits equal credits in every period and commodity"""
+        report = _builder().trial_balance()
+        assert report.periods == ["2024-01", "2024-02", "2024-03"]
+        for _, _, amounts in report.summary:
+            assert amounts == [Fraction(0)] * 3
+
+    def test_income_statement(self):
+        """Income prints positive; net income per commodity and period"""
+        report = _builder().income_statement()
+
+        income = next(s for s in report.sections if s.title == AccountCategory.INCOME)
+        assert income.totals["CAD"] == [Fraction(3000), Fraction(0), Fraction(0)]
+
+        net = {commodity: amounts for _, commodity, amounts in report.summary}
+        assert net["CAD"] == [Fraction(3000), Fraction(-4550, 100), Fraction(0)]
+        assert net["USD"] == [Fraction(0), Fraction(0), Fraction(-10)]
+
+    def test_income_statement_by_quarter(self):
+        """A quarter column sums its months"""
+        report = _builder("quarter").income_statement()
+        net = {commodity: amounts for _, commodity, amounts in report.summary}
+        assert report.periods == ["2024-Q1"]
+        assert net["CAD"] == [Fraction(3000) - Fraction(4550, 100)]
+
+    def test_balance_sheet_balances(self):
+        """Assets = liabilities + equity + unclosed net income"""
+        report = _builder().balance_sheet()
+
+        assets = next(s for s in report.sections if s.title == AccountCategory.ASSET)
+        unclosed = {commodity: amounts for _, commodity, amounts in report.summary}
+        assert assets.totals["CAD"] == unclosed["CAD"]
+        assert assets.totals["CAD"][-1] == Fraction(1000) + Fraction(3000) - Fraction(4550, 100)
+
+    def test_rows_follow_hierarchy(self):
+        """Parents come before children, with depth for indentation"""
+        report = _builder().income_statement()
+        expense = next(s for s in report.sections if s.title == AccountCategory.EXPENSE)
+        assert [(row.account, row.commodity, row.depth) for row in expense.rows] == [
+            ("Expenses", "CAD", 0),
+            ("Expenses", "USD", 0),
+            ("Expenses:Food", "CAD", 1),
+            ("Expenses:SaaS", "USD", 1),
+        ]
+
+    def test_start_after_end(self):
+        with pytest.raises(ValueError, match="after end"):
+            PeriodReportBuilder(ACCOUNTS, ENTRIES, "month", date(2024, 2, 1), date(2024, 1, 1))
+
+
+class TestRendering:
+    """Text and CSV output"""
+
+    def test_format_amount(self):
+        assert format_amount(Fraction(-4550, 100)) == "-45.50"
+        assert format_amount(Fraction(1, 8)) == "0.125"
+        assert format_amount(Fraction(1, 3)) == "0.333333"
+        assert format_amount(Fraction(5)) == "5.00"
+
+    def test_render_csv(self):
+        """One CSV row per account and commodity, plus totals and summary"""
+        lines = render_csv(_builder().income_statement()).splitlines()
+        assert lines[0] == "section,account,commodity,2024-01,2024-02,2024-03"
+        assert "Income,Income:Salary,CAD,3000.00,0.00,0.00" in lines
+        assert "Summary,Net income,CAD,3000.00,-45.50,0.00" in lines
+
+    def test_render_text(self):
+        text = render_text(_builder().income_statement())
+        assert text.startswith("Income Statement\n")
+        assert "Salary" in text
+        assert "-45.50" in text
@@ -0,0 +1,95 @@
+"""
+Tests for account register queries.
+
+Uses temp_gnucash_for_close_books. Assets:Bank:Checking (CAD) has seven 2024
+lines: +3000, +3000, +1000, +200, -150, -800, -400, ending at 5850.
+"""
+
+from datetime import date
+from fractions import Fraction
+
+import pytest
+
+from services.register_query import RegisterFilter
+
+CHECKING = "Assets:Bank:Checking"
+
+
+def _run(path, **options):
+    from repositories.gnucash_repository import GnuCashRepository, SessionMode
+    from use_cases.query_register import QueryRegisterUseCase
+
+    repo = GnuCashRepository(path)
+    repo.open(mode=SessionMode.READ_ONLY)
+    try:
+        return QueryRegisterUseCase(repo).execute(CHECKING, RegisterFilter.build(**options))
+    finally:
+        repo.close()
+
+
+class TestRegisterFilter:
+    """Option checks"""
+
+    def test_limit_and_tail_exclusive(self):
+        with pytest.raises(ValueError, match="--limit or --tail"):
+            RegisterFilter.build(limit=1, tail=1)
+
+    def test_reversed_range(self):
+        with pytest.raises(ValueError, match="--from"):
+            RegisterFilter.build(start=date(2024, 2, 1), end=date(2024, 1, 1))
+
+    def test_invalid_regex(self):
+        with pytest.raises(ValueError, match="--description-regex"):
+            RegisterFilter.build(description_regex="(")
+
+
+class TestRegisterQuery:
+    """Queries against a real book"""
+
+    def test_full_register_running_balance(self, temp_gnucash_for_close_books):
+        """Every line, with the engine's running balance"""
+        lines = _run(temp_gnucash_for_close_books)
+
+        assert [line.amount for line in lines] == [3000, 3000, 1000, 200, -150, -800, -400]
+        assert [line.balance for line in lines] == [3000, 6000, 7000, 7200, 7050, 6250, 5850]
+        assert lines[0].description == "January base salary"
+        assert lines[0].transfer == "Income:Salary:Base"
+
+    def test_date_range(self, temp_gnucash_for_close_books):
+        """Range bounds are inclusive and the balance carries in from earlier lines"""
+        lines = _run(temp_gnucash_for_close_books, start=date(2024, 3, 15), end=date(2024, 6, 20))
+
+        assert [line.date for line in lines] == [
+            date(2024, 3, 15), date(2024, 4, 30), date(2024, 5, 10), date(2024, 6, 20),
+        ]
+        assert lines[0].balance == Fraction(7000)
+
+    def test_description_and_amount(self, temp_gnucash_for_close_books):
+        """Regex and absolute amount filters combine"""
+        lines = _run(
+            temp_gnucash_for_close_books,
+            description_regex="SALARY|flight", ignore_case=True, max_amount=Fraction(1000),
+        )
+
+        assert [line.description for line in lines] == ["Conference flight"]
+        assert lines[0].amount == Fraction(-800)
+
+    def test_limit_and_tail(self, temp_gnucash_for_close_books):
+        """--limit takes the first matches, --tail the last, both in date order"""
+        first = _run(temp_gnucash_for_close_books, min_amount=Fraction(300), limit=2)
+        last = _run(temp_gnucash_for_close_books, min_amount=Fraction(300), tail=2)
+
+        assert [line.date for line in first] == [date(2024, 1, 31), date(2024, 2, 28)]
+        assert [line.date for line in last] == [date(2024, 6, 20), date(2024, 7, 5)]
+
+    def test_unknown_account(self, temp_gnucash_for_close_books):
+        from repositories.gnucash_repository import GnuCashRepository, SessionMode
+        from use_cases.query_register import QueryRegisterUseCase
+
+        repo = GnuCashRepository(temp_gnucash_for_close_books)
+        repo.open(mode=SessionMode.READ_ONLY)
+        try:
+            with pytest.raises(ValueError, match="Account not found"):
+                QueryRegisterUseCase(repo).execute("Assets:Nope", RegisterFilter())
+        finally:
+            repo.close()
@@ -558,3 +558,55 @@ class TestTransactionMatcherGUID:
 
         finally:
             session.end()
+
+    def test_find_by_guid_index(self, temp_gnucash_with_transactions):
+        """Test GUID lookup through a GuidIndex built from a list and from the book"""
+        from gnucash import Session
+
+        from services.transaction_matcher import GuidIndex, TransactionMatcher
+
+        try:
+            from gnucash import SessionOpenMode
+            session = Session(f'xml://{temp_gnucash_with_transactions}',
+                            SessionOpenMode.SESSION_READ_ONLY)
+        except ImportError:
+            # Fall back to older GnuCash API (< 4.0)
+            session = Session(f'xml://{temp_gnucash_with_transactions}',
+                            ignore_lock=True)
+
+        try:
+            book = session.book
+
+            from gnucash import Query, Transaction
+            query = Query()
+            query.search_for('Trans')
+            query.set_book(book)
+            result = query.run()
+            transactions = [Transaction(instance=tx) for tx in result]
+
+            matcher = TransactionMatcher()
+            fake_guid = "00000000000000000000000000000000"
+
+            list_index = GuidIndex(transactions)
+            assert len(list_index) == len(transactions)
+
+            book_index = GuidIndex.from_book(book)
+            assert len(book_index) == 0
+
+            for index in (list_index, book_index):
+                for tx in transactions:
+                    guid = tx.GetGUID().to_string()
+                    found = matcher.find_by_guid(index, guid)
+                    assert found is not None
+                    assert found.GetGUID().to_string() == guid
+                    assert guid in index
+
+                assert matcher.find_by_guid(index, fake_guid) is None
+                assert fake_guid not in index
+                assert "not-a-guid" not in index
+
+            # Engine lookups are cached after the first hit
+            assert len(book_index) == len(transactions)
+
+        finally:
+            session.end()
@@ -169,6 +169,166 @@ class TestTransactionMatcherBasic:
 
         assert sig_none != sig_set
 
+    def test_amount_key_normalizes_denominators(self):
+        """Test that equal values with different denominators share an amount key"""
+        from services.transaction_matcher import TransactionMatcher
+
+        key1 = TransactionMatcher.make_amount_key([
+            ("Expenses:Groceries", 5000, 100),
+            ("Assets:Bank:Checking", -5000, 100),
+        ])
+        key2 = TransactionMatcher.make_amount_key([
+            ("Assets:Bank:Checking", -50, 1),
+            ("Expenses:Groceries", 50, 1),
+        ])
+
+        assert key1 == key2
+        assert key1 == (("Assets:Bank:Checking", -50, 1), ("Expenses:Groceries", 50, 1))
+
+    def test_amount_key_different_amounts_differ(self):
+        """Test that different amounts produce different amount keys"""
+        from services.transaction_matcher import TransactionMatcher
+
+        key1 = TransactionMatcher.make_amount_key([
+            ("Expenses:Groceries", 5000, 100),
+            ("Assets:Bank:Checking", -5000, 100),
+        ])
+        key2 = TransactionMatcher.make_amount_key([
+            ("Expenses:Groceries", 7500, 100),
+            ("Assets:Bank:Checking", -7500, 100),
+        ])
+
+        assert key1 != key2
+
+    def test_amount_key_is_a_multiset(self):
+        """Test that repeated splits on the same account are all kept"""
+        from services.transaction_matcher import TransactionMatcher
+
+        key1 = TransactionMatcher.make_amount_key([
+            ("Expenses:Groceries", 10, 1),
+            ("Expenses:Groceries", 20, 1),
+            ("Assets:Bank:Checking", -30, 1),
+        ])
+        key2 = TransactionMatcher.make_amount_key([
+            ("Expenses:Groceries", 20, 1),
+            ("Expenses:Groceries", 20, 1),
+            ("Assets:Bank:Checking", -30, 1),
+        ])
+
+        assert key1 != key2
+
+    def test_amount_key_zero_value(self):
+        """Test that zero values normalize regardless of denominator"""
+        from services.transaction_matcher import TransactionMatcher
+
+        key = TransactionMatcher.make_amount_key([("Expenses:Fees", 0, 100)])
+
+        assert key == (("Expenses:Fees", 0, 1),)
+
+
+class TestTransactionDateIndex:
+    """Test date-window matching without GnuCash"""
+
+    def _index(self):
+        from services.transaction_matcher import TransactionDateIndex, TransactionMatcher
+
+        records = [
+            TransactionMatcher.record_from_plaintext(
+                "2024-01-15",
+                [("Liabilities:Visa", "-42.10"), ("Expenses:Groceries", "42.10")],
+                description="Grocery run",
+            ),
+            TransactionMatcher.record_from_plaintext(
+                "2024-01-20",
+                [("Liabilities:Visa", "-18.00"), ("Expenses:Dining", "18.00")],
+                description="Lunch",
+            ),
+        ]
+        return TransactionDateIndex(records)
+
+    def test_candidates_within_window(self):
+        """Test that candidates are limited to the account and date window"""
+        from datetime import date
+
+        index = self._index()
+
+        assert len(index.candidates("Liabilities:Visa", date(2024, 1, 17), 2)) == 1
+        assert len(index.candidates("Liabilities:Visa", date(2024, 1, 17), 3)) == 2
+        assert len(index.candidates("Expenses:Dining", date(2024, 1, 15), 3)) == 0
+        assert index.candidates("Assets:Unknown", date(2024, 1, 15), 30) == []
+
+    def test_match_posted_days_later(self):
+        """Test that the same charge posted two days later matches"""
+        from services.transaction_matcher import TransactionMatcher
+
+        incoming = TransactionMatcher.record_from_plaintext(
+            "2024-01-17",
+            [("Expenses:Groceries", "42.10"), ("Liabilities:Visa", "-42.10")],
+        )
+
+        match = self._index().find_best_match(incoming, window_days=3)
+
+        assert match is not None
+        assert match.existing.description == "Grocery run"
+        assert match.day_offset == 2
+        assert match.confidence == 0.5
+
+    def test_no_match_outside_window(self):
+        """Test that a charge outside the window does not match"""
+        from services.transaction_matcher import TransactionMatcher
+
+        incoming = TransactionMatcher.record_from_plaintext(
+            "2024-01-19",
+            [("Expenses:Groceries", "42.10"), ("Liabilities:Visa", "-42.10")],
+        )
+
+        assert self._index().find_best_match(incoming, window_days=3) is None
+
+    def test_amount_tolerance(self):
+        """Test that amounts must be within tolerance and lower confidence"""
+        from fractions import Fraction
+
+        from services.transaction_matcher import TransactionMatcher
+
+        incoming = TransactionMatcher.record_from_plaintext(
+            "2024-01-15",
+            [("Expenses:Groceries", "42.15"), ("Liabilities:Visa", "-42.15")],
+        )
+        index = self._index()
+
+        assert index.find_best_match(incoming, window_days=1) is None
+
+        match = index.find_best_match(incoming, window_days=1, amount_tolerance=Fraction(1, 10))
+        assert match is not None
+        assert match.amount_difference == Fraction(5, 100)
+        assert match.confidence == 0.75
+
+    def test_same_day_exact_match_has_full_confidence(self):
+        """Test that an exact same-day match scores 1.0"""
+        from services.transaction_matcher import TransactionMatcher
+
+        incoming = TransactionMatcher.record_from_plaintext(
+            "2024-01-20",
+            [("Expenses:Dining", "18"), ("Liabilities:Visa", "-18")],
+        )
+
+        match = self._index().find_best_match(incoming, window_days=3)
+
+        assert match is not None
+        assert match.confidence == 1.0
+
+    def test_doc_link_must_match(self):
+        """Test that doc_link stays strict in date-window matching"""
+        from services.transaction_matcher import TransactionMatcher
+
+        incoming = TransactionMatcher.record_from_plaintext(
+            "2024-01-15",
+            [("Expenses:Groceries", "42.10"), ("Liabilities:Visa", "-42.10")],
+            doc_link="receipts/2024-01-15.pdf",
+        )
+
+        assert self._index().find_best_match(incoming, window_days=3) is None
+
 
 if __name__ == "__main__":
     # Allow running directly for quick tests
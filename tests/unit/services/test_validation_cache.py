@@ -0,0 +1,113 @@
+"""
+Tests for the validation result cache
+
+The cache stores TransactionRow snapshots keyed by GUID and edit stamp, so these
+tests do not need a GnuCash book.
+"""
+
+import os
+from dataclasses import replace
+from datetime import date
+
+import pytest
+
+from services.ledger_snapshot import SplitRow, TransactionRow
+from services.validation_cache import ValidationCache
+
+RULE_KEY = "transactions:1"
+STAMP = "2024-01-01 10:00:00|2024-01-15 10:59:00|2|"
+ISSUE = {
+    'severity': 'WARNING',
+    'code': 'EMPTY_DESCRIPTION',
+    'message': 'Transaction has empty description',
+    'context': {'guid': 'a' * 32},
+}
+
+
+@pytest.fixture
+def row():
+    return TransactionRow(
+        guid="a" * 32,
+        date=date(2024, 1, 15),
+        description="",
+        currency="CAD",
+        doc_link=None,
+        splits=(
+            SplitRow("Assets:Bank:Checking", -5000, 100),
+            SplitRow("Expenses:Groceries", 5000, 100),
+        ),
+    )
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "book.gnucash.validation-cache.json")
+
+
+class TestValidationCache:
+    """Test ValidationCache"""
+
+    def test_miss_then_hit(self, row, cache_path):
+        """A stored snapshot and result are returned for the same stamp"""
+        cache = ValidationCache(cache_path)
+
+        assert cache.get(row.guid, STAMP) is None
+        cache.put(row, STAMP, {RULE_KEY: [ISSUE]})
+
+        assert cache.get(row.guid, STAMP) == (row, {RULE_KEY: [ISSUE]})
+        assert cache.get("b" * 32, STAMP) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_edited_transaction_misses(self, row, cache_path):
+        """A changed edit stamp invalidates the cached entry"""
+        cache = ValidationCache(cache_path)
+        cache.put(row, STAMP, {RULE_KEY: [ISSUE]})
+
+        assert cache.get(row.guid, "2024-01-01 10:00:00|2024-01-16 10:59:00|2|") is None
+
+    def test_save_and_load(self, row, cache_path):
+        """Snapshots and results survive a save/load round trip"""
+        undated = replace(row, guid="b" * 32, date=None, doc_link="receipts/1.pdf", splits=(
+            SplitRow(None, 1, 3),
+        ))
+        cache = ValidationCache(cache_path)
+        cache.put(row, STAMP, {RULE_KEY: [ISSUE], "transactions:0": []})
+        cache.put(undated, STAMP, {RULE_KEY: []})
+        cache.save()
+
+        loaded = ValidationCache.load(cache_path)
+        assert len(loaded) == 2
+        assert loaded.get(row.guid, STAMP) == (row, {RULE_KEY: [ISSUE], "transactions:0": []})
+        cached_row, _ = loaded.get(undated.guid, STAMP)
+        assert cached_row == undated
+        assert cached_row.signature == undated.signature
+
+    def test_save_drops_deleted_transactions(self, row, cache_path):
+        """Transactions not seen during a run are pruned on save"""
+        cache = ValidationCache(cache_path)
+        cache.put(row, STAMP, {RULE_KEY: []})
+        cache.put(replace(row, guid="b" * 32), STAMP, {RULE_KEY: []})
+        cache.save()
+
+        cache = ValidationCache.load(cache_path)
+        cache.get(row.guid, STAMP)
+        cache.save()
+
+        assert len(ValidationCache.load(cache_path)) == 1
+
+    def test_load_missing_or_corrupt_file(self, cache_path):
+        """An unusable file gives an empty cache"""
+        assert len(ValidationCache.load(cache_path)) == 0
+
+        with open(cache_path, 'w') as f:
+            f.write("{not json")
+        assert len(ValidationCache.load(cache_path)) == 0
+
+        with open(cache_path, 'w') as f:
+            f.write('{"version": 999, "transactions": {"x": {}}}')
+        assert len(ValidationCache.load(cache_path)) == 0
+
+    def test_default_path(self):
+        """Sidecar sits next to the book"""
+        path = ValidationCache.default_path(os.path.join("books", "mybook.gnucash"))
+        assert path == os.path.join("books", "mybook.gnucash.validation-cache.json")
@@ -213,6 +213,107 @@ class TestExecuteEdgeCases:
             )
 
 
+# ---------------------------------------------------------------------------
+# TestExecuteMany
+# ---------------------------------------------------------------------------
+
+
+def _add_2025_salary(repo):
+    """Add -3000 CAD salary on 2025-03-01 (checking +3000)"""
+    from gnucash import GncNumeric, Split, Transaction
+
+    from infrastructure.gnucash.utils import find_account
+
+    book = repo.book
+    root = repo.get_root_account()
+    cad = book.get_table().lookup("CURRENCY", "CAD")
+
+    tx = Transaction(book)
+    tx.BeginEdit()
+    tx.SetCurrency(cad)
+    tx.SetDate(1, 3, 2025)
+    tx.SetDescription("2025 March salary")
+    s1 = Split(book)
+    s1.SetParent(tx)
+    s1.SetAccount(find_account(root, "Income:Salary:Base"))
+    s1.SetValue(GncNumeric(-300000, 100))
+    s2 = Split(book)
+    s2.SetParent(tx)
+    s2.SetAccount(find_account(root, "Assets:Bank:Checking"))
+    s2.SetValue(GncNumeric(300000, 100))
+    tx.CommitEdit()
+
+
+class TestExecuteMany:
+    """CloseBooksUseCase.execute_many — several periods from one ledger"""
+
+    def test_closes_each_year_with_its_own_activity(self, temp_gnucash_for_close_books):
+        """2024 closes 2024 income, 2025 closes only the 2025 salary"""
+        from infrastructure.gnucash.utils import find_account
+        from repositories.gnucash_repository import GnuCashRepository
+        from services.book_closer import BookCloser
+        from use_cases.close_books import CloseBooksUseCase
+
+        with GnuCashRepository(temp_gnucash_for_close_books) as repo:
+            _add_2025_salary(repo)
+            use_case = CloseBooksUseCase(repo)
+
+            results = use_case.execute_many([date(2025, 12, 31), CLOSING_DATE])
+
+            assert [r.closing_date for r in results] == [CLOSING_DATE, date(2025, 12, 31)]
+            assert sorted(results[0].currencies_closed) == ["CAD", "USD"]
+            assert results[1].currencies_closed == ["CAD"]
+            assert use_case.check_status(CLOSING_DATE)
+            assert use_case.check_status(date(2025, 12, 31))
+
+            root = repo.get_root_account()
+            cad_eq = find_account(root, "Equity:Retained Earnings:CAD")
+            closer = BookCloser()
+            assert closer.get_balance_as_of_date(cad_eq, CLOSING_DATE) == -CAD_NET
+            assert closer.get_balance_as_of_date(cad_eq, date(2025, 12, 31)) == -CAD_NET - 3000
+
+    def test_skips_already_closed_year(self, temp_gnucash_for_close_books):
+        """A closed year is reported as skipped instead of raising"""
+        from repositories.gnucash_repository import GnuCashRepository
+        from use_cases.close_books import CloseBooksUseCase
+
+        with GnuCashRepository(temp_gnucash_for_close_books) as repo:
+            use_case = CloseBooksUseCase(repo)
+            use_case.execute(CLOSING_DATE)
+            _add_2025_salary(repo)
+
+            results = use_case.execute_many([CLOSING_DATE, date(2025, 12, 31)])
+
+            assert results[0].already_closed
+            assert "already closed" in results[0].get_summary()
+            assert results[1].currencies_closed == ["CAD"]
+            assert use_case.check_status_many([CLOSING_DATE, date(2025, 12, 31)]) == [
+                (CLOSING_DATE, True),
+                (date(2025, 12, 31), True),
+            ]
+
+    def test_closed_year_after_unclosed_year(self, temp_gnucash_for_close_books):
+        """A year closed before the run is re-checked after closing an earlier year"""
+        from repositories.gnucash_repository import GnuCashRepository
+        from use_cases.close_books import CloseBooksUseCase
+
+        with GnuCashRepository(temp_gnucash_for_close_books) as repo:
+            _add_2025_salary(repo)
+            use_case = CloseBooksUseCase(repo)
+            use_case.execute(date(2025, 12, 31))  # 2024 left open, closed cumulatively in 2025
+
+            results = use_case.execute_many([CLOSING_DATE, date(2025, 12, 31)])
+
+            # Same outcome as closing 2024 and then 2025 in two separate runs
+            assert sorted(results[0].currencies_closed) == ["CAD", "USD"]
+            assert not results[1].already_closed
+            assert sorted(results[1].currencies_closed) == ["CAD", "USD"]
+            assert use_case.check_status_many([CLOSING_DATE, date(2025, 12, 31)]) == [
+                (CLOSING_DATE, True),
+                (date(2025, 12, 31), True),
+            ]
+
+
 # ---------------------------------------------------------------------------
 # TestGetSummary
 # ---------------------------------------------------------------------------
@@ -0,0 +1,26 @@
+"""
+Tests for invoice output file names in PrintInvoicesUseCase's module
+"""
+
+
+class TestInvoiceFileNames:
+    """invoice_file_name / invoice_file_names"""
+
+    def test_unsafe_characters_replaced(self):
+        from use_cases.print_invoices import invoice_file_name
+
+        assert invoice_file_name("INV/2026 001") == "INV_2026_001.pdf"
+        assert invoice_file_name("INV-2026-001", "html") == "INV-2026-001.html"
+
+    def test_colliding_ids_get_distinct_names(self):
+        """INV/1 and INV_1 map to the same name; the later one gets a suffix"""
+        from use_cases.print_invoices import invoice_file_names
+
+        assert invoice_file_names(["INV/1", "INV_1", "INV:1", "INV-2"]) == [
+            "INV_1.pdf", "INV_1-2.pdf", "INV_1-3.pdf", "INV-2.pdf",
+        ]
+
+    def test_names_differing_only_in_case_collide(self):
+        from use_cases.print_invoices import invoice_file_names
+
+        assert invoice_file_names(["inv-1", "INV-1"], "html") == ["inv-1.html", "INV-1-2.html"]
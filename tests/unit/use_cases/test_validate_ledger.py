@@ -137,3 +137,134 @@ class TestValidateLedger:
             )
 
             assert result.is_valid()
+
+    def test_validate_with_rule_selection(self, temp_gnucash_with_transactions):
+        """Test enabling and disabling rules by name"""
+        from repositories.gnucash_repository import GnuCashRepository
+        from use_cases.validate_ledger import ValidateLedgerUseCase
+
+        with GnuCashRepository(temp_gnucash_with_transactions) as repo:
+            use_case = ValidateLedgerUseCase(repo)
+
+            # Fixture transactions are dated 2024, so none are in the future
+            result = use_case.execute(enabled_rules=['future-dates'])
+            assert result.is_valid()
+            assert len(result.get_all_issues()) == 0
+
+            result = use_case.execute(disabled_rules=['duplicates', 'hierarchy'])
+            assert result.is_valid()
+
+            with pytest.raises(ValueError, match="Unknown validation rule"):
+                use_case.execute(enabled_rules=['no-such-rule'])
+
+    def test_validate_with_jobs(self, temp_gnucash_with_transactions):
+        """Test that parallel validation reports the same issues as a serial run"""
+        from gnucash import GncNumeric, Split, Transaction
+
+        from repositories.gnucash_repository import GnuCashRepository
+        from use_cases.validate_ledger import ValidateLedgerUseCase
+
+        with GnuCashRepository(temp_gnucash_with_transactions) as repo:
+            # Add a duplicate so the cross-partition reduce has something to count
+            cad = repo.book.get_table().lookup('CURRENCY', 'CAD')
+            dup_tx = Transaction(repo.book)
+            dup_tx.BeginEdit()
+            dup_tx.SetCurrency(cad)
+            dup_tx.SetDate(15, 1, 2024)
+            dup_tx.SetDescription("Duplicate")
+
+            split1 = Split(repo.book)
+            split1.SetParent(dup_tx)
+            split1.SetAccount(repo.get_account("Expenses:Groceries"))
+            split1.SetValue(GncNumeric(5000, 100))
+
+            split2 = Split(repo.book)
+            split2.SetParent(dup_tx)
+            split2.SetAccount(repo.get_account("Assets:Bank:Checking"))
+            split2.SetValue(GncNumeric(-5000, 100))
+            dup_tx.CommitEdit()
+
+            use_case = ValidateLedgerUseCase(repo)
+            serial = use_case.execute()
+            parallel = use_case.execute(jobs=2)
+
+            def codes(result):
+                return sorted(issue.code for issue in result.get_all_issues())
+
+            assert codes(parallel) == codes(serial)
+            assert any(w.code == "DUPLICATES_DETECTED" for w in parallel.warnings)
+
+    def test_validate_incremental(self, temp_gnucash_with_transactions, tmp_path):
+        """Test that a second cached run reuses every per-transaction result"""
+        from repositories.gnucash_repository import GnuCashRepository
+        from services.validation_cache import ValidationCache
+        from use_cases.validate_ledger import ValidateLedgerUseCase
+
+        cache_path = str(tmp_path / "validation-cache.json")
+
+        with GnuCashRepository(temp_gnucash_with_transactions) as repo:
+            use_case = ValidateLedgerUseCase(repo)
+            transaction_count = len(repo.get_all_transactions())
+
+            first_cache = ValidationCache.load(cache_path)
+            first = use_case.execute(cache=first_cache)
+            assert first_cache.misses == transaction_count
+            assert os.path.exists(cache_path)
+
+            second_cache = ValidationCache.load(cache_path)
+            second = use_case.execute(cache=second_cache)
+            assert second_cache.hits == transaction_count
+            assert second_cache.misses == 0
+
+            assert second.is_valid() == first.is_valid()
+            assert len(second.get_all_issues()) == len(first.get_all_issues())
+
+    def test_validate_incremental_rechecks_edited(self, temp_gnucash_with_transactions, tmp_path):
+        """Test that only a transaction with a new edit stamp is snapshotted again"""
+        from repositories.gnucash_repository import GnuCashRepository
+        from services.validation_cache import ValidationCache
+        from use_cases.validate_ledger import ValidateLedgerUseCase
+
+        cache_path = str(tmp_path / "validation-cache.json")
+
+        with GnuCashRepository(temp_gnucash_with_transactions) as repo:
+            use_case = ValidateLedgerUseCase(repo)
+            use_case.execute(cache=ValidationCache.load(cache_path))
+
+            tx = repo.get_all_transactions()[0]
+            tx.BeginEdit()
+            tx.SetDescription("")
+            tx.CommitEdit()
+
+            cache = ValidationCache.load(cache_path)
+            result = use_case.execute(cache=cache)
+            assert cache.misses == 1
+            assert any(w.code == "EMPTY_DESCRIPTION" for w in result.warnings)
+
+    def test_validate_incremental_split_value_edit(self, temp_gnucash_with_transactions, tmp_path):
+        """Changing any split value invalidates the cached result"""
+        from gnucash import GncNumeric
+
+        from repositories.gnucash_repository import GnuCashRepository
+        from services.validation_cache import ValidationCache
+        from use_cases.validate_ledger import ValidateLedgerUseCase
+
+        cache_path = str(tmp_path / "validation-cache.json")
+
+        with GnuCashRepository(temp_gnucash_with_transactions) as repo:
+            use_case = ValidateLedgerUseCase(repo)
+            use_case.execute(cache=ValidationCache.load(cache_path))
+
+            # Same dates, description and splits; only the amounts change
+            tx = repo.get_all_transactions()[0]
+            tx.BeginEdit()
+            for split in tx.GetSplitList():
+                value = split.GetValue()
+                doubled = GncNumeric(value.num() * 2, value.denom())
+                split.SetValue(doubled)
+                split.SetAmount(doubled)
+            tx.CommitEdit()
+
+            cache = ValidationCache.load(cache_path)
+            use_case.execute(cache=cache)
+            assert cache.misses == 1
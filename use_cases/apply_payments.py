@@ -0,0 +1,146 @@
+"""
+Use case for applying a list of customer payments to open invoices.
+
+Open invoices are read with one query and indexed by payment_matcher; each
+payment is then matched in O(log n) and applied with Invoice.ApplyPayment, so
+the GnuCash payment transaction and lot links are the same as when paying in
+the GUI. The caller saves the book once after all payments are applied.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from fractions import Fraction
+from typing import Iterable, List, Tuple
+
+import gnucash.gnucash_business as gb
+import gnucash.gnucash_core_c as gc
+from gnucash import GncNumeric, Query, Transaction
+
+from repositories.gnucash_repository import GnuCashRepository
+from services.payment_matcher import IncomingPayment, OpenInvoice, OpenInvoiceIndex
+
+
+@dataclass
+class ApplyPaymentsResult:
+    """Payments applied and payments left unmatched"""
+
+    applied: List[Tuple[IncomingPayment, OpenInvoice]] = field(default_factory=list)
+    unmatched: List[Tuple[IncomingPayment, str]] = field(default_factory=list)
+
+    def get_summary(self, dry_run: bool = False) -> str:
+        """Format the result for display."""
+        verb = "Would apply" if dry_run else "Applied"
+        lines = [f"{verb} {len(self.applied)} payment(s)"]
+        for payment, invoice in self.applied:
+            lines.append(f"  {payment.describe()} -> invoice {invoice.invoice_id}")
+        if self.unmatched:
+            lines.append(f"Unmatched: {len(self.unmatched)} payment(s)")
+            for payment, reason in self.unmatched:
+                lines.append(f"  {payment.describe()}: {reason}")
+        return "\n".join(lines)
+
+
+def _to_fraction(numeric) -> Fraction:
+    return Fraction(numeric.num(), numeric.denom())
+
+
+def _to_gnc_numeric(amount: Fraction) -> GncNumeric:
+    return GncNumeric(amount.numerator, amount.denominator)
+
+
+class ApplyPaymentsUseCase:
+    """Use case for matching payments to open invoices and applying them"""
+
+    def __init__(self, repository: GnuCashRepository):
+        """
+        Initialize use case.
+
+        Args:
+            repository: GnuCash repository instance, opened for writing
+        """
+        self.repository = repository
+
+    def open_invoices(self) -> List[OpenInvoice]:
+        """
+        Read every posted customer invoice with a balance left to pay.
+
+        Returns:
+            Open invoices
+        """
+        query = Query()
+        query.search_for('gncInvoice')
+        query.set_book(self.repository.book)
+        invoices = [gb.Invoice(instance=r) for r in query.run()]
+        query.destroy()
+
+        open_invoices = []
+        for inv in invoices:
+            if not inv.IsPosted():
+                continue
+            try:
+                customer = inv.GetOwner().GetCustomer()
+            except Exception:
+                continue
+            lot = inv.GetPostedLot()
+            if customer is None or lot is None:
+                continue
+            remaining = _to_fraction(lot.get_balance())
+            if remaining <= 0:
+                continue
+            open_invoices.append(OpenInvoice(
+                customer_id=customer.GetID(),
+                invoice_id=inv.GetID(),
+                due=inv.GetDateDue().date(),
+                remaining=remaining,
+                billing_id=inv.GetBillingID() or "",
+                invoice=inv,
+            ))
+        return open_invoices
+
+    def execute(self, payments: Iterable[IncomingPayment], dry_run: bool = False) -> ApplyPaymentsResult:
+        """
+        Match payments to open invoices and apply them.
+
+        Payments are matched in order, so an earlier payment takes an invoice
+        before a later one with the same amount.
+
+        Args:
+            payments: Payments to apply
+            dry_run: Only match, without creating payment transactions
+
+        Returns:
+            ApplyPaymentsResult
+        """
+        book = self.repository.book
+        index = OpenInvoiceIndex(self.open_invoices())
+        accounts = {}
+        result = ApplyPaymentsResult()
+
+        for payment in payments:
+            invoice, reason = index.find(payment)
+            if invoice is None:
+                result.unmatched.append((payment, reason))
+                continue
+
+            if payment.bank_account not in accounts:
+                accounts[payment.bank_account] = self.repository.get_account(payment.bank_account)
+            bank_account = accounts[payment.bank_account]
+            if bank_account is None:
+                result.unmatched.append((payment, f"account '{payment.bank_account}' not found"))
+                continue
+
+            if not dry_run:
+                txn = Transaction(instance=gc.xaccMallocTransaction(book.instance))
+                invoice.invoice.ApplyPayment(
+                    txn,
+                    bank_account,
+                    _to_gnc_numeric(payment.amount),
+                    GncNumeric(1, 1),
+                    datetime(payment.date.year, payment.date.month, payment.date.day),
+                    payment.memo,
+                    payment.num or None,
+                )
+            index.settle(invoice, payment.amount)
+            result.applied.append((payment, invoice))
+
+        return result
@@ -10,11 +10,13 @@ Orchestrates BookCloser service and GnuCashRepository to:
 
 from dataclasses import dataclass, field
 from datetime import date
-from typing import List, Set
+from typing import List, Optional, Set, Tuple
 
 from gnucash import Transaction
 
 from repositories.gnucash_repository import GnuCashRepository
+from services.balance_checkpoint import BalanceCheckpoints
+from services.balance_provider import BalanceProvider
 from services.book_closer import BookCloser
 
 
@@ -36,8 +38,12 @@ class CloseBooksResult:
     transactions_created: List[Transaction] = field(default_factory=list)
     equity_accounts_created: List[str] = field(default_factory=list)
     dry_run: bool = False
+    already_closed: bool = False
 
     def get_summary(self) -> str:
+        if self.already_closed:
+            return f"Books already closed as of {self.closing_date} (skipped; use --force to re-close)"
+
         lines = []
         if self.dry_run:
             lines.append(f"DRY RUN - Books would be closed as of {self.closing_date}")
@@ -60,19 +66,61 @@ class CloseBooksResult:
 class CloseBooksUseCase:
     """Use case for closing books at fiscal year end"""
 
-    def __init__(self, repository: GnuCashRepository):
+    def __init__(
+        self,
+        repository: GnuCashRepository,
+        balance_source: str = "python",
+        checkpoints: Optional[BalanceCheckpoints] = None,
+    ):
+        """
+        Initialize use case.
+
+        Args:
+            repository: GnuCash repository instance
+            balance_source: Where balances come from, one of
+                services.balance_provider.BALANCE_SOURCES ("python", "engine", "verify")
+            checkpoints: Balance checkpoints to start from, and to update with
+                record_checkpoints (optional)
+        """
         self.repository = repository
         self.book_closer = BookCloser()
+        self.balance_source = balance_source
+        self.checkpoints = checkpoints
+
+    def _balance_provider(self, root, before: date) -> BalanceProvider:
+        """Build the balance provider for queries on or after `before`."""
+        return self.book_closer.build_balance_provider(
+            root, self.balance_source, self.checkpoints, before
+        )
 
     def check_status(self, closing_date: date) -> bool:
         """
         Check if books are closed as of closing_date without making changes.
 
+        The check is on balances, not on closing transactions, so it reads the
+        history the balance source needs (none before a checkpoint, and none in
+        Python with the "engine" source).
+
         Returns:
             True if all Income/Expense accounts have zero balance as of closing_date
         """
         root = self.repository.get_root_account()
-        return self.book_closer.is_closed(root, closing_date)
+        provider = self._balance_provider(root, closing_date)
+        return self.book_closer.is_closed(root, closing_date, provider)
+
+    def check_status_many(self, closing_dates: List[date]) -> List[Tuple[date, bool]]:
+        """
+        Check closing status for several dates, reading history once.
+
+        Returns:
+            (closing_date, is_closed) pairs in date order
+        """
+        root = self.repository.get_root_account()
+        ledger = self._balance_provider(root, min(closing_dates))
+        return [
+            (closing_date, self.book_closer.is_closed(root, closing_date, ledger))
+            for closing_date in sorted(set(closing_dates))
+        ]
 
     def execute(
         self,
@@ -103,8 +151,11 @@ class CloseBooksUseCase:
         """
         root = self.repository.get_root_account()
 
+        # Read Income/Expense history once; every phase below queries this ledger
+        ledger = self._balance_provider(root, closing_date)
+
         # Check if already closed
-        already_closed = self.book_closer.is_closed(root, closing_date)
+        already_closed = self.book_closer.is_closed(root, closing_date, ledger)
 
         if already_closed and not force:
             raise AlreadyClosedError(
@@ -112,22 +163,131 @@ class CloseBooksUseCase:
                 "Use --force to delete existing closing entries and re-close."
             )
 
-        # For --force: identify existing closing transactions to exclude/delete
         exclude_guids: Set[str] = set()
-        if already_closed and force:
+        return self._close_period(
+            root, ledger, closing_date, equity_template, already_closed and force,
+            dry_run, exclude_guids
+        )
+
+    def execute_many(
+        self,
+        closing_dates: List[date],
+        equity_template: str = "Equity:Retained Earnings",
+        force: bool = False,
+        dry_run: bool = False,
+    ) -> List[CloseBooksResult]:
+        """
+        Close books for several periods in order, reading history once.
+
+        Each period closes the activity after the previous closing date, as if
+        the periods had been closed one at a time in date order. Periods that are
+        already closed are skipped (result.already_closed) unless force is set.
+        The caller saves once after all periods.
+
+        Args:
+            closing_dates: Closing dates (sorted and de-duplicated here)
+            equity_template: Base path for retained earnings accounts
+            force: If True, delete existing closing transactions and re-close
+            dry_run: If True, preview what would be closed without making changes
+
+        Returns:
+            One CloseBooksResult per closing date, in date order
+        """
+        root = self.repository.get_root_account()
+        ledger = self._balance_provider(root, min(closing_dates))
+
+        results = []
+        exclude_guids: Set[str] = set()
+        previous: Optional[date] = None
+
+        for closing_date in sorted(set(closing_dates)):
+            # The previous period is closed once handled above, so check only the
+            # activity after it, as a run closing one period at a time would
+            already_closed = self.book_closer.is_closed(
+                root, closing_date, ledger, exclude_guids, since=previous
+            )
+
+            if already_closed and not force:
+                results.append(CloseBooksResult(
+                    closing_date=closing_date, dry_run=dry_run, already_closed=True
+                ))
+            else:
+                result = self._close_period(
+                    root, ledger, closing_date, equity_template, already_closed,
+                    dry_run, exclude_guids, since=previous
+                )
+                # Keep later periods on the same pre-run view of the book whether
+                # or not the provider sees the transactions just created
+                exclude_guids.update(tx.GetGUID().to_string() for tx in result.transactions_created)
+                results.append(result)
+
+            previous = closing_date
+
+        return results
+
+    def record_checkpoints(self, as_of: date) -> int:
+        """
+        Record balance checkpoints as of a closing date.
+
+        Call after closing; the caller saves the checkpoint store.
+
+        Args:
+            as_of: Checkpoint date (normally the last closing date)
+
+        Returns:
+            Number of accounts checkpointed
+
+        Raises:
+            ValueError: If the use case has no checkpoint store
+        """
+        if self.checkpoints is None:
+            raise ValueError("No checkpoint store configured")
+        root = self.repository.get_root_account()
+        return self.book_closer.record_checkpoints(root, self.checkpoints, as_of)
+
+    def _close_period(
+        self,
+        root,
+        ledger: BalanceProvider,
+        closing_date: date,
+        equity_template: str,
+        reclose: bool,
+        dry_run: bool,
+        exclude_guids: Set[str],
+        since: Optional[date] = None,
+    ) -> CloseBooksResult:
+        """
+        Create the closing transactions for one closing date.
+
+        Args:
+            root: Root account
+            ledger: Provider from BookCloser.build_balance_provider, built before any changes
+            closing_date: Date to close books
+            equity_template: Base path for retained earnings accounts
+            reclose: Delete the existing closing transactions on closing_date first
+            dry_run: If True, preview what would be closed without making changes
+            exclude_guids: Transaction GUIDs the ledger must ignore; closing
+                transactions deleted here are added to it
+            since: Previous closing date in this run (only later activity is closed)
+
+        Returns:
+            CloseBooksResult for this date
+        """
+        # For --force: identify existing closing transactions to exclude/delete
+        if reclose:
             closing_txns = self.book_closer.find_closing_transactions(root, closing_date)
-            exclude_guids = {tx.GetGUID().to_string() for tx in closing_txns}
+            exclude_guids.update(tx.GetGUID().to_string() for tx in closing_txns)
 
             if not dry_run:
                 # Delete existing closing transactions before re-closing
                 for tx in closing_txns:
                     self.repository.delete_transaction(tx)
-                exclude_guids = set()  # No need to exclude after deletion
 
-        # Compute which accounts need closing (excluding prior closing transactions
-        # when doing a force dry-run, so we see what would happen post-deletion)
+        # Compute which accounts need closing, excluding prior closing transactions
+        # (the ledger was built before they were deleted, or, for a force dry-run,
+        # shows what would happen post-deletion)
         accounts_by_currency = self.book_closer.group_accounts_by_currency(
-            root, closing_date, exclude_guids=exclude_guids if dry_run else None
+            root, closing_date, exclude_guids=exclude_guids, ledger=ledger, since=since
         )
 
         result = CloseBooksResult(closing_date=closing_date, dry_run=dry_run)
@@ -6,15 +6,21 @@ All tax-table and invoice-entry reading uses ctypes directly because the
 GnuCash Python SWIG bindings have const-type mismatches for these calls
 (confirmed on GnuCash 4.4 – 5.10 across Debian 11/12/13, Ubuntu 20/22).
 See infrastructure/gnucash/engine.py for the platform notes.
+
+Invoices and bills come from one gncInvoice query, partitioned by owner type.
+Account full names are cached by account pointer, since the same income,
+receivable and tax accounts appear on nearly every entry. Each object is
+formatted and written on its own (see write()), so the export never holds
+the whole business-objects section in memory.
 """
 import ctypes
+from typing import Dict, Iterator, List, TextIO, Tuple
 
 import gnucash.gnucash_business as gb
 import gnucash.gnucash_core_c as gc
 from gnucash import Book, Query, Split
 
 from infrastructure.gnucash.engine import load_gnc_engine
-from infrastructure.gnucash.utils import get_account_full_name
 
 
 def _fmt_rate(rate: float) -> str:
@@ -34,53 +40,77 @@ class ExportBusinessObjectsUseCase:
     def __init__(self, book: Book):
         self.book = book
         self._lib = load_gnc_engine()
+        self._account_names: Dict[int, str] = {}
 
     def _account_full_name(self, acct_ptr: int) -> str:
         """
         Build colon-separated account full name via ctypes (avoids SWIG const-type bug).
-        Walks the parent chain until the root (parent with no parent).
+
+        Names are cached by pointer, and a parent's cached name is reused for
+        its children, so each account's name is read from the engine once.
+        The root account (the one with no parent) is not part of the name.
         """
+        name = self._account_names.get(acct_ptr)
+        if name is not None:
+            return name
+
         lib = self._lib
-        parts = []
-        ptr = acct_ptr
-        while ptr:
-            name_b = lib.xaccAccountGetName(ptr)
-            if name_b:
-                parts.append(name_b.decode('utf-8'))
-            parent = lib.gnc_account_get_parent(ptr)
-            if not parent:
-                break
-            # Stop before root account (root's parent is None)
-            grandparent = lib.gnc_account_get_parent(parent)
-            if not grandparent:
-                break
-            ptr = parent
-        parts.reverse()
-        return ':'.join(parts)
+        name_b = lib.xaccAccountGetName(acct_ptr)
+        name = name_b.decode('utf-8') if name_b else ''
+        parent = lib.gnc_account_get_parent(acct_ptr)
+        # Stop before root account (root's parent is None)
+        if parent and lib.gnc_account_get_parent(parent):
+            parent_name = self._account_full_name(parent)
+            name = f'{parent_name}:{name}' if name else parent_name
+
+        self._account_names[acct_ptr] = name
+        return name
+
+    def _account_name(self, account) -> str:
+        """Full name of a SWIG Account object, from the pointer cache."""
+        return self._account_full_name(int(account.instance))
 
     def execute(self) -> str:
         """Return the complete business-objects plaintext block."""
-        parts = []
-        customers = self._export_customers()
-        vendors   = self._export_vendors()
-        tables    = self._export_tax_tables()
-        invoices  = self._export_invoices()
-        bills     = self._export_bills()
-        for section in (customers, vendors, tables, invoices, bills):
-            if section:
-                parts.append(section)
-        return '\n\n'.join(parts)
+        return '\n\n'.join(self.iter_blocks())
+
+    def write(self, f: TextIO, lead: str = '') -> int:
+        """
+        Write the business-objects block to a file, one object at a time.
+
+        Args:
+            f: Text file to write to
+            lead: Text written before the first object (nothing is written
+                when there are no business objects)
+
+        Returns:
+            Number of objects written
+        """
+        count = 0
+        for block in self.iter_blocks():
+            f.write(lead if count == 0 else '\n\n')
+            f.write(block)
+            count += 1
+        return count
+
+    def iter_blocks(self) -> Iterator[str]:
+        """Yield the plaintext block of each object: customers, vendors, tax tables, invoices, bills."""
+        yield from self._customer_blocks()
+        yield from self._vendor_blocks()
+        yield from self._tax_table_blocks()
+        invoices, bills = self._posted_invoices_by_owner()
+        yield from self._invoice_blocks(invoices)
+        yield from self._bill_blocks(bills)
 
     # ── Customers ────────────────────────────────────────────────────────────
 
-    def _export_customers(self) -> str:
+    def _customer_blocks(self) -> Iterator[str]:
         q = Query()
         q.search_for('gncCustomer')
         q.set_book(self.book)
         customers = [gb.Customer(instance=r) for r in q.run()]
         q.destroy()
 
-        lines_list = []
         for cust in customers:
             addr  = cust.GetAddr()
             lines = [
@@ -98,31 +128,28 @@ class ExportBusinessObjectsUseCase:
             ]:
                 if val:
                     lines.append(f'  {field}: "{val}"')
-            lines_list.append('\n'.join(lines))
-        return '\n\n'.join(lines_list)
+            yield '\n'.join(lines)
 
     # ── Vendors ──────────────────────────────────────────────────────────────
 
-    def _export_vendors(self) -> str:
+    def _vendor_blocks(self) -> Iterator[str]:
         q = Query()
         q.search_for('gncVendor')
         q.set_book(self.book)
         vendors = [gb.Vendor(instance=r) for r in q.run()]
         q.destroy()
 
-        lines_list = []
         for v in vendors:
             lines = [
                 f'vendor "{v.GetID()}"',
                 f'  name: "{v.GetName()}"',
                 f'  currency: {v.GetCurrency().get_mnemonic()}',
             ]
-            lines_list.append('\n'.join(lines))
-        return '\n\n'.join(lines_list)
+            yield '\n'.join(lines)
 
     # ── Tax tables ───────────────────────────────────────────────────────────
 
-    def _export_tax_tables(self) -> str:
+    def _tax_table_blocks(self) -> Iterator[str]:
         """
         List all tax tables via ctypes gncTaxTableGetTables (GList* of GncTaxTable*).
         book.get_taxtables() does not exist in the Python bindings.
@@ -132,7 +159,6 @@ class ExportBusinessObjectsUseCase:
         # gncTaxTableGetTables returns a GList* of GncTaxTable* pointers
         glist_ptr = lib.gncTaxTableGetTables(int(self.book.instance))
 
-        tables = []
         while glist_ptr:
             buf    = (ctypes.c_void_p * 3).from_address(glist_ptr)
             tt_ptr = buf[0]
@@ -167,33 +193,47 @@ class ExportBusinessObjectsUseCase:
                 lines.append(f'    rate: {_fmt_rate(rate)}')
                 lines.append('    type: PERCENT')
 
-            tables.append('\n'.join(lines))
-        return '\n\n'.join(tables)
+            yield '\n'.join(lines)
 
-    # ── Invoices ─────────────────────────────────────────────────────────────
+    # ── Invoices and bills ───────────────────────────────────────────────────
 
-    def _export_invoices(self) -> str:
-        lib = self._lib
+    def _posted_invoices_by_owner(self) -> Tuple[List[Tuple[object, object]], List[Tuple[object, object]]]:
+        """
+        Run one gncInvoice query and split posted invoices by owner.
 
+        Bills are gncInvoice objects whose owner is a Vendor; there is no
+        separate 'gncBill' QOF type.
+
+        Returns:
+            Tuple of ((invoice, customer) list, (bill, vendor) list)
+        """
         q = Query()
         q.search_for('gncInvoice')
         q.set_book(self.book)
         all_invoices = [gb.Invoice(instance=r) for r in q.run()]
         q.destroy()
 
-        # Only export customer invoices (owner is Customer, not Vendor)
         invoices = []
+        bills = []
         for inv in all_invoices:
             if not inv.IsPosted():
                 continue
             try:
-                cust = inv.GetOwner().GetCustomer()
+                owner = inv.GetOwner()
+                cust = owner.GetCustomer()
                 if cust is not None:
                     invoices.append((inv, cust))
+                    continue
+                vendor = owner.GetVendor()
+                if vendor is not None:
+                    bills.append((inv, vendor))
             except Exception:
                 pass
+        return invoices, bills
+
+    def _invoice_blocks(self, invoices) -> Iterator[str]:
+        lib = self._lib
 
-        invoice_strings = []
         for inv, cust in invoices:
             lines = [
                 f'invoice "{inv.GetID()}"',
@@ -212,7 +252,7 @@ class ExportBusinessObjectsUseCase:
             # posted block
             posted_txn = inv.GetPostedTxn()
             if posted_txn:
-                ar_name = get_account_full_name(inv.GetPostedAcc())
+                ar_name = self._account_name(inv.GetPostedAcc())
                 lines.append('  posted:')
                 lines.append(f'    date: {inv.GetDatePosted().strftime("%Y-%m-%d")}')
                 lines.append(f'    due: {inv.GetDateDue().strftime("%Y-%m-%d")}')
@@ -221,20 +261,25 @@ class ExportBusinessObjectsUseCase:
                 lines.append('    accumulate: true')
 
             # payment blocks — from lot splits, excluding the posting transaction
-            lot = inv.GetPostedLot()
-            if lot:
-                for raw_split in lot.get_split_list():
-                    s   = Split(instance=raw_split)
-                    txn = s.GetParent()
-                    if txn is None:
-                        continue
-                    # Skip the posting transaction itself
-                    if gc.gncInvoiceGetInvoiceFromTxn(txn.instance) is not None:
-                        continue
-                    lines += self._format_payment(txn)
-
-            invoice_strings.append('\n'.join(lines))
-        return '\n\n'.join(invoice_strings)
+            lines += self._format_payments(inv)
+
+            yield '\n'.join(lines)
+
+    def _format_payments(self, inv) -> list:
+        """Format the payments applied to a posted invoice or bill."""
+        lines: list = []
+        lot = inv.GetPostedLot()
+        if lot:
+            for raw_split in lot.get_split_list():
+                s   = Split(instance=raw_split)
+                txn = s.GetParent()
+                if txn is None:
+                    continue
+                # Skip the posting transaction itself
+                if gc.gncInvoiceGetInvoiceFromTxn(txn.instance) is not None:
+                    continue
+                lines += self._format_payment(txn)
+        return lines
 
     def _format_inv_entry(self, lib, raw_entry) -> list:
         ptr = int(raw_entry.instance)
@@ -249,8 +294,7 @@ class ExportBusinessObjectsUseCase:
         taxable     = bool(lib.gncEntryGetInvTaxable(ptr))
         tax_incl    = bool(lib.gncEntryGetInvTaxIncluded(ptr))
 
-        # Account full name via Python wrapper (works fine here)
-        acct_name = get_account_full_name(raw_entry.GetInvAccount())
+        acct_name = self._account_name(raw_entry.GetInvAccount())
 
         date_str = raw_entry.GetDate().strftime("%Y-%m-%d")
 
@@ -290,7 +334,7 @@ class ExportBusinessObjectsUseCase:
             acct  = split.GetAccount()
             atype = gc.xaccAccountGetType(acct.instance)
             if atype not in (gc.ACCT_TYPE_RECEIVABLE, gc.ACCT_TYPE_PAYABLE):
-                bank_name = get_account_full_name(acct)
+                bank_name = self._account_name(acct)
                 pay_amt   = abs(split.GetAmount().to_double())
                 break
 
@@ -307,31 +351,9 @@ class ExportBusinessObjectsUseCase:
 
     # ── Bills (vendor invoices) ───────────────────────────────────────────────
 
-    def _export_bills(self) -> str:
-        """
-        Bills are gncInvoice objects whose owner is a Vendor.
-        There is no separate 'gncBill' QOF type.
-        """
+    def _bill_blocks(self, bills) -> Iterator[str]:
         lib = self._lib
 
-        q = Query()
-        q.search_for('gncInvoice')
-        q.set_book(self.book)
-        all_invoices = [gb.Invoice(instance=r) for r in q.run()]
-        q.destroy()
-
-        bills = []
-        for inv in all_invoices:
-            if not inv.IsPosted():
-                continue
-            try:
-                vendor = inv.GetOwner().GetVendor()
-                if vendor is not None:
-                    bills.append((inv, vendor))
-            except Exception:
-                pass
-
-        bill_strings = []
         for inv, vendor in bills:
             lines = [
                 f'bill "{inv.GetID()}"',
@@ -345,7 +367,7 @@ class ExportBusinessObjectsUseCase:
 
             posted_txn = inv.GetPostedTxn()
             if posted_txn:
-                ap_name = get_account_full_name(inv.GetPostedAcc())
+                ap_name = self._account_name(inv.GetPostedAcc())
                 lines.append('  posted:')
                 lines.append(f'    date: {inv.GetDatePosted().strftime("%Y-%m-%d")}')
                 lines.append(f'    due: {inv.GetDateDue().strftime("%Y-%m-%d")}')
@@ -353,16 +375,6 @@ class ExportBusinessObjectsUseCase:
                 lines.append(f'    memo: "{posted_txn.GetDescription()}"')
                 lines.append('    accumulate: true')
 
-            lot = inv.GetPostedLot()
-            if lot:
-                for raw_split in lot.get_split_list():
-                    s   = Split(instance=raw_split)
-                    txn = s.GetParent()
-                    if txn is None:
-                        continue
-                    if gc.gncInvoiceGetInvoiceFromTxn(txn.instance) is not None:
-                        continue
-                    lines += self._format_payment(txn)
-
-            bill_strings.append('\n'.join(lines))
-        return '\n\n'.join(bill_strings)
+            lines += self._format_payments(inv)
+
+            yield '\n'.join(lines)
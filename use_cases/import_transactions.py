@@ -7,6 +7,7 @@ and transactions.
 """
 
 import logging
+from fractions import Fraction
 from typing import Dict, List
 
 from gnucash import GncNumeric
@@ -17,7 +18,7 @@ from services.conflict_resolver import ConflictResolver, ResolutionStrategy
 from services.gnucash_importer import GnuCashImporter
 from services.ledger_validator import LedgerValidator
 from services.plaintext_parser import DirectiveType, PlaintextParser
-from services.transaction_matcher import TransactionMatcher
+from services.transaction_matcher import GuidIndex, TransactionMatcher
 
 
 class ImportResult:
@@ -30,6 +31,7 @@ class ImportResult:
         self.error_count = 0
         self.duplicates = []
         self.conflicts = []
+        self.fuzzy_matches = []
         self.errors = []
 
     def get_summary(self) -> str:
@@ -118,14 +120,13 @@ class ImportTransactionsUseCase:
         if conflicts:
             # Need to find corresponding existing transactions for conflicts
             conflict_pairs = []
+            existing_by_signature = self.matcher.index_by_signature(existing_transactions)
             for conflict_tx in conflicts:
                 conflict_sig = self.matcher.get_signature(conflict_tx)
-                # Find existing transaction with same signature
-                for existing_tx in existing_transactions:
-                    existing_sig = self.matcher.get_signature(existing_tx)
-                    if existing_sig == conflict_sig:
-                        conflict_pairs.append((existing_tx, conflict_tx))
-                        break
+                # Pair with the first existing transaction with same signature
+                matching_txs = existing_by_signature.get(conflict_sig)
+                if matching_txs:
+                    conflict_pairs.append((matching_txs[0], conflict_tx))
 
             to_import_from_conflicts, unresolved = self.resolver.resolve(
                 conflict_pairs,
@@ -213,7 +214,9 @@ class ImportTransactionsUseCase:
     def import_from_file(
         self,
         input_path: str,
-        resolution_strategy: ResolutionStrategy = ResolutionStrategy.SKIP
+        resolution_strategy: ResolutionStrategy = ResolutionStrategy.SKIP,
+        match_window_days: int = 0,
+        amount_tolerance: Fraction = Fraction(0)
     ) -> ImportResult:
         """
         Import from full GnuCash plaintext format file.
@@ -226,9 +229,15 @@ class ImportTransactionsUseCase:
         Commodities and accounts are created first, then transactions are imported
         with duplicate detection and conflict resolution.
 
+        When match_window_days > 0, a transaction that matches an existing one with
+        the same accounts and doc_link within +/- match_window_days (and amounts
+        within amount_tolerance) is also skipped and reported in result.fuzzy_matches.
+
         Args:
             input_path: Path to plaintext file in GnuCash format
             resolution_strategy: How to handle conflicts
+            match_window_days: Date window for fuzzy duplicate matching (0 = disabled)
+            amount_tolerance: Maximum per-account amount difference for fuzzy matching
 
         Returns:
             ImportResult with summary
@@ -272,6 +281,10 @@ class ImportTransactionsUseCase:
 
         # Step 3: Import transactions with duplicate detection
         existing_transactions = self.repository.get_all_transactions()
+        guid_index = GuidIndex(existing_transactions)
+        date_index = None
+        if match_window_days > 0:
+            date_index = self.matcher.build_date_index(existing_transactions, {})
 
         for child in parser.root_directive.children:
             if child.type == DirectiveType.TRANSACTION:
@@ -280,11 +293,7 @@ class ImportTransactionsUseCase:
                     if 'guid' in child.metadata:
                         guid = child.metadata['guid']
                         # Check if transaction with this GUID already exists
-                        is_duplicate = any(
-                            tx.GetGUID().to_string() == guid
-                            for tx in existing_transactions
-                        )
-                        if is_duplicate:
+                        if self.matcher.find_by_guid(guid_index, guid) is not None:
                             logging.info(f"Skipping duplicate transaction with GUID {guid}")
                             result.skipped_count += 1
                             continue
@@ -311,6 +320,32 @@ class ImportTransactionsUseCase:
                         result.skipped_count += 1
                         continue
 
+                    # Check for near-duplicate within the date window
+                    if date_index is not None:
+                        record = self.matcher.record_from_plaintext(
+                            date_str,
+                            [
+                                (split.props['account'],
+                                 split.metadata.get('value', split.props['amount']))
+                                for split in child.children
+                            ],
+                            doc_link=child.metadata.get('doc_link'),
+                            description=child.props.get('tx_desc') or "",
+                            source=child,
+                        )
+                        match = date_index.find_best_match(
+                            record, match_window_days, amount_tolerance
+                        )
+                        if match is not None:
+                            logging.info(
+                                f"Skipping transaction on {date_str}: matches existing "
+                                f"transaction on {match.existing.date} "
+                                f"(confidence {match.confidence:.2f})"
+                            )
+                            result.fuzzy_matches.append(match)
+                            result.skipped_count += 1
+                            continue
+
                     # Create transaction
                     importer.create_transaction(child, book)
                     result.imported_count += 1
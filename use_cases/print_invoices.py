@@ -0,0 +1,139 @@
+"""
+Use case for printing many invoices at once.
+
+Selects posted customer invoices by customer and posted date, and extracts
+every selected invoice's XML in the one open session. Rendering the XML to PDF
+happens afterwards, outside the session (see services/invoice_render_pool.py).
+"""
+
+import re
+from datetime import date
+from typing import List, Optional, Tuple
+
+import gnucash.gnucash_business as gb
+from gnucash import Query
+
+from repositories.gnucash_repository import GnuCashRepository
+from services.invoice_renderer import invoice_to_xml_string
+
+
+def invoice_file_name(invoice_id: str, output_format: str = 'pdf') -> str:
+    """
+    Output file name for an invoice ID.
+
+    Characters that are unsafe in file names are replaced with '_'.
+
+    Args:
+        invoice_id: Invoice ID (e.g. "INV-2026-001")
+        output_format: 'pdf' or 'html'
+
+    Returns:
+        File name, e.g. "INV-2026-001.pdf"
+    """
+    return re.sub(r'[^A-Za-z0-9._-]', '_', invoice_id) + '.' + output_format
+
+
+def invoice_file_names(invoice_ids: List[str], output_format: str = 'pdf') -> List[str]:
+    """
+    Distinct output file names for several invoices written to one directory.
+
+    Different IDs can give the same name ("INV/1" and "INV_1" both give
+    "INV_1.pdf"), and names differing only in case clash on case-insensitive
+    file systems. A later clashing invoice gets a numbered suffix instead of
+    overwriting the earlier file.
+
+    Args:
+        invoice_ids: Invoice IDs, in output order
+        output_format: 'pdf' or 'html'
+
+    Returns:
+        File names in the same order, e.g. ["INV_1.pdf", "INV_1-2.pdf"]
+    """
+    names = []
+    used = set()
+    for invoice_id in invoice_ids:
+        name = invoice_file_name(invoice_id, output_format)
+        stem = name[:-len(output_format) - 1]
+        suffix = 1
+        while name.casefold() in used:
+            suffix += 1
+            name = f"{stem}-{suffix}.{output_format}"
+        used.add(name.casefold())
+        names.append(name)
+    return names
+
+
+class PrintInvoicesUseCase:
+    """Use case for selecting invoices and extracting their XML"""
+
+    def __init__(self, repository: GnuCashRepository):
+        """
+        Initialize use case.
+
+        Args:
+            repository: GnuCash repository instance
+        """
+        self.repository = repository
+
+    def find_invoices(
+        self,
+        customer_id: Optional[str] = None,
+        posted_from: Optional[date] = None,
+        posted_to: Optional[date] = None,
+    ) -> List:
+        """
+        Find posted customer invoices (not vendor bills).
+
+        Args:
+            customer_id: Only invoices of this customer
+            posted_from: Only invoices posted on or after this date
+            posted_to: Only invoices posted on or before this date
+
+        Returns:
+            Invoices sorted by ID
+        """
+        q = Query()
+        q.search_for('gncInvoice')
+        q.set_book(self.repository.book)
+        all_invoices = [gb.Invoice(instance=r) for r in q.run()]
+        q.destroy()
+
+        invoices = []
+        for inv in all_invoices:
+            if not inv.IsPosted():
+                continue
+            try:
+                cust = inv.GetOwner().GetCustomer()
+            except Exception:
+                continue
+            if cust is None or (customer_id is not None and cust.GetID() != customer_id):
+                continue
+            posted = inv.GetDatePosted().date()
+            if posted_from is not None and posted < posted_from:
+                continue
+            if posted_to is not None and posted > posted_to:
+                continue
+            invoices.append(inv)
+
+        invoices.sort(key=lambda inv: inv.GetID())
+        return invoices
+
+    def extract(self, invoices: List, company_info=None) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """
+        Build the XML of each invoice.
+
+        Args:
+            invoices: Invoices to extract
+            company_info: Company details from read_book_company_info
+
+        Returns:
+            Tuple of ((invoice ID, XML string) list, (invoice ID, error) list)
+        """
+        extracted = []
+        failed = []
+        for inv in invoices:
+            try:
+                extracted.append((inv.GetID(), invoice_to_xml_string(inv, self.repository.book, company_info)))
+            except Exception as e:
+                failed.append((inv.GetID(), str(e) or e.__class__.__name__))
+        return extracted, failed
@@ -0,0 +1,54 @@
+"""
+Use case for querying an account register.
+
+Looks the account up by full name and runs a RegisterQuery over its split list.
+Account names for the transfer column are cached by account pointer, since the
+same few counter-accounts appear on most lines.
+"""
+
+from typing import Dict, List
+
+from infrastructure.gnucash.utils import find_account, get_account_full_name
+from repositories.gnucash_repository import GnuCashRepository
+from services.register_query import RegisterFilter, RegisterLine, RegisterQuery
+
+
+class QueryRegisterUseCase:
+    """Use case for filtering the register of one account"""
+
+    def __init__(self, repository: GnuCashRepository):
+        """
+        Initialize use case.
+
+        Args:
+            repository: GnuCash repository instance
+        """
+        self.repository = repository
+        self._names: Dict[int, str] = {}
+
+    def _account_name(self, account) -> str:
+        ptr = int(account.instance)
+        name = self._names.get(ptr)
+        if name is None:
+            name = get_account_full_name(account)
+            self._names[ptr] = name
+        return name
+
+    def execute(self, account_name: str, query: RegisterFilter) -> List[RegisterLine]:
+        """
+        Run a register query.
+
+        Args:
+            account_name: Full account name (e.g. "Liabilities:Visa")
+            query: Conditions and limits
+
+        Returns:
+            Matching register lines in posted-date order
+
+        Raises:
+            ValueError: If the account does not exist
+        """
+        account = find_account(self.repository.get_root_account(), account_name)
+        if account is None:
+            raise ValueError(f"Account not found: {account_name}")
+        return RegisterQuery(self._account_name).run(account, query)
@@ -0,0 +1,286 @@
+"""
+Use case for period reports (trial balance, income statement, balance sheet).
+
+Extracts every account's split amounts from the book in one pass and hands the
+snapshot to PeriodReportBuilder, which does all aggregation in plain Python.
+The net worth report also reads the price database and the exchange rates
+implied by multi-currency splits, once, into a PriceTable.
+
+The aging report reads every posted invoice and bill with one query and takes
+each one's outstanding balance from its posted lot.
+"""
+
+from datetime import date
+from fractions import Fraction
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import gnucash.gnucash_business as gb
+from gnucash import Query, Split
+
+from repositories.gnucash_repository import GnuCashRepository
+from services.account_categorizer import AccountCategorizer
+from services.aging_report import DEFAULT_BUCKETS, PAYABLE, RECEIVABLE, OpenItem, aging_report
+from services.net_worth import NetWorth, PriceEntry, PriceTable, net_worth
+from services.period_report import AccountInfo, PeriodReport, PeriodReportBuilder, SplitEntry
+
+# Report name -> PeriodReportBuilder method
+REPORT_KINDS = {
+    'trial-balance': 'trial_balance',
+    'income-statement': 'income_statement',
+    'balance-sheet': 'balance_sheet',
+}
+
+
+class PeriodReportUseCase:
+    """Use case for building period reports from a GnuCash book"""
+
+    def __init__(self, repository: GnuCashRepository):
+        """
+        Initialize use case.
+
+        Args:
+            repository: GnuCash repository instance
+        """
+        self.repository = repository
+        self.categorizer = AccountCategorizer()
+
+    def snapshot(self, prices: Optional[List[PriceEntry]] = None) -> Tuple[List[AccountInfo], List[SplitEntry]]:
+        """
+        Read the account tree and every split amount once.
+
+        Args:
+            prices: If given, the price implied by every split whose commodity
+                differs from its transaction's currency (value / amount) is
+                appended to it
+
+        Returns:
+            Tuple of (accounts in hierarchy order, split entries)
+        """
+        accounts: List[AccountInfo] = []
+        entries: List[SplitEntry] = []
+
+        def visit(account, prefix: str):
+            for child in account.get_children_sorted():
+                name = f"{prefix}{child.GetName()}"
+                commodity = child.GetCommodity()
+                mnemonic = commodity.get_mnemonic() if commodity is not None else ""
+                accounts.append(AccountInfo(
+                    name=name,
+                    category=self.categorizer.get_category(child),
+                    commodity=mnemonic,
+                ))
+                for split in child.GetSplitList():
+                    tx = split.GetParent()
+                    posted = tx.GetDate()
+                    ordinal = date(posted.year, posted.month, posted.day).toordinal()
+                    amount = split.GetAmount()
+                    entries.append((name, ordinal, amount.num(), amount.denom()))
+
+                    if prices is not None and amount.num() != 0:
+                        currency = tx.GetCurrency().get_mnemonic()
+                        if currency != mnemonic:
+                            value = split.GetValue()
+                            prices.append((
+                                mnemonic,
+                                currency,
+                                ordinal,
+                                Fraction(value.num(), value.denom()) / Fraction(amount.num(), amount.denom()),
+                            ))
+                visit(child, f"{name}:")
+
+        visit(self.repository.get_root_account(), "")
+        return accounts, entries
+
+    def price_entries(self) -> List[PriceEntry]:
+        """
+        Read every price in the book's price database.
+
+        Returns:
+            Price entries (commodity, currency, date ordinal, price)
+        """
+        pricedb = self.repository.book.get_price_db()
+        entries: List[PriceEntry] = []
+        for namespace in self.repository.book.get_table().get_namespaces_list():
+            for commodity in namespace.get_commodity_list():
+                for price in pricedb.get_prices(commodity, None):
+                    value = price.get_value()
+                    entries.append((
+                        price.get_commodity().get_mnemonic(),
+                        price.get_currency().get_mnemonic(),
+                        price.get_time64().date().toordinal(),
+                        Fraction(value.num(), value.denom()),
+                    ))
+        return entries
+
+    def net_worth(
+        self,
+        currency: str,
+        period: str = 'month',
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> NetWorth:
+        """
+        Build a net worth report converted to one currency.
+
+        Prices from transactions come first and price database entries after
+        them, so the price database wins when both have a price on one day.
+
+        Args:
+            currency: Report currency mnemonic (e.g. "USD")
+            period: 'month', 'quarter' or 'year'
+            start: First date reported (default: first posted split)
+            end: Last date reported (default: last posted split)
+
+        Returns:
+            NetWorth
+
+        Raises:
+            ValueError: If period is unknown, or the book has no transactions
+                and no dates were given
+        """
+        prices: List[PriceEntry] = []
+        accounts, entries = self.snapshot(prices)
+        prices.extend(self.price_entries())
+        start, end = self._date_range(entries, start, end)
+        return net_worth(accounts, entries, PriceTable(prices), period, start, end, currency)
+
+    @staticmethod
+    def _date_range(
+        entries: List[SplitEntry], start: Optional[date], end: Optional[date]
+    ) -> Tuple[date, date]:
+        """Fill in missing report dates from the first and last posted split."""
+        if start is None or end is None:
+            if not entries:
+                raise ValueError("Book has no transactions; give --from and --to")
+            ordinals = [entry[1] for entry in entries]
+            start = start or date.fromordinal(min(ordinals))
+            end = end or date.fromordinal(max(ordinals))
+        return start, end
+
+    def execute(
+        self,
+        kind: str,
+        period: str = 'month',
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> PeriodReport:
+        """
+        Build a report.
+
+        Args:
+            kind: One of REPORT_KINDS
+            period: 'month', 'quarter' or 'year'
+            start: First date reported (default: first posted split)
+            end: Last date reported (default: last posted split)
+
+        Returns:
+            PeriodReport
+
+        Raises:
+            ValueError: If kind or period is unknown, or the book has no
+                transactions and no dates were given
+        """
+        if kind not in REPORT_KINDS:
+            raise ValueError(f"Unknown report '{kind}'. Available: {', '.join(REPORT_KINDS)}")
+
+        accounts, entries = self.snapshot()
+        start, end = self._date_range(entries, start, end)
+
+        builder = PeriodReportBuilder(accounts, entries, period, start, end)
+        return getattr(builder, REPORT_KINDS[kind])()
+
+
+class AgingReportUseCase:
+    """Use case for aging open invoices and bills by days past due"""
+
+    def __init__(self, repository: GnuCashRepository):
+        """
+        Initialize use case.
+
+        Args:
+            repository: GnuCash repository instance
+        """
+        self.repository = repository
+
+    @staticmethod
+    def _owner(inv) -> Optional[Tuple[str, str, str]]:
+        """(RECEIVABLE or PAYABLE, owner ID, owner name) of an invoice or bill."""
+        try:
+            owner = inv.GetOwner()
+            customer = owner.GetCustomer()
+            if customer is not None:
+                return RECEIVABLE, customer.GetID(), customer.GetName()
+            vendor = owner.GetVendor()
+            if vendor is not None:
+                return PAYABLE, vendor.GetID(), vendor.GetName()
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def _balance_as_of(lot, as_of: date) -> Fraction:
+        """Lot balance, leaving out splits (e.g. payments) posted after as_of."""
+        balance = lot.get_balance()
+        total = Fraction(balance.num(), balance.denom())
+        for raw_split in lot.get_split_list():
+            split = Split(instance=raw_split)
+            txn = split.GetParent()
+            if txn is not None and txn.GetDate().date() > as_of:
+                amount = split.GetAmount()
+                total -= Fraction(amount.num(), amount.denom())
+        return total
+
+    def open_items(self, as_of: date) -> Iterator[OpenItem]:
+        """
+        Find every invoice and bill with a balance outstanding on a date.
+
+        Args:
+            as_of: Report date; invoices posted later are left out
+
+        Yields:
+            OpenItem per invoice or bill, with a positive balance while the
+            customer owes it or it is owed to the vendor
+        """
+        query = Query()
+        query.search_for('gncInvoice')
+        query.set_book(self.repository.book)
+        invoices = [gb.Invoice(instance=r) for r in query.run()]
+        query.destroy()
+
+        for inv in invoices:
+            if not inv.IsPosted() or inv.GetDatePosted().date() > as_of:
+                continue
+            owner = self._owner(inv)
+            lot = inv.GetPostedLot()
+            if owner is None or lot is None:
+                continue
+            kind, owner_id, name = owner
+            balance = self._balance_as_of(lot, as_of)
+            # A bill's lot sits on the credit side of accounts payable
+            if kind == PAYABLE:
+                balance = -balance
+            if balance == 0:
+                continue
+            yield OpenItem(
+                kind=kind,
+                owner_id=owner_id,
+                owner=name,
+                invoice_id=inv.GetID(),
+                due=inv.GetDateDue().date(),
+                currency=inv.GetCurrency().get_mnemonic(),
+                balance=balance,
+            )
+
+    def execute(self, as_of: date, buckets: Sequence[int] = DEFAULT_BUCKETS) -> PeriodReport:
+        """
+        Build an aging report.
+
+        Args:
+            as_of: Report date
+            buckets: Sorted bucket limits in days past due
+
+        Returns:
+            PeriodReport with Receivable and Payable sections, one row per
+            customer or vendor and currency
+        """
+        return aging_report(self.open_items(as_of), as_of, buckets)
@@ -4,11 +4,17 @@ Use case for validating GnuCash ledger.
 Orchestrates validation services to check ledger integrity.
 """
 
-from typing import Optional
+from typing import Iterable, Optional
 
 from repositories.gnucash_repository import GnuCashRepository
-from services.ledger_validator import LedgerValidator, ValidationResult
-from services.transaction_matcher import TransactionMatcher
+from services.ledger_validator import (
+    DateOrderRule,
+    DuplicateRule,
+    FutureDateRule,
+    LedgerValidator,
+    ValidationResult,
+)
+from services.validation_cache import ValidationCache
 
 
 class ValidateLedgerUseCase:
@@ -23,69 +29,86 @@ class ValidateLedgerUseCase:
         """
         self.repository = repository
         self.validator = LedgerValidator()
-        self.matcher = TransactionMatcher()
 
     def execute(
         self,
         check_duplicates: bool = True,
         check_date_order: bool = True,
-        check_future_dates: bool = True
+        check_future_dates: bool = True,
+        enabled_rules: Optional[Iterable[str]] = None,
+        disabled_rules: Iterable[str] = (),
+        jobs: int = 1,
+        cache: Optional[ValidationCache] = None
     ) -> ValidationResult:
         """
         Validate entire ledger.
 
+        All enabled rules run in a single pass over accounts and transactions.
+        With jobs > 1, transaction-level rules run in a process pool over
+        date-range partitions of the transactions. With a cache, only new or
+        edited transactions are re-checked by per-transaction rules.
+
         Args:
             check_duplicates: Whether to check for duplicate transactions
             check_date_order: Whether to check transaction date order
             check_future_dates: Whether to check for future dates
+            enabled_rules: Rule names to run (defaults to all registered rules)
+            disabled_rules: Rule names to skip
+            jobs: Number of worker processes for transaction-level rules
+            cache: Per-transaction result cache, saved after the run (optional)
 
         Returns:
             ValidationResult with all issues found
+
+        Raises:
+            ValueError: If a rule name is not registered
         """
+        disabled = set(disabled_rules)
+        if not check_duplicates:
+            disabled.add(DuplicateRule.name)
+        if not check_date_order:
+            disabled.add(DateOrderRule.name)
+        if not check_future_dates:
+            disabled.add(FutureDateRule.name)
+
+        rules = self.validator.create_rules(enabled_rules, disabled)
+
         root = self.repository.get_root_account()
         transactions = self.repository.get_all_transactions()
+        result = self.validator.run_rules(root, transactions, rules, jobs=jobs, cache=cache)
 
-        # Full ledger validation
-        result = self.validator.validate_ledger(root, transactions)
-
-        # Additional checks
-        if check_duplicates:
-            dup_count = self.matcher.get_duplicate_count(transactions)
-            if dup_count > 0:
-                result.add_warning(
-                    "DUPLICATES_DETECTED",
-                    f"Found {dup_count} duplicate transaction(s)",
-                    {'count': dup_count}
-                )
-
-        if check_date_order:
-            order_result = self.validator.check_transaction_date_order(transactions)
-            result.errors.extend(order_result.errors)
-            result.warnings.extend(order_result.warnings)
-            result.info.extend(order_result.info)
-
-        if check_future_dates:
-            future_result = self.validator.check_future_transactions(transactions)
-            result.errors.extend(future_result.errors)
-            result.warnings.extend(future_result.warnings)
-            result.info.extend(future_result.info)
+        if cache is not None:
+            cache.save()
 
         return result
 
     def validate_and_report(
         self,
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        enabled_rules: Optional[Iterable[str]] = None,
+        disabled_rules: Iterable[str] = (),
+        jobs: int = 1,
+        cache: Optional[ValidationCache] = None
     ) -> ValidationResult:
         """
         Validate ledger and generate report.
 
         Args:
             output_path: Optional path to write report file
+            enabled_rules: Rule names to run (defaults to all registered rules)
+            disabled_rules: Rule names to skip
+            jobs: Number of worker processes for transaction-level rules
+            cache: Per-transaction result cache, saved after the run (optional)
 
         Returns:
             ValidationResult
         """
-        result = self.execute()
+        result = self.execute(
+            enabled_rules=enabled_rules,
+            disabled_rules=disabled_rules,
+            jobs=jobs,
+            cache=cache
+        )
         report = self.validator.format_validation_report(result)
 
         if output_path:
@@ -96,29 +119,62 @@ class ValidateLedgerUseCase:
 
         return result
 
-    def quick_check(self) -> bool:
+    def quick_check(
+        self,
+        enabled_rules: Optional[Iterable[str]] = None,
+        disabled_rules: Iterable[str] = (),
+        jobs: int = 1,
+        cache: Optional[ValidationCache] = None
+    ) -> bool:
         """
         Quick validation check.
 
+        Args:
+            enabled_rules: Rule names to run (defaults to all registered rules)
+            disabled_rules: Rule names to skip
+            jobs: Number of worker processes for transaction-level rules
+            cache: Per-transaction result cache, saved after the run (optional)
+
         Returns:
             True if ledger is valid (no errors)
         """
         result = self.execute(
             check_duplicates=True,
             check_date_order=False,
-            check_future_dates=False
+            check_future_dates=False,
+            enabled_rules=enabled_rules,
+            disabled_rules=disabled_rules,
+            jobs=jobs,
+            cache=cache
         )
         return result.is_valid()
 
-    def get_statistics(self) -> dict:
+    def get_statistics(
+        self,
+        enabled_rules: Optional[Iterable[str]] = None,
+        disabled_rules: Iterable[str] = (),
+        jobs: int = 1,
+        cache: Optional[ValidationCache] = None
+    ) -> dict:
         """
         Get ledger statistics with validation status.
 
+        Args:
+            enabled_rules: Rule names to run (defaults to all registered rules)
+            disabled_rules: Rule names to skip
+            jobs: Number of worker processes for transaction-level rules
+            cache: Per-transaction result cache, saved after the run (optional)
+
         Returns:
             Dictionary with stats and validation info
         """
         stats = self.repository.get_statistics()
-        result = self.execute()
+        result = self.execute(
+            enabled_rules=enabled_rules,
+            disabled_rules=disabled_rules,
+            jobs=jobs,
+            cache=cache
+        )
 
         stats['validation'] = {
             'is_valid': result.is_valid(),